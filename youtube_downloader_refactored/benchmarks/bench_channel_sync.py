@@ -0,0 +1,96 @@
+"""
+Benchmark da sincronização incremental de canais.
+
+Simula um canal grande, paginado como as abas do YouTube (cada página
+custa uma requisição), com alguns envios novos desde a última execução,
+e compara a sincronização incremental com uma que percorre a lista
+inteira a cada execução. Os downloads são simulados e não há acesso à
+rede.
+
+Uso:
+    python -m benchmarks.bench_channel_sync [--videos 10000] [--new 3] [--page-latency 0.01]
+"""
+
+import argparse
+import tempfile
+import time
+from contextlib import contextmanager
+
+from src.services.channel_sync import ChannelSync
+from src.services.sync_store import SyncStore
+
+CHANNEL = "https://www.youtube.com/@canal/videos"
+PAGE_SIZE = 30  # itens por página de continuação na aba de vídeos
+
+
+class _SimulatedChannel:
+    """Canal do mais novo para o mais antigo, com latência por página."""
+
+    def __init__(self, count: int, page_latency: float):
+        self.ids = [f"v{n:06d}" for n in range(count - 1, -1, -1)]
+        self.page_latency = page_latency
+        self.pages = 0
+
+    def upload(self, count: int) -> None:
+        start = len(self.ids)
+        self.ids[:0] = [f"v{n:06d}" for n in range(start + count - 1, start - 1, -1)]
+
+    def _entries(self):
+        for offset in range(0, len(self.ids), PAGE_SIZE):
+            self.pages += 1
+            time.sleep(self.page_latency)
+            for video_id in self.ids[offset:offset + PAGE_SIZE]:
+                yield {'_type': 'url', 'ie_key': 'Youtube', 'id': video_id,
+                       'url': f"https://www.youtube.com/watch?v={video_id}"}
+
+    def extract_info(self, url, download=False, ie_key=None, process=True):
+        return {'_type': 'playlist', 'id': 'canal', 'entries': self._entries()}
+
+    @contextmanager
+    def checkout(self, options):
+        yield self
+
+
+class _NoopService:
+    """Serviço de download que não baixa nada."""
+
+    def download(self, request, progress_callback=None, control=None):
+        pass
+
+
+def _measure(sync: ChannelSync, channel: _SimulatedChannel):
+    """Sincroniza uma vez e retorna (segundos, páginas pedidas, resultado)."""
+    channel.pages = 0
+    started = time.perf_counter()
+    result = sync.sync(CHANNEL)
+    return time.perf_counter() - started, channel.pages, result
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--videos', type=int, default=10000)
+    parser.add_argument('--new', type=int, default=3)
+    parser.add_argument('--page-latency', type=float, default=0.01, help="segundos simulados por página")
+    parser.add_argument('--real-latency', type=float, default=0.5, help="segundos por página na estimativa")
+    args = parser.parse_args()
+
+    print(f"Canal com {args.videos} vídeos, {args.new} envio(s) novo(s), {PAGE_SIZE} itens por página")
+    print(f"{'modo':<14}{'páginas':>9}{'itens':>8}{'novos':>7}{'tempo (s)':>11}{'estimado (s)':>14}")
+    for label, streak in (("lista inteira", 10 ** 9), ("incremental", None)):
+        with tempfile.TemporaryDirectory() as directory:
+            channel = _SimulatedChannel(args.videos, args.page_latency)
+            options = {} if streak is None else {'known_streak': streak}
+            sync = ChannelSync(
+                SyncStore(f"{directory}/sync.db"), download_service=_NoopService(),
+                ydl_pool=channel, **options
+            )
+            sync.sync(CHANNEL, directory, baseline=True)
+            channel.upload(args.new)
+            elapsed, pages, result = _measure(sync, channel)
+            print(f"{label:<14}{pages:>9}{result.enumerated:>8}{len(result.downloaded):>7}"
+                  f"{elapsed:>11.2f}{pages * args.real_latency:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
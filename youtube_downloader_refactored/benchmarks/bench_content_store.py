@@ -0,0 +1,70 @@
+"""
+Benchmark do armazenamento por conteúdo.
+
+Simula vários usuários baixando os mesmos vídeos em pastas próprias e
+compara o espaço ocupado em disco com cópias independentes e com os
+arquivos deduplicados pelo ContentStore, além do custo da deduplicação
+(hash e link) por arquivo. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_content_store [--users 5] [--videos 10] [--size-mb 8]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.services.content_store import ContentStore
+
+
+def _disk_usage(directory: str) -> int:
+    """Bytes ocupados em disco, contando cada inode uma única vez."""
+    seen = set()
+    total = 0
+    for parent, _, names in os.walk(directory):
+        for name in names:
+            stat = os.stat(os.path.join(parent, name))
+            if (stat.st_dev, stat.st_ino) not in seen:
+                seen.add((stat.st_dev, stat.st_ino))
+                total += stat.st_blocks * 512
+    return total
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=5)
+    parser.add_argument('--videos', type=int, default=10)
+    parser.add_argument('--size-mb', type=int, default=8)
+    args = parser.parse_args()
+
+    contents = [os.urandom(args.size_mb * 1024 ** 2) for _ in range(args.videos)]
+    with tempfile.TemporaryDirectory() as tmp:
+        users_dir = os.path.join(tmp, 'users')
+        paths = []
+        for user in range(args.users):
+            folder = os.path.join(users_dir, f'usuario{user}')
+            os.makedirs(folder)
+            for index, content in enumerate(contents):
+                path = os.path.join(folder, f'video{index}.mp4')
+                with open(path, 'wb') as f:
+                    f.write(content)
+                paths.append(path)
+        copies = _disk_usage(users_dir)
+
+        store = ContentStore(os.path.join(tmp, 'store'))
+        start = time.perf_counter()
+        for path in paths:
+            store.ingest(path)
+        per_file_ms = (time.perf_counter() - start) / len(paths) * 1000
+        deduplicated = _disk_usage(tmp) - os.path.getsize(os.path.join(tmp, 'store', 'store.db'))
+
+    print(f"{args.users} usuários x {args.videos} vídeos de {args.size_mb} MB")
+    print(f"cópias independentes: {copies / 1024 ** 2:8.1f} MB")
+    print(f"deduplicado:          {deduplicated / 1024 ** 2:8.1f} MB ({copies / deduplicated:.1f}x menos)")
+    print(f"custo por arquivo:    {per_file_ms:8.1f} ms (hash + link)")
+
+
+if __name__ == '__main__':
+    main()
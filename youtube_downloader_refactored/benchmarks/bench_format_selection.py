@@ -0,0 +1,127 @@
+"""
+Benchmark da seleção de formatos.
+
+Compara, sobre um corpus sintético de info dicts no estilo do YouTube
+(H.264, VP9 e AV1 em várias resoluções), o tamanho total baixado com
+as antigas strings de formato do yt-dlp contra o FormatSelector com
+as políticas de DownloadFormats. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_format_selection [--videos 200] [--seed 1]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+import yt_dlp
+
+from src.config.constants import DownloadFormats
+from src.services.format_selector import FormatSelector
+
+# Strings usadas antes do FormatSelector, para comparação
+LEGACY_FORMATS = {
+    "Melhor qualidade": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]",
+    "Qualidade até 720p": "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]",
+    "Áudio MP3": "bestaudio[ext=m4a]",
+}
+
+# Bitrate típico de H.264 por altura (kbps) e fator relativo de cada codec
+H264_KBPS = {144: 90, 240: 220, 360: 450, 480: 850, 720: 1700, 1080: 3300}
+CODECS = [('avc1.64001F', 'mp4', 1.0, 100), ('vp09.00.40.08', 'webm', 0.7, 200), ('av01.0.08M.08', 'mp4', 0.6, 300)]
+AUDIO = [
+    ('139', 'm4a', 'mp4a.40.5', 49), ('140', 'm4a', 'mp4a.40.2', 129),
+    ('249', 'webm', 'opus', 53), ('250', 'webm', 'opus', 70), ('251', 'webm', 'opus', 135),
+]
+
+
+def build_corpus(videos: int, seed: int) -> List[Dict[str, Any]]:
+    """Gera info dicts sintéticos com variação de duração e complexidade."""
+    rng = random.Random(seed)
+    corpus = []
+    for n in range(videos):
+        duration = rng.randint(60, 1800)
+        complexity = rng.uniform(0.5, 1.6)
+        max_height = rng.choice([480, 720, 1080, 1080])
+        formats = []
+
+        for format_id, ext, acodec, abr in AUDIO:
+            abr = abr * rng.uniform(0.9, 1.1)
+            formats.append(_format(format_id, ext, 'none', acodec, abr, duration, abr=abr))
+
+        for height, kbps in H264_KBPS.items():
+            if height > max_height:
+                continue
+            for vcodec, ext, factor, base_id in CODECS:
+                if vcodec.startswith('av01') and rng.random() < 0.4:
+                    continue  # nem todo vídeo tem AV1
+                tbr = kbps * complexity * factor * rng.uniform(0.8, 1.25)
+                fmt = _format(f'{base_id + height}', ext, vcodec, 'none', tbr, duration,
+                              height=height, width=height * 16 // 9, fps=30)
+                formats.append(fmt)
+
+        formats.append(_format('18', 'mp4', 'avc1.42001E', 'mp4a.40.2', 600 * complexity, duration,
+                               height=360, width=640, fps=30))
+        formats.sort(key=lambda f: f['tbr'])
+        corpus.append({'id': f'video{n}', 'duration': duration, 'formats': formats})
+    return corpus
+
+
+def _format(format_id: str, ext: str, vcodec: str, acodec: str, tbr: float,
+            duration: int, **extra: Any) -> Dict[str, Any]:
+    """Cria um formato com tamanho derivado do bitrate."""
+    fmt = {
+        'format_id': format_id, 'format': format_id, 'ext': ext, 'protocol': 'https',
+        'vcodec': vcodec, 'acodec': acodec, 'tbr': tbr, 'url': f'https://example.invalid/{format_id}',
+        'filesize': int(tbr * 1000 / 8 * duration),
+    }
+    fmt.update(extra)
+    return fmt
+
+
+def _size(selected: Dict[str, Any]) -> int:
+    """Soma o tamanho de um formato escolhido (simples ou mesclado)."""
+    parts = selected.get('requested_formats') or [selected]
+    return sum(f['filesize'] for f in parts)
+
+
+def run(corpus: List[Dict[str, Any]]) -> None:
+    """Executa as duas estratégias e imprime o comparativo."""
+    ydl = yt_dlp.YoutubeDL({'quiet': True})
+    print(f"{'formato':<32}{'antigo (GB)':>13}{'novo (GB)':>11}{'redução':>9}{'ms/vídeo':>10}")
+
+    for name, policy in DownloadFormats.POLICIES.items():
+        legacy = LEGACY_FORMATS.get(name)
+        legacy_total = 0
+        if legacy:
+            legacy_selector = ydl.build_format_selector(legacy)
+            for info in corpus:
+                ctx = {'formats': info['formats'], 'has_merged_format': False, 'incomplete_formats': False}
+                legacy_total += sum(_size(f) for f in legacy_selector(ctx))
+
+        selector = FormatSelector(policy)
+        start = time.perf_counter()
+        new_total = 0
+        for info in corpus:
+            ctx = {'formats': info['formats'], 'has_merged_format': False, 'incomplete_formats': False}
+            new_total += sum(_size(f) for f in selector(ctx))
+        elapsed = (time.perf_counter() - start) / len(corpus)
+
+        old_col = f"{legacy_total / 1e9:>13.2f}" if legacy else f"{'-':>13}"
+        reduction = f"{1 - new_total / legacy_total:>8.0%}" if legacy else f"{'-':>8}"
+        print(f"{name:<32}{old_col}{new_total / 1e9:>11.2f} {reduction}{elapsed * 1000:>10.3f}")
+
+
+def main() -> None:
+    """Gera o corpus e executa o benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--videos', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    run(build_corpus(args.videos, args.seed))
+
+
+if __name__ == '__main__':
+    main()
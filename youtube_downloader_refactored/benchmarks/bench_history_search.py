@@ -0,0 +1,105 @@
+"""
+Benchmark do histórico de downloads.
+
+Popula um histórico com muitos registros (títulos e canais gerados a
+partir de um vocabulário) e mede o custo de registrar um download na
+thread chamadora e o tempo da primeira página de buscas por título,
+canal, formato e período. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_history_search [--entries 100000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src.config.constants import DownloadFormats
+from src.models.history import HistoryEntry, HistoryQuery
+from src.services.history_store import HistoryStore
+
+WORDS = (
+    "tutorial python música ao vivo gameplay review unboxing receita bolo treino "
+    "podcast entrevista notícias futebol melhores momentos trailer oficial clipe "
+    "aula matemática física química história viagem vlog setup programação "
+    "javascript minecraft speedrun documentário natureza espaço carros"
+).split()
+DAY = 24 * 3600
+
+
+def _populate(store: HistoryStore, count: int, seed: int = 7) -> float:
+    """Grava registros sintéticos e retorna o custo médio por add(), em µs."""
+    rng = random.Random(seed)
+    channels = [f"Canal {rng.choice(WORDS).title()} {n}" for n in range(500)]
+    formats = DownloadFormats.get_format_keys()
+    now = time.time()
+
+    elapsed = 0.0
+    for n in range(count):
+        entry = HistoryEntry(
+            title=" ".join(rng.choice(WORDS) for _ in range(6)) + f" #{n}",
+            url=f"https://youtu.be/{n:011d}",
+            file_path=f"/videos/{n}.mp4",
+            format_choice=rng.choice(formats),
+            video_id=f"{n:011d}",
+            channel=rng.choice(channels),
+            size_bytes=rng.randint(1, 500) * 1024 * 1024,
+            downloaded_at=now - rng.random() * 365 * DAY,
+        )
+        start = time.perf_counter()
+        store.add(entry)
+        elapsed += time.perf_counter() - start
+    store.flush()
+    return elapsed / count * 1e6
+
+
+def _time_query(store: HistoryStore, query: HistoryQuery, runs: int = 20) -> tuple:
+    """Retorna (mediana em ms, registros) da primeira página de uma busca."""
+    timings, results = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = store.search(query)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, len(results)
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(os.path.join(tmp, 'history.db'))
+        start = time.perf_counter()
+        per_add = _populate(store, args.entries)
+        populate = time.perf_counter() - start
+
+        sample = store.search(HistoryQuery(text="minecraft"), limit=1)[0]
+        now = time.time()
+        queries = {
+            "sem filtro": HistoryQuery(),
+            "título comum": HistoryQuery(text="tutorial"),
+            "título, prefixo": HistoryQuery(text="program"),
+            "título, 2 palavras": HistoryQuery(text="minecraft speedrun"),
+            "título raro": HistoryQuery(text=sample.title.split("#")[1]),
+            "canal": HistoryQuery(channel=sample.channel),
+            "formato": HistoryQuery(format_choice="Áudio MP3"),
+            "últimos 7 dias": HistoryQuery(since=now - 7 * DAY),
+            "título + formato": HistoryQuery(text="música", format_choice="Áudio MP3"),
+        }
+
+        print(f"{args.entries} registros gravados em {populate:.1f} s "
+              f"({per_add:.1f} µs por add() na thread chamadora)")
+        print(f"{'busca':<22}{'ms':>8}{'linhas':>8}")
+        for name, query in queries.items():
+            ms, rows = _time_query(store, query)
+            print(f"{name:<22}{ms:>8.2f}{rows:>8}")
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
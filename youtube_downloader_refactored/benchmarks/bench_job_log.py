@@ -0,0 +1,69 @@
+"""
+Benchmark do custo do registro por job.
+
+Mede quanto cada mensagem do yt-dlp custa ao passar pelo JobLog (buffer
+em memória) em comparação com o modo silencioso sem logger, que as
+descarta, e com um logging.Logger gravando em arquivo a cada mensagem.
+Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_job_log [--messages 100000]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import yt_dlp
+
+from src.services.job_log import JobLog
+
+
+def _per_message(ydl, messages: int) -> float:
+    """Custo médio, em µs, de uma mensagem de tela do yt-dlp."""
+    start = time.perf_counter()
+    for n in range(messages):
+        ydl.to_screen(f"[download] Destination: video-{n}.mp4")
+    return (time.perf_counter() - start) / messages * 1e6
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--messages', type=int, default=100_000)
+    args = parser.parse_args()
+
+    with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
+        quiet = _per_message(ydl, args.messages)
+
+    with yt_dlp.YoutubeDL({'quiet': True, 'logger': JobLog("bench")}) as ydl:
+        buffered = _per_message(ydl, args.messages)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = logging.getLogger('bench_job_log')
+        logger.setLevel(logging.DEBUG)
+        handler = logging.FileHandler(os.path.join(tmp, 'bench.log'))
+        logger.addHandler(handler)
+        with yt_dlp.YoutubeDL({'quiet': True, 'logger': logger}) as ydl:
+            to_file = _per_message(ydl, args.messages)
+        logger.removeHandler(handler)
+        handler.close()
+
+        log = JobLog("bench")
+        for n in range(1000):
+            log.info(f"mensagem {n}")
+        start = time.perf_counter()
+        log.flush(tmp)
+        flush_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{'modo':<24}{'µs/mensagem':>12}")
+    print(f"{'silencioso (descarta)':<24}{quiet:>12.2f}")
+    print(f"{'JobLog (buffer)':<24}{buffered:>12.2f}")
+    print(f"{'logging em arquivo':<24}{to_file:>12.2f}")
+    print(f"gravação do buffer na falha: {flush_ms:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
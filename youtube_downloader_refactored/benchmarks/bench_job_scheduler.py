@@ -0,0 +1,74 @@
+"""
+Benchmark das políticas de escalonamento da fila.
+
+Submete ao JobManager uma carga mista (alguns vídeos longos chegando
+antes de dezenas de clipes curtos) com um serviço de download simulado,
+cuja duração é proporcional ao tamanho estimado, e compara o tempo médio
+até a conclusão de cada job com FIFO, prioridade e menor job primeiro.
+Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_job_scheduler [--long 3] [--short 30] [--workers 2]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from src.models.video_info import DownloadRequest
+from src.services.job_manager import JobManager
+from src.services.job_scheduler import JobScheduler
+
+MB = 1024 ** 2
+
+
+class _SimulatedService:
+    """Serviço de download que dorme pelo tempo proporcional ao tamanho."""
+
+    def __init__(self, bytes_per_second: float):
+        self._rate = bytes_per_second
+
+    def download(self, request, progress_callback=None, control=None):
+        time.sleep(request.estimated_size / self._rate)
+
+
+def _run(policy: str, requests, workers: int, rate: float):
+    """Executa a carga com uma política e retorna os tempos de conclusão."""
+    manager = JobManager(
+        download_service=_SimulatedService(rate), max_concurrent=workers,
+        scheduler=JobScheduler(policy)
+    )
+    jobs = [manager.submit(request) for request in requests]
+    manager.start()
+    while any(not job.status.is_terminal() for job in jobs):
+        time.sleep(0.01)
+    manager.shutdown()
+    return [job.finished_at - job.created_at for job in jobs]
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--long', type=int, default=3)
+    parser.add_argument('--short', type=int, default=30)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--rate-mb', type=float, default=1000.0, help="MB/s simulados por download")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    sizes = [4000 * MB] * args.long + [rng.randint(10, 80) * MB for _ in range(args.short)]
+    requests = [
+        DownloadRequest(f"https://youtu.be/{n}", "/tmp", "Melhor qualidade", estimated_size=size)
+        for n, size in enumerate(sizes)
+    ]
+
+    print(f"{args.long} vídeos longos + {args.short} clipes, {args.workers} workers")
+    print(f"{'política':<10}{'média (s)':>11}{'mediana (s)':>13}{'máximo (s)':>12}")
+    for policy in JobScheduler.POLICIES:
+        times = _run(policy, requests, args.workers, args.rate_mb * MB)
+        print(f"{policy:<10}{statistics.mean(times):>11.2f}{statistics.median(times):>13.2f}{max(times):>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Teste de resistência da gravação ao vivo.
+
+Grava por um tempo longo uma transmissão HLS local (segmentos curtos,
+janela deslizante e quedas periódicas da playlist) com rotação e
+retenção de arquivos, e amostra a memória residente, os descritores
+abertos, as threads e os arquivos no destino. Numa gravação saudável
+esses números ficam estáveis do início ao fim. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_live_recorder [--duration 60] [--segment-kb 64]
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+from src.config.constants import LiveConfig
+from src.models.exceptions import DownloadCancelledError
+from src.models.video_info import DownloadRequest
+from src.services.job_control import JobControl
+from src.services.live_recorder import LiveRecorder
+from src.services.ydl_pool import YoutubeDLPool
+
+SEGMENT_SECONDS = 0.05
+WINDOW = 20
+
+
+class _LiveHandler(BaseHTTPRequestHandler):
+    """Transmissão cuja borda avança com o relógio; a playlist cai a cada 5 s."""
+
+    def do_GET(self) -> None:
+        server = self.server
+        elapsed = time.monotonic() - server.started
+        head = int(elapsed / SEGMENT_SECONDS) + WINDOW
+        if self.path.startswith('/live.m3u8'):
+            if elapsed % 5.0 > 4.8:
+                self._send(503, b'')
+                return
+            lines = ['#EXTM3U', f'#EXT-X-TARGETDURATION:{SEGMENT_SECONDS}',
+                     f'#EXT-X-MEDIA-SEQUENCE:{head - WINDOW}']
+            for sequence in range(head - WINDOW, head):
+                lines += [f'#EXTINF:{SEGMENT_SECONDS},', f'seg/{sequence}.ts']
+            self._send(200, '\n'.join(lines).encode())
+        else:
+            sequence = int(re.search(r'(\d+)\.ts', self.path).group(1))
+            self._send(200, bytes([sequence % 256]) * server.segment_bytes)
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def _sample(directory: str) -> dict:
+    """Memória residente, descritores, threads e arquivos no destino."""
+    with open('/proc/self/statm') as f:
+        rss_pages = int(f.read().split()[1])
+    return {
+        'rss_mb': rss_pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2,
+        'fds': len(os.listdir('/proc/self/fd')),
+        'threads': threading.active_count(),
+        'files': len(os.listdir(directory)),
+    }
+
+
+def main() -> None:
+    """Executa o teste e imprime as amostras."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--duration', type=float, default=60.0, help="segundos de gravação")
+    parser.add_argument('--segment-kb', type=int, default=64)
+    parser.add_argument('--rotate-seconds', type=float, default=2.0, help="conteúdo por arquivo")
+    parser.add_argument('--keep', type=int, default=5, help="arquivos mantidos no destino")
+    args = parser.parse_args()
+
+    LiveConfig.RECONNECT_DELAY = 0.05
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _LiveHandler)
+    server.daemon_threads = True
+    server.started = time.monotonic()
+    server.segment_bytes = args.segment_kb * 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = LiveRecorder(
+            cookie_manager=Mock(), ydl_pool=YoutubeDLPool(),
+            segment_seconds=args.rotate_seconds, keep_segments=args.keep
+        )
+        request = DownloadRequest(
+            f"http://127.0.0.1:{server.server_address[1]}/live.m3u8", directory,
+            "Melhor qualidade", custom_title="soak", live=True
+        )
+        control = JobControl()
+        progress = {}
+        samples = []
+
+        def sampler() -> None:
+            interval = args.duration / 10
+            started = time.monotonic()
+            while not control.is_cancelled:
+                time.sleep(interval)
+                samples.append(dict(_sample(directory), t=time.monotonic() - started, **progress))
+                if time.monotonic() - started >= args.duration:
+                    control.cancel()
+
+        thread = threading.Thread(target=sampler, daemon=True)
+        thread.start()
+        try:
+            recorder.record(request, progress.update, control)
+        except DownloadCancelledError:
+            pass
+        thread.join()
+
+    print(f"{'tempo (s)':>9}{'gravado (s)':>13}{'MB':>9}{'RSS (MB)':>10}{'fds':>6}{'threads':>9}{'arquivos':>10}")
+    for sample in samples:
+        print(f"{sample['t']:>9.0f}{sample.get('live_duration', 0):>13.1f}"
+              f"{sample.get('downloaded_bytes', 0) / 1024 ** 2:>9.1f}{sample['rss_mb']:>10.1f}"
+              f"{sample['fds']:>6}{sample['threads']:>9}{sample['files']:>10}")
+    reconnects = sum(event['kind'] == 'retry' for event in control.stats.events)
+    gaps = sum(event['kind'] == 'live_gap' for event in control.stats.events)
+    first, last = samples[1], samples[-1]
+    print(f"reconexões (últimos {control.stats.MAX_EVENTS} eventos): {reconnects}, perdas: {gaps}")
+    print(f"variação de RSS entre a 2ª e a última amostra: {last['rss_mb'] - first['rss_mb']:+.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
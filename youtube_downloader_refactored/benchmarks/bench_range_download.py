@@ -0,0 +1,97 @@
+"""
+Benchmark do download em segmentos paralelos.
+
+Sobe um servidor HTTP local com suporte a Range que limita a banda de
+cada conexão (como fazem CDNs com formatos progressivos) e mede o tempo
+para baixar o mesmo arquivo com 1, 2, 4 e 8 conexões pelo yt-dlp, com o
+RangeDownloader associado. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_range_download [--size-mb 8] [--rate-kb 1024]
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yt_dlp
+
+from src.services.range_downloader import RangeDownloader
+
+
+class _ThrottledHandler(BaseHTTPRequestHandler):
+    """Serve o arquivo com Range e banda limitada por conexão."""
+
+    protocol_version = "HTTP/1.1"
+    block = 16 * 1024
+
+    def do_GET(self) -> None:
+        data, rate = self.server.data, self.server.rate
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        start, end = 0, len(data) - 1
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else end
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(data)}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(end + 1 - start))
+        self.end_headers()
+
+        began = time.monotonic()
+        sent = 0
+        try:
+            for offset in range(start, end + 1, self.block):
+                chunk = data[offset:min(offset + self.block, end + 1)]
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                delay = sent / rate - (time.monotonic() - began)
+                if delay > 0:
+                    time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=8)
+    parser.add_argument('--rate-kb', type=int, default=1024, help="Banda por conexão em KiB/s")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ThrottledHandler)
+    server.daemon_threads = True
+    server.data = os.urandom(args.size_mb * 1024 ** 2)
+    server.rate = args.rate_kb * 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/video.mp4'
+
+    print(f"arquivo de {args.size_mb} MiB, {args.rate_kb} KiB/s por conexão")
+    print(f"{'conexões':>9}{'segundos':>10}{'MiB/s':>8}{'ganho':>7}")
+    baseline = None
+    try:
+        for connections in (1, 2, 4, 8):
+            with tempfile.TemporaryDirectory() as tmp, yt_dlp.YoutubeDL({
+                'quiet': True, 'noprogress': True, 'range_connections': connections,
+                'buffersize': 64 * 1024,
+            }) as ydl:
+                RangeDownloader.attach(ydl)
+                start = time.perf_counter()
+                ydl.dl(os.path.join(tmp, 'video.mp4'), {'id': 'bench', 'ext': 'mp4', 'url': url})
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{connections:>9}{elapsed:>10.2f}{args.size_mb / elapsed:>8.2f}{baseline / elapsed:>6.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Compara os perfis de desempenho numa fila de jobs simulada.
+
+Cada job simulado "baixa" por --seconds segundos, reportando progresso a
+cada 10 ms como o yt-dlp, e divide uma banda fixa com os jobs em
+paralelo. Para cada perfil mostra o tempo até esvaziar a fila e quantos
+eventos de progresso chegaram aos assinantes (cada evento é serializado
+e enviado a cada cliente do daemon). Ao fim mede o custo de uma recarga
+das configurações. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_settings_profiles [--jobs 16] [--seconds 0.5]
+"""
+
+import argparse
+import threading
+import time
+from unittest.mock import Mock
+
+from src.config.constants import DaemonConfig, SettingsConfig
+from src.config.settings import Settings
+from src.models.video_info import DownloadRequest
+from src.services.job_manager import JobManager
+
+
+def _fake_download(seconds: float, link_slots: int, active: list, lock: threading.Lock):
+    """Download simulado que fica mais lento quando há mais jobs que a banda comporta."""
+    def download(request, progress_callback, control):
+        progress_callback = control.wrap_progress_hook(progress_callback)
+        with lock:
+            active[0] += 1
+        try:
+            done = 0.0
+            while done < seconds:
+                time.sleep(0.01)
+                with lock:
+                    share = min(1.0, link_slots / active[0])
+                done += 0.01 * share
+                progress_callback({'status': 'downloading', '_percent_str': f"{100 * done / seconds:.1f}%"})
+        finally:
+            with lock:
+                active[0] -= 1
+    return download
+
+
+def run_profile(profile, jobs: int, seconds: float, link_slots: int) -> dict:
+    """Esvazia uma fila de jobs simulados com o perfil aplicado."""
+    Settings(path=None, environ={}, profile=profile).load()
+    lock = threading.Lock()
+    service = Mock()
+    service.download.side_effect = _fake_download(seconds, link_slots, [0], lock)
+    manager = JobManager(download_service=service, max_concurrent=DaemonConfig.MAX_CONCURRENT_JOBS)
+    subscription = manager.subscribe()
+    manager.start()
+    started = time.monotonic()
+    for n in range(jobs):
+        manager.submit(DownloadRequest(f"https://www.youtube.com/watch?v={n}", "/tmp", "Melhor qualidade"))
+
+    progress = finished = 0
+    while finished < jobs:
+        event = subscription.get(timeout=60)
+        if event is None:
+            raise RuntimeError("a fila parou de produzir eventos")
+        if event['event'] == 'progress':
+            progress += 1
+        elif event['job']['status'] in ('completed', 'failed', 'cancelled'):
+            finished += 1
+    elapsed = time.monotonic() - started
+    subscription.close()
+    manager.shutdown()
+    return {'elapsed': elapsed, 'progress': progress, 'workers': DaemonConfig.MAX_CONCURRENT_JOBS}
+
+
+def main() -> None:
+    """Executa a fila com cada perfil e imprime a comparação."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=16, help="jobs na fila")
+    parser.add_argument('--seconds', type=float, default=0.5, help="duração de cada job sozinho")
+    parser.add_argument('--link-slots', type=int, default=4, help="jobs que a banda comporta sem dividir")
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs de {args.seconds:.1f}s, banda para {args.link_slots} em paralelo")
+    print(f"{'perfil':<16}{'workers':>8}{'tempo':>10}{'eventos':>10}")
+    for profile in [None] + sorted(SettingsConfig.PROFILES):
+        result = run_profile(profile, args.jobs, args.seconds, args.link_slots)
+        print(f"{profile or 'padrão':<16}{result['workers']:>8}{result['elapsed']:>9.2f}s{result['progress']:>10}")
+
+    settings = Settings(path=None, environ={}, profile='server')
+    settings.load()
+    rounds = 1000
+    started = time.perf_counter()
+    for _ in range(rounds):
+        settings.reload()
+    print(f"recarga sem mudanças: {(time.perf_counter() - started) / rounds * 1e6:.0f} µs")
+    Settings(path=None, environ={}).load()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark das atualizações de progresso na interface.
+
+Simula o fluxo de eventos de progresso do yt-dlp (várias chamadas por
+segundo, com percentual e ETA mudando mais devagar que os eventos) e
+compara o comportamento anterior, que reaplicava a folha de estilo do
+StatusLabel e a barra de progresso a cada evento, com o StatusLabel
+baseado em estados e a barra atualizada só quando o valor muda.
+Mede o tempo por atualização e conta as repinturas dos widgets.
+
+Uso:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_status_updates [--ticks 3000]
+"""
+
+import argparse
+import time
+
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication, QLabel, QProgressBar, QVBoxLayout, QWidget
+
+from src.ui.base_components import StatusLabel
+from src.config.constants import Colors
+
+
+class LegacyStatusLabel(QLabel):
+    """Reprodução do StatusLabel anterior, que aplicava a folha a cada chamada."""
+
+    def show_info(self, message: str) -> None:
+        """Exibe a mensagem reaplicando a folha de estilo."""
+        self.setText(message)
+        self.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; padding: 4px;")
+
+
+class PaintCounter(QObject):
+    """Filtro de eventos que conta repinturas."""
+
+    def __init__(self):
+        """Inicializa o contador."""
+        super().__init__()
+        self.paints = 0
+
+    def eventFilter(self, obj, event):
+        """Conta eventos de pintura sem interceptá-los."""
+        if event.type() == QEvent.Paint:
+            self.paints += 1
+        return False
+
+
+def _ticks(count: int):
+    """Gera (percentual, eta) como em um download: ~20 eventos por ponto percentual."""
+    for n in range(count):
+        percent = n * 100 // count
+        eta = (count - n) // 10
+        yield percent, eta
+
+
+def bench(app: QApplication, ticks: int, legacy: bool):
+    """Executa as atualizações e retorna (ms por atualização, repinturas)."""
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    status = LegacyStatusLabel() if legacy else StatusLabel()
+    bar = QProgressBar()
+    layout.addWidget(bar)
+    layout.addWidget(status)
+    window.show()
+    app.processEvents()
+
+    counter = PaintCounter()
+    status.installEventFilter(counter)
+    bar.installEventFilter(counter)
+
+    start = time.perf_counter()
+    for percent, eta in _ticks(ticks):
+        if legacy or percent != bar.value():
+            bar.setValue(percent)
+            bar.setFormat(f"{percent}%")
+        status.show_info(f"📥 Baixando... {percent}% - {eta}s restantes")
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    window.close()
+    return elapsed / ticks * 1000, counter.paints
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--ticks', type=int, default=3000)
+    args = parser.parse_args()
+
+    app = QApplication([])
+    bench(app, 200, legacy=True)  # aquecimento
+    legacy = bench(app, args.ticks, legacy=True)
+    current = bench(app, args.ticks, legacy=False)
+
+    print(f"{'modo':<12}{'ms/atualização':>16}{'repinturas':>12}")
+    print(f"{'anterior':<12}{legacy[0]:>16.3f}{legacy[1]:>12}")
+    print(f"{'estados':<12}{current[0]:>16.3f}{current[1]:>12}")
+    print(f"redução: {legacy[0] / current[0]:.1f}x no tempo, "
+          f"{legacy[1] / max(current[1], 1):.1f}x nas repinturas")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Mede a entrega a um consumidor: arquivo intermediário x pipe.
+
+Simula um pipeline (ex.: transcodificador) que consome o vídeo servido
+por um servidor HTTP local com banda limitada. No modo "arquivo", o
+vídeo é gravado por inteiro em disco e só então lido pelo consumidor;
+no modo "pipe", o consumidor lê de um os.pipe() enquanto o download
+acontece. Para cada modo mostra quando o consumidor recebeu o primeiro
+byte, quando terminou e quantos bytes o processo gravou em disco
+(/proc/self/io). Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_stream_sink [--size-mb 64] [--rate-mb 32]
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+from src.config.constants import DownloadFormats, StreamConfig
+from src.models.video_info import DownloadRequest
+from src.services.stream_sink import FileSink, MediaStreamer
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    """Serve o vídeo em blocos, respeitando a banda configurada."""
+
+    def do_GET(self) -> None:
+        server = self.server
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(server.payload)))
+        self.end_headers()
+        started = time.monotonic()
+        for offset in range(0, len(server.payload), StreamConfig.CHUNK_SIZE):
+            self.wfile.write(server.payload[offset:offset + StreamConfig.CHUNK_SIZE])
+            delay = started + (offset + StreamConfig.CHUNK_SIZE) / server.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def _disk_writes() -> int:
+    """Bytes gravados em disco pelo processo até agora."""
+    with open('/proc/self/io') as f:
+        fields = dict(line.split(': ') for line in f.read().splitlines())
+    return int(fields['write_bytes'])
+
+
+def _consume(read, first_byte: list) -> str:
+    """Consumidor: lê até o fim, marcando a chegada do primeiro byte."""
+    digest = hashlib.sha256()
+    while True:
+        data = read(StreamConfig.CHUNK_SIZE)
+        if not data:
+            return digest.hexdigest()
+        if not first_byte:
+            first_byte.append(time.monotonic())
+        digest.update(data)
+
+
+def run_file(streamer: MediaStreamer, request: DownloadRequest) -> dict:
+    """Grava o vídeo inteiro em um arquivo e então o entrega ao consumidor."""
+    first_byte = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'video.mp4')
+        started = time.monotonic()
+        with open(path, 'wb') as f:
+            streamer.stream(request, FileSink(f))
+            os.fsync(f.fileno())
+        with open(path, 'rb') as f:
+            digest = _consume(f.read, first_byte)
+        return {'first_byte': first_byte[0] - started, 'total': time.monotonic() - started, 'sha256': digest}
+
+
+def run_pipe(streamer: MediaStreamer, request: DownloadRequest) -> dict:
+    """Entrega o vídeo ao consumidor por um pipe, durante o download."""
+    first_byte = []
+    read_fd, write_fd = os.pipe()
+    result = {}
+    consumer = threading.Thread(
+        target=lambda: result.update(sha256=_consume(lambda n: os.read(read_fd, n), first_byte))
+    )
+    started = time.monotonic()
+    consumer.start()
+    sink = FileSink.open(write_fd)
+    streamer.stream(request, sink)
+    sink.close()
+    os.close(write_fd)
+    consumer.join()
+    os.close(read_fd)
+    return dict(result, first_byte=first_byte[0] - started, total=time.monotonic() - started)
+
+
+def main() -> None:
+    """Executa os dois modos e imprime a comparação."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=64, help="tamanho do vídeo")
+    parser.add_argument('--rate-mb', type=float, default=32.0, help="banda do servidor em MB/s")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _RateLimitedHandler)
+    server.daemon_threads = True
+    server.payload = os.urandom(args.size_mb * 1024 ** 2)
+    server.rate = args.rate_mb * 1024 ** 2
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    fmt = {'url': f"http://127.0.0.1:{server.server_address[1]}/video.mp4", 'protocol': 'http'}
+    streamer = MediaStreamer(cookie_manager=Mock(), ydl_pool=Mock())
+    streamer.resolve = Mock(return_value=(fmt, "video"))
+    request = DownloadRequest("bench", ".", DownloadFormats.DEFAULT)
+    expected = hashlib.sha256(server.payload).hexdigest()
+
+    print(f"{args.size_mb} MB a {args.rate_mb:.0f} MB/s")
+    print(f"{'modo':<10}{'1º byte':>10}{'total':>10}{'disco':>12}")
+    for name, run in (('arquivo', run_file), ('pipe', run_pipe)):
+        before = _disk_writes()
+        result = run(streamer, request)
+        written = _disk_writes() - before
+        assert result['sha256'] == expected, f"{name}: conteúdo diferente"
+        print(f"{name:<10}{result['first_byte']:>9.2f}s{result['total']:>9.2f}s{written / 1024 ** 2:>9.1f} MB")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
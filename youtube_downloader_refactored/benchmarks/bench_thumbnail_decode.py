@@ -0,0 +1,97 @@
+"""
+Benchmark do carregamento de thumbnails.
+
+Compara o caminho anterior (thumbnail maxres 1280x720 decodificada por
+inteiro em QImage, copiada para QPixmap e só então reduzida) com o
+atual (menor variante suficiente, 320x180, decodificada direto no
+tamanho de exibição com QImageReader). Mede bytes transferidos, maior
+buffer de pixels alocado e tempo. Não acessa a rede: as imagens são
+geradas em memória.
+
+Uso:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_thumbnail_decode [--runs 50]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, QSize
+from PyQt5.QtGui import QColor, QImage, QImageReader, QPainter, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from src.config.constants import ThumbnailConfig
+
+
+def _make_jpeg(width: int, height: int, seed: int = 3) -> bytes:
+    """Gera um JPEG com formas variadas (comprime como uma foto, não como cor sólida)."""
+    rng = random.Random(seed)
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(30, 30, 30))
+    painter = QPainter(image)
+    for _ in range(400):
+        painter.fillRect(
+            rng.randrange(width), rng.randrange(height),
+            rng.randrange(8, width // 4), rng.randrange(8, height // 4),
+            QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        )
+    painter.end()
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, 'JPG', 90)
+    return bytes(data)
+
+
+def decode_full(data: bytes, width: int, height: int):
+    """Caminho anterior: decodifica tudo, copia para QPixmap e reduz."""
+    image = QImage()
+    image.loadFromData(data)
+    pixmap = QPixmap(image)
+    return pixmap.scaled(width, height, Qt.KeepAspectRatio), image.sizeInBytes()
+
+
+def decode_scaled(data: bytes, width: int, height: int):
+    """Caminho atual: decodifica direto no tamanho de exibição."""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    reader.setScaledSize(reader.size().scaled(QSize(width, height), Qt.KeepAspectRatio))
+    image = reader.read()
+    return QPixmap.fromImage(image), image.sizeInBytes()
+
+
+def _time(fn, data: bytes, runs: int):
+    """Tempo médio por chamada (ms) e maior buffer de pixels (bytes)."""
+    width, height = ThumbnailConfig.WIDTH, ThumbnailConfig.HEIGHT
+    _, peak = fn(data, width, height)
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn(data, width, height)
+    return (time.perf_counter() - start) / runs * 1000, peak
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)  # QPixmap exige a aplicação
+    maxres = _make_jpeg(1280, 720)
+    medium = _make_jpeg(320, 180)
+
+    full_ms, full_peak = _time(decode_full, maxres, args.runs)
+    scaled_ms, scaled_peak = _time(decode_scaled, medium, args.runs)
+
+    print(f"{'caminho':<22}{'KiB baixados':>14}{'KiB de pixels':>15}{'ms':>8}")
+    print(f"{'maxres + scaled()':<22}{len(maxres) / 1024:>14.1f}{full_peak / 1024:>15.0f}{full_ms:>8.2f}")
+    print(f"{'variante + leitor':<22}{len(medium) / 1024:>14.1f}{scaled_peak / 1024:>15.0f}{scaled_ms:>8.2f}")
+    print(f"redução: {len(maxres) / len(medium):.1f}x bytes, "
+          f"{full_peak / scaled_peak:.1f}x memória, {full_ms / scaled_ms:.1f}x tempo")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Mede memória e threads numa sessão longa: uma QThread por download x pool.
+
+Simula milhares de downloads seguidos pela interface. No modo "legado",
+cada download cria uma QThread nova, conecta seus sinais e a atribui a
+um único atributo, como a janela fazia antes; no modo "pool", os
+downloads são tarefas executadas pelo DownloadWorkerPool. A cada bloco
+de downloads mostra a memória residente (/proc/self/statm), as threads
+conhecidas pelo Python, os objetos QThread ainda vivos, quantas threads
+do sistema foram criadas até ali e o custo médio de um download vazio
+no bloco. Não acessa a rede.
+
+Uso:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_worker_lifecycle [--downloads 5000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import threading
+import time
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QThread, pyqtSignal
+
+from src.models.video_info import DownloadRequest
+from src.services.job_control import JobControl
+from src.ui.download_worker import DownloadWorkerPool, LocalDownloadTask
+
+
+class _FakeService:
+    """Download simulado com alguns eventos de progresso e buffers por job."""
+
+    def download(self, request, progress_callback, control):
+        progress_callback = control.wrap_progress_hook(progress_callback)
+        buffer = bytearray(64 * 1024)
+        for n in range(1, 6):
+            progress_callback({'status': 'downloading', '_percent_str': f"{n * 20}.0%"})
+        del buffer
+
+
+class _LegacyThread(QThread):
+    """Uma thread por download, como a antiga DownloadThread."""
+
+    progress_signal = pyqtSignal(dict)
+    finished_signal = pyqtSignal(str)
+
+    def __init__(self, request, service):
+        super().__init__()
+        self._request = request
+        self._service = service
+        self._control = JobControl()
+
+    def run(self):
+        self._service.download(self._request, self.progress_signal.emit, self._control)
+        self.finished_signal.emit("success")
+
+
+def _rss_mb() -> float:
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+
+
+def _live_qthreads() -> int:
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, QThread))
+
+
+def run_legacy(app, downloads: int, report) -> None:
+    """Cria uma QThread por download e a substitui pela próxima, sem deleteLater."""
+    service = _FakeService()
+    holder = {}
+    created = 0
+    for n in range(downloads):
+        loop = QEventLoop()
+        thread = _LegacyThread(DownloadRequest(f"https://youtu.be/{n}", "/tmp", "Melhor qualidade"), service)
+        thread.progress_signal.connect(lambda data: None)
+        # Esperar só finished_signal e trocar a thread aborta o processo
+        # ("QThread: Destroyed while thread is still running")
+        thread.finished.connect(loop.quit)
+        holder['thread'] = thread
+        thread.start()
+        created += 1
+        loop.exec_()
+        report(n + 1, created)
+
+
+def run_pool(app, downloads: int, report) -> None:
+    """Executa os downloads como tarefas de um pool fixo."""
+    service = _FakeService()
+    pool = DownloadWorkerPool(size=1)
+    pool.progress_signal.connect(lambda task_id, data: None)
+    loop = QEventLoop()
+    pool.finished_signal.connect(lambda task_id, result: loop.quit())
+    for n in range(downloads):
+        pool.submit(LocalDownloadTask(DownloadRequest(f"https://youtu.be/{n}", "/tmp", "Melhor qualidade"), service))
+        loop.exec_()
+        report(n + 1, pool.size)
+    pool.shutdown()
+
+
+def main() -> None:
+    """Executa os dois modos e imprime a evolução de memória e threads."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--downloads', type=int, default=5000, help="downloads simulados por modo")
+    parser.add_argument('--every', type=int, default=1000, help="intervalo entre amostras")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    for name, run in (('legado', run_legacy), ('pool', run_pool)):
+        print(f"\n{name}")
+        print(f"{'downloads':>10}{'RSS (MB)':>10}{'threads':>9}{'QThreads':>10}{'criadas':>9}{'µs/download':>13}")
+        start_threads = threading.active_count()
+        block_started = [time.perf_counter()]
+
+        def report(done, created):
+            if done % args.every == 0:
+                per_download = (time.perf_counter() - block_started[0]) / args.every * 1e6
+                gc.collect()
+                print(f"{done:>10}{_rss_mb():>10.1f}{threading.active_count() - start_threads:>+9}"
+                      f"{_live_qthreads():>10}{created:>9}{per_download:>13.0f}")
+                block_started[0] = time.perf_counter()
+        run(app, args.downloads, report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark da latência de extração com o cache do yt-dlp.
+
+Extrai o mesmo vídeo várias vezes, cada vez com uma instância nova do
+YoutubeDL (sem o cache em memória do extrator), primeiro com o cache
+em disco vazio e depois com ele já preenchido, e mostra a latência e
+os acertos do cache. Acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_ydl_cache [--url URL] [--rounds 3] [--cookies ARQUIVO]
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+from typing import List, Optional
+
+import yt_dlp
+
+from src.config.constants import CacheConfig
+from src.services.ydl_cache import YtDlpCache
+
+
+def _extract(cache: YtDlpCache, url: str, cookies_file: Optional[str]) -> float:
+    """Extrai o vídeo com uma instância nova e retorna a duração."""
+    options = {'quiet': True, 'no_warnings': True}
+    if cookies_file:
+        options['cookiefile'] = cookies_file
+    with yt_dlp.YoutubeDL(options) as ydl:
+        cache.attach(ydl)
+        start = time.perf_counter()
+        ydl.extract_info(url, download=False)
+        return time.perf_counter() - start
+
+
+def bench(url: str, rounds: int, cookies_file: Optional[str]) -> None:
+    """Mede extrações com o cache frio e quente e imprime o resultado."""
+    directory = tempfile.mkdtemp(prefix='ytdlp-cache-')
+    try:
+        cache = YtDlpCache(directory)
+        cold: List[float] = []
+        for _ in range(rounds):
+            shutil.rmtree(directory)
+            cold.append(_extract(cache, url, cookies_file))
+        cold_stats = cache.stats()
+
+        warm = [_extract(cache, url, cookies_file) for _ in range(rounds)]
+        warm_stats = cache.stats()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{'cache':<8}{'ms (mediana)':>14}{'acertos':>10}{'falhas':>10}")
+    print(f"{'frio':<8}{statistics.median(cold) * 1000:>14.0f}"
+          f"{cold_stats.hits:>10}{cold_stats.misses:>10}")
+    print(f"{'quente':<8}{statistics.median(warm) * 1000:>14.0f}"
+          f"{warm_stats.hits - cold_stats.hits:>10}{warm_stats.misses - cold_stats.misses:>10}")
+    print(f"tamanho do cache: {warm_stats.size_bytes / 1024:.0f} KiB")
+
+
+def main() -> None:
+    """Executa o benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default=CacheConfig.WARM_URL)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--cookies', default=None, help="arquivo de cookies (opcional)")
+    args = parser.parse_args()
+
+    yt_dlp.YoutubeDL({'quiet': True})  # aquece imports e plugins
+    bench(args.url, args.rounds, args.cookies)
+
+
+if __name__ == '__main__':
+    main()
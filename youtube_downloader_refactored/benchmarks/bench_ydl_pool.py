@@ -0,0 +1,86 @@
+"""
+Benchmark do overhead por job do yt-dlp.
+
+Compara criar um yt_dlp.YoutubeDL novo a cada job (com leitura do
+arquivo de cookies) contra retirar uma instância do YoutubeDLPool
+com o cookie jar compartilhado. Não acessa a rede.
+
+Uso:
+    python -m benchmarks.bench_ydl_pool [--jobs 50]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import yt_dlp
+
+from src.services.cookie_manager import CookieJarManager
+from src.services.ydl_pool import YoutubeDLPool
+
+OPTIONS = {
+    'quiet': True,
+    'noprogress': True,
+    'merge_output_format': 'mp4',
+    'postprocessors': [{'key': 'FFmpegVideoConvertor', 'preferedformat': 'mp4'}],
+}
+
+
+def _write_cookies(path: str, count: int = 200) -> None:
+    """Gera um arquivo de cookies Netscape de tamanho realista."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Netscape HTTP Cookie File\n")
+        for i in range(count):
+            f.write(f".youtube.com\tTRUE\t/\tTRUE\t1999999999\tC{i}\t{'v' * 40}\n")
+
+
+def bench_fresh(jobs: int, cookies_file: str) -> float:
+    """Tempo médio por job criando uma instância nova (comportamento anterior)."""
+    start = time.perf_counter()
+    for n in range(jobs):
+        options = dict(OPTIONS, cookiefile=cookies_file, outtmpl=f'/tmp/{n}.%(ext)s',
+                       progress_hooks=[lambda d: None])
+        with yt_dlp.YoutubeDL(options) as ydl:
+            ydl.cookiejar  # força a leitura dos cookies, como em um job real
+    return (time.perf_counter() - start) / jobs
+
+
+def bench_pool(jobs: int, cookies_file: str) -> float:
+    """Tempo médio por job retirando instâncias do pool."""
+    pool = YoutubeDLPool(CookieJarManager(cookies_file))
+    with pool.checkout(OPTIONS):
+        pass  # aquecimento: a primeira instância é criada fora da medição
+
+    start = time.perf_counter()
+    for n in range(jobs):
+        options = dict(OPTIONS, outtmpl=f'/tmp/{n}.%(ext)s', progress_hooks=[lambda d: None])
+        with pool.checkout(options) as ydl:
+            ydl.cookiejar
+    elapsed = (time.perf_counter() - start) / jobs
+    pool.clear()
+    return elapsed
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookies_file = os.path.join(tmp, 'cookies.txt')
+        _write_cookies(cookies_file)
+
+        yt_dlp.YoutubeDL({'quiet': True})  # aquece imports e plugins
+        fresh = bench_fresh(args.jobs, cookies_file)
+        pooled = bench_pool(args.jobs, cookies_file)
+
+    print(f"{'modo':<12}{'ms/job':>10}")
+    print(f"{'novo':<12}{fresh * 1000:>10.2f}")
+    print(f"{'pool':<12}{pooled * 1000:>10.2f}")
+    print(f"redução: {fresh / pooled:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,18 +4,450 @@ Ponto de entrada da aplicação YouTube Gamer DL.
 Este módulo inicializa e executa a aplicação.
 """
 
+import argparse
 import sys
-from src.app_controller import AppController
+from typing import List, Optional
+
+from src.utils.startup_metrics import StartupMetrics
+
+# Origem das métricas de inicialização: o mais cedo possível no processo
+StartupMetrics.shared()
+
+from src.config.constants import (  # noqa: E402
+    DaemonConfig, DownloadFormats, FarmConfig, LiveConfig, SettingsConfig
+)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Interpreta os argumentos de linha de comando.
+
+    Args:
+        argv: Argumentos a interpretar (padrão: sys.argv)
+
+    Returns:
+        Argumentos interpretados
+    """
+    parser = argparse.ArgumentParser(description="YouTube Gamer DL")
+    parser.add_argument(
+        '--daemon', action='store_true',
+        help="Executa apenas o motor de download, servindo uma API HTTP local"
+    )
+    parser.add_argument('--host', default=DaemonConfig.HOST, help="Endereço do daemon")
+    parser.add_argument('--port', type=int, default=DaemonConfig.PORT, help="Porta do daemon")
+    parser.add_argument(
+        '--connect', action='store_true',
+        help="Usa um daemon já em execução em vez de um motor próprio"
+    )
+    parser.add_argument(
+        '--processes', action='store_true',
+        help="Executa extrações e downloads em processos separados (escapa do GIL)"
+    )
+    parser.add_argument(
+        '--worker', action='store_true',
+        help="Executa um worker que consome a fila compartilhada de downloads"
+    )
+    parser.add_argument(
+        '--enqueue', nargs='+', metavar='URL',
+        help="Adiciona URLs à fila compartilhada e sai"
+    )
+    parser.add_argument('--queue', default=FarmConfig.DB_PATH, help="Arquivo da fila compartilhada")
+    parser.add_argument(
+        '--concurrency', type=int, default=1, help="Downloads simultâneos do worker"
+    )
+    parser.add_argument(
+        '--sync', nargs='*', metavar='URL',
+        help="Baixa só os vídeos novos dos canais/playlists (sem URLs: todos os já registrados)"
+    )
+    parser.add_argument(
+        '--sync-baseline', action='store_true',
+        help="Com --sync, registra os vídeos atuais como vistos sem baixá-los"
+    )
+    parser.add_argument(
+        '--record-live', metavar='URL',
+        help="Grava uma transmissão ao vivo em arquivos rotativos até ela terminar"
+    )
+    parser.add_argument(
+        '--from-start', action='store_true',
+        help="Com --record-live, começa pelo início da janela da transmissão, e não pela borda ao vivo"
+    )
+    parser.add_argument(
+        '--segment-seconds', type=float, default=LiveConfig.SEGMENT_SECONDS,
+        help="Com --record-live, duração de cada arquivo gravado"
+    )
+    parser.add_argument(
+        '--keep-segments', type=int, default=LiveConfig.KEEP_SEGMENTS,
+        help="Com --record-live, arquivos mantidos no destino (0 = todos)"
+    )
+    parser.add_argument(
+        '--stream', metavar='URL',
+        help="Envia o vídeo para a saída padrão ou um pipe, sem gravar arquivo"
+    )
+    parser.add_argument(
+        '--output', default='-', metavar='DESTINO',
+        help="Com --stream, destino dos bytes: '-' (saída padrão), fd:N ou um pipe nomeado"
+    )
+    parser.add_argument(
+        '--save-path', help="Pasta de destino dos itens enfileirados ou sincronizados (padrão: pasta atual)"
+    )
+    parser.add_argument(
+        '--format', choices=DownloadFormats.get_format_keys(),
+        help=f"Formato dos itens enfileirados, sincronizados ou enviados (padrão: {DownloadFormats.DEFAULT})"
+    )
+    parser.add_argument(
+        '--store-gc', action='store_true',
+        help="Remove do armazenamento por conteúdo os arquivos que nenhum destino usa mais"
+    )
+    parser.add_argument(
+        '--no-prewarm', action='store_true',
+        help="Não prepara a janela de download durante a tela de login"
+    )
+    parser.add_argument(
+        '--startup-report', action='store_true',
+        help="Imprime ao sair o tempo até o primeiro download e outras métricas"
+    )
+    parser.add_argument(
+        '--profile', choices=sorted(SettingsConfig.PROFILES),
+        help="Perfil de desempenho (sobrepõe YTGDL_PROFILE e o arquivo de configurações)"
+    )
+    parser.add_argument(
+        '--settings', default=SettingsConfig.FILE, metavar='ARQUIVO',
+        help="Arquivo JSON de configurações de desempenho"
+    )
+    parser.add_argument(
+        '--show-settings', action='store_true',
+        help="Imprime as configurações efetivas e a origem de cada valor"
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def run_daemon(host: str, port: int, use_processes: bool = False) -> int:
+    """
+    Executa o daemon de downloads até ser interrompido.
+
+    Args:
+        host: Endereço de escuta
+        port: Porta de escuta
+        use_processes: Se True, extrações e downloads rodam em processos separados
+
+    Returns:
+        Código de saída
+    """
+    import signal
+    import threading
+
+    from src.config.settings import Settings
+    from src.models.exceptions import SettingsError
+    from src.services.daemon_server import DownloadDaemon
+    from src.services.job_manager import JobManager
+    from src.services.process_backend import ProcessBackend
+
+    manager = backend = None
+    if use_processes:
+        total = DaemonConfig.TOTAL_RATE_LIMIT
+        backend = ProcessBackend(
+            rate_limit=total // DaemonConfig.MAX_CONCURRENT_JOBS if total else None,
+            record_history=True
+        )
+        manager = JobManager(download_service=backend, video_info_service=backend)
+
+    daemon = DownloadDaemon(manager=manager, video_info_service=backend, host=host, port=port)
+    print(f"Daemon de downloads escutando em {daemon.address}")
+
+    def reload_settings():
+        settings = Settings.shared()
+        try:
+            changed = settings.reload()
+        except SettingsError as e:
+            print(f"Configurações mantidas: {e}", file=sys.stderr)
+            return
+        print(f"Configurações recarregadas: {', '.join(changed) or 'nada mudou'}", file=sys.stderr)
+        restart = settings.restart_required(changed)
+        if restart:
+            print(f"Só valem após reiniciar: {', '.join(restart)}", file=sys.stderr)
+
+    if hasattr(signal, 'SIGHUP'):
+        # Recarrega fora do handler: os ouvintes podem precisar de bloqueios
+        signal.signal(signal.SIGHUP, lambda *_: threading.Thread(target=reload_settings, daemon=True).start())
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if backend is not None:
+            backend.shutdown()
+    return 0
+
+
+def run_worker(queue_path: str, concurrency: int, use_processes: bool = False) -> int:
+    """
+    Executa um worker da fila compartilhada até ser interrompido.
+
+    Args:
+        queue_path: Arquivo SQLite da fila
+        concurrency: Downloads simultâneos
+        use_processes: Se True, os downloads rodam em processos separados
+
+    Returns:
+        Código de saída
+    """
+    from src.services.farm_worker import FarmWorker
+    from src.services.process_backend import ProcessBackend
+    from src.services.work_queue import WorkQueue
+
+    backend = ProcessBackend(record_history=True) if use_processes else None
+    worker = FarmWorker(WorkQueue(queue_path), download_service=backend, concurrency=concurrency)
+    print(f"Worker {worker.worker_id} consumindo {queue_path}")
+    try:
+        worker.run_forever()
+    finally:
+        if backend is not None:
+            backend.shutdown()
+    return 0
+
+
+def run_enqueue(queue_path: str, urls: List[str], save_path: str, format_choice: str) -> int:
+    """
+    Adiciona downloads à fila compartilhada.
+
+    Args:
+        queue_path: Arquivo SQLite da fila
+        urls: URLs a baixar
+        save_path: Pasta de destino (vista pelos workers)
+        format_choice: Formato escolhido
+
+    Returns:
+        Código de saída
+    """
+    from src.models.video_info import DownloadRequest
+    from src.services.work_queue import WorkQueue
+
+    ids = WorkQueue(queue_path).enqueue_many(
+        DownloadRequest(url, save_path, format_choice) for url in urls
+    )
+    print(f"{len(ids)} item(ns) adicionado(s) à fila {queue_path}")
+    return 0
+
+
+def run_sync(
+    urls: List[str],
+    save_path: Optional[str],
+    format_choice: Optional[str],
+    baseline: bool = False
+) -> int:
+    """
+    Sincroniza canais e playlists, baixando apenas os vídeos novos.
+
+    Args:
+        urls: Fontes a sincronizar (vazio = todas as registradas)
+        save_path: Pasta de destino (None = a registrada para cada fonte)
+        format_choice: Formato (None = o registrado para cada fonte)
+        baseline: Se True, marca os vídeos atuais como vistos sem baixá-los
+
+    Returns:
+        Código de saída (1 se alguma fonte ou download falhou)
+    """
+    from src.services.channel_sync import ChannelSync
+
+    sync = ChannelSync()
+    if urls:
+        results = [sync.sync(url, save_path, format_choice, baseline) for url in urls]
+    else:
+        results = sync.sync_all()
+
+    failed = False
+    for result in results:
+        if result.error:
+            failed = True
+            print(f"{result.url}: erro na enumeração: {result.error}")
+            continue
+        failed = failed or bool(result.failed)
+        action = "marcado(s)" if baseline else "baixado(s)"
+        print(f"{result.url}: {len(result.downloaded)} novo(s) {action}, {len(result.failed)} falha(s), "
+              f"{result.enumerated} item(ns) percorrido(s) em {result.elapsed:.1f}s")
+    return 1 if failed else 0
+
+
+def run_record_live(
+    url: str,
+    save_path: str,
+    format_choice: str,
+    from_start: bool,
+    segment_seconds: float,
+    keep_segments: int
+) -> int:
+    """
+    Grava uma transmissão ao vivo até ela terminar ou ser interrompida (Ctrl+C).
+
+    Args:
+        url: URL da transmissão
+        save_path: Pasta de destino
+        format_choice: Formato (define a altura máxima da variante gravada)
+        from_start: Se True, começa pelo início da janela da transmissão
+        segment_seconds: Duração de cada arquivo gravado
+        keep_segments: Arquivos mantidos no destino (0 = todos)
+
+    Returns:
+        Código de saída
+    """
+    from src.models.exceptions import DownloadError
+    from src.models.video_info import DownloadRequest
+    from src.services.job_control import JobControl
+    from src.services.live_recorder import LiveRecorder
+
+    recorder = LiveRecorder(segment_seconds=segment_seconds, keep_segments=keep_segments)
+    request = DownloadRequest(url, save_path, format_choice, live=True, live_from_start=from_start)
+    control = JobControl()
+
+    def report(data):
+        if data['status'] == 'downloading':
+            print(f"\r{data['live_duration']:.0f}s gravados, {data['downloaded_bytes'] / 1024 ** 2:.1f} MB",
+                  end='', flush=True)
+
+    try:
+        files = recorder.record(request, report, control)
+    except KeyboardInterrupt:
+        print("\nGravação interrompida.")
+        return 0
+    except DownloadError as e:
+        print(f"\nErro na gravação: {e}")
+        return 1
+    print(f"\n{len(files)} arquivo(s) gravado(s) em {save_path}")
+    for event in control.stats.events:
+        print(f"  {event['kind']}: {event['detail']}")
+    return 0
+
+
+def run_stream(url: str, output: str, format_choice: str) -> int:
+    """
+    Envia um vídeo para a saída padrão ou um pipe, sem gravar arquivo.
+
+    As mensagens vão para a saída de erros, pois a saída padrão pode
+    ser o próprio destino.
+
+    Args:
+        url: URL do vídeo
+        output: '-' (saída padrão), fd:N ou caminho de um pipe nomeado
+        format_choice: Formato (precisa de um stream sem mesclagem)
+
+    Returns:
+        Código de saída
+    """
+    from src.models.exceptions import DownloadError
+    from src.models.video_info import DownloadRequest
+    from src.services.download_service import DownloadService
+    from src.services.stream_sink import FileSink
+
+    def report(data):
+        if data['status'] == 'downloading':
+            print(f"\r{data['downloaded_bytes'] / 1024 ** 2:.1f} MB enviados", end='', file=sys.stderr, flush=True)
+
+    try:
+        sink = FileSink.open(output)
+    except (OSError, ValueError) as e:
+        print(f"Destino inválido: {e}", file=sys.stderr)
+        return 1
+    try:
+        result = DownloadService().stream(DownloadRequest(url, '.', format_choice), sink, report)
+    except KeyboardInterrupt:
+        print("\nEnvio interrompido.", file=sys.stderr)
+        return 1
+    except DownloadError as e:
+        print(f"\nErro no envio: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sink.close()
+    print(f"\n{result['title']} ({result['format_id']}, {result['ext']}): "
+          f"{result['bytes'] / 1024 ** 2:.1f} MB enviados para {sink.name}", file=sys.stderr)
+    return 0
+
+
+def run_store_gc() -> int:
+    """
+    Executa a coleta de lixo do armazenamento por conteúdo.
+
+    Returns:
+        Código de saída
+    """
+    from src.services.content_store import ContentStore
+
+    store = ContentStore.shared()
+    removed, freed = store.collect_garbage()
+    stats = store.stats()
+    print(f"{removed} objeto(s) removido(s), {freed / 1024 ** 2:.1f} MB liberados")
+    print(f"{stats.objects} objeto(s) para {stats.references} arquivo(s), "
+          f"{stats.saved_bytes / 1024 ** 2:.1f} MB economizados")
+    return 0
+
+
+def show_settings() -> int:
+    """
+    Imprime as configurações efetivas.
+
+    Returns:
+        Código de saída
+    """
+    from src.config.settings import Settings
+
+    settings = Settings.shared().to_dict()
+    print(f"Perfil: {settings['profile'] or 'nenhum'}  Arquivo: {settings['file']}")
+    for key, item in settings['settings'].items():
+        print(f"{key:<32}{item['value']!s:<24}{item['source']}")
+    return 0
 
 
 def main() -> int:
     """
     Função principal da aplicação.
-    
+
     Returns:
         Código de saída da aplicação
     """
-    controller = AppController()
+    args = parse_args()
+
+    # Antes de importar os serviços: alguns leem os limites ao serem criados
+    from src.config.settings import Settings
+    from src.models.exceptions import SettingsError
+    try:
+        Settings.configure(args.settings, args.profile)
+    except SettingsError as e:
+        print(f"Configurações inválidas: {e}", file=sys.stderr)
+        return 2
+
+    if args.show_settings:
+        return show_settings()
+    if args.daemon:
+        return run_daemon(args.host, args.port, args.processes)
+    if args.worker:
+        return run_worker(args.queue, args.concurrency, args.processes)
+    if args.enqueue:
+        return run_enqueue(
+            args.queue, args.enqueue, args.save_path or '.', args.format or DownloadFormats.DEFAULT
+        )
+    if args.record_live:
+        return run_record_live(
+            args.record_live, args.save_path or '.', args.format or DownloadFormats.DEFAULT,
+            args.from_start, args.segment_seconds, args.keep_segments
+        )
+    if args.stream:
+        return run_stream(args.stream, args.output, args.format or DownloadFormats.DEFAULT)
+    if args.sync is not None:
+        return run_sync(args.sync, args.save_path, args.format, args.sync_baseline)
+    if args.store_gc:
+        return run_store_gc()
+
+    from src.app_controller import AppController
+    from src.services.daemon_client import DaemonClient
+
+    daemon_client = None
+    if args.connect:
+        daemon_client = DaemonClient(f"http://{args.host}:{args.port}")
+
+    controller = AppController(
+        daemon_client, prewarm=not args.no_prewarm, report_startup=args.startup_report,
+        use_processes=args.processes
+    )
     return controller.run()
 
 
@@ -6,11 +6,21 @@ Aplica o padrão Controller do MVC.
 """
 
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from PyQt5.QtWidgets import QApplication
 
 from .ui.login_window import LoginWindow
-from .ui.downloader_window import DownloaderWindow
+from .ui.prewarm_thread import PrewarmThread
+from .services.daemon_client import DaemonClient
+from .utils.startup_metrics import StartupMetrics
+
+if TYPE_CHECKING:
+    from .ui.downloader_window import DownloaderWindow
+
+
+def _import_downloader() -> None:
+    """Importa a janela de download e suas dependências (inclui o yt-dlp)."""
+    from .ui import downloader_window  # noqa: F401
 
 
 class AppController:
@@ -19,19 +29,68 @@ class AppController:
     
     Responsável por inicializar a aplicação e gerenciar
     a transição entre as janelas de login e download.
+    
+    Enquanto a tela de login está aberta, a janela de download é
+    preparada em background: o yt-dlp é importado fora da thread da
+    interface, a janela é construída oculta e os serviços deixam uma
+    instância do yt-dlp e o cookie jar prontos para o primeiro uso.
     """
     
-    def __init__(self):
-        """Inicializa o controlador da aplicação."""
+    def __init__(
+        self,
+        daemon_client: Optional[DaemonClient] = None,
+        prewarm: bool = True,
+        report_startup: bool = False,
+        use_processes: bool = False
+    ):
+        """
+        Inicializa o controlador da aplicação.
+        
+        Args:
+            daemon_client: Cliente do daemon; se informado, a janela de
+                download atua como cliente fino do motor compartilhado
+            prewarm: Se True, prepara a janela de download durante o login
+            report_startup: Se True, imprime as métricas de inicialização ao sair
+            use_processes: Se True, extrações e downloads rodam em processos separados
+        """
+        self._metrics = StartupMetrics.shared()
         self._app = QApplication(sys.argv)
+        self._daemon_client = daemon_client
+        self._prewarm = prewarm
+        self._report_startup = report_startup
+        self._use_processes = use_processes
         self._login_window = LoginWindow(self._open_downloader)
-        self._downloader_window: Optional[DownloaderWindow] = None
+        self._downloader_window: Optional['DownloaderWindow'] = None
+        self._prewarm_thread: Optional[PrewarmThread] = None
+    
+    def _start_prewarm(self) -> None:
+        """Importa as dependências da janela de download em background."""
+        self._prewarm_thread = PrewarmThread([_import_downloader])
+        self._prewarm_thread.finished.connect(self._on_imports_ready)
+        self._prewarm_thread.start()
+    
+    def _on_imports_ready(self) -> None:
+        """Constrói a janela oculta e aquece seus serviços em background."""
+        window = self._ensure_downloader()
+        window.ensurePolished()
+        self._prewarm_thread = PrewarmThread([window.prewarm])
+        self._prewarm_thread.finished.connect(
+            lambda: self._metrics.mark(StartupMetrics.PREWARM_DONE)
+        )
+        self._prewarm_thread.start()
+    
+    def _ensure_downloader(self) -> 'DownloaderWindow':
+        """Retorna a janela de download, criando-a se necessário."""
+        if self._downloader_window is None:
+            from .ui.downloader_window import DownloaderWindow
+            self._downloader_window = DownloaderWindow(self._daemon_client, self._use_processes)
+        return self._downloader_window
     
     def _open_downloader(self) -> None:
         """Abre a janela de download após login bem-sucedido."""
-        if self._downloader_window is None:
-            self._downloader_window = DownloaderWindow()
-        self._downloader_window.show()
+        self._metrics.mark(StartupMetrics.LOGIN_SUCCEEDED)
+        self._ensure_downloader().show()
+        self._metrics.mark(StartupMetrics.DOWNLOADER_SHOWN)
     
     def run(self) -> int:
         """
@@ -41,4 +100,13 @@ class AppController:
             Código de saída da aplicação
         """
         self._login_window.show()
-        return self._app.exec_()
+        self._metrics.mark(StartupMetrics.LOGIN_SHOWN)
+        if self._prewarm:
+            self._start_prewarm()
+        
+        exit_code = self._app.exec_()
+        if self._prewarm_thread is not None:
+            self._prewarm_thread.wait()
+        if self._report_startup:
+            print(self._metrics.report(), file=sys.stderr)
+        return exit_code
@@ -5,8 +5,12 @@ Centraliza todas as constantes, estilos CSS e configurações visuais
 para facilitar manutenção e evitar repetição.
 """
 
+import os
+import tempfile
 from typing import Dict
 
+from ..models.format_policy import FormatPolicy
+
 
 class AppConstants:
     """Constantes gerais da aplicação."""
@@ -16,6 +20,237 @@ class AppConstants:
     BORDER_RADIUS = 16
     
 
+class DaemonConfig:
+    """Configurações do daemon local de downloads."""
+    
+    HOST = "127.0.0.1"
+    PORT = 8765
+    MAX_CONCURRENT_JOBS = 2
+    TOTAL_RATE_LIMIT = None  # bytes/s divididos entre os slots; None = sem limite
+    EVENT_QUEUE_SIZE = 1000
+    MAX_FINISHED_JOBS = 500
+    PROGRESS_INTERVAL = 0.0  # segundos mínimos entre eventos de progresso de um job (0 = todos)
+    
+
+class FarmConfig:
+    """Fila de trabalho compartilhada entre máquinas (modo worker)."""
+    
+    DB_PATH = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "farm.db")
+    LEASE_SECONDS = 60.0  # sem renovação nesse prazo, o job volta à fila
+    HEARTBEAT_INTERVAL = 15.0  # segundos entre renovações da concessão
+    POLL_INTERVAL = 2.0  # espera quando a fila está vazia
+    MAX_ATTEMPTS = 3  # concessões expiradas antes de o job ser dado como falho
+    BUSY_TIMEOUT = 30.0  # segundos de espera pelo bloqueio do banco
+    ERROR_BACKOFF = 1.0  # espera após um erro da fila, dobrada a cada erro seguido
+    ERROR_BACKOFF_MAX = 60.0  # teto dessa espera
+    
+
+class SyncConfig:
+    """Espelhamento incremental de canais e playlists."""
+    
+    DB_PATH = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "sync.db")
+    KNOWN_STREAK = 20  # itens já vistos em sequência que encerram a enumeração
+    BUSY_TIMEOUT = 30.0  # segundos de espera pelo bloqueio do banco
+    
+
+class SchedulerConfig:
+    """Ordem de execução dos jobs na fila do JobManager."""
+    
+    POLICY = "sjf"  # "fifo", "priority" ou "sjf" (menor tamanho estimado primeiro)
+    AGING_SECONDS = 300.0  # cada intervalo de espera sobe um nível de prioridade
+    UNKNOWN_SIZE = 500 * 1024 ** 2  # estimativa usada para jobs sem tamanho conhecido
+    PREEMPT = False  # pausa o job menos prioritário quando chega um mais prioritário
+    
+
+class BatchConfig:
+    """Resolução de metadados em lote (URLs arrastadas, coladas ou via API)."""
+    
+    MAX_WORKERS = 4  # igual ao máximo de instâncias ociosas do pool do yt-dlp
+    REQUESTS_PER_SECOND = 5.0  # None = sem limite
+    BURST = 5
+    
+
+class ProcessConfig:
+    """Execução de extrações e downloads em processos separados."""
+    
+    MAX_WORKERS = os.cpu_count() or 2  # processos de extração de metadados
+    START_METHOD = "forkserver"  # usa "spawn" onde não houver forkserver
+    POLL_INTERVAL = 0.1  # segundos entre repasses de comandos ao processo
+    CANCEL_GRACE = 5.0  # segundos até encerrar à força um processo cancelado
+
+
+class HistoryConfig:
+    """Histórico de downloads."""
+    
+    DB_PATH = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "history.db")
+    BATCH_SIZE = 200  # registros gravados por transação
+    FLUSH_INTERVAL = 0.5  # segundos de espera para acumular um lote
+    PAGE_SIZE = 200  # linhas carregadas por vez na tela de histórico
+    SEARCH_DELAY_MS = 150  # espera após a digitação antes de buscar
+
+
+class LogConfig:
+    """Registro por job das mensagens do yt-dlp."""
+
+    DIR = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "logs")
+    FILE_NAME = "jobs.log"
+    MAX_FILE_BYTES = 1024 ** 2  # tamanho de cada arquivo antes da rotação
+    BACKUP_COUNT = 3  # arquivos antigos mantidos
+    BUFFER_LINES = 500  # mensagens mais recentes guardadas em memória por job
+    VERBOSE = False  # inclui as mensagens de depuração do yt-dlp (mais custo por job)
+
+
+class CacheConfig:
+    """Cache em disco do yt-dlp (JavaScript do player e soluções de assinatura)."""
+
+    DIR = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "ytdlp-cache")
+    MAX_BYTES = 64 * 1024 ** 2  # acima disso os arquivos menos usados são removidos
+    WARM_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"  # vídeo curto e estável
+    WARM_ON_STARTUP = True  # aquece o cache no pré-aquecimento se estiver vazio
+    LATENCY_SAMPLES = 100  # extrações guardadas para as médias de latência
+
+
+class ThumbnailConfig:
+    """Carregamento das thumbnails exibidas na janela de download."""
+
+    WIDTH = 200
+    HEIGHT = 150
+    MAX_BYTES = 2 * 1024 ** 2  # imagens maiores são recusadas sem decodificar
+    CHUNK_SIZE = 16 * 1024
+    TIMEOUT = 10  # segundos
+
+
+class StorageConfig:
+    """Configurações de armazenamento dos downloads."""
+    
+    # Diretório local rápido onde fragmentos e intermediários da mesclagem
+    # ficam até o arquivo final ser movido ao destino; None = direto no destino
+    SCRATCH_DIR = os.path.join(tempfile.gettempdir(), "youtube_downloader")
+    SAFETY_MARGIN = 1.1  # folga sobre o tamanho estimado
+    MIN_FREE_BYTES = 200 * 1024 ** 2  # espaço que sempre deve sobrar no disco
+    
+
+class ContentStoreConfig:
+    """Armazenamento por conteúdo dos arquivos baixados (deduplicação)."""
+
+    ENABLED = False  # guarda cada arquivo uma vez e o liga às pastas de destino
+    # Precisa estar no mesmo sistema de arquivos dos destinos (links não cruzam discos)
+    DIR = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "store")
+    LINK_MODE = "auto"  # "auto" (reflink, senão hard link), "reflink" ou "hardlink"
+    HASH_CHUNK_SIZE = 1024 ** 2
+    BUSY_TIMEOUT = 30.0  # segundos de espera pelo bloqueio do índice
+
+
+class DownloadConfig:
+    """Opções do yt-dlp aplicadas a cada download."""
+    
+    RATE_LIMIT = None  # bytes/s por download quando o serviço não recebe um limite; None = sem limite
+    CONCURRENT_FRAGMENTS = 1  # fragmentos HLS/DASH baixados em paralelo por download
+
+
+class RangeConfig:
+    """Download de formatos progressivos em segmentos paralelos (HTTP Range)."""
+
+    CONNECTIONS = 1  # padrão por job; 1 = downloader nativo do yt-dlp
+    MAX_CONNECTIONS = 16
+    MIN_SEGMENT_BYTES = 1024 ** 2  # arquivos pequenos usam menos segmentos
+    PROGRESS_INTERVAL = 0.1  # segundos entre eventos de progresso agregados
+    STATE_INTERVAL = 1.0  # segundos entre gravações do estado para retomada
+
+
+class LiveConfig:
+    """Gravação de transmissões ao vivo (HLS) em arquivos rotativos."""
+
+    SEGMENT_SECONDS = 600.0  # duração de conteúdo por arquivo gravado
+    KEEP_SEGMENTS = 0  # arquivos mantidos no destino (0 = todos); os mais antigos são apagados
+    LIVE_EDGE_SEGMENTS = 3  # segmentos antes do fim da playlist onde a gravação começa
+    SEGMENT_RETRIES = 3  # novas tentativas de um segmento antes de ele ser dado como perdido
+    RECONNECT_DELAY = 1.0  # espera inicial após uma falha ao recarregar a playlist (dobra a cada falha)
+    RECONNECT_MAX_DELAY = 30.0
+    RERESOLVE_AFTER = 3  # falhas seguidas até pedir ao yt-dlp uma nova URL da playlist
+    RECONNECT_TIMEOUT = 600.0  # segundos sem playlist até a transmissão ser dada como encerrada
+    TIMEOUT = 15.0  # segundos por requisição
+    CHUNK_SIZE = 64 * 1024
+
+
+class StreamConfig:
+    """Configurações do envio da mídia para um pipe ou stream, sem arquivo em disco."""
+
+    CHUNK_SIZE = 64 * 1024  # bytes lidos da rede e entregues ao destino por vez
+    RETRIES = 5  # reconexões seguidas sem receber bytes antes de desistir
+    RETRY_DELAY = 1.0  # espera inicial entre reconexões (dobra a cada falha)
+    TIMEOUT = 20.0  # segundos por requisição
+    PROGRESS_INTERVAL = 0.5  # segundos entre eventos de progresso
+
+
+class ThrottleConfig:
+    """Detecção de estrangulamento e travamento das conexões de download."""
+    
+    WINDOW_SECONDS = 8.0  # janela de medição da velocidade
+    MIN_SPEED_RATIO = 0.3  # fração da velocidade de pico abaixo da qual há estrangulamento
+    MIN_SPEED = 50 * 1024  # bytes/s; abaixo disso é estrangulamento mesmo sem pico medido
+    RATE_LIMIT_FRACTION = 0.5  # com 'ratelimit', o piso absoluto não passa dessa fração do limite
+    STALL_TIMEOUT = 20  # segundos sem receber bytes até reconectar
+    BLOCK_SIZE = 64 * 1024  # leitura fixa: blocos grandes deixariam o monitor sem amostras
+    MAX_RESTARTS = 5
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 15.0
+    
+
+class SettingsConfig:
+    """Arquivo, variáveis de ambiente e perfis das configurações de desempenho."""
+    
+    FILE = os.path.join(os.path.expanduser("~"), ".youtube_gamer_dl", "settings.json")
+    ENV_PREFIX = "YTGDL_"  # ex.: YTGDL_DAEMON_MAX_CONCURRENT_JOBS=4, YTGDL_PROFILE=server
+    PROFILE = None  # perfil aplicado quando nem o arquivo nem o ambiente escolhem um
+    
+    PROFILES: Dict[str, Dict[str, object]] = {
+        # Poucos núcleos e bateria: pouca concorrência, cache pequeno, interface fluida
+        "laptop": {
+            "daemon.max_concurrent_jobs": 2,
+            "daemon.progress_interval": 0.25,
+            "download.concurrent_fragments": 2,
+            "batch.max_workers": 2,
+            "process.max_workers": 2,
+            "cache.max_bytes": 32 * 1024 ** 2,
+        },
+        # Muitos núcleos e banda: mais jobs e conexões, progresso esparso
+        "server": {
+            "daemon.max_concurrent_jobs": 8,
+            "daemon.progress_interval": 1.0,
+            "download.concurrent_fragments": 4,
+            "range.connections": 4,
+            "batch.max_workers": 8,
+            "batch.requests_per_second": 10.0,
+            "batch.burst": 10,
+            "cache.max_bytes": 256 * 1024 ** 2,
+            "range.progress_interval": 1.0,
+            "stream.progress_interval": 2.0,
+        },
+        # Conexão lenta ou instável: um job por vez, esperas longas, blocos pequenos
+        "low-bandwidth": {
+            "daemon.max_concurrent_jobs": 1,
+            "daemon.progress_interval": 1.0,
+            "download.concurrent_fragments": 1,
+            "range.connections": 1,
+            "batch.max_workers": 1,
+            "batch.requests_per_second": 1.0,
+            "batch.burst": 1,
+            "throttle.stall_timeout": 60,
+            "throttle.block_size": 16 * 1024,
+            "stream.chunk_size": 16 * 1024,
+            "stream.timeout": 60.0,
+        },
+    }
+
+
+class WorkerPoolConfig:
+    """Threads de download da interface, criadas uma vez e reaproveitadas."""
+    
+    SIZE = 1  # a janela baixa um vídeo por vez; a fila local é sequencial
+    SHUTDOWN_TIMEOUT_MS = 10_000  # espera pelos workers ao fechar a janela
+
+
 class WindowSize:
     """Dimensões das janelas."""
     
@@ -35,6 +270,7 @@ class Colors:
     TEXT_WHITE = "white"
     ACCENT = "#f04747"
     ACCENT_HOVER = "#d73737"
+    SUCCESS = "#43b581"
     BORDER = "#444"
     HOVER_BG = "#3c3f45"
 
@@ -127,23 +363,43 @@ class Styles:
         color: {Colors.ACCENT};
         font-weight: bold;
     """
+    
+    # Folha única do StatusLabel; o estado visual vem da propriedade "state"
+    STATUS_LABEL = f"""
+        QLabel {{
+            padding: 4px;
+            color: {Colors.TEXT_PRIMARY};
+        }}
+        QLabel[state="success"] {{
+            color: {Colors.SUCCESS};
+        }}
+        QLabel[state="error"] {{
+            color: {Colors.ACCENT};
+        }}
+    """
 
 
 class DownloadFormats:
-    """Formatos de download disponíveis."""
+    """Formatos de download disponíveis, descritos por políticas de seleção."""
+    
+    DEFAULT = "Melhor qualidade"
     
-    FORMATS: Dict[str, str] = {
-        "Melhor qualidade": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]",
-        "Qualidade até 720p": "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]",
-        "Áudio MP3": "bestaudio[ext=m4a]",
+    POLICIES: Dict[str, FormatPolicy] = {
+        "Melhor qualidade": FormatPolicy(),
+        "Qualidade até 720p": FormatPolicy(max_height=720),
+        "Economia de dados (até 480p)": FormatPolicy(max_height=480, min_audio_bitrate=64),
+        "Compatível H.264 (até 1080p)": FormatPolicy(
+            max_height=1080, video_codecs=('avc1',), audio_codecs=('mp4a',)
+        ),
+        "Áudio MP3": FormatPolicy(audio_only=True, containers=('m4a',)),
     }
     
     @classmethod
     def get_format_keys(cls):
         """Retorna lista de nomes dos formatos."""
-        return list(cls.FORMATS.keys())
+        return list(cls.POLICIES.keys())
     
     @classmethod
-    def get_format_string(cls, format_name: str) -> str:
-        """Retorna a string de formato do yt-dlp."""
-        return cls.FORMATS.get(format_name, 'best')
+    def get_policy(cls, format_name: str) -> FormatPolicy:
+        """Retorna a política de seleção de um formato."""
+        return cls.POLICIES.get(format_name, cls.POLICIES[cls.DEFAULT])
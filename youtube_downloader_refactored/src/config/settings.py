@@ -0,0 +1,350 @@
+"""
+Configurações de desempenho ajustáveis em tempo de execução.
+
+Os limites de concorrência, banda, cache e progresso ficam nas classes
+de constants.py (DaemonConfig, RangeConfig, ...), lidas pelos serviços.
+Settings define quais desses valores podem ser ajustados, com tipo e
+limites, e os aplica nessas classes a partir de, em ordem crescente de
+precedência:
+- um perfil nomeado (SettingsConfig.PROFILES: "laptop", "server", "low-bandwidth");
+- o arquivo JSON de configurações;
+- variáveis de ambiente (YTGDL_<SEÇÃO>_<NOME>).
+
+Um reload() valida tudo antes de aplicar qualquer valor: uma
+configuração inválida deixa os valores anteriores intactos. Jobs em
+andamento seguem com as opções com que começaram; os valores novos
+valem para os jobs seguintes, e os serviços de vida longa (ex.: o
+JobManager do daemon) recebem as mudanças pelos ouvintes registrados
+em subscribe(). Os itens com live=False só são lidos na inicialização
+e exigem reiniciar o processo.
+"""
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Tuple
+
+from .constants import (
+    BatchConfig, CacheConfig, DaemonConfig, DownloadConfig, LogConfig, ProcessConfig,
+    RangeConfig, SchedulerConfig, SettingsConfig, StorageConfig, StreamConfig, ThrottleConfig
+)
+from ..models.exceptions import SettingsError
+
+
+@dataclass(frozen=True)
+class Setting:
+    """Item ajustável: o atributo de uma classe de configuração, com tipo e limites."""
+
+    key: str  # "seção.nome", também usado no arquivo e no ambiente
+    owner: type
+    attribute: str
+    kind: type  # int, float, bool ou str
+    nullable: bool = False  # aceita None ("none" no ambiente)
+    minimum: Optional[float] = None
+    choices: Tuple[str, ...] = ()
+    live: bool = True  # False = só é lido na inicialização
+
+    _SIZE = re.compile(r'^(\d+(?:\.\d+)?)\s*([kmg]?)i?b?$', re.IGNORECASE)
+    _UNITS = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+
+    @property
+    def env_name(self) -> str:
+        """Nome da variável de ambiente que sobrepõe o item."""
+        return SettingsConfig.ENV_PREFIX + self.key.upper().replace('.', '_')
+
+    def parse(self, value: Any) -> Any:
+        """
+        Converte e valida um valor vindo do arquivo, do ambiente ou de um perfil.
+
+        Inteiros aceitam sufixos binários em texto ("64M", "1.5G").
+
+        Args:
+            value: Valor bruto
+
+        Returns:
+            Valor no tipo do item
+
+        Raises:
+            SettingsError: Se o valor não for válido para o item
+        """
+        if isinstance(value, str):
+            value = value.strip()
+            if value.lower() in ('none', 'null', ''):
+                value = None
+        if value is None:
+            if not self.nullable:
+                raise SettingsError(f"{self.key}: valor obrigatório")
+            return None
+        try:
+            parsed = self._convert(value)
+        except (TypeError, ValueError):
+            raise SettingsError(f"{self.key}: {value!r} não é um valor do tipo {self.kind.__name__}") from None
+        if self.minimum is not None and parsed < self.minimum:
+            raise SettingsError(f"{self.key}: {parsed} é menor que o mínimo {self.minimum:g}")
+        if self.choices and parsed not in self.choices:
+            raise SettingsError(f"{self.key}: {parsed!r} não está entre {', '.join(self.choices)}")
+        return parsed
+
+    def _convert(self, value: Any) -> Any:
+        """Converte o valor para o tipo do item."""
+        if self.kind is bool:
+            if isinstance(value, bool):
+                return value
+            text = str(value).lower()
+            if text in ('1', 'true', 'yes', 'on', 'sim'):
+                return True
+            if text in ('0', 'false', 'no', 'off', 'nao', 'não'):
+                return False
+            raise ValueError(value)
+        if isinstance(value, bool):
+            raise TypeError(value)
+        if self.kind is int:
+            if isinstance(value, str):
+                match = self._SIZE.match(value)
+                if not match:
+                    raise ValueError(value)
+                return int(float(match.group(1)) * self._UNITS[match.group(2).lower()])
+            if isinstance(value, float) and not value.is_integer():
+                raise ValueError(value)
+            return int(value)
+        if self.kind is float:
+            return float(value)
+        if not isinstance(value, str):
+            raise TypeError(value)
+        return os.path.expanduser(value) if self.attribute.endswith('_DIR') else value
+
+
+SETTINGS: Tuple[Setting, ...] = (
+    Setting('daemon.max_concurrent_jobs', DaemonConfig, 'MAX_CONCURRENT_JOBS', int, minimum=1),
+    Setting('daemon.total_rate_limit', DaemonConfig, 'TOTAL_RATE_LIMIT', int, nullable=True, minimum=1),
+    Setting('daemon.progress_interval', DaemonConfig, 'PROGRESS_INTERVAL', float, minimum=0),
+    Setting('download.rate_limit', DownloadConfig, 'RATE_LIMIT', int, nullable=True, minimum=1),
+    Setting('download.concurrent_fragments', DownloadConfig, 'CONCURRENT_FRAGMENTS', int, minimum=1),
+    Setting('range.connections', RangeConfig, 'CONNECTIONS', int, minimum=1),
+    Setting('range.max_connections', RangeConfig, 'MAX_CONNECTIONS', int, minimum=1),
+    Setting('range.min_segment_bytes', RangeConfig, 'MIN_SEGMENT_BYTES', int, minimum=1),
+    Setting('range.progress_interval', RangeConfig, 'PROGRESS_INTERVAL', float, minimum=0),
+    Setting('batch.max_workers', BatchConfig, 'MAX_WORKERS', int, minimum=1, live=False),
+    Setting('batch.requests_per_second', BatchConfig, 'REQUESTS_PER_SECOND', float,
+            nullable=True, minimum=0.01, live=False),
+    Setting('batch.burst', BatchConfig, 'BURST', int, minimum=1, live=False),
+    Setting('process.max_workers', ProcessConfig, 'MAX_WORKERS', int, minimum=1, live=False),
+    Setting('cache.max_bytes', CacheConfig, 'MAX_BYTES', int, minimum=0),
+    Setting('storage.scratch_dir', StorageConfig, 'SCRATCH_DIR', str, nullable=True),
+    Setting('storage.min_free_bytes', StorageConfig, 'MIN_FREE_BYTES', int, minimum=0, live=False),
+    Setting('throttle.stall_timeout', ThrottleConfig, 'STALL_TIMEOUT', float, minimum=1),
+    Setting('throttle.block_size', ThrottleConfig, 'BLOCK_SIZE', int, minimum=1024),
+    Setting('stream.chunk_size', StreamConfig, 'CHUNK_SIZE', int, minimum=1024),
+    Setting('stream.timeout', StreamConfig, 'TIMEOUT', float, minimum=1),
+    Setting('stream.progress_interval', StreamConfig, 'PROGRESS_INTERVAL', float, minimum=0),
+    Setting('scheduler.policy', SchedulerConfig, 'POLICY', str, choices=('fifo', 'priority', 'sjf'), live=False),
+    Setting('scheduler.preempt', SchedulerConfig, 'PREEMPT', bool, live=False),
+    Setting('log.verbose', LogConfig, 'VERBOSE', bool),
+)
+
+# Valores de constants.py, restaurados quando uma sobreposição é removida
+_DEFAULTS: Dict[str, Any] = {setting.key: getattr(setting.owner, setting.attribute) for setting in SETTINGS}
+
+
+class Settings:
+    """Carrega, valida e aplica as configurações de desempenho."""
+
+    _shared: ClassVar[Optional['Settings']] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        path: Optional[str] = SettingsConfig.FILE,
+        environ: Optional[Mapping[str, str]] = None,
+        profile: Optional[str] = None
+    ):
+        """
+        Inicializa as configurações. Nada é aplicado até load().
+
+        Args:
+            path: Arquivo JSON de configurações (None = nenhum)
+            environ: Variáveis de ambiente (padrão: os.environ, lido a cada carga)
+            profile: Perfil escolhido explicitamente (ex.: --profile); tem
+                precedência sobre o ambiente e o arquivo
+        """
+        self._path = path
+        self._environ = environ
+        self._profile = profile
+        self._active_profile: Optional[str] = None
+        self._values: Dict[str, Any] = dict(_DEFAULTS)
+        self._sources: Dict[str, str] = {key: 'padrão' for key in _DEFAULTS}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    @classmethod
+    def shared(cls) -> 'Settings':
+        """Retorna as configurações do processo."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, path: Optional[str] = SettingsConfig.FILE, profile: Optional[str] = None) -> 'Settings':
+        """
+        Substitui as configurações do processo e as carrega.
+
+        Deve ser chamado na inicialização, antes de criar os serviços.
+
+        Args:
+            path: Arquivo JSON de configurações
+            profile: Perfil escolhido explicitamente
+
+        Returns:
+            Configurações carregadas
+
+        Raises:
+            SettingsError: Se o arquivo, o ambiente ou o perfil forem inválidos
+        """
+        settings = cls(path, profile=profile)
+        settings.load()
+        with cls._shared_lock:
+            cls._shared = settings
+        return settings
+
+    @property
+    def profile(self) -> Optional[str]:
+        """Perfil aplicado na última carga."""
+        return self._active_profile
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Lê o perfil, o arquivo e o ambiente e aplica os valores.
+
+        Returns:
+            Itens alterados por esta carga, com os novos valores
+
+        Raises:
+            SettingsError: Se algum valor for inválido (nada é aplicado)
+        """
+        with self._lock:
+            values, sources, profile = self._resolve()
+            changed = {key: value for key, value in values.items() if self._values.get(key) != value}
+            for setting in SETTINGS:
+                setattr(setting.owner, setting.attribute, values[setting.key])
+            self._values, self._sources, self._active_profile = values, sources, profile
+            listeners = list(self._listeners)
+        if changed:
+            for listener in listeners:
+                listener(changed)
+        return changed
+
+    reload = load
+
+    def restart_required(self, changed: Mapping[str, Any]) -> List[str]:
+        """
+        Itens alterados que só valem após reiniciar o processo.
+
+        Args:
+            changed: Resultado de load()/reload()
+        """
+        return [setting.key for setting in SETTINGS if setting.key in changed and not setting.live]
+
+    def get(self, key: str) -> Any:
+        """
+        Valor atual de um item.
+
+        Raises:
+            SettingsError: Se o item não existir
+        """
+        with self._lock:
+            if key not in self._values:
+                raise SettingsError(f"Configuração desconhecida: {key}")
+            return self._values[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Perfil, valores e origem de cada valor, para a API e a linha de comando."""
+        with self._lock:
+            return {
+                'profile': self._active_profile,
+                'file': self._path,
+                'settings': {
+                    key: {'value': self._values[key], 'source': self._sources[key]} for key in self._values
+                },
+            }
+
+    def subscribe(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Registra um ouvinte chamado com os itens alterados a cada carga.
+
+        Args:
+            listener: Callable que recebe {chave: novo valor}
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Remove um ouvinte registrado."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _resolve(self) -> Tuple[Dict[str, Any], Dict[str, str], Optional[str]]:
+        """Calcula os valores de todas as fontes, sem aplicá-los."""
+        environ = os.environ if self._environ is None else self._environ
+        document = self._read_file()
+        file_values = self._flatten(document)
+
+        profile = (
+            self._profile
+            or environ.get(SettingsConfig.ENV_PREFIX + 'PROFILE')
+            or document.get('profile')
+            or SettingsConfig.PROFILE
+        )
+        if profile and profile not in SettingsConfig.PROFILES:
+            raise SettingsError(
+                f"Perfil desconhecido: {profile} (disponíveis: {', '.join(SettingsConfig.PROFILES)})"
+            )
+
+        by_key = {setting.key: setting for setting in SETTINGS}
+        layers = [
+            (f"perfil {profile}", SettingsConfig.PROFILES.get(profile) or {}),
+            ('arquivo', file_values),
+        ]
+        values, sources = dict(_DEFAULTS), {key: 'padrão' for key in _DEFAULTS}
+        for source, layer in layers:
+            for key, raw in layer.items():
+                if key not in by_key:
+                    raise SettingsError(f"Configuração desconhecida em {source}: {key}")
+                values[key] = by_key[key].parse(raw)
+                sources[key] = source
+        for setting in SETTINGS:
+            if setting.env_name in environ:
+                values[setting.key] = setting.parse(environ[setting.env_name])
+                sources[setting.key] = 'ambiente'
+        return values, sources, profile
+
+    def _read_file(self) -> Dict[str, Any]:
+        """Lê o arquivo JSON; um arquivo ausente equivale a um vazio."""
+        if not self._path:
+            return {}
+        try:
+            with open(self._path, encoding='utf-8') as f:
+                document = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            raise SettingsError(f"Não foi possível ler {self._path}: {e}") from e
+        if not isinstance(document, dict):
+            raise SettingsError(f"{self._path}: o arquivo deve conter um objeto JSON")
+        return document
+
+    @staticmethod
+    def _flatten(document: Dict[str, Any]) -> Dict[str, Any]:
+        """Converte {"seção": {"nome": valor}} em {"seção.nome": valor}."""
+        values = {}
+        for section, items in document.items():
+            if section == 'profile':
+                continue
+            if not isinstance(items, dict):
+                raise SettingsError(f"Seção inválida no arquivo de configurações: {section}")
+            for name, value in items.items():
+                values[f"{section}.{name}"] = value
+        return values
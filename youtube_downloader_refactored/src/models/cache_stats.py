@@ -0,0 +1,65 @@
+"""
+Estatísticas do cache do yt-dlp.
+
+Contabiliza acertos e falhas do cache em disco e a latência das
+extrações, separando as feitas com o cache quente das que precisaram
+baixar ou resolver o JavaScript do player.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..config.constants import CacheConfig
+
+
+@dataclass
+class CacheStats:
+    """Acertos, falhas e latência de extração do cache do yt-dlp."""
+
+    MAX_SAMPLES = CacheConfig.LATENCY_SAMPLES
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evicted_files: int = 0
+    size_bytes: int = 0
+    warm_latencies: List[float] = field(default_factory=list)
+    cold_latencies: List[float] = field(default_factory=list)
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """Fração das leituras atendidas pelo cache (None = nenhuma leitura)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def record_extraction(self, seconds: float, warm: bool) -> None:
+        """
+        Registra a duração de uma extração, mantendo apenas as mais recentes.
+
+        Args:
+            seconds: Duração da extração
+            warm: Se True, a extração não teve falhas no cache
+        """
+        samples = self.warm_latencies if warm else self.cold_latencies
+        samples.append(seconds)
+        del samples[:-self.MAX_SAMPLES]
+
+    @staticmethod
+    def mean(samples: List[float]) -> Optional[float]:
+        """Média das amostras (None = sem amostras)."""
+        return sum(samples) / len(samples) if samples else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa as estatísticas para JSON."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_ratio': self.hit_ratio,
+            'evicted_files': self.evicted_files,
+            'size_bytes': self.size_bytes,
+            'warm_extractions': len(self.warm_latencies),
+            'warm_latency_mean': self.mean(self.warm_latencies),
+            'cold_extractions': len(self.cold_latencies),
+            'cold_latency_mean': self.mean(self.cold_latencies),
+        }
@@ -20,6 +20,16 @@ class DownloadError(Exception):
     pass
 
 
+class DownloadCancelledError(DownloadError):
+    """Download interrompido por solicitação do usuário."""
+    pass
+
+
+class InsufficientDiskSpaceError(DownloadError):
+    """Espaço livre insuficiente para concluir o download."""
+    pass
+
+
 class CookiesNotFoundError(Exception):
     """Arquivo de cookies não encontrado."""
     pass
@@ -28,3 +38,18 @@ class CookiesNotFoundError(Exception):
 class VideoInfoError(Exception):
     """Erro ao obter informações do vídeo."""
     pass
+
+
+class JobNotFoundError(Exception):
+    """Job de download não encontrado na fila."""
+    pass
+
+
+class DaemonError(Exception):
+    """Erro de comunicação com o daemon de downloads."""
+    pass
+
+
+class SettingsError(Exception):
+    """Configuração de desempenho inválida (arquivo, ambiente ou perfil)."""
+    pass
@@ -0,0 +1,57 @@
+"""
+Modelos da seleção de formatos.
+
+Define as políticas que descrevem qual stream baixar e o resultado
+da seleção feita sobre os formatos disponíveis de um vídeo.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FormatPolicy:
+    """
+    Restrições e preferências para escolher os streams de um vídeo.
+
+    Codecs são comparados por prefixo (ex.: 'avc1', 'vp09', 'av01',
+    'mp4a', 'opus'); tuplas vazias aceitam qualquer valor.
+    """
+
+    max_height: Optional[int] = None
+    audio_only: bool = False
+    video_codecs: Tuple[str, ...] = ()
+    audio_codecs: Tuple[str, ...] = ()
+    containers: Tuple[str, ...] = ()
+    min_audio_bitrate: float = 96.0  # kbps; abaixo disso o áudio perde qualidade audível
+    prefer_smallest: bool = True
+
+    def describe(self) -> str:
+        """Retorna uma descrição curta da política."""
+        parts = ["somente áudio" if self.audio_only else "vídeo"]
+        if self.max_height:
+            parts.append(f"até {self.max_height}p")
+        if self.video_codecs:
+            parts.append("/".join(self.video_codecs))
+        if self.containers:
+            parts.append("/".join(self.containers))
+        parts.append("menor arquivo" if self.prefer_smallest else "maior bitrate")
+        return ", ".join(parts)
+
+
+@dataclass
+class FormatChoice:
+    """Streams escolhidos para um vídeo e o tamanho estimado do download."""
+
+    format_id: str
+    ext: str
+    height: Optional[int] = None
+    vcodec: Optional[str] = None
+    acodec: Optional[str] = None
+    estimated_size: Optional[int] = None
+    formats: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_merged(self) -> bool:
+        """Indica se vídeo e áudio vêm de streams separados."""
+        return len(self.formats) > 1
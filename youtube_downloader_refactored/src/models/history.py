@@ -0,0 +1,39 @@
+"""
+Modelos do histórico de downloads.
+
+Define o registro de um download concluído e os filtros de busca.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class HistoryEntry:
+    """Registro de um arquivo baixado."""
+    
+    title: str
+    url: str
+    file_path: str
+    format_choice: str
+    video_id: Optional[str] = None
+    channel: Optional[str] = None
+    size_bytes: Optional[int] = None
+    downloaded_at: float = field(default_factory=time.time)
+    entry_id: Optional[int] = None
+    
+    def get_formatted_date(self) -> str:
+        """Retorna a data do download no formato dd/mm/aaaa hh:mm."""
+        return time.strftime("%d/%m/%Y %H:%M", time.localtime(self.downloaded_at))
+
+
+@dataclass(frozen=True)
+class HistoryQuery:
+    """Filtros de busca no histórico (campos vazios não filtram)."""
+    
+    text: str = ""
+    channel: Optional[str] = None
+    format_choice: Optional[str] = None
+    since: Optional[float] = None
+    until: Optional[float] = None
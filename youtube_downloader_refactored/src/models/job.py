@@ -0,0 +1,120 @@
+"""
+Modelos de jobs de download.
+
+Define o estado de um download submetido à fila compartilhada.
+"""
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Dict, Any, List
+
+from .video_info import DownloadRequest
+
+
+class JobStatus(str, Enum):
+    """Estados possíveis de um job de download."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def is_terminal(self) -> bool:
+        """Verifica se o job não sofrerá mais mudanças de estado."""
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+def _new_job_id() -> str:
+    """Gera um identificador curto e único para um job."""
+    return uuid.uuid4().hex[:12]
+
+
+@dataclass
+class JobStats:
+    """Eventos de rede registrados durante a execução de um job."""
+
+    MAX_EVENTS = 50
+
+    throttle_restarts: int = 0
+    connection_retries: int = 0
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def record(self, kind: str, detail: str) -> None:
+        """
+        Registra um evento, mantendo apenas os mais recentes.
+
+        Args:
+            kind: Tipo do evento ('throttle' ou 'retry')
+            detail: Descrição legível do evento
+        """
+        if kind == 'throttle':
+            self.throttle_restarts += 1
+        elif kind == 'retry':
+            self.connection_retries += 1
+        self.events.append({'time': time.time(), 'kind': kind, 'detail': detail})
+        del self.events[:-self.MAX_EVENTS]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa as estatísticas para JSON."""
+        return {
+            'throttle_restarts': self.throttle_restarts,
+            'connection_retries': self.connection_retries,
+            'events': list(self.events),
+        }
+
+
+@dataclass
+class DownloadJob:
+    """Job de download gerenciado pela fila compartilhada."""
+
+    request: DownloadRequest
+    job_id: str = field(default_factory=_new_job_id)
+    status: JobStatus = JobStatus.QUEUED
+    percent: float = 0.0
+    eta: Optional[int] = None
+    speed: Optional[float] = None
+    error: Optional[str] = None
+    log_file: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    stats: JobStats = field(default_factory=JobStats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o job para JSON."""
+        return {
+            'job_id': self.job_id,
+            'status': self.status.value,
+            'url': self.request.url,
+            'save_path': self.request.save_path,
+            'format_choice': self.request.format_choice,
+            'custom_title': self.request.custom_title,
+            'priority': self.request.priority,
+            'estimated_size': self.request.estimated_size,
+            'live': self.request.live,
+            'percent': self.percent,
+            'eta': self.eta,
+            'speed': self.speed,
+            'error': self.error,
+            'log_file': self.log_file,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'stats': self.stats.to_dict(),
+        }
+
+
+@dataclass
+class WorkItem:
+    """Job retirado da fila compartilhada por um worker, com a concessão recebida."""
+
+    item_id: int
+    request: DownloadRequest
+    lease_token: str
+    worker_id: str
+    attempts: int
+    lease_expires: float
@@ -0,0 +1,34 @@
+"""
+Estatísticas do armazenamento por conteúdo.
+
+Compara o espaço que os arquivos ocupariam como cópias independentes
+com o espaço realmente ocupado pelos objetos guardados uma única vez.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class StoreStats:
+    """Objetos, referências e espaço economizado pelo armazenamento."""
+
+    objects: int = 0
+    references: int = 0
+    stored_bytes: int = 0
+    referenced_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Espaço que as cópias duplicadas ocupariam a mais."""
+        return max(self.referenced_bytes - self.stored_bytes, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa as estatísticas para JSON."""
+        return {
+            'objects': self.objects,
+            'references': self.references,
+            'stored_bytes': self.stored_bytes,
+            'referenced_bytes': self.referenced_bytes,
+            'saved_bytes': self.saved_bytes,
+        }
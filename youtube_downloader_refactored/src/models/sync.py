@@ -0,0 +1,46 @@
+"""
+Modelos da sincronização de canais e playlists.
+
+Define a fonte espelhada, com suas marcas d'água (último vídeo e data de
+envio mais recente já sincronizados), e o resultado de uma sincronização.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class SyncSource:
+    """Canal ou playlist espelhado e até onde já foi sincronizado."""
+    
+    url: str
+    save_path: str
+    format_choice: str
+    last_video_id: Optional[str] = None  # primeiro item da última enumeração
+    last_upload_date: Optional[str] = None  # YYYYMMDD; tudo antes disso já foi visto
+    last_synced_at: Optional[float] = None
+
+
+@dataclass
+class SyncResult:
+    """Resultado da sincronização de uma fonte."""
+    
+    url: str
+    enumerated: int = 0  # itens percorridos na enumeração
+    stopped_early: bool = False  # enumeração encerrada ao alcançar itens conhecidos
+    downloaded: List[str] = field(default_factory=list)  # ids baixados (ou marcados, na linha de base)
+    failed: Dict[str, str] = field(default_factory=dict)  # id -> mensagem de erro
+    error: Optional[str] = None  # falha da enumeração (nada foi baixado)
+    elapsed: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o resultado para JSON."""
+        return {
+            'url': self.url,
+            'enumerated': self.enumerated,
+            'stopped_early': self.stopped_early,
+            'downloaded': list(self.downloaded),
+            'failed': dict(self.failed),
+            'error': self.error,
+            'elapsed': self.elapsed,
+        }
@@ -4,8 +4,8 @@ Modelos de dados para informações de vídeo.
 Define as estruturas de dados usadas na aplicação.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -15,10 +15,65 @@ class VideoInfo:
     title: str
     thumbnail_url: Optional[str] = None
     duration: Optional[int] = None
+    video_id: Optional[str] = None
+    size_estimates: Dict[str, Optional[int]] = field(default_factory=dict)
+    thumbnails: List[Dict[str, Any]] = field(default_factory=list)
     
     def __str__(self) -> str:
         """Representação em string do vídeo."""
         return f"📹 {self.title}"
+    
+    def pick_thumbnail(self, width: int, height: int) -> Optional[str]:
+        """
+        Escolhe a menor thumbnail que preenche a área sem ser ampliada.
+        
+        Considera apenas variantes com dimensões conhecidas; se nenhuma
+        for grande o bastante, usa a thumbnail principal.
+        
+        Args:
+            width: Largura da área de exibição
+            height: Altura da área de exibição
+            
+        Returns:
+            URL da thumbnail ou None se o vídeo não tiver nenhuma
+        """
+        candidates = [
+            thumb for thumb in self.thumbnails
+            if thumb.get('width') and thumb.get('height')
+            # Redução proporcional para caber na área: <= 1 não amplia
+            and min(width / thumb['width'], height / thumb['height']) <= 1
+        ]
+        if candidates:
+            return min(candidates, key=lambda thumb: thumb['width'] * thumb['height'])['url']
+        return self.thumbnail_url
+    
+    def get_formatted_size(self, format_name: str) -> str:
+        """Retorna o tamanho estimado do download no formato escolhido."""
+        size = self.size_estimates.get(format_name)
+        if not size:
+            return ""
+        if size >= 1024 ** 3:
+            return f"~{size / 1024 ** 3:.1f} GB"
+        return f"~{size / 1024 ** 2:.1f} MB"
+
+
+@dataclass
+class ResolvedVideo:
+    """Resultado da resolução de metadados de uma URL em lote."""
+    
+    url: str
+    video_id: Optional[str] = None
+    info: Optional[VideoInfo] = None
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Indica se os metadados foram obtidos."""
+        return self.info is not None
+    
+    def __str__(self) -> str:
+        """Representação em string do resultado."""
+        return str(self.info) if self.info else f"⚠️ {self.url}: {self.error}"
 
 
 @dataclass
@@ -54,6 +109,11 @@ class DownloadRequest:
     save_path: str
     format_choice: str
     custom_title: Optional[str] = None
+    connections: Optional[int] = None  # segmentos paralelos (None = RangeConfig.CONNECTIONS)
+    priority: int = 0  # maior = escalonado antes na fila do JobManager
+    estimated_size: Optional[int] = None  # bytes estimados no formato escolhido (VideoInfo.size_estimates)
+    live: bool = False  # grava a transmissão ao vivo em arquivos rotativos (LiveRecorder)
+    live_from_start: bool = False  # começa pelo início da janela da playlist em vez da borda ao vivo
     
     def get_filename(self) -> str:
         """Retorna o nome do arquivo a ser usado."""
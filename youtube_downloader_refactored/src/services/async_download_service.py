@@ -0,0 +1,226 @@
+"""
+Serviço de download assíncrono.
+
+Expõe o motor de download como corrotinas asyncio, limitando a
+concorrência com um semáforo e um pool fixo de threads.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from .download_service import DownloadService, ProgressParser
+from .job_control import JobControl
+from .stream_sink import AsyncStreamSink
+from .video_info_service import VideoInfoService
+from ..models.video_info import DownloadRequest, DownloadProgress, VideoInfo
+from ..config.constants import DaemonConfig
+
+
+class ProgressStream:
+    """
+    Fluxo assíncrono de progresso de um download.
+
+    Recebe eventos da thread do yt-dlp e os entrega como iterador
+    assíncrono. Se o consumidor atrasar, os eventos mais antigos são
+    descartados, mantendo a memória limitada.
+    """
+
+    _END = object()
+
+    def __init__(self, maxsize: int = 100):
+        """
+        Inicializa o fluxo. Deve ser criado dentro do loop em execução.
+
+        Args:
+            maxsize: Número máximo de eventos pendentes
+        """
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Associa o fluxo ao loop que executa o download."""
+        self._loop = loop
+
+    def _push(self, item: Any) -> None:
+        """Enfileira um item no loop, descartando o mais antigo se cheio."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(item)
+
+    def _publish_threadsafe(self, progress: DownloadProgress) -> None:
+        """Publica um evento a partir da thread de download."""
+        self._loop.call_soon_threadsafe(self._push, progress)
+
+    def _close(self) -> None:
+        """Sinaliza o fim do fluxo (chamado no loop)."""
+        self._push(self._END)
+
+    def __aiter__(self) -> AsyncIterator[DownloadProgress]:
+        return self
+
+    async def __anext__(self) -> DownloadProgress:
+        item = await self._queue.get()
+        if item is self._END:
+            raise StopAsyncIteration
+        return item
+
+
+class AsyncDownloadService:
+    """Fachada asyncio sobre DownloadService e VideoInfoService."""
+
+    def __init__(
+        self,
+        download_service: Optional[DownloadService] = None,
+        video_info_service: Optional[VideoInfoService] = None,
+        max_concurrent: int = DaemonConfig.MAX_CONCURRENT_JOBS
+    ):
+        """
+        Inicializa o serviço.
+
+        Args:
+            download_service: Serviço de download síncrono
+            video_info_service: Serviço de metadados síncrono
+            max_concurrent: Máximo de operações simultâneas (e de threads)
+        """
+        self._download_service = download_service or DownloadService()
+        self._video_info_service = video_info_service or VideoInfoService()
+        self._max_concurrent = max_concurrent
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="async-download"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Cria o semáforo sob demanda, dentro do loop em execução."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        return self._semaphore
+
+    async def get_info(self, url: str) -> VideoInfo:
+        """
+        Obtém informações de um vídeo sem bloquear o loop.
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+            VideoInfoError: Se houver erro ao obter informações
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            return await loop.run_in_executor(
+                self._executor, self._video_info_service.get_video_info, url
+            )
+
+    async def download(
+        self,
+        request: DownloadRequest,
+        progress: Optional[ProgressStream] = None,
+        control: Optional[JobControl] = None
+    ) -> None:
+        """
+        Realiza o download sem bloquear o loop.
+
+        O cancelamento da corrotina é propagado ao yt-dlp, que é
+        interrompido no próximo evento de progresso; a corrotina só
+        termina depois que a thread de download é liberada.
+
+        Args:
+            request: Requisição de download
+            progress: Fluxo que receberá os eventos de progresso
+            control: Controle para pausar/retomar o download
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+            DownloadCancelledError: Se o download for cancelado pelo controle
+            DownloadError: Se houver erro no download
+        """
+        loop = asyncio.get_running_loop()
+        control = control or JobControl()
+        if progress is not None:
+            progress._bind(loop)
+
+        def on_progress(data: Dict[str, Any]) -> None:
+            if progress is not None:
+                progress._publish_threadsafe(ProgressParser.parse(data))
+
+        await self._run(
+            lambda: self._download_service.download(
+                request, progress_callback=on_progress, control=control
+            ),
+            progress, control
+        )
+    
+    async def stream(
+        self,
+        request: DownloadRequest,
+        writer: Any,
+        progress: Optional[ProgressStream] = None,
+        control: Optional[JobControl] = None
+    ) -> Dict[str, Any]:
+        """
+        Envia o vídeo a um stream asyncio, sem gravar arquivo.
+        
+        Cada bloco espera o drain() do destino antes de o próximo ser
+        lido da rede, então um consumidor lento segura o download.
+        
+        Args:
+            request: Requisição de download (save_path é ignorado)
+            writer: Destino no formato do asyncio.StreamWriter (write() e
+                drain()) ou com write() assíncrono; não é fechado ao final
+            progress: Fluxo que receberá os eventos de progresso
+            control: Controle para pausar/retomar o envio
+            
+        Returns:
+            Formato enviado ('title', 'format_id', 'ext', 'bytes')
+            
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+            DownloadCancelledError: Se o envio for cancelado pelo controle
+            DownloadError: Se não houver formato transmissível ou o envio falhar
+        """
+        loop = asyncio.get_running_loop()
+        control = control or JobControl()
+        sink = AsyncStreamSink(writer, loop)
+        if progress is not None:
+            progress._bind(loop)
+        
+        def on_progress(data: Dict[str, Any]) -> None:
+            if progress is not None:
+                progress._publish_threadsafe(ProgressParser.parse(data))
+        
+        return await self._run(
+            lambda: self._download_service.stream(
+                request, sink, progress_callback=on_progress, control=control
+            ),
+            progress, control, on_cancel=sink.abort
+        )
+    
+    async def _run(
+        self,
+        work: Callable[[], Any],
+        progress: Optional[ProgressStream],
+        control: JobControl,
+        on_cancel: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """Executa um download no pool de threads, propagando o cancelamento da corrotina."""
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._get_semaphore():
+                future = loop.run_in_executor(self._executor, work)
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    control.cancel()
+                    if on_cancel is not None:
+                        on_cancel()
+                    # Aguarda a thread encerrar antes de liberar o slot
+                    await asyncio.wait([future])
+                    future.exception()
+                    raise
+        finally:
+            if progress is not None:
+                progress._close()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Libera o pool de threads."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,131 @@
+"""
+Resolução de metadados em lote.
+
+Resolve listas de URLs (arrastadas, coladas ou recebidas pela API) em
+paralelo com um pool limitado, descartando vídeos repetidos e
+respeitando um limite de requisições por segundo. Os resultados são
+entregues à medida que ficam prontos.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Optional, Set
+
+from .video_info_service import VideoInfoService
+from ..models.video_info import ResolvedVideo
+from ..models.exceptions import VideoInfoError, CookiesNotFoundError
+from ..utils.rate_limiter import RateLimiter
+from ..utils.validators import URLValidator
+from ..config.constants import BatchConfig
+
+
+class BatchResolver:
+    """Resolve metadados de várias URLs em paralelo."""
+
+    def __init__(
+        self,
+        video_info_service: Optional[VideoInfoService] = None,
+        max_workers: int = BatchConfig.MAX_WORKERS,
+        rate_limit: Optional[float] = BatchConfig.REQUESTS_PER_SECOND,
+        burst: int = BatchConfig.BURST
+    ):
+        """
+        Inicializa o resolvedor.
+
+        Args:
+            video_info_service: Serviço de metadados (compartilhado entre as threads)
+            max_workers: Máximo de resoluções simultâneas
+            rate_limit: Máximo de requisições por segundo (None = sem limite)
+            burst: Requisições permitidas de imediato
+        """
+        self._video_info_service = video_info_service or VideoInfoService()
+        self._max_workers = max_workers
+        self._limiter = RateLimiter(rate_limit, burst)
+
+    @staticmethod
+    def deduplicate(urls: Iterable[str]) -> List[str]:
+        """
+        Remove URLs vazias e repetidas, comparando pelo ID do vídeo.
+
+        Args:
+            urls: URLs na ordem recebida
+
+        Returns:
+            URLs únicas, mantendo a primeira ocorrência
+        """
+        unique, seen = [], set()
+        for url in urls:
+            url = url.strip()
+            if not url:
+                continue
+            key = URLValidator.extract_video_id(url) or url
+            if key not in seen:
+                seen.add(key)
+                unique.append(url)
+        return unique
+
+    def resolve(
+        self,
+        urls: Iterable[str],
+        cancel_event: Optional[threading.Event] = None
+    ) -> Iterator[ResolvedVideo]:
+        """
+        Resolve as URLs, entregando cada resultado assim que fica pronto.
+
+        URLs inválidas geram resultados com erro sem acessar a rede. Vídeos
+        que só se revelam repetidos após a resolução (ex.: links de formatos
+        diferentes) também são descartados.
+
+        Args:
+            urls: URLs a resolver
+            cancel_event: Se sinalizado, as resoluções pendentes são abandonadas
+
+        Yields:
+            ResolvedVideo na ordem de conclusão
+        """
+        seen_ids: Set[str] = set()
+        pending = []
+        for url in self.deduplicate(urls):
+            if URLValidator.validate(url):
+                pending.append(url)
+            else:
+                yield ResolvedVideo(url=url, error="URL inválida. Use uma URL do YouTube.")
+        if not pending:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='batch-resolver')
+        futures = [executor.submit(self._resolve_one, url, cancel_event) for url in pending]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                if result.video_id:
+                    if result.video_id in seen_ids:
+                        continue
+                    seen_ids.add(result.video_id)
+                yield result
+        finally:
+            # Consumidor interrompeu a iteração: abandona o que ainda não começou
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _resolve_one(
+        self,
+        url: str,
+        cancel_event: Optional[threading.Event]
+    ) -> Optional[ResolvedVideo]:
+        """Resolve uma única URL respeitando o limite de taxa."""
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        self._limiter.acquire()
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+
+        video_id = URLValidator.extract_video_id(url)
+        try:
+            info = self._video_info_service.get_video_info(url)
+        except (CookiesNotFoundError, VideoInfoError) as e:
+            return ResolvedVideo(url=url, video_id=video_id, error=str(e))
+        return ResolvedVideo(url=url, video_id=info.video_id or video_id, info=info)
@@ -0,0 +1,240 @@
+"""
+Sincronização incremental de canais e playlists.
+
+Espelhar um canal baixando de novo a lista inteira a cada execução
+custa uma página de enumeração para cada cem vídeos, mesmo quando só
+há um ou dois envios novos. A sincronização percorre a lista de forma
+preguiçosa (extract_flat + lazy_playlist), do mais novo para o mais
+antigo, e para de pedir páginas ao encontrar SyncConfig.KNOWN_STREAK
+itens já vistos em sequência ou um item anterior à marca d'água de data
+da fonte. Só os itens novos são baixados, do mais antigo para o mais
+novo, e cada um é marcado como visto assim que termina. Um download que
+falha é registrado como pendente no SyncStore e tentado de novo a cada
+sincronização, mesmo que a enumeração pare antes de alcançá-lo.
+
+A parada antecipada supõe listas em ordem do mais novo para o mais
+antigo, como as abas de vídeos dos canais do YouTube.
+"""
+
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from yt_dlp.utils import PagedList, YoutubeDLError
+
+from .cookie_manager import CookieJarManager
+from .download_service import DownloadService
+from .sync_store import SyncStore
+from .ydl_cache import YtDlpCache
+from .ydl_pool import YoutubeDLPool
+from ..models.sync import SyncResult, SyncSource
+from ..models.video_info import DownloadRequest
+from ..models.exceptions import DownloadError
+from ..config.constants import DownloadFormats, SyncConfig
+
+
+class ChannelSync:
+    """Baixa apenas os itens novos de canais e playlists espelhados."""
+
+    ENUMERATION_OPTIONS = {
+        'quiet': True,
+        'skip_download': True,
+        'extract_flat': 'in_playlist',
+        'lazy_playlist': True,
+    }
+    MAX_REDIRECTS = 5
+
+    _LIST_TYPES = ('playlist', 'multi_video')
+    _LINK_TYPES = ('url', 'url_transparent')
+
+    def __init__(
+        self,
+        store: Optional[SyncStore] = None,
+        download_service: Optional[DownloadService] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None,
+        known_streak: int = SyncConfig.KNOWN_STREAK
+    ):
+        """
+        Inicializa a sincronização.
+
+        Args:
+            store: Marcas d'água das fontes (padrão: o armazenamento compartilhado)
+            download_service: Serviço que baixa os itens novos
+            ydl_pool: Pool do yt-dlp usado na enumeração
+            known_streak: Itens já vistos em sequência que encerram a enumeração
+        """
+        if ydl_pool is None:
+            ydl_pool = YoutubeDLPool(CookieJarManager.shared(), cache=YtDlpCache.shared())
+        self._store = store or SyncStore.shared()
+        self._download_service = download_service or DownloadService(ydl_pool=ydl_pool)
+        self._ydl_pool = ydl_pool
+        self._known_streak = known_streak
+
+    def sync(
+        self,
+        url: str,
+        save_path: Optional[str] = None,
+        format_choice: Optional[str] = None,
+        baseline: bool = False
+    ) -> SyncResult:
+        """
+        Sincroniza uma fonte, registrando-a se ainda não for conhecida.
+
+        Args:
+            url: URL do canal ou da playlist
+            save_path: Pasta de destino (None = a registrada, ou a pasta atual)
+            format_choice: Formato (None = o registrado, ou o padrão)
+            baseline: Se True, marca os itens novos como vistos sem baixá-los,
+                para espelhar apenas os envios futuros
+
+        Returns:
+            Itens percorridos, baixados e que falharam (ou o erro da enumeração)
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+        """
+        started = time.monotonic()
+        source = self._store.get_source(url) or SyncSource(url, '.', DownloadFormats.DEFAULT)
+        source.save_path = save_path or source.save_path
+        source.format_choice = format_choice or source.format_choice
+        self._store.save_source(source)
+
+        result = SyncResult(url)
+        try:
+            new, first_id = self._scan(source, result)
+        except YoutubeDLError as e:
+            result.error = str(e)
+            result.elapsed = time.monotonic() - started
+            return result
+        new_ids = {entry['id'] for entry in new}
+        retries = [entry for entry in self._store.pending(url) if entry['id'] not in new_ids]
+        pending = retries + list(reversed(new))
+        if baseline:
+            self._store.mark_seen(url, [(entry['id'], entry.get('upload_date')) for entry in pending])
+            result.downloaded = [entry['id'] for entry in pending]
+        else:
+            for entry in pending:
+                self._download(source, entry, result)
+
+        dates = [entry['upload_date'] for entry in new if entry.get('upload_date')]
+        watermark = max(dates) if dates and not result.failed else None
+        self._store.advance(url, first_id, watermark)
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def sync_all(self) -> List[SyncResult]:
+        """
+        Sincroniza todas as fontes registradas.
+
+        Returns:
+            Resultado de cada fonte
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+        """
+        return [self.sync(source.url) for source in self._store.sources()]
+
+    def _scan(self, source: SyncSource, result: SyncResult) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Enumera a fonte até alcançar o trecho já sincronizado.
+
+        Returns:
+            (itens novos, do mais novo para o mais antigo; id do primeiro item)
+        """
+        known = self._store.known_ids(source.url)
+        new: List[Dict[str, Any]] = []
+        with self._ydl_pool.checkout(dict(self.ENUMERATION_OPTIONS)) as ydl:
+            info = self._resolve(ydl, source.url)
+            first_id = self._walk(ydl, info, known, source.last_upload_date, new, result)
+        return new, first_id
+
+    def _resolve(self, ydl: Any, url: str, ie_key: Optional[str] = None) -> Dict[str, Any]:
+        """Extrai sem processar, seguindo redirecionamentos para a lista real."""
+        info = ydl.extract_info(url, download=False, ie_key=ie_key, process=False)
+        for _ in range(self.MAX_REDIRECTS):
+            if info.get('_type') not in self._LINK_TYPES:
+                break
+            info = ydl.extract_info(info['url'], download=False, ie_key=info.get('ie_key'), process=False)
+        return info
+
+    def _walk(
+        self,
+        ydl: Any,
+        info: Dict[str, Any],
+        known: Set[str],
+        watermark: Optional[str],
+        new: List[Dict[str, Any]],
+        result: SyncResult
+    ) -> Optional[str]:
+        """
+        Percorre uma lista (e as listas aninhadas, como as abas de um canal).
+
+        Returns:
+            Id do primeiro vídeo encontrado
+        """
+        first_id = None
+        streak = 0
+        for entry in self._entries(info):
+            if not entry:
+                continue
+            if self._is_list(entry):
+                if entry.get('_type') not in self._LIST_TYPES:
+                    entry = self._resolve(ydl, entry['url'], entry.get('ie_key'))
+                nested_first = self._walk(ydl, entry, known, watermark, new, result)
+                first_id = first_id or nested_first
+                continue
+
+            video_id = entry.get('id')
+            if not video_id:
+                continue
+            result.enumerated += 1
+            first_id = first_id or video_id
+            upload_date = entry.get('upload_date')
+            if watermark and upload_date and upload_date < watermark:
+                result.stopped_early = True
+                break
+            if video_id in known:
+                streak += 1
+                if streak >= self._known_streak:
+                    result.stopped_early = True
+                    break
+                continue
+            streak = 0
+            known.add(video_id)
+            new.append(entry)
+        return first_id
+
+    def _entries(self, info: Dict[str, Any]):
+        """Itera os itens de uma lista sem pedir páginas além das consumidas."""
+        if info.get('_type') not in self._LIST_TYPES:
+            yield info
+            return
+        entries = info.get('entries') or ()
+        if isinstance(entries, PagedList):
+            for page_number in itertools.count():
+                page = entries.getpage(page_number)
+                if not page:
+                    return
+                yield from page
+        else:
+            yield from entries
+
+    def _is_list(self, entry: Dict[str, Any]) -> bool:
+        """Indica se o item é uma lista aninhada (aba de canal ou playlist)."""
+        if entry.get('_type') in self._LIST_TYPES:
+            return True
+        ie_key = entry.get('ie_key') or ''
+        return entry.get('_type') in self._LINK_TYPES and ie_key.endswith(('Tab', 'Playlist'))
+
+    def _download(self, source: SyncSource, entry: Dict[str, Any], result: SyncResult) -> None:
+        """Baixa um item novo e o marca como visto se der certo."""
+        url = entry.get('webpage_url') or entry.get('url') or entry['id']
+        request = DownloadRequest(url, source.save_path, source.format_choice)
+        try:
+            self._download_service.download(request)
+        except DownloadError as e:
+            result.failed[entry['id']] = str(e)
+            self._store.mark_failed(source.url, entry['id'], url, entry.get('upload_date'), str(e))
+            return
+        self._store.mark_seen(source.url, [(entry['id'], entry.get('upload_date'))])
+        result.downloaded.append(entry['id'])
@@ -0,0 +1,241 @@
+"""
+Armazenamento por conteúdo dos arquivos baixados.
+
+Cada arquivo entregue no destino é identificado pelo SHA-256 do seu
+conteúdo e guardado uma única vez em objects/; as pastas de destino
+recebem reflinks (cópias sob demanda, em btrfs/XFS/APFS) ou hard links
+para o objeto em vez de cópias. Um índice SQLite registra quais caminhos
+referenciam cada objeto, e a coleta de lixo remove os objetos que não
+são mais referenciados por nenhum arquivo existente.
+
+Links não cruzam sistemas de arquivos: destinos em outro disco que o
+armazenamento ficam como estão, sem deduplicação.
+"""
+
+import errno
+import hashlib
+import os
+import tempfile
+import time
+from typing import ClassVar, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: apenas hard links
+    fcntl = None
+
+from ..models.store_stats import StoreStats
+from ..utils.registry import SharedRegistry
+from ..utils.sqlite_utils import create_schema, transaction
+from ..config.constants import ContentStoreConfig
+
+
+class ContentStore:
+    """Objetos endereçados por conteúdo, ligados às pastas de destino."""
+
+    MODE_AUTO = "auto"
+    MODE_REFLINK = "reflink"
+    MODE_HARDLINK = "hardlink"
+
+    # ioctl do Linux que clona o conteúdo de um arquivo (linux/fs.h)
+    _FICLONE = 0x40049409
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS objects (
+            digest TEXT PRIMARY KEY,
+            size_bytes INTEGER NOT NULL,
+            stored_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS refs (
+            path TEXT PRIMARY KEY,
+            digest TEXT NOT NULL,
+            device INTEGER NOT NULL,
+            inode INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_refs_digest ON refs (digest);
+    """
+
+    _registry: ClassVar[SharedRegistry['ContentStore']] = SharedRegistry()
+
+    def __init__(self, root: str = ContentStoreConfig.DIR, link_mode: str = ContentStoreConfig.LINK_MODE):
+        """
+        Inicializa o armazenamento, criando o diretório e o índice se necessário.
+
+        Args:
+            root: Diretório do armazenamento (no mesmo disco dos destinos)
+            link_mode: "auto", "reflink" ou "hardlink"
+        """
+        self._root = os.path.abspath(root)
+        self._link_mode = link_mode
+        self._db_path = os.path.join(self._root, "store.db")
+        os.makedirs(os.path.join(self._root, "objects"), exist_ok=True)
+        create_schema(self._db_path, self.SCHEMA, ContentStoreConfig.BUSY_TIMEOUT)
+
+    @classmethod
+    def shared(cls, root: str = ContentStoreConfig.DIR) -> 'ContentStore':
+        """
+        Retorna o armazenamento compartilhado de um diretório.
+
+        Args:
+            root: Diretório do armazenamento
+        """
+        return cls._registry.get(root, cls)
+
+    @property
+    def root(self) -> str:
+        """Diretório do armazenamento."""
+        return self._root
+
+    def ingest(self, path: str) -> Optional[str]:
+        """
+        Guarda um arquivo pelo conteúdo e o substitui por um link ao objeto.
+
+        Se o conteúdo já estiver guardado, o arquivo passa a compartilhar
+        o objeto existente e sua cópia é liberada; senão, o próprio
+        arquivo vira o objeto. Em caso de falha o arquivo fica intacto.
+
+        Args:
+            path: Arquivo recém-entregue no destino
+
+        Returns:
+            SHA-256 do conteúdo ou None se não foi possível deduplicar
+            (outro disco ou sistema de arquivos sem suporte a links)
+        """
+        path = os.path.abspath(path)
+        try:
+            digest, size = self._hash(path)
+        except OSError:
+            return None
+        obj = self.object_path(digest)
+
+        with transaction(self._db_path, ContentStoreConfig.BUSY_TIMEOUT) as connection:
+            known = connection.execute(
+                "SELECT 1 FROM objects WHERE digest = ?", (digest,)
+            ).fetchone() is not None
+            try:
+                if known and os.path.exists(obj):
+                    if not os.path.samefile(obj, path):
+                        self._replace_with_link(obj, path)
+                else:
+                    os.makedirs(os.path.dirname(obj), exist_ok=True)
+                    self._link(path, obj)
+                    connection.execute(
+                        "INSERT OR REPLACE INTO objects (digest, size_bytes, stored_at) VALUES (?, ?, ?)",
+                        (digest, size, time.time())
+                    )
+            except OSError:
+                return None
+            stat = os.stat(path)
+            connection.execute(
+                "INSERT OR REPLACE INTO refs (path, digest, device, inode) VALUES (?, ?, ?, ?)",
+                (path, digest, stat.st_dev, stat.st_ino)
+            )
+        return digest
+
+    def object_path(self, digest: str) -> str:
+        """Caminho do objeto com um conteúdo."""
+        return os.path.join(self._root, "objects", digest[:2], digest)
+
+    def references(self, digest: str) -> int:
+        """Quantidade de caminhos registrados que referenciam um objeto."""
+        with transaction(self._db_path, ContentStoreConfig.BUSY_TIMEOUT) as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM refs WHERE digest = ?", (digest,)
+            ).fetchone()[0]
+
+    def collect_garbage(self) -> Tuple[int, int]:
+        """
+        Remove referências a arquivos apagados ou substituídos e os objetos órfãos.
+
+        Returns:
+            (objetos removidos, bytes liberados)
+        """
+        removed = freed = 0
+        with transaction(self._db_path, ContentStoreConfig.BUSY_TIMEOUT) as connection:
+            refs = connection.execute("SELECT path, device, inode FROM refs").fetchall()
+            for path, device, inode in refs:
+                try:
+                    stat = os.stat(path)
+                    alive = (stat.st_dev, stat.st_ino) == (device, inode)
+                except OSError:
+                    alive = False
+                if not alive:
+                    connection.execute("DELETE FROM refs WHERE path = ?", (path,))
+
+            orphans = connection.execute(
+                "SELECT digest, size_bytes FROM objects"
+                " WHERE digest NOT IN (SELECT digest FROM refs)"
+            ).fetchall()
+            for digest, size in orphans:
+                try:
+                    os.remove(self.object_path(digest))
+                    freed += size
+                except FileNotFoundError:
+                    pass
+                connection.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+                removed += 1
+        return removed, freed
+
+    def stats(self) -> StoreStats:
+        """Objetos, referências e espaço economizado."""
+        with transaction(self._db_path, ContentStoreConfig.BUSY_TIMEOUT) as connection:
+            objects, stored = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM objects"
+            ).fetchone()
+            references, referenced = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(objects.size_bytes), 0)"
+                " FROM refs JOIN objects USING (digest)"
+            ).fetchone()
+        return StoreStats(objects, references, stored, referenced)
+
+    def _replace_with_link(self, obj: str, path: str) -> None:
+        """Troca o arquivo por um link ao objeto, sem expor um arquivo parcial."""
+        directory, name = os.path.split(path)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory)
+        os.close(fd)
+        os.remove(temp_path)
+        try:
+            self._link(obj, temp_path)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _link(self, src: str, dst: str) -> None:
+        """Cria dst compartilhando o conteúdo de src, conforme o modo configurado."""
+        if self._link_mode != self.MODE_HARDLINK:
+            try:
+                self._reflink(src, dst)
+                return
+            except OSError:
+                if self._link_mode == self.MODE_REFLINK:
+                    raise
+        os.link(src, dst)
+
+    @classmethod
+    def _reflink(cls, src: str, dst: str) -> None:
+        """Clona src em dst sem copiar os dados (cópia sob demanda)."""
+        if fcntl is None:
+            raise OSError(errno.EOPNOTSUPP, "Reflink não suportado nesta plataforma")
+        with open(src, 'rb') as source, open(dst, 'xb') as target:
+            try:
+                fcntl.ioctl(target.fileno(), cls._FICLONE, source.fileno())
+            except OSError:
+                target.close()
+                os.remove(dst)
+                raise
+
+    @staticmethod
+    def _hash(path: str) -> Tuple[str, int]:
+        """SHA-256 e tamanho de um arquivo, lido em blocos."""
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(ContentStoreConfig.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+        return digest.hexdigest(), size
@@ -0,0 +1,161 @@
+"""
+Gerenciador do arquivo de cookies.
+
+Mantém um único cookie jar carregado em memória e compartilhado por
+todas as instâncias do yt-dlp, recarregando-o apenas quando o arquivo
+muda e gravando alterações de forma atômica.
+"""
+
+import os
+import tempfile
+import threading
+from typing import Any, ClassVar, FrozenSet, Optional, Tuple
+
+from yt_dlp.cookies import YoutubeDLCookieJar
+
+from ..models.exceptions import CookiesNotFoundError
+from ..utils.registry import SharedRegistry
+from ..config.constants import AppConstants
+
+
+class CookieJarManager:
+    """Cookie jar compartilhado com recarga por mtime e escrita atômica."""
+
+    _registry: ClassVar[SharedRegistry['CookieJarManager']] = SharedRegistry()
+
+    def __init__(self, cookies_file: str = AppConstants.COOKIES_FILE):
+        """
+        Inicializa o gerenciador.
+
+        Args:
+            cookies_file: Caminho para o arquivo de cookies (formato Netscape)
+        """
+        self._cookies_file = os.path.abspath(cookies_file)
+        self._jar = YoutubeDLCookieJar(self._cookies_file)
+        self._lock = threading.RLock()
+        self._loaded_mtime: Optional[int] = None
+        self._fingerprint: FrozenSet[Tuple[Any, ...]] = frozenset()
+        self._load_count = 0
+
+    @classmethod
+    def shared(cls, cookies_file: str = AppConstants.COOKIES_FILE) -> 'CookieJarManager':
+        """
+        Retorna o gerenciador compartilhado para um arquivo de cookies.
+
+        Args:
+            cookies_file: Caminho para o arquivo de cookies
+        """
+        return cls._registry.get(cookies_file, cls)
+
+    @property
+    def cookies_file(self) -> str:
+        """Caminho absoluto do arquivo de cookies."""
+        return self._cookies_file
+
+    @property
+    def load_count(self) -> int:
+        """Quantas vezes o arquivo foi interpretado."""
+        return self._load_count
+
+    def exists(self) -> bool:
+        """Verifica se o arquivo de cookies existe."""
+        return os.path.exists(self._cookies_file)
+
+    def get_jar(self) -> YoutubeDLCookieJar:
+        """
+        Retorna o jar compartilhado, recarregando-o se o arquivo mudou.
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo não puder ser lido
+        """
+        mtime = self._current_mtime()
+        with self._lock:
+            if mtime != self._loaded_mtime:
+                self._reload(mtime)
+            return self._jar
+
+    def attach(self, ydl: Any) -> None:
+        """
+        Associa o jar compartilhado a uma instância do YoutubeDL.
+
+        A instância não deve receber a opção 'cookiefile', para que não
+        interprete nem regrave o arquivo por conta própria.
+
+        Args:
+            ydl: Instância do yt_dlp.YoutubeDL
+        """
+        ydl.cookiejar = self.get_jar()
+
+    def save(self) -> bool:
+        """
+        Grava o jar no arquivo se houve alterações desde a última leitura.
+
+        A escrita é serializada entre threads e feita em um arquivo
+        temporário renomeado por cima do original, de modo que leitores
+        nunca vejam um arquivo parcial. Se o arquivo foi alterado por
+        fora (ex.: cookies exportados novamente), ele tem prioridade e
+        é recarregado em vez de sobrescrito.
+
+        Returns:
+            True se o arquivo foi gravado
+        """
+        with self._lock:
+            if self._loaded_mtime is None:
+                return False
+            if self._current_mtime() != self._loaded_mtime:
+                self._reload(self._current_mtime())
+                return False
+            fingerprint = self._compute_fingerprint()
+            if fingerprint == self._fingerprint:
+                return False
+
+            directory = os.path.dirname(self._cookies_file)
+            fd, temp_path = tempfile.mkstemp(prefix='.cookies-', suffix='.tmp', dir=directory)
+            os.close(fd)
+            try:
+                self._jar.save(temp_path)
+                os.replace(temp_path, self._cookies_file)
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            self._loaded_mtime = self._current_mtime()
+            self._fingerprint = fingerprint
+            return True
+
+    def _reload(self, mtime: int) -> None:
+        """Interpreta o arquivo e substitui o conteúdo do jar compartilhado."""
+        fresh = YoutubeDLCookieJar(self._cookies_file)
+        try:
+            fresh.load()
+        except OSError as e:
+            raise CookiesNotFoundError(
+                f"Não foi possível ler o arquivo de cookies '{self._cookies_file}'."
+            ) from e
+
+        # Troca o conteúdo sob o lock do jar para que requisições em
+        # andamento nunca vejam um jar parcialmente carregado
+        with self._jar._cookies_lock:
+            self._jar.clear()
+            for cookie in fresh:
+                self._jar.set_cookie(cookie)
+
+        self._loaded_mtime = mtime
+        self._fingerprint = self._compute_fingerprint()
+        self._load_count += 1
+
+    def _current_mtime(self) -> int:
+        """Retorna o mtime do arquivo em nanossegundos."""
+        try:
+            return os.stat(self._cookies_file).st_mtime_ns
+        except OSError as e:
+            raise CookiesNotFoundError(
+                f"Arquivo de cookies '{self._cookies_file}' não encontrado."
+            ) from e
+
+    def _compute_fingerprint(self) -> FrozenSet[Tuple[Any, ...]]:
+        """Resume o conteúdo do jar para detectar alterações."""
+        return frozenset(
+            (c.domain, c.path, c.name, c.value, c.expires) for c in self._jar
+        )
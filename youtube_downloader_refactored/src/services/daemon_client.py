@@ -0,0 +1,173 @@
+"""
+Cliente do daemon de downloads.
+
+Permite que a interface e scripts submetam jobs ao daemon local
+em vez de manter um motor de download próprio.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from ..models.video_info import DownloadRequest
+from ..models.exceptions import DaemonError, JobNotFoundError
+from ..config.constants import DaemonConfig
+
+
+class DaemonClient:
+    """Cliente HTTP/JSON do daemon de downloads."""
+
+    def __init__(
+        self,
+        base_url: str = f"http://{DaemonConfig.HOST}:{DaemonConfig.PORT}",
+        timeout: float = 10.0
+    ):
+        """
+        Inicializa o cliente.
+
+        Args:
+            base_url: URL base do daemon
+            timeout: Tempo limite das requisições em segundos
+        """
+        self._base_url = base_url.rstrip('/')
+        self._timeout = timeout
+        self._session = requests.Session()
+
+    def submit(self, request: DownloadRequest) -> Dict[str, Any]:
+        """
+        Submete um download à fila do daemon.
+
+        Returns:
+            Estado inicial do job
+        """
+        return self._request('POST', '/jobs', json={
+            'url': request.url,
+            'save_path': request.save_path,
+            'format_choice': request.format_choice,
+            'custom_title': request.custom_title,
+            'connections': request.connections,
+            'priority': request.priority,
+            'estimated_size': request.estimated_size,
+            'live': request.live,
+            'live_from_start': request.live_from_start,
+        })
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """Obtém o estado de um job."""
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Lista os jobs conhecidos pelo daemon."""
+        return self._request('GET', '/jobs')
+
+    def get_log(self, job_id: str, save: bool = False) -> Dict[str, Any]:
+        """
+        Obtém as mensagens do yt-dlp registradas para um job.
+
+        Args:
+            job_id: Identificador do job
+            save: Se True, o daemon também grava o registro em arquivo
+        """
+        return self._request('POST' if save else 'GET', f'/jobs/{job_id}/log')
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Obtém as estatísticas do cache do yt-dlp usado pelo daemon."""
+        return self._request('GET', '/cache')
+
+    def cancel(self, job_id: str, keep_partial: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Solicita o cancelamento de um job.
+
+        Args:
+            job_id: Identificador do job
+            keep_partial: Se informado, define se os arquivos .part são preservados
+        """
+        params = None if keep_partial is None else {'keep_partial': '1' if keep_partial else '0'}
+        return self._request('POST', f'/jobs/{job_id}/cancel', params=params)
+
+    def pause(self, job_id: str) -> Dict[str, Any]:
+        """Pausa um job em execução."""
+        return self._request('POST', f'/jobs/{job_id}/pause')
+
+    def resume(self, job_id: str) -> Dict[str, Any]:
+        """Retoma um job pausado."""
+        return self._request('POST', f'/jobs/{job_id}/resume')
+
+    def iter_events(self, job_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Itera sobre os eventos transmitidos pelo daemon.
+
+        Args:
+            job_id: Filtra eventos de um único job; o fluxo termina
+                quando o job chega a um estado final
+
+        Raises:
+            DaemonError: Se a conexão com o daemon falhar
+        """
+        params = {'job_id': job_id} if job_id else None
+        try:
+            with self._session.get(
+                f"{self._base_url}/events",
+                params=params,
+                stream=True,
+                timeout=(self._timeout, None)
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line:
+                        event = json.loads(line)
+                        if event['event'] != 'heartbeat':
+                            yield event
+        except requests.RequestException as e:
+            raise DaemonError(f"Falha ao acompanhar eventos do daemon: {e}") from e
+
+    def resolve_batch(self, urls: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Resolve metadados de várias URLs no daemon.
+
+        Args:
+            urls: URLs a resolver
+
+        Yields:
+            Metadados (ou erro) de cada vídeo, na ordem de conclusão
+
+        Raises:
+            DaemonError: Se a conexão com o daemon falhar
+        """
+        try:
+            with self._session.post(
+                f"{self._base_url}/info/batch",
+                json={'urls': list(urls)},
+                stream=True,
+                timeout=(self._timeout, None)
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line)
+        except requests.RequestException as e:
+            raise DaemonError(f"Falha ao resolver URLs no daemon: {e}") from e
+
+    def is_available(self) -> bool:
+        """Verifica se o daemon está respondendo."""
+        try:
+            self.list_jobs()
+            return True
+        except DaemonError:
+            return False
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Executa uma requisição e decodifica a resposta JSON."""
+        try:
+            response = self._session.request(
+                method, f"{self._base_url}{path}", timeout=self._timeout, **kwargs
+            )
+        except requests.RequestException as e:
+            raise DaemonError(f"Daemon indisponível em {self._base_url}: {e}") from e
+
+        if response.status_code == 404 and path.startswith('/jobs/'):
+            raise JobNotFoundError(response.json().get('error', 'Job não encontrado.'))
+        if response.status_code >= 400:
+            raise DaemonError(f"Erro do daemon ({response.status_code}): {response.text}")
+        return response.json()
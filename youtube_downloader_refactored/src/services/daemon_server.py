@@ -0,0 +1,329 @@
+"""
+Servidor do daemon de downloads.
+
+Expõe o JobManager por uma API HTTP/JSON local para que várias janelas
+e scripts compartilhem a mesma fila, caches e limites de banda.
+"""
+
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from .batch_resolver import BatchResolver
+from .job_manager import JobManager
+from .video_info_service import VideoInfoService
+from .ydl_cache import YtDlpCache
+from ..models.video_info import DownloadRequest, VideoInfo
+from ..models.exceptions import JobNotFoundError, VideoInfoError, CookiesNotFoundError, SettingsError
+from ..config.constants import DaemonConfig
+from ..config.settings import Settings
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """Roteia as requisições HTTP para o JobManager."""
+
+    server: '_DaemonHTTPServer'
+    protocol_version = "HTTP/1.1"
+
+    _JOB_ROUTE = re.compile(r'^/jobs/(?P<job_id>[0-9a-f]+)(?:/(?P<action>cancel|pause|resume|log))?$')
+    _HEARTBEAT_SECONDS = 15.0
+
+    def do_GET(self) -> None:
+        """Trata consultas de jobs, eventos, metadados, estatísticas do cache e configurações."""
+        path, query = self._parse_path()
+
+        if path == '/jobs':
+            self._send_json(200, [job.to_dict() for job in self.server.manager.list_jobs()])
+        elif path == '/events':
+            self._stream_events(query.get('job_id'))
+        elif path == '/info':
+            self._send_video_info(query.get('url'))
+        elif path == '/cache':
+            self._send_json(200, YtDlpCache.shared().stats().to_dict())
+        elif path == '/settings':
+            self._send_json(200, Settings.shared().to_dict())
+        else:
+            match = self._JOB_ROUTE.match(path)
+            if match and not match.group('action'):
+                self._with_job(match.group('job_id'), self.server.manager.get_job)
+            elif match and match.group('action') == 'log':
+                self._send_job_log(match.group('job_id'), flush=False)
+            else:
+                self._send_json(404, {'error': 'Rota não encontrada.'})
+
+    def do_POST(self) -> None:
+        """Trata submissão, cancelamento, pausa, retomada, registro de jobs e recarga das configurações."""
+        path, query = self._parse_path()
+
+        if path == '/jobs':
+            self._submit_job()
+            return
+        if path == '/info/batch':
+            self._stream_batch_info()
+            return
+        if path == '/settings/reload':
+            self._reload_settings()
+            return
+
+        match = self._JOB_ROUTE.match(path)
+        action = match.group('action') if match else None
+        manager = self.server.manager
+
+        if action == 'cancel':
+            keep_partial = query.get('keep_partial')
+            self._with_job(
+                match.group('job_id'),
+                lambda job_id: manager.cancel(
+                    job_id, None if keep_partial is None else keep_partial == '1'
+                )
+            )
+        elif action == 'pause':
+            self._with_job(match.group('job_id'), manager.pause)
+        elif action == 'resume':
+            self._with_job(match.group('job_id'), manager.resume)
+        elif action == 'log':
+            self._send_job_log(match.group('job_id'), flush=True)
+        else:
+            self._send_json(404, {'error': 'Rota não encontrada.'})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silencia o log de acesso padrão do http.server."""
+
+    def _parse_path(self) -> Tuple[str, Dict[str, str]]:
+        """Separa caminho e parâmetros da URL."""
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        return parsed.path.rstrip('/') or '/', query
+
+    def _submit_job(self) -> None:
+        """Cria um job a partir do corpo JSON da requisição."""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+            request = DownloadRequest(
+                url=body['url'],
+                save_path=body['save_path'],
+                format_choice=body['format_choice'],
+                custom_title=body.get('custom_title'),
+                connections=int(body['connections']) if body.get('connections') else None,
+                priority=int(body.get('priority') or 0),
+                estimated_size=int(body['estimated_size']) if body.get('estimated_size') else None,
+                live=bool(body.get('live')),
+                live_from_start=bool(body.get('live_from_start'))
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': f"Requisição inválida: {e}"})
+            return
+
+        job = self.server.manager.submit(request, keep_partial=bool(body.get('keep_partial')))
+        self._send_json(201, job.to_dict())
+
+    def _with_job(self, job_id: str, action) -> None:
+        """Executa uma ação sobre um job e responde com seu estado."""
+        try:
+            job = action(job_id)
+        except JobNotFoundError as e:
+            self._send_json(404, {'error': str(e)})
+            return
+        self._send_json(200, job.to_dict())
+
+    def _send_job_log(self, job_id: str, flush: bool) -> None:
+        """Responde com o registro do job, gravando-o em arquivo se pedido."""
+        try:
+            log = self.server.manager.get_log(job_id)
+        except JobNotFoundError as e:
+            self._send_json(404, {'error': str(e)})
+            return
+        if flush:
+            try:
+                log.flush()
+            except OSError as e:
+                self._send_json(500, {'error': f"Não foi possível gravar o registro: {e}"})
+                return
+        self._send_json(200, {'job_id': job_id, 'file': log.file_path, 'lines': log.lines()})
+
+    def _reload_settings(self) -> None:
+        """Relê o arquivo e o ambiente, respondendo com o que mudou."""
+        settings = Settings.shared()
+        try:
+            changed = settings.reload()
+        except SettingsError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        self._send_json(200, {
+            'profile': settings.profile,
+            'changed': changed,
+            'restart_required': settings.restart_required(changed),
+        })
+
+    def _send_video_info(self, url: Optional[str]) -> None:
+        """Responde com os metadados de um vídeo."""
+        if not url:
+            self._send_json(400, {'error': "Parâmetro 'url' obrigatório."})
+            return
+        try:
+            info = self.server.video_info_service.get_video_info(url)
+        except (CookiesNotFoundError, VideoInfoError) as e:
+            self._send_json(502, {'error': str(e)})
+            return
+        self._send_json(200, self._video_info_dict(info))
+
+    def _stream_batch_info(self) -> None:
+        """Resolve uma lista de URLs, transmitindo cada resultado em NDJSON."""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            urls = json.loads(self.rfile.read(length) or b'{}')['urls']
+            if not isinstance(urls, list):
+                raise TypeError("'urls' deve ser uma lista")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': f"Requisição inválida: {e}"})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        results = self.server.batch_resolver.resolve(str(url) for url in urls)
+        try:
+            for result in results:
+                payload = {'url': result.url, 'video_id': result.video_id, 'error': result.error}
+                if result.info is not None:
+                    payload.update(self._video_info_dict(result.info))
+                self._write_line(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            results.close()
+            self.close_connection = True
+
+    @staticmethod
+    def _video_info_dict(info: VideoInfo) -> Dict[str, Any]:
+        """Serializa os metadados de um vídeo."""
+        return {
+            'title': info.title,
+            'thumbnail_url': info.thumbnail_url,
+            'thumbnails': info.thumbnails,
+            'duration': info.duration,
+            'size_estimates': info.size_estimates,
+        }
+
+    def _stream_events(self, job_id: Optional[str]) -> None:
+        """Transmite eventos como JSON delimitado por linhas (NDJSON)."""
+        subscription = self.server.manager.subscribe(job_id)
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+
+            if job_id:
+                # Garante que o cliente receba o estado atual mesmo sem novos eventos
+                try:
+                    job = self.server.manager.get_job(job_id)
+                except JobNotFoundError as e:
+                    self._write_line({'event': 'error', 'error': str(e)})
+                    return
+                self._write_line({'event': 'status', 'job': job.to_dict()})
+                if job.status.is_terminal():
+                    return
+
+            while not self.server.stopping:
+                event = subscription.get(timeout=self._HEARTBEAT_SECONDS)
+                if event is None:
+                    event = {'event': 'heartbeat'}
+                self._write_line(event)
+                if job_id and event['event'] == 'status' and event['job']['status'] in (
+                    'completed', 'failed', 'cancelled'
+                ):
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            subscription.close()
+            self.close_connection = True
+
+    def _write_line(self, payload: Dict[str, Any]) -> None:
+        """Escreve uma linha NDJSON e força o envio."""
+        self.wfile.write(json.dumps(payload).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        """Envia uma resposta JSON."""
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _DaemonHTTPServer(ThreadingHTTPServer):
+    """Servidor HTTP com acesso ao gerenciador de jobs."""
+
+    daemon_threads = True
+
+    def __init__(self, address, manager: JobManager, video_info_service: VideoInfoService):
+        super().__init__(address, _DaemonRequestHandler)
+        self.manager = manager
+        self.video_info_service = video_info_service
+        self.batch_resolver = BatchResolver(video_info_service)
+        self.stopping = False
+
+
+class DownloadDaemon:
+    """Daemon que serve um único motor de download para vários clientes."""
+
+    def __init__(
+        self,
+        manager: Optional[JobManager] = None,
+        video_info_service: Optional[VideoInfoService] = None,
+        host: str = DaemonConfig.HOST,
+        port: int = DaemonConfig.PORT
+    ):
+        """
+        Inicializa o daemon.
+
+        Args:
+            manager: Fila de jobs compartilhada
+            video_info_service: Serviço de metadados compartilhado
+            host: Endereço de escuta (apenas local por padrão)
+            port: Porta de escuta (0 = porta livre qualquer)
+        """
+        video_info_service = video_info_service or VideoInfoService()
+        self._manager = manager or JobManager(video_info_service=video_info_service)
+        Settings.shared().subscribe(self._on_settings_changed)
+        self._server = _DaemonHTTPServer((host, port), self._manager, video_info_service)
+
+    @property
+    def address(self) -> str:
+        """URL base do daemon."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def manager(self) -> JobManager:
+        """Gerenciador de jobs servido pelo daemon."""
+        return self._manager
+
+    def serve_forever(self) -> None:
+        """Inicia os workers e atende requisições até o encerramento."""
+        self._manager.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._manager.shutdown()
+
+    def shutdown(self) -> None:
+        """Encerra o servidor e a fila de jobs."""
+        Settings.shared().unsubscribe(self._on_settings_changed)
+        self._server.stopping = True
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _on_settings_changed(self, changed: Dict[str, Any]) -> None:
+        """Aplica à fila os novos limites de concorrência e banda."""
+        if 'daemon.max_concurrent_jobs' in changed or 'daemon.total_rate_limit' in changed:
+            self._manager.reconfigure(DaemonConfig.MAX_CONCURRENT_JOBS, DaemonConfig.TOTAL_RATE_LIMIT)
@@ -7,60 +7,284 @@ Aplica o princípio de Responsabilidade Única (SRP).
 
 import os
 import re
-from typing import Callable, Optional, Dict, Any
-import yt_dlp
-
+import sqlite3
+from typing import Callable, List, Optional, Dict, Any
 from ..models.video_info import DownloadRequest, DownloadProgress
-from ..models.exceptions import DownloadError, CookiesNotFoundError
-from ..config.constants import AppConstants, DownloadFormats
+from .content_store import ContentStore
+from .cookie_manager import CookieJarManager
+from .format_selector import FormatSelector
+from .history_store import HistoryRecorder, HistoryStore
+from .job_control import JobControl
+from .job_log import JobLog
+from .live_recorder import LiveRecorder
+from .storage import DiskPreflight, DiskSpaceGuard, StagingArea
+from .stream_sink import MediaStreamer, StreamSink
+from .throttle_monitor import ThrottleMonitor
+from .ydl_cache import YtDlpCache
+from .ydl_pool import YoutubeDLPool
+from ..models.exceptions import (
+    DownloadError, DownloadCancelledError, CookiesNotFoundError, InsufficientDiskSpaceError
+)
+from ..config.constants import (
+    AppConstants, ContentStoreConfig, DownloadConfig, DownloadFormats, LogConfig, RangeConfig,
+    StorageConfig, ThrottleConfig
+)
+
+# scratch_dir não informado: StorageConfig.SCRATCH_DIR é lido a cada job
+_SCRATCH_FROM_CONFIG = object()
 
 
 class DownloadService:
     """Serviço responsável pelo download de vídeos."""
     
-    def __init__(self, cookies_file: str = AppConstants.COOKIES_FILE):
+    def __init__(
+        self,
+        cookies_file: str = AppConstants.COOKIES_FILE,
+        rate_limit: Optional[int] = None,
+        cookie_manager: Optional[CookieJarManager] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None,
+        scratch_dir: Optional[str] = _SCRATCH_FROM_CONFIG,
+        disk_guard: Optional[DiskSpaceGuard] = None,
+        history_store: Optional[HistoryStore] = None,
+        ydl_cache: Optional[YtDlpCache] = None,
+        content_store: Optional[ContentStore] = None,
+        live_recorder: Optional[LiveRecorder] = None,
+        media_streamer: Optional[MediaStreamer] = None
+    ):
         """
         Inicializa o serviço de download.
         
         Args:
             cookies_file: Caminho para o arquivo de cookies
+            rate_limit: Limite de banda por download em bytes/s (None = DownloadConfig.RATE_LIMIT)
+            cookie_manager: Gerenciador do cookie jar compartilhado
+            ydl_pool: Pool de instâncias do yt-dlp reutilizadas entre jobs
+            scratch_dir: Diretório local para fragmentos e mesclagem (None = direto no
+                destino; padrão: StorageConfig.SCRATCH_DIR, lido a cada job)
+            disk_guard: Verificação de espaço livre compartilhada entre jobs
+            history_store: Histórico onde os downloads concluídos são registrados
+            ydl_cache: Cache em disco do yt-dlp (player e assinaturas)
+            content_store: Armazenamento por conteúdo que deduplica os arquivos
+                entregues (padrão: o compartilhado, se ContentStoreConfig.ENABLED)
+            live_recorder: Gravador usado nas requisições de transmissões ao vivo
+            media_streamer: Envio da mídia para um pipe ou stream (stream())
         """
         self._cookies_file = cookies_file
+        self._rate_limit = rate_limit
+        self._cookie_manager = cookie_manager or CookieJarManager.shared(cookies_file)
+        self._ydl_pool = ydl_pool or YoutubeDLPool(
+            self._cookie_manager, cache=ydl_cache or YtDlpCache.shared()
+        )
+        self._scratch_dir = scratch_dir
+        self._disk_guard = disk_guard or DiskSpaceGuard()
+        self._history_store = history_store
+        if content_store is None and ContentStoreConfig.ENABLED:
+            content_store = ContentStore.shared()
+        self._content_store = content_store
+        self._live_recorder = live_recorder or LiveRecorder(
+            cookie_manager=self._cookie_manager, ydl_pool=self._ydl_pool
+        )
+        self._media_streamer = media_streamer or MediaStreamer(
+            cookie_manager=self._cookie_manager, ydl_pool=self._ydl_pool
+        )
     
     def download(
         self,
         request: DownloadRequest,
-        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        control: Optional[JobControl] = None
     ) -> None:
         """
         Realiza o download de um vídeo.
         
+        Requisições com live=True gravam a transmissão ao vivo em arquivos
+        rotativos (LiveRecorder) em vez de um único arquivo crescente.
+        
         Args:
             request: Requisição de download
             progress_callback: Callback para atualização de progresso
+            control: Controle de cancelamento/pausa do download
             
         Raises:
             CookiesNotFoundError: Se o arquivo de cookies não existir
+            DownloadCancelledError: Se o download for cancelado
+            InsufficientDiskSpaceError: Se não houver espaço para o download
             DownloadError: Se houver erro no download
         """
+        self._check_cookies()
+        
+        if request.live:
+            self._record_live(request, progress_callback, control)
+            return
+        
+        if control is not None:
+            progress_callback = control.wrap_progress_hook(progress_callback)
+        
+        scratch_dir = StorageConfig.SCRATCH_DIR if self._scratch_dir is _SCRATCH_FROM_CONFIG else self._scratch_dir
+        staging = StagingArea(scratch_dir) if scratch_dir else None
+        output_dir = staging.prepare() if staging else request.save_path
+        preflight = DiskPreflight(
+            self._disk_guard, staging.directory if staging else None, request.save_path
+        )
+        
+        monitor = ThrottleMonitor(
+            control.stats if control is not None else None,
+            rate_limit=self._rate_limit or DownloadConfig.RATE_LIMIT
+        )
+        ydl_opts = self._build_download_options(
+            request, monitor.wrap_progress_hook(progress_callback), output_dir
+        )
+        ydl_opts['retry_sleep_functions'] = monitor.retry_sleep_functions()
+        selector = ydl_opts['format']
+        
+        def match_filter(info: Dict[str, Any], *, incomplete: bool = False) -> Optional[str]:
+            # O yt-dlp chama o filtro antes da seleção do formato (incomplete)
+            # e de novo em process_info, já com o formato escolhido. O seletor
+            # não recebe a duração, então ela é guardada já na primeira chamada
+            selector.observe(info)
+            return preflight(info, incomplete=incomplete)
+        ydl_opts['match_filter'] = match_filter
+        post_hooks = [staging.record] if staging is not None else []
+        recorder = HistoryRecorder(request) if self._history_store is not None else None
+        if recorder is not None:
+            ydl_opts['progress_hooks'] = ydl_opts.get('progress_hooks', []) + [recorder.progress_hook]
+            post_hooks.append(recorder.post_hook)
+        delivered: List[str] = []
+        if self._content_store is not None:
+            post_hooks.append(delivered.append)
+        if post_hooks:
+            ydl_opts['post_hooks'] = post_hooks
+        log = control.log if control is not None else JobLog()
+        ydl_opts['logger'] = log
+        ydl_opts['progress_hooks'] = ydl_opts.get('progress_hooks', []) + [log.progress_hook]
+        ydl_opts['postprocessor_hooks'] = [log.postprocessor_hook]
+        if control is not None:
+            ydl_opts['postprocessor_hooks'].append(control.postprocessor_hook)
+        
+        try:
+            with self._ydl_pool.checkout(ydl_opts) as ydl:
+                ydl.download([request.url])
+            if staging is not None:
+                staging.commit(request.save_path)
+            for filepath in delivered:
+                path = os.path.join(request.save_path, os.path.basename(filepath))
+                try:
+                    self._content_store.ingest(path)
+                except sqlite3.Error as e:
+                    # A deduplicação é opcional: o arquivo já foi entregue
+                    log.warning(f"Arquivo não deduplicado ({path}): {e}")
+            if recorder is not None:
+                self._history_store.add_many(recorder.entries())
+            self._cookie_manager.save()
+        except InsufficientDiskSpaceError:
+            raise
+        except Exception as e:
+            if control is not None and control.is_cancelled:
+                control.cleanup_partial_files()
+                raise DownloadCancelledError("Download cancelado.") from e
+            log.error(f"{type(e).__name__}: {e}")
+            raise DownloadError(
+                f"Erro durante o download: {str(e)}\nRegistro do job: {self._flush_log(log)}"
+            ) from e
+        finally:
+            preflight.release()
+            if staging is not None:
+                staging.cleanup()
+    
+    def stream(
+        self,
+        request: DownloadRequest,
+        sink: StreamSink,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> Dict[str, Any]:
+        """
+        Envia o vídeo a um pipe ou stream em vez de gravá-lo em save_path.
+        
+        O destino recebe os bytes à medida que chegam, sem arquivo
+        intermediário; só formatos sem mesclagem nem conversão servem.
+        
+        Args:
+            request: Requisição de download (save_path é ignorado)
+            sink: Destino dos bytes (ex.: FileSink.open('-'))
+            progress_callback: Callback para atualização de progresso
+            control: Controle de cancelamento/pausa do envio
+            
+        Returns:
+            Formato enviado ('title', 'format_id', 'ext', 'bytes')
+            
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+            DownloadCancelledError: Se o envio for cancelado
+            DownloadError: Se não houver formato transmissível ou o envio falhar
+        """
+        self._check_cookies()
+        result = self._media_streamer.stream(request, sink, progress_callback, control)
+        self._cookie_manager.save()
+        return result
+    
+    def set_rate_limit(self, rate_limit: Optional[int]) -> None:
+        """
+        Altera o limite de banda dos próximos downloads.
+        
+        Downloads em andamento mantêm o limite com que começaram.
+        
+        Args:
+            rate_limit: Limite por download em bytes/s (None = DownloadConfig.RATE_LIMIT)
+        """
+        self._rate_limit = rate_limit
+    
+    def prewarm(self) -> None:
+        """
+        Prepara o primeiro download antes de ele ser pedido.
+        
+        Deixa no pool uma instância do yt-dlp com o perfil usado pelos
+        downloads, o extrator do YouTube e o cookie jar já carregados.
+        Pode ser chamado de outra thread. Sem arquivo de cookies não há o
+        que preparar, pois o download seria recusado.
+        """
+        if not os.path.exists(self._cookies_file):
+            return
+        
+        request = DownloadRequest(url="", save_path=".", format_choice=DownloadFormats.DEFAULT)
+        with self._ydl_pool.checkout(self._build_download_options(request, None)) as ydl:
+            ydl.get_info_extractor('Youtube')
+    
+    def _check_cookies(self) -> None:
+        """Recusa o download se o arquivo de cookies não existir."""
         if not os.path.exists(self._cookies_file):
             raise CookiesNotFoundError(
                 f"Arquivo de cookies '{self._cookies_file}' não encontrado.\n"
                 "Exporte usando a extensão 'Get cookies.txt clean' e salve na pasta do app."
             )
-        
-        ydl_opts = self._build_download_options(request, progress_callback)
-        
+    
+    @staticmethod
+    def _flush_log(log: JobLog) -> str:
+        """Grava o registro do job em arquivo, sem mascarar o erro original."""
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([request.url])
-        except Exception as e:
-            raise DownloadError(f"Erro durante o download: {str(e)}") from e
+            return log.flush()
+        except OSError as e:
+            return f"não gravado ({e})"
+    
+    def _record_live(
+        self,
+        request: DownloadRequest,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        control: Optional[JobControl]
+    ) -> None:
+        """Grava uma transmissão ao vivo, anexando o registro do job aos erros."""
+        log = control.log if control is not None else JobLog()
+        try:
+            self._live_recorder.record(request, progress_callback, control)
+        except DownloadError as e:
+            log.error(f"{type(e).__name__}: {e}")
+            raise DownloadError(f"{e}\nRegistro do job: {self._flush_log(log)}") from e
     
     def _build_download_options(
         self,
         request: DownloadRequest,
-        progress_callback: Optional[Callable[[Dict[str, Any]], None]]
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        output_dir: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Constrói as opções de download para o yt-dlp.
@@ -68,26 +292,41 @@ class DownloadService:
         Args:
             request: Requisição de download
             progress_callback: Callback para progresso
+            output_dir: Diretório onde o yt-dlp grava os arquivos (padrão: destino)
             
         Returns:
             Dicionário de opções para o yt-dlp
         """
-        format_string = DownloadFormats.get_format_string(request.format_choice)
+        policy = DownloadFormats.get_policy(request.format_choice)
         filename = request.get_filename()
         
         options = {
-            'format': format_string,
-            'outtmpl': os.path.join(request.save_path, f'{filename}.%(ext)s'),
+            'format': FormatSelector(policy, merge_ext='mp4'),
+            'outtmpl': os.path.join(output_dir or request.save_path, f'{filename}.%(ext)s'),
             'merge_output_format': 'mp4',
-            'cookiefile': self._cookies_file,
             'quiet': True,
             'noprogress': True,
+            'socket_timeout': ThrottleConfig.STALL_TIMEOUT,
+            'buffersize': ThrottleConfig.BLOCK_SIZE,
+            'noresizebuffer': True,
+            'verbose': LogConfig.VERBOSE,
             'postprocessors': [{
                 'key': 'FFmpegVideoConvertor',
                 'preferedformat': 'mp4',
             }],
         }
         
+        rate_limit = self._rate_limit or DownloadConfig.RATE_LIMIT
+        if rate_limit:
+            options['ratelimit'] = rate_limit
+        
+        if DownloadConfig.CONCURRENT_FRAGMENTS > 1:
+            options['concurrent_fragment_downloads'] = DownloadConfig.CONCURRENT_FRAGMENTS
+        
+        connections = request.connections or RangeConfig.CONNECTIONS
+        if connections > 1:
+            options['range_connections'] = connections
+        
         if progress_callback:
             options['progress_hooks'] = [progress_callback]
         
@@ -0,0 +1,231 @@
+"""
+Worker da fila compartilhada.
+
+Consome a WorkQueue com um número fixo de slots, executando cada job
+com o DownloadService (ou o backend de processos) e renovando as
+concessões em uma thread própria. Se uma renovação falha, o job foi
+devolvido à fila e possivelmente já está com outro worker: o download
+local é cancelado e seu resultado descartado. Erros da própria fila
+(ex.: banco bloqueado em armazenamento de rede) não derrubam as
+threads: são registrados e a operação é repetida após uma espera
+crescente. O resultado de um job é registrado de novo até a fila
+aceitá-lo ou a concessão vencer, para que outro worker não repita um
+download já concluído.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .download_service import DownloadService
+from .history_store import HistoryStore
+from .job_control import JobControl
+from .job_log import JobLog
+from .work_queue import WorkQueue
+from ..models.job import WorkItem
+from ..models.exceptions import DownloadCancelledError
+from ..config.constants import FarmConfig
+
+
+class FarmWorker:
+    """Executa jobs da fila compartilhada até ser interrompido."""
+
+    def __init__(
+        self,
+        work_queue: WorkQueue,
+        download_service: Optional[DownloadService] = None,
+        concurrency: int = 1,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: float = FarmConfig.HEARTBEAT_INTERVAL,
+        poll_interval: float = FarmConfig.POLL_INTERVAL,
+        error_backoff: float = FarmConfig.ERROR_BACKOFF
+    ):
+        """
+        Inicializa o worker.
+
+        Args:
+            work_queue: Fila compartilhada
+            download_service: Serviço que executa os downloads
+            concurrency: Downloads simultâneos neste worker
+            worker_id: Identificador do worker (padrão: máquina e PID)
+            heartbeat_interval: Segundos entre renovações das concessões
+            poll_interval: Espera quando a fila está vazia
+            error_backoff: Espera inicial após um erro da fila
+        """
+        self._queue = work_queue
+        self._download_service = download_service or DownloadService(history_store=HistoryStore.shared())
+        self._concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self._heartbeat_interval = heartbeat_interval
+        self._poll_interval = poll_interval
+        self._error_backoff = error_backoff
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._active: Dict[int, Tuple[WorkItem, JobControl]] = {}
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Inicia os slots e a thread de renovação das concessões."""
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._slot_loop, name=f"farm-slot-{index}", daemon=True)
+            for index in range(self._concurrency)
+        ]
+        self._threads.append(
+            threading.Thread(target=self._heartbeat_loop, name="farm-heartbeat", daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Interrompe o worker, cancelando os downloads em andamento.
+
+        Os jobs cancelados voltam à fila sem contar a tentativa (ver
+        WorkQueue.release), em vez de esperar a concessão vencer. Se a
+        fila estiver indisponível, a espera pelas threads pode chegar ao
+        prazo da concessão (ver _settle).
+
+        Args:
+            wait: Se True, aguarda as threads terminarem
+        """
+        self._stop.set()
+        with self._lock:
+            controls = [control for _, control in self._active.values()]
+        for control in controls:
+            control.cancel(keep_partial=True)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def run_forever(self) -> None:
+        """Executa até KeyboardInterrupt."""
+        self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def process_one(self) -> bool:
+        """
+        Retira e executa um único job.
+
+        Returns:
+            False se a fila estava vazia
+        """
+        item = self._queue.claim(self.worker_id)
+        if item is None:
+            return False
+
+        control = JobControl(log=JobLog(f"farm-{item.item_id}"))
+        with self._lock:
+            # Conferido sob o lock: um stop() que já tirou sua cópia de
+            # _active não cancelaria este job
+            stopping = self._stop.is_set()
+            if not stopping:
+                self._active[item.item_id] = (item, control)
+        if stopping:
+            self._settle(item, lambda: self._queue.release(item))
+            return True
+
+        # O item só sai de _active (e deixa de ser renovado) depois que a
+        # fila registra o resultado
+        try:
+            self._download_service.download(item.request, control=control)
+        except DownloadCancelledError:
+            # Worker encerrando: devolve o job agora. Concessão perdida: o
+            # job já está com a fila e a devolução é recusada
+            if self._stop.is_set():
+                self._settle(item, lambda: self._queue.release(item))
+        except Exception as e:
+            error = str(e)
+            self._settle(item, lambda: self._queue.fail(item, error, control.log.file_path))
+        else:
+            self._settle(item, lambda: self._queue.complete(item))
+        finally:
+            with self._lock:
+                self._active.pop(item.item_id, None)
+        return True
+
+    def _settle(self, item: WorkItem, action: Callable[[], bool]) -> None:
+        """
+        Registra o resultado de um job na fila, repetindo enquanto ela falhar.
+
+        As novas tentativas não são interrompidas pelo encerramento; só
+        param quando a concessão vence, pois aí o job pode já estar com
+        outro worker.
+
+        Args:
+            item: Item concedido ao worker
+            action: Operação da fila (complete, fail ou release)
+        """
+        errors = 0
+        while True:
+            try:
+                action()
+                return
+            except Exception as e:
+                remaining = item.lease_expires - time.time()
+                if remaining <= 0:
+                    print(
+                        f"Worker {self.worker_id}: resultado do item {item.item_id} não registrado"
+                        f" ({type(e).__name__}: {e}); a concessão venceu",
+                        file=sys.stderr
+                    )
+                    return
+                errors += 1
+                time.sleep(min(self._report_error("registrar o resultado de um job", e, errors), remaining))
+
+    def _slot_loop(self) -> None:
+        """Consome a fila até o encerramento."""
+        errors = 0
+        while not self._stop.is_set():
+            try:
+                processed = self.process_one()
+            except Exception as e:
+                errors += 1
+                self._stop.wait(self._report_error("retirar um job", e, errors))
+                continue
+            errors = 0
+            if not processed:
+                self._stop.wait(self._poll_interval)
+
+    def _heartbeat_loop(self) -> None:
+        """Renova as concessões ativas, cancelando os jobs cuja concessão se perdeu."""
+        errors = 0
+        interval = self._heartbeat_interval
+        while not self._stop.wait(interval):
+            try:
+                self.renew_leases()
+            except Exception as e:
+                errors += 1
+                # Tenta de novo antes do próximo ciclo: a concessão continua correndo
+                interval = min(self._report_error("renovar as concessões", e, errors), self._heartbeat_interval)
+                continue
+            errors = 0
+            interval = self._heartbeat_interval
+
+    def _report_error(self, action: str, error: Exception, errors: int) -> float:
+        """Registra um erro da fila e retorna a espera antes da próxima tentativa."""
+        delay = min(self._error_backoff * 2 ** (errors - 1), FarmConfig.ERROR_BACKOFF_MAX)
+        print(
+            f"Worker {self.worker_id}: erro ao {action} ({type(error).__name__}: {error});"
+            f" nova tentativa em {delay:.1f}s",
+            file=sys.stderr
+        )
+        return delay
+
+    def renew_leases(self) -> None:
+        """Renova uma vez as concessões dos jobs em andamento."""
+        with self._lock:
+            active = list(self._active.values())
+        for item, control in active:
+            if not self._queue.heartbeat(item):
+                control.log.warning(f"Concessão do item {item.item_id} perdida; abandonando o job.")
+                control.cancel(keep_partial=True)
@@ -0,0 +1,304 @@
+"""
+Seleção de formatos por tamanho e codec.
+
+Inspeciona os formatos disponíveis de um vídeo uma única vez, estima
+o tamanho de cada combinação possível e escolhe a menor que atenda à
+política (resolução, codec e contêiner). Pode ser usado diretamente
+como a opção 'format' do yt-dlp.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..models.format_policy import FormatChoice, FormatPolicy
+
+Format = Dict[str, Any]
+
+
+class FormatSelector:
+    """Seletor de formatos guiado por uma FormatPolicy."""
+
+    def __init__(self, policy: FormatPolicy, merge_ext: str = 'mp4', duration: Optional[float] = None):
+        """
+        Inicializa o seletor.
+
+        Args:
+            policy: Política de seleção
+            merge_ext: Contêiner final quando vídeo e áudio são mesclados
+            duration: Duração do vídeo em segundos, se já conhecida
+        """
+        self._policy = policy
+        self._merge_ext = merge_ext
+        self._duration = duration
+
+    @property
+    def policy(self) -> FormatPolicy:
+        """Política usada na seleção."""
+        return self._policy
+
+    def observe(self, info: Dict[str, Any]) -> None:
+        """
+        Guarda a duração do vídeo que será selecionado em seguida.
+
+        O contexto que o yt-dlp passa ao seletor não inclui a duração;
+        este método deve ser chamado com o info dict antes da seleção
+        (por exemplo, pelo 'match_filter'), para que formatos que só
+        informam bitrate tenham tamanho estimado como em
+        estimate_choice_sizes().
+
+        Args:
+            info: Info dict do vídeo
+        """
+        self._duration = info.get('duration')
+
+    def __call__(self, ctx: Dict[str, Any]) -> Iterator[Format]:
+        """
+        Interface de seletor do yt-dlp (opção 'format' como callable).
+
+        Args:
+            ctx: Contexto do yt-dlp com a chave 'formats' (e, opcionalmente,
+                'duration'; sem ela, vale a duração informada ao seletor)
+
+        Yields:
+            Formato escolhido, no mesmo formato que o yt-dlp usa para
+            combinações 'video+audio'
+        """
+        formats = ctx.get('formats') or []
+        choice = self.select(formats, ctx.get('duration') or self._duration)
+        if choice is None:
+            # Nenhum stream reconhecível: mantém o comportamento de "best"
+            if formats:
+                yield formats[-1]
+            return
+        if choice.is_merged:
+            yield self._merge(*choice.formats)
+        else:
+            yield choice.formats[0]
+
+    def select(
+        self,
+        formats: Sequence[Format],
+        duration: Optional[float] = None
+    ) -> Optional[FormatChoice]:
+        """
+        Escolhe os streams para a política configurada.
+
+        Se nenhum formato atender às restrições de codec e contêiner,
+        elas são relaxadas antes de desistir; o limite de resolução é
+        sempre respeitado quando houver algum formato dentro dele.
+
+        Args:
+            formats: Lista 'formats' do info dict do yt-dlp
+            duration: Duração em segundos, usada para estimar tamanhos
+                de formatos que só informam bitrate
+
+        Returns:
+            FormatChoice escolhido ou None se não houver streams
+        """
+        usable = [f for f in formats if self._is_usable(f)]
+        choice = self._select(usable, self._policy, duration)
+        if choice is None:
+            relaxed = FormatPolicy(
+                max_height=self._policy.max_height,
+                audio_only=self._policy.audio_only,
+                min_audio_bitrate=self._policy.min_audio_bitrate,
+                prefer_smallest=self._policy.prefer_smallest,
+            )
+            choice = self._select(usable, relaxed, duration)
+        return choice
+
+    @staticmethod
+    def estimate_size(fmt: Format, duration: Optional[float] = None) -> Optional[int]:
+        """
+        Estima o tamanho em bytes de um formato.
+
+        Args:
+            fmt: Formato do yt-dlp
+            duration: Duração do vídeo em segundos
+
+        Returns:
+            Tamanho estimado ou None se não houver dados suficientes
+        """
+        size = fmt.get('filesize') or fmt.get('filesize_approx')
+        if size:
+            return int(size)
+        tbr = fmt.get('tbr') or ((fmt.get('vbr') or 0) + (fmt.get('abr') or 0))
+        if tbr and duration:
+            return int(tbr * 1000 / 8 * duration)
+        return None
+
+    def _select(
+        self,
+        formats: List[Format],
+        policy: FormatPolicy,
+        duration: Optional[float]
+    ) -> Optional[FormatChoice]:
+        """Aplica uma política sobre formatos já filtrados."""
+        audio = [
+            f for f in formats
+            if self._is_audio_only(f) and self._codec_allowed(f.get('acodec'), policy.audio_codecs)
+        ]
+        audio = self._preferred_language(audio)
+
+        if policy.audio_only:
+            if policy.containers:
+                audio = [f for f in audio if f.get('ext') in policy.containers]
+            best_audio = self._pick_audio(audio, policy, duration)
+            return self._build_choice([best_audio], duration) if best_audio else None
+
+        video = [
+            f for f in formats
+            if f.get('vcodec') != 'none'
+            and (not policy.max_height or (f.get('height') or 0) <= policy.max_height)
+            and self._codec_allowed(f.get('vcodec'), policy.video_codecs)
+            and (not policy.containers or f.get('ext') in policy.containers)
+        ]
+        if not video:
+            return None
+
+        tier = max(self._tier(f) for f in video)
+        best_audio = self._pick_audio(audio, policy, duration)
+
+        candidates: List[List[Format]] = []
+        for fmt in video:
+            if self._tier(fmt) != tier:
+                continue
+            if fmt.get('acodec') not in (None, 'none'):
+                candidates.append([fmt])
+            elif best_audio is not None:
+                candidates.append([fmt, best_audio])
+        if not candidates:
+            return None
+
+        return self._build_choice(self._rank(candidates, policy, duration), duration)
+
+    def _pick_audio(
+        self,
+        audio: List[Format],
+        policy: FormatPolicy,
+        duration: Optional[float]
+    ) -> Optional[Format]:
+        """Escolhe o áudio: o menor acima do piso de bitrate ou o melhor abaixo dele."""
+        if not audio:
+            return None
+        above_floor = [f for f in audio if (f.get('abr') or f.get('tbr') or 0) >= policy.min_audio_bitrate]
+        if above_floor:
+            return self._rank([[f] for f in above_floor], policy, duration)[0]
+        return max(audio, key=lambda f: f.get('abr') or f.get('tbr') or 0)
+
+    def _rank(
+        self,
+        candidates: List[List[Format]],
+        policy: FormatPolicy,
+        duration: Optional[float]
+    ) -> List[Format]:
+        """Ordena combinações pelo tamanho estimado e retorna a preferida."""
+        def key(combo: List[Format]) -> Tuple[bool, float, float]:
+            sizes = [self.estimate_size(f, duration) for f in combo]
+            bitrate = sum(f.get('tbr') or 0 for f in combo)
+            if None in sizes:
+                return (True, 0.0, bitrate)
+            return (False, float(sum(sizes)), bitrate)
+
+        scored = [(key(combo), combo) for combo in candidates]
+        if policy.prefer_smallest:
+            return min(scored, key=lambda item: item[0])[1]
+        # Maior arquivo primeiro; combinações sem tamanho conhecido ficam por último
+        return max(scored, key=lambda item: (not item[0][0], item[0][1], item[0][2]))[1]
+
+    def _build_choice(self, combo: List[Format], duration: Optional[float]) -> FormatChoice:
+        """Monta o FormatChoice de uma combinação."""
+        video = next((f for f in combo if f.get('vcodec') not in (None, 'none')), None)
+        audio = next((f for f in combo if f.get('acodec') not in (None, 'none')), None)
+        sizes = [self.estimate_size(f, duration) for f in combo]
+
+        return FormatChoice(
+            format_id='+'.join(str(f.get('format_id')) for f in combo),
+            ext=self._merge_ext if len(combo) > 1 else combo[0].get('ext', self._merge_ext),
+            height=video.get('height') if video else None,
+            vcodec=video.get('vcodec') if video else None,
+            acodec=audio.get('acodec') if audio else None,
+            estimated_size=None if None in sizes else sum(sizes),
+            formats=list(combo),
+        )
+
+    def _merge(self, video: Format, audio: Format) -> Format:
+        """Monta o dicionário de formato mesclado esperado pelo yt-dlp."""
+        pair = (video, audio)
+        sizes = [f.get('filesize') or f.get('filesize_approx') for f in pair]
+        return {
+            'requested_formats': list(pair),
+            'format': '+'.join(str(f.get('format', f.get('format_id'))) for f in pair),
+            'format_id': '+'.join(str(f.get('format_id')) for f in pair),
+            'ext': self._merge_ext,
+            'protocol': '+'.join(str(f.get('protocol', 'https')) for f in pair),
+            'language': audio.get('language'),
+            'filesize_approx': sum(sizes) if None not in sizes else None,
+            'tbr': sum(f.get('tbr') or 0 for f in pair),
+            'width': video.get('width'),
+            'height': video.get('height'),
+            'resolution': video.get('resolution'),
+            'fps': video.get('fps'),
+            'dynamic_range': video.get('dynamic_range'),
+            'vcodec': video.get('vcodec'),
+            'vbr': video.get('vbr'),
+            'aspect_ratio': video.get('aspect_ratio'),
+            'acodec': audio.get('acodec'),
+            'abr': audio.get('abr'),
+            'asr': audio.get('asr'),
+            'audio_channels': audio.get('audio_channels'),
+        }
+
+    @staticmethod
+    def _is_usable(fmt: Format) -> bool:
+        """Descarta storyboards, streams com DRM e formatos sem mídia."""
+        if fmt.get('has_drm') or fmt.get('ext') == 'mhtml':
+            return False
+        return not (fmt.get('vcodec') == 'none' and fmt.get('acodec') == 'none')
+
+    @staticmethod
+    def _is_audio_only(fmt: Format) -> bool:
+        """Verifica se o formato contém apenas áudio."""
+        return fmt.get('vcodec') == 'none' and fmt.get('acodec') not in (None, 'none')
+
+    @staticmethod
+    def _codec_allowed(codec: Optional[str], allowed: Tuple[str, ...]) -> bool:
+        """Compara o codec com os prefixos permitidos."""
+        if not allowed:
+            return True
+        return bool(codec) and codec.lower().startswith(allowed)
+
+    @staticmethod
+    def _tier(fmt: Format) -> Tuple[int, bool]:
+        """Faixa de qualidade de um vídeo: altura e alta taxa de quadros."""
+        return (fmt.get('height') or 0, (fmt.get('fps') or 0) > 30)
+
+    @staticmethod
+    def _preferred_language(audio: List[Format]) -> List[Format]:
+        """Mantém apenas as faixas de áudio no idioma preferido (original)."""
+        if not audio:
+            return audio
+        best = max(f.get('language_preference') or 0 for f in audio)
+        return [f for f in audio if (f.get('language_preference') or 0) == best]
+
+
+def estimate_choice_sizes(
+    info: Dict[str, Any],
+    policies: Dict[str, FormatPolicy]
+) -> Dict[str, Optional[int]]:
+    """
+    Estima o tamanho do download para cada política.
+
+    Args:
+        info: Info dict do yt-dlp
+        policies: Políticas indexadas pelo nome exibido na interface
+
+    Returns:
+        Tamanho estimado em bytes por nome (None se desconhecido)
+    """
+    formats = info.get('formats') or []
+    duration = info.get('duration')
+    sizes: Dict[str, Optional[int]] = {}
+    for name, policy in policies.items():
+        choice = FormatSelector(policy).select(formats, duration)
+        sizes[name] = choice.estimated_size if choice else None
+    return sizes
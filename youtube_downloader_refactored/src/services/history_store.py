@@ -0,0 +1,323 @@
+"""
+Histórico de downloads.
+
+Guarda em SQLite um registro de cada arquivo baixado, com índices por
+data, canal e formato e busca textual (FTS5) por título e canal. As
+gravações são enfileiradas e feitas em lote por uma thread própria,
+de modo que registrar um download nunca espera pelo disco.
+"""
+
+import atexit
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple
+
+from ..models.history import HistoryEntry, HistoryQuery
+from ..models.video_info import DownloadRequest
+from ..utils.registry import SharedRegistry
+from ..config.constants import HistoryConfig
+
+
+class HistoryStore:
+    """Histórico de downloads em SQLite com gravação em lote."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS downloads (
+            id INTEGER PRIMARY KEY,
+            video_id TEXT,
+            title TEXT NOT NULL,
+            channel TEXT,
+            url TEXT NOT NULL,
+            format_choice TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            size_bytes INTEGER,
+            downloaded_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_downloads_date ON downloads (downloaded_at);
+        CREATE INDEX IF NOT EXISTS idx_downloads_channel
+            ON downloads (channel COLLATE NOCASE, downloaded_at);
+        CREATE INDEX IF NOT EXISTS idx_downloads_format ON downloads (format_choice, downloaded_at);
+        CREATE INDEX IF NOT EXISTS idx_downloads_video ON downloads (video_id);
+        CREATE VIRTUAL TABLE IF NOT EXISTS downloads_fts USING fts5(
+            title, channel, content='downloads', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE TRIGGER IF NOT EXISTS downloads_ai AFTER INSERT ON downloads BEGIN
+            INSERT INTO downloads_fts (rowid, title, channel)
+            VALUES (new.id, new.title, new.channel);
+        END;
+        CREATE TRIGGER IF NOT EXISTS downloads_ad AFTER DELETE ON downloads BEGIN
+            INSERT INTO downloads_fts (downloads_fts, rowid, title, channel)
+            VALUES ('delete', old.id, old.title, old.channel);
+        END;
+    """
+
+    COLUMNS = (
+        'video_id', 'title', 'channel', 'url', 'format_choice',
+        'file_path', 'size_bytes', 'downloaded_at',
+    )
+
+    _registry: ClassVar[SharedRegistry['HistoryStore']] = SharedRegistry()
+    _STOP = object()
+
+    def __init__(
+        self,
+        db_path: str = HistoryConfig.DB_PATH,
+        batch_size: int = HistoryConfig.BATCH_SIZE,
+        flush_interval: float = HistoryConfig.FLUSH_INTERVAL
+    ):
+        """
+        Inicializa o histórico, criando o banco se necessário.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+            batch_size: Máximo de registros gravados por transação
+            flush_interval: Segundos de espera para acumular um lote
+        """
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._db_path = db_path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: 'queue.Queue[Any]' = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+        self._read_lock = threading.Lock()
+        self._reader = self._connect()
+        self._reader.executescript(self.SCHEMA)
+
+    @classmethod
+    def shared(cls, db_path: str = HistoryConfig.DB_PATH) -> 'HistoryStore':
+        """
+        Retorna o histórico compartilhado para um arquivo de banco.
+
+        Os registros pendentes são gravados ao fim do processo.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        def create(path: str) -> 'HistoryStore':
+            store = cls(path)
+            atexit.register(store.close)
+            return store
+
+        return cls._registry.get(db_path, create)
+
+    def add(self, entry: HistoryEntry) -> None:
+        """
+        Enfileira um registro para gravação (não bloqueia).
+
+        Args:
+            entry: Registro do download
+        """
+        self.add_many([entry])
+
+    def add_many(self, entries: Iterable[HistoryEntry]) -> None:
+        """
+        Enfileira vários registros para gravação (não bloqueia).
+
+        Args:
+            entries: Registros dos downloads
+        """
+        self._ensure_writer()
+        for entry in entries:
+            self._queue.put(entry)
+
+    def flush(self) -> None:
+        """Aguarda a gravação de todos os registros enfileirados."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Grava os registros pendentes e encerra a thread de gravação."""
+        with self._writer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+        if writer is not None:
+            self._queue.put(self._STOP)
+            writer.join()
+        with self._read_lock:
+            self._reader.close()
+
+    def search(
+        self,
+        query: HistoryQuery = HistoryQuery(),
+        limit: int = HistoryConfig.PAGE_SIZE,
+        after: Optional[HistoryEntry] = None
+    ) -> List[HistoryEntry]:
+        """
+        Busca registros, do mais recente para o mais antigo.
+
+        A paginação é feita a partir do último registro da página
+        anterior, com custo constante independentemente da posição.
+
+        Args:
+            query: Filtros da busca
+            limit: Máximo de registros retornados
+            after: Último registro da página anterior (None = primeira página)
+
+        Returns:
+            Registros encontrados
+        """
+        sql = "SELECT d.id, " + ", ".join(f"d.{c}" for c in self.COLUMNS) + " FROM downloads d"
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        match = self._match_expression(query.text)
+        if match:
+            # Subconsulta: o índice FTS é consultado uma vez, e não por linha
+            conditions.append("d.id IN (SELECT rowid FROM downloads_fts WHERE downloads_fts MATCH ?)")
+            params.append(match)
+        if query.channel:
+            conditions.append("d.channel = ? COLLATE NOCASE")
+            params.append(query.channel)
+        if query.format_choice:
+            conditions.append("d.format_choice = ?")
+            params.append(query.format_choice)
+        if query.since is not None:
+            conditions.append("d.downloaded_at >= ?")
+            params.append(query.since)
+        if query.until is not None:
+            conditions.append("d.downloaded_at < ?")
+            params.append(query.until)
+        if after is not None:
+            conditions.append("(d.downloaded_at, d.id) < (?, ?)")
+            params.extend([after.downloaded_at, after.entry_id])
+
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY d.downloaded_at DESC, d.id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._read_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return [self._entry_from_row(row) for row in rows]
+
+    def _ensure_writer(self) -> None:
+        """Inicia a thread de gravação na primeira escrita."""
+        with self._writer_lock:
+            if self._closed:
+                raise RuntimeError("Histórico já foi fechado.")
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name='history-writer', daemon=True
+                )
+                self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Agrupa os registros enfileirados e os grava em uma transação por lote."""
+        connection = self._connect()
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    self._write_batch(connection, batch)
+            except sqlite3.Error as e:
+                # O histórico é auxiliar: uma falha de gravação não derruba a thread
+                print(f"Erro ao gravar histórico: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stopping else 0)):
+                    self._queue.task_done()
+        connection.close()
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[HistoryEntry]) -> None:
+        """Grava um lote de registros."""
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        sql = f"INSERT INTO downloads ({', '.join(self.COLUMNS)}) VALUES ({placeholders})"
+        rows = [tuple(getattr(entry, column) for column in self.COLUMNS) for entry in batch]
+        with connection:
+            connection.executemany(sql, rows)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre uma conexão em modo WAL (leituras não esperam as gravações)."""
+        connection = sqlite3.connect(self._db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @staticmethod
+    def _match_expression(text: str) -> Optional[str]:
+        """Converte o texto digitado em uma busca FTS5 por prefixo de cada palavra."""
+        words = re.findall(r"\w+", text or "")
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    @classmethod
+    def _entry_from_row(cls, row: Tuple[Any, ...]) -> HistoryEntry:
+        """Converte uma linha do banco em HistoryEntry."""
+        values = dict(zip(cls.COLUMNS, row[1:]))
+        return HistoryEntry(entry_id=row[0], **values)
+
+
+class HistoryRecorder:
+    """Coleta, durante um download, os dados dos arquivos para o histórico."""
+
+    def __init__(self, request: DownloadRequest):
+        """
+        Inicializa o coletor.
+
+        Args:
+            request: Requisição do download
+        """
+        self._request = request
+        self._info: Dict[str, Any] = {}
+        self._files: List[Tuple[str, Dict[str, Any]]] = []
+
+    def progress_hook(self, data: Dict[str, Any]) -> None:
+        """Guarda os metadados do vídeo em download (usado como progress hook)."""
+        info = data.get('info_dict')
+        if info:
+            self._info = info
+
+    def post_hook(self, filepath: str) -> None:
+        """Registra o arquivo final de um vídeo (usado como post hook)."""
+        self._files.append((os.path.basename(filepath), self._info))
+
+    def entries(self) -> List[HistoryEntry]:
+        """
+        Monta os registros dos arquivos já entregues no destino.
+
+        Returns:
+            Um registro por arquivo final
+        """
+        entries = []
+        for name, info in self._files:
+            path = os.path.join(self._request.save_path, name)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = None
+            entries.append(HistoryEntry(
+                title=info.get('title') or os.path.splitext(name)[0],
+                url=info.get('webpage_url') or self._request.url,
+                file_path=path,
+                format_choice=self._request.format_choice,
+                video_id=info.get('id'),
+                channel=info.get('channel') or info.get('uploader'),
+                size_bytes=size,
+            ))
+        return entries
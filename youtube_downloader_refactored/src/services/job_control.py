@@ -0,0 +1,156 @@
+"""
+Controle cooperativo de downloads em andamento.
+
+Permite cancelar, pausar e retomar um download a partir da UI ou da
+API. Os comandos são aplicados pelos hooks do yt-dlp, ou seja, no
+próximo evento de progresso.
+"""
+
+import glob
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+from yt_dlp.utils import DownloadCancelled
+
+from .job_log import JobLog
+from ..models.job import JobStats
+from ..utils.system_utils import ProcessUtils
+
+
+class JobControl:
+    """Sinalizador de cancelamento e pausa de um único download."""
+
+    def __init__(
+        self,
+        keep_partial: bool = False,
+        stats: Optional[JobStats] = None,
+        log: Optional[JobLog] = None
+    ):
+        """
+        Inicializa o controle.
+
+        Args:
+            keep_partial: Se True, preserva os arquivos .part ao cancelar,
+                permitindo retomar o download depois
+            stats: Estatísticas de rede do job (criadas se não informadas)
+            log: Registro das mensagens do yt-dlp (criado se não informado)
+        """
+        self.stats = stats or JobStats()
+        self.log = log or JobLog()
+        self._keep_partial = keep_partial
+        self._cancelled = threading.Event()
+        self._resumed = threading.Event()
+        self._resumed.set()
+        self._lock = threading.Lock()
+        self._output_files: Set[str] = set()
+        self._postprocessing = False
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Indica se o cancelamento foi solicitado."""
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        """Indica se o download está pausado."""
+        return not self._resumed.is_set()
+
+    @property
+    def keep_partial(self) -> bool:
+        """Indica se os arquivos parciais serão preservados ao cancelar."""
+        return self._keep_partial
+
+    def cancel(self, keep_partial: Optional[bool] = None) -> None:
+        """
+        Solicita o cancelamento do download.
+
+        Se o job estiver no pós-processamento, os processos ffmpeg que
+        trabalham nos arquivos deste job são encerrados imediatamente.
+
+        Args:
+            keep_partial: Sobrescreve a política de preservação dos .part
+        """
+        if keep_partial is not None:
+            self._keep_partial = keep_partial
+        self._cancelled.set()
+        self._resumed.set()
+
+        with self._lock:
+            postprocessing = self._postprocessing
+            files = set(self._output_files)
+        if postprocessing:
+            for path in files:
+                ProcessUtils.terminate_children_using(path)
+
+    def pause(self) -> None:
+        """Pausa o download no próximo evento de progresso."""
+        if not self.is_cancelled:
+            self._resumed.clear()
+
+    def resume(self) -> None:
+        """Retoma um download pausado."""
+        self._resumed.set()
+
+    def checkpoint(self) -> None:
+        """
+        Aplica os comandos pendentes na thread do download.
+
+        Bloqueia enquanto o job estiver pausado.
+
+        Raises:
+            DownloadCancelled: Se o cancelamento foi solicitado
+        """
+        self._resumed.wait()
+        if self.is_cancelled:
+            raise DownloadCancelled("Download cancelado pelo usuário.")
+
+    def wrap_progress_hook(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Callable[[Dict[str, Any]], None]:
+        """
+        Cria um hook de progresso que respeita o controle.
+
+        Args:
+            callback: Hook original (opcional)
+
+        Returns:
+            Hook para o yt-dlp
+        """
+        def hook(data: Dict[str, Any]) -> None:
+            self._track_files(data)
+            self.checkpoint()
+            if callback:
+                callback(data)
+        return hook
+
+    def postprocessor_hook(self, data: Dict[str, Any]) -> None:
+        """Hook de pós-processamento que acompanha a fase e aplica comandos."""
+        with self._lock:
+            self._postprocessing = data.get('status') == 'started'
+            filepath = (data.get('info_dict') or {}).get('filepath')
+            if filepath:
+                self._output_files.add(filepath)
+        self.checkpoint()
+
+    def cleanup_partial_files(self) -> None:
+        """Remove os arquivos temporários do job, salvo se keep_partial."""
+        if self._keep_partial:
+            return
+
+        with self._lock:
+            files = set(self._output_files)
+        for path in files:
+            for candidate in [path + '.part', path + '.ytdl', *glob.glob(glob.escape(path) + '.part-Frag*')]:
+                try:
+                    os.remove(candidate)
+                except OSError:
+                    pass
+
+    def _track_files(self, data: Dict[str, Any]) -> None:
+        """Registra os arquivos de saída informados pelo yt-dlp."""
+        filename = data.get('filename')
+        if filename:
+            with self._lock:
+                self._output_files.add(filename)
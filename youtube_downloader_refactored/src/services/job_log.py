@@ -0,0 +1,162 @@
+"""
+Registro por job das mensagens do yt-dlp.
+
+O JobLog é passado ao yt-dlp como 'logger' e guarda as mensagens de
+cada job em um buffer circular em memória, com o identificador do job
+e a fase em que foram emitidas. Nada é escrito em disco enquanto o job
+corre bem: o buffer só vai para o arquivo rotativo quando o download
+falha ou quando é pedido explicitamente.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Any, ClassVar, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ..config.constants import LogConfig
+
+# (sequência, horário, nível, fase, mensagem)
+LogRecord = Tuple[int, float, int, str, str]
+
+
+class JobLog:
+    """Buffer circular das mensagens de um job, gravado em arquivo sob demanda."""
+
+    PHASE_EXTRACT = "extract"
+    PHASE_DOWNLOAD = "download"
+    PHASE_POSTPROCESS = "postprocess"
+
+    FORMAT = "%(asctime)s job=%(job_id)s phase=%(phase)s %(levelname)s %(message)s"
+
+    _handlers: ClassVar[Dict[str, RotatingFileHandler]] = {}
+    _handlers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, job_id: Optional[str] = None, max_lines: int = LogConfig.BUFFER_LINES):
+        """
+        Inicializa o registro.
+
+        Args:
+            job_id: Identificador do job (gerado se não informado)
+            max_lines: Mensagens mais recentes mantidas em memória
+        """
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.phase = self.PHASE_EXTRACT
+        self._records: Deque[LogRecord] = deque(maxlen=max_lines)
+        self._sequence = itertools.count()
+        self._written = -1
+        self._file_path: Optional[str] = None
+        self._flush_lock = threading.Lock()
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """Arquivo onde o registro foi gravado (None = ainda não gravado)."""
+        return self._file_path
+
+    # Interface de logger esperada pelo yt-dlp
+
+    def debug(self, msg: str) -> None:
+        """Mensagens de tela do yt-dlp (e de depuração, no modo verboso)."""
+        level = logging.DEBUG if msg.startswith('[debug] ') else logging.INFO
+        self._records.append((next(self._sequence), time.time(), level, self.phase, msg))
+
+    def info(self, msg: str) -> None:
+        """Mensagem informativa."""
+        self._records.append((next(self._sequence), time.time(), logging.INFO, self.phase, msg))
+
+    def warning(self, msg: str) -> None:
+        """Aviso do yt-dlp."""
+        self._records.append((next(self._sequence), time.time(), logging.WARNING, self.phase, msg))
+
+    def error(self, msg: str) -> None:
+        """Erro do yt-dlp."""
+        self._records.append((next(self._sequence), time.time(), logging.ERROR, self.phase, msg))
+
+    # Hooks que acompanham a fase do job
+
+    def progress_hook(self, data: Dict[str, Any]) -> None:
+        """Marca a fase de download (usado como progress hook)."""
+        self.phase = self.PHASE_DOWNLOAD
+
+    def postprocessor_hook(self, data: Dict[str, Any]) -> None:
+        """Marca a fase de pós-processamento (usado como postprocessor hook)."""
+        self.phase = self.PHASE_POSTPROCESS
+
+    def records(self) -> List[LogRecord]:
+        """Cópia das mensagens em memória, da mais antiga para a mais nova."""
+        return list(self._records)
+
+    def lines(self) -> List[str]:
+        """Mensagens em memória formatadas como no arquivo."""
+        formatter = logging.Formatter(self.FORMAT)
+        return [formatter.format(self._make_record(record)) for record in self.records()]
+
+    def extend(self, records: Iterable[LogRecord], file_path: Optional[str] = None) -> None:
+        """
+        Acrescenta mensagens registradas em outro processo.
+
+        Args:
+            records: Mensagens vindas de records() do outro registro
+            file_path: Arquivo onde o outro processo já as gravou, se gravou
+        """
+        for _, created, level, phase, msg in records:
+            sequence = next(self._sequence)
+            self._records.append((sequence, created, level, phase, msg))
+            if file_path is not None:
+                self._written = sequence
+        if file_path is not None:
+            self._file_path = file_path
+
+    def flush(self, directory: str = LogConfig.DIR) -> str:
+        """
+        Grava no arquivo rotativo as mensagens ainda não gravadas.
+
+        Args:
+            directory: Diretório dos arquivos de log
+
+        Returns:
+            Caminho do arquivo de log
+        """
+        handler = self._handler(directory)
+        with self._flush_lock:
+            for record in self.records():
+                if record[0] > self._written:
+                    handler.handle(self._make_record(record))
+                    self._written = record[0]
+            handler.flush()
+            self._file_path = handler.baseFilename
+        return self._file_path
+
+    def _make_record(self, record: LogRecord) -> logging.LogRecord:
+        """Converte uma mensagem do buffer em LogRecord com os campos do job."""
+        _, created, level, phase, msg = record
+        return logging.makeLogRecord({
+            'name': 'youtube_gamer_dl.jobs',
+            'levelno': level,
+            'levelname': logging.getLevelName(level),
+            'msg': msg,
+            'created': created,
+            'msecs': (created % 1) * 1000,
+            'job_id': self.job_id,
+            'phase': phase,
+        })
+
+    @classmethod
+    def _handler(cls, directory: str) -> RotatingFileHandler:
+        """Retorna o arquivo rotativo compartilhado de um diretório."""
+        path = os.path.join(os.path.abspath(directory), LogConfig.FILE_NAME)
+        with cls._handlers_lock:
+            handler = cls._handlers.get(path)
+            if handler is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                handler = RotatingFileHandler(
+                    path, maxBytes=LogConfig.MAX_FILE_BYTES,
+                    backupCount=LogConfig.BACKUP_COUNT, encoding='utf-8'
+                )
+                handler.setFormatter(logging.Formatter(cls.FORMAT))
+                cls._handlers[path] = handler
+            return handler
@@ -0,0 +1,543 @@
+"""
+Gerenciador de jobs de download.
+
+Mantém uma fila compartilhada de downloads executada por um número fixo
+de workers, permitindo que vários clientes usem o mesmo motor. A ordem
+de execução vem do JobScheduler, e um job mais prioritário pode pausar
+o menos prioritário em execução (preempção).
+Aplica o princípio de Responsabilidade Única (SRP).
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Deque, Dict, List, Optional, Any, Set
+
+from .download_service import DownloadService, ProgressParser
+from .history_store import HistoryStore
+from .job_control import JobControl
+from .job_log import JobLog
+from .job_scheduler import JobScheduler
+from .video_info_service import VideoInfoService
+from ..models.job import DownloadJob, JobStatus
+from ..models.video_info import DownloadRequest
+from ..models.exceptions import (
+    JobNotFoundError, DownloadCancelledError, CookiesNotFoundError, VideoInfoError
+)
+from ..config.constants import BatchConfig, DaemonConfig, SchedulerConfig
+
+
+class EventSubscription:
+    """Assinatura de eventos de jobs publicada pelo JobManager."""
+
+    def __init__(self, manager: 'JobManager', job_id: Optional[str], maxsize: int):
+        """
+        Inicializa a assinatura.
+
+        Args:
+            manager: Gerenciador que publica os eventos
+            job_id: Filtra eventos de um único job (None = todos)
+            maxsize: Tamanho máximo da fila de eventos pendentes
+        """
+        self._manager = manager
+        self._job_id = job_id
+        self._queue: 'queue.Queue[Dict[str, Any]]' = queue.Queue(maxsize)
+
+    def matches(self, job_id: str) -> bool:
+        """Verifica se a assinatura deve receber eventos do job."""
+        return self._job_id is None or self._job_id == job_id
+
+    def put(self, event: Dict[str, Any]) -> None:
+        """Enfileira um evento, descartando-o se o assinante estiver atrasado."""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Aguarda o próximo evento.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            Evento recebido ou None se o tempo esgotar
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Cancela a assinatura."""
+        self._manager._unsubscribe(self)
+
+
+class JobManager:
+    """Fila compartilhada de downloads com workers fixos."""
+
+    def __init__(
+        self,
+        download_service: Optional[DownloadService] = None,
+        max_concurrent: int = DaemonConfig.MAX_CONCURRENT_JOBS,
+        total_rate_limit: Optional[int] = DaemonConfig.TOTAL_RATE_LIMIT,
+        scheduler: Optional[JobScheduler] = None,
+        preempt: bool = SchedulerConfig.PREEMPT,
+        video_info_service: Optional[VideoInfoService] = None
+    ):
+        """
+        Inicializa o gerenciador.
+
+        Args:
+            download_service: Serviço de download compartilhado pelos workers
+            max_concurrent: Número de downloads simultâneos
+            total_rate_limit: Banda total em bytes/s dividida entre os workers
+            scheduler: Ordem de execução dos jobs pendentes (padrão: SchedulerConfig)
+            preempt: Se True, um job mais prioritário pausa o menos prioritário
+                em execução quando não há worker livre
+            video_info_service: Serviço de metadados usado para estimar, em
+                segundo plano, o tamanho dos jobs submetidos sem
+                estimated_size (política SJF)
+        """
+        self._owns_service = download_service is None
+        if download_service is None:
+            download_service = DownloadService(
+                rate_limit=self._per_job_limit(total_rate_limit, max_concurrent),
+                history_store=HistoryStore.shared()
+            )
+
+        self._download_service = download_service
+        self._max_concurrent = max_concurrent
+        self._total_rate_limit = total_rate_limit
+        self._last_progress: Dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._pending = scheduler if scheduler is not None else JobScheduler()
+        self._preempt = preempt
+        self._video_info_service = video_info_service
+        self._estimator: Optional[ThreadPoolExecutor] = None
+        self._preempted: Dict[str, str] = {}
+        # Jobs pausados por preempção cujo slot foi cedido ao job que os pausou
+        self._lent_slots: Set[str] = set()
+        self._busy_workers = 0
+        self._jobs: Dict[str, DownloadJob] = {}
+        self._controls: Dict[str, JobControl] = {}
+        self._logs: Dict[str, JobLog] = {}
+        self._finished_ids: Deque[str] = deque()
+        self._subscriptions: List[EventSubscription] = []
+        self._workers: List[threading.Thread] = []
+        self._loop_workers = 0
+        self._running = False
+
+    def start(self) -> None:
+        """Inicia os workers da fila."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+
+        with self._cond:
+            self._spawn_workers()
+
+    def reconfigure(self, max_concurrent: int, total_rate_limit: Optional[int]) -> None:
+        """
+        Altera os limites sem interromper os jobs em execução.
+
+        Com mais slots, os jobs pendentes começam em seguida; com menos,
+        os jobs em execução terminam normalmente e os pendentes esperam
+        até sobrar um slot. A banda por job vale para os jobs seguintes.
+
+        Args:
+            max_concurrent: Número de downloads simultâneos
+            total_rate_limit: Banda total em bytes/s dividida entre os workers
+        """
+        with self._cond:
+            self._max_concurrent = max_concurrent
+            self._total_rate_limit = total_rate_limit
+            if self._running:
+                self._spawn_workers()
+            self._cond.notify_all()
+        if self._owns_service:
+            self._download_service.set_rate_limit(self._per_job_limit(total_rate_limit, max_concurrent))
+
+    @property
+    def max_concurrent(self) -> int:
+        """Número de downloads simultâneos."""
+        return self._max_concurrent
+
+    @staticmethod
+    def _per_job_limit(total_rate_limit: Optional[int], max_concurrent: int) -> Optional[int]:
+        """Banda de cada job quando a banda total é dividida entre os slots."""
+        return total_rate_limit // max_concurrent if total_rate_limit else None
+
+    def _spawn_workers(self) -> None:
+        """Cria os workers que faltam para ocupar os slots (sob o bloqueio)."""
+        for index in range(self._loop_workers, self._max_concurrent):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"download-worker-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        self._loop_workers = max(self._loop_workers, self._max_concurrent)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Encerra os workers, cancelando os jobs em execução.
+
+        Args:
+            wait: Se True, aguarda os workers terminarem
+        """
+        with self._cond:
+            self._running = False
+            for control in self._controls.values():
+                control.cancel()
+            estimator, self._estimator = self._estimator, None
+            self._cond.notify_all()
+        if estimator is not None:
+            estimator.shutdown(wait=False, cancel_futures=True)
+
+        if wait:
+            for worker in list(self._workers):
+                worker.join()
+        self._workers.clear()
+        self._loop_workers = 0
+
+    def submit(self, request: DownloadRequest, keep_partial: bool = False) -> DownloadJob:
+        """
+        Adiciona um download à fila.
+
+        Sem estimated_size, o job entra na fila com tamanho desconhecido
+        e o tamanho no formato escolhido é obtido dos metadados em segundo
+        plano, para que a política SJF tenha o que ordenar sem atrasar a
+        resposta.
+
+        Args:
+            request: Requisição de download
+            keep_partial: Se True, preserva os arquivos .part ao cancelar
+
+        Returns:
+            Job criado
+        """
+        job = DownloadJob(request=request)
+        log = JobLog(job.job_id)
+        with self._cond:
+            self._jobs[job.job_id] = job
+            self._logs[job.job_id] = log
+            self._controls[job.job_id] = JobControl(keep_partial=keep_partial, stats=job.stats, log=log)
+            self._pending.push(job)
+            victim = self._preempt_for(job)
+            self._cond.notify()
+        if victim is not None:
+            self._publish(victim, 'status')
+        self._publish(job, 'status')
+        if request.estimated_size is None:
+            self._schedule_estimate(job)
+        return job
+
+    def _schedule_estimate(self, job: DownloadJob) -> None:
+        """Agenda a estimativa do tamanho de um job pendente (só na política SJF)."""
+        if self._video_info_service is None or self._pending.policy != JobScheduler.SJF:
+            return
+        with self._cond:
+            if self._estimator is None:
+                self._estimator = ThreadPoolExecutor(
+                    max_workers=BatchConfig.MAX_WORKERS, thread_name_prefix='size-estimate'
+                )
+            estimator = self._estimator
+        estimator.submit(self._estimate_size, job)
+
+    def _estimate_size(self, job: DownloadJob) -> None:
+        """
+        Preenche o tamanho estimado de um job que ainda está na fila.
+
+        O JobScheduler compara os pendentes a cada retirada, então o job
+        passa a ser ordenado pelo novo tamanho sem ser reinserido.
+        """
+        with self._cond:
+            if job.status != JobStatus.QUEUED:
+                return
+        try:
+            info = self._video_info_service.get_video_info(job.request.url)
+        except (CookiesNotFoundError, VideoInfoError):
+            return
+        size = info.size_estimates.get(job.request.format_choice)
+        if size is None:
+            return
+        with self._cond:
+            if job.status != JobStatus.QUEUED:
+                return
+            job.request = replace(job.request, estimated_size=size)
+        self._publish(job, 'status')
+
+    def get_job(self, job_id: str) -> DownloadJob:
+        """
+        Obtém um job pelo identificador.
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Job '{job_id}' não encontrado.")
+        return job
+
+    def get_log(self, job_id: str) -> JobLog:
+        """
+        Obtém o registro das mensagens do yt-dlp de um job.
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        with self._cond:
+            log = self._logs.get(job_id)
+        if log is None:
+            raise JobNotFoundError(f"Job '{job_id}' não encontrado.")
+        return log
+
+    def list_jobs(self) -> List[DownloadJob]:
+        """Retorna todos os jobs conhecidos, do mais antigo ao mais novo."""
+        with self._cond:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at)
+
+    def cancel(self, job_id: str, keep_partial: Optional[bool] = None) -> DownloadJob:
+        """
+        Cancela um job na fila ou em execução.
+
+        Jobs em execução são interrompidos no próximo evento de progresso
+        e o slot passa imediatamente ao próximo job da fila.
+
+        Args:
+            job_id: Identificador do job
+            keep_partial: Sobrescreve a preservação dos arquivos .part
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        job = self.get_job(job_id)
+        with self._cond:
+            if job.status.is_terminal():
+                return job
+            if job.status == JobStatus.QUEUED:
+                self._pending.remove(job)
+                self._finish(job, JobStatus.CANCELLED)
+            else:
+                self._controls[job_id].cancel(keep_partial)
+                return job
+        self._publish(job, 'status')
+        return job
+
+    def pause(self, job_id: str) -> DownloadJob:
+        """
+        Pausa um job em execução no próximo evento de progresso.
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        job = self.get_job(job_id)
+        with self._cond:
+            if job.status != JobStatus.RUNNING:
+                return job
+            self._controls[job_id].pause()
+            job.status = JobStatus.PAUSED
+        self._publish(job, 'status')
+        return job
+
+    def resume(self, job_id: str) -> DownloadJob:
+        """
+        Retoma um job pausado.
+
+        Raises:
+            JobNotFoundError: Se o job não existir
+        """
+        job = self.get_job(job_id)
+        with self._cond:
+            if job.status != JobStatus.PAUSED:
+                return job
+            self._preempted.pop(job_id, None)
+            self._reclaim_slot(job_id)
+            self._controls[job_id].resume()
+            job.status = JobStatus.RUNNING
+        self._publish(job, 'status')
+        return job
+
+    def subscribe(self, job_id: Optional[str] = None) -> EventSubscription:
+        """
+        Assina os eventos de status e progresso.
+
+        Args:
+            job_id: Filtra eventos de um único job (None = todos)
+        """
+        subscription = EventSubscription(self, job_id, DaemonConfig.EVENT_QUEUE_SIZE)
+        with self._cond:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove uma assinatura."""
+        with self._cond:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def _worker_loop(self) -> None:
+        """Consome jobs da fila até o encerramento."""
+        while True:
+            with self._cond:
+                # Workers além dos slots (após reconfigure) esperam um slot livre
+                while self._running and (not self._pending or self._busy_workers >= self._max_concurrent):
+                    self._cond.wait()
+                if not self._running:
+                    return
+                job = self._pending.pop()
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                self._busy_workers += 1
+
+            self._publish(job, 'status')
+            try:
+                self._run_job(job)
+            finally:
+                with self._cond:
+                    # Um job que terminou pausado por preempção já cedeu seu slot
+                    if job.job_id in self._lent_slots:
+                        self._lent_slots.discard(job.job_id)
+                    else:
+                        self._busy_workers -= 1
+                    self._cond.notify_all()
+
+    def _preempt_for(self, job: DownloadJob) -> Optional[DownloadJob]:
+        """
+        Pausa o job menos prioritário em execução para dar lugar a um novo.
+
+        Chamado sob o bloqueio. O job pausado cede seu slot ao novo job,
+        que roda em uma thread própria e, ao terminar, devolve o slot e
+        retoma o job pausado.
+
+        Returns:
+            Job pausado ou None se não houve preempção
+        """
+        if not (self._preempt and self._running) or self._busy_workers < self._max_concurrent:
+            return None
+        running = [
+            candidate for candidate in self._jobs.values()
+            if candidate.status == JobStatus.RUNNING
+            and candidate.request.priority < job.request.priority
+            and candidate.job_id in self._controls
+        ]
+        if not running:
+            return None
+
+        victim = min(running, key=lambda candidate: (candidate.request.priority, -(candidate.started_at or 0)))
+        self._controls[victim.job_id].pause()
+        victim.status = JobStatus.PAUSED
+        self._preempted[victim.job_id] = job.job_id
+        self._lent_slots.add(victim.job_id)
+        victim.stats.record('preempted', f"pausado pelo job {job.job_id} (prioridade {job.request.priority})")
+
+        self._pending.remove(job)
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        worker = threading.Thread(
+            target=self._run_preempting, args=(job, victim),
+            name=f"download-preempt-{job.job_id}", daemon=True
+        )
+        self._workers.append(worker)
+        worker.start()
+        return victim
+
+    def _run_preempting(self, job: DownloadJob, victim: DownloadJob) -> None:
+        """Executa um job que tomou o lugar de outro e retoma o job pausado."""
+        try:
+            self._run_job(job)
+        finally:
+            with self._cond:
+                self._busy_workers -= 1
+                if threading.current_thread() in self._workers:
+                    self._workers.remove(threading.current_thread())
+                resumed = self._resume_victim(job, victim)
+                self._cond.notify_all()
+        if resumed:
+            self._publish(victim, 'status')
+
+    def _resume_victim(self, job: DownloadJob, victim: DownloadJob) -> bool:
+        """Devolve o slot ao job pausado por 'job' e o retoma (sob o bloqueio)."""
+        if self._preempted.get(victim.job_id) != job.job_id:
+            return False
+        del self._preempted[victim.job_id]
+        control = self._controls.get(victim.job_id)
+        if control is None or victim.status != JobStatus.PAUSED:
+            return False
+        self._reclaim_slot(victim.job_id)
+        control.resume()
+        victim.status = JobStatus.RUNNING
+        return True
+
+    def _reclaim_slot(self, job_id: str) -> None:
+        """Faz um job que cedeu seu slot voltar a ocupá-lo (sob o bloqueio)."""
+        if job_id in self._lent_slots:
+            self._lent_slots.discard(job_id)
+            self._busy_workers += 1
+
+    def _run_job(self, job: DownloadJob) -> None:
+        """Executa um job e registra o resultado."""
+        control = self._controls[job.job_id]
+        try:
+            self._download_service.download(
+                job.request,
+                progress_callback=lambda data: self._update_progress(job, data),
+                control=control
+            )
+            status = JobStatus.COMPLETED
+        except Exception as e:
+            if isinstance(e, DownloadCancelledError) or control.is_cancelled:
+                status = JobStatus.CANCELLED
+            else:
+                status = JobStatus.FAILED
+                job.error = str(e)
+                job.log_file = control.log.file_path
+
+        with self._cond:
+            self._finish(job, status)
+        self._publish(job, 'status')
+
+    def _update_progress(self, job: DownloadJob, data: Dict[str, Any]) -> None:
+        """Atualiza o progresso do job a partir do hook do yt-dlp."""
+        progress = ProgressParser.parse(data)
+        job.percent = progress.percent
+        job.eta = progress.eta
+        job.speed = progress.speed
+        if DaemonConfig.PROGRESS_INTERVAL and progress.status == 'downloading':
+            now = time.monotonic()
+            if now - self._last_progress.get(job.job_id, 0.0) < DaemonConfig.PROGRESS_INTERVAL:
+                return
+            self._last_progress[job.job_id] = now
+        self._publish(job, 'progress')
+
+    def _finish(self, job: DownloadJob, status: JobStatus) -> None:
+        """Marca o job como finalizado e limita o histórico em memória."""
+        job.status = status
+        job.finished_at = time.time()
+        self._controls.pop(job.job_id, None)
+        self._preempted.pop(job.job_id, None)
+        self._last_progress.pop(job.job_id, None)
+        if status == JobStatus.COMPLETED:
+            job.percent = 100.0
+
+        self._finished_ids.append(job.job_id)
+        while len(self._finished_ids) > DaemonConfig.MAX_FINISHED_JOBS:
+            finished_id = self._finished_ids.popleft()
+            self._jobs.pop(finished_id, None)
+            self._logs.pop(finished_id, None)
+
+    def _publish(self, job: DownloadJob, event: str) -> None:
+        """Envia um evento do job para os assinantes interessados."""
+        payload = {'event': event, 'job': job.to_dict()}
+        with self._cond:
+            subscriptions = [s for s in self._subscriptions if s.matches(job.job_id)]
+        for subscription in subscriptions:
+            subscription.put(payload)
@@ -0,0 +1,119 @@
+"""
+Escalonamento da fila de downloads.
+
+Decide qual job pendente o próximo worker livre executa. Além da ordem
+de chegada (FIFO), há a ordem por prioridade e a do menor job primeiro
+(SJF), que usa o tamanho estimado do download para que um vídeo de horas
+não segure dezenas de clipes curtos. Nas duas últimas, cada intervalo de
+espera sobe um nível de prioridade (envelhecimento), de modo que jobs
+grandes ou pouco prioritários não esperem para sempre.
+"""
+
+import itertools
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from ..models.job import DownloadJob
+from ..config.constants import SchedulerConfig
+
+
+class JobScheduler:
+    """
+    Jobs pendentes ordenados por uma política de escalonamento.
+
+    Não é thread-safe: o JobManager o usa sob o próprio bloqueio. Como o
+    envelhecimento muda a ordem com o tempo, a escolha percorre todos os
+    pendentes (a fila tem no máximo algumas centenas de jobs).
+    """
+
+    FIFO = "fifo"
+    PRIORITY = "priority"
+    SJF = "sjf"
+    POLICIES = (FIFO, PRIORITY, SJF)
+
+    def __init__(
+        self,
+        policy: str = SchedulerConfig.POLICY,
+        aging_seconds: float = SchedulerConfig.AGING_SECONDS,
+        unknown_size: int = SchedulerConfig.UNKNOWN_SIZE,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Inicializa o escalonador.
+
+        Args:
+            policy: "fifo", "priority" ou "sjf"
+            aging_seconds: Espera que vale um nível de prioridade (0 = sem envelhecimento)
+            unknown_size: Tamanho assumido para jobs sem estimativa
+            clock: Relógio comparável a DownloadJob.created_at (injetável para testes)
+
+        Raises:
+            ValueError: Se a política for desconhecida
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Política de escalonamento desconhecida: {policy}")
+        self._policy = policy
+        self._aging = aging_seconds
+        self._unknown_size = unknown_size
+        self._clock = clock
+        self._jobs: List[DownloadJob] = []
+        self._order: Dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def policy(self) -> str:
+        """Política de escalonamento em uso."""
+        return self._policy
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[DownloadJob]:
+        return iter(self._jobs)
+
+    def push(self, job: DownloadJob) -> None:
+        """Adiciona um job pendente."""
+        self._order[job.job_id] = next(self._sequence)
+        self._jobs.append(job)
+
+    def remove(self, job: DownloadJob) -> None:
+        """
+        Retira um job pendente.
+
+        Raises:
+            ValueError: Se o job não estiver pendente
+        """
+        self._jobs.remove(job)
+        del self._order[job.job_id]
+
+    def pop(self) -> DownloadJob:
+        """
+        Retira o próximo job a executar.
+
+        Raises:
+            IndexError: Se não houver jobs pendentes
+        """
+        if not self._jobs:
+            raise IndexError("Nenhum job pendente.")
+        now = self._clock()
+        job = min(self._jobs, key=lambda candidate: self._key(candidate, now))
+        self.remove(job)
+        return job
+
+    def effective_priority(self, job: DownloadJob, now: float) -> int:
+        """Prioridade do job somada aos níveis ganhos pela espera."""
+        if not self._aging:
+            return job.request.priority
+        waited = max(now - job.created_at, 0.0)
+        return job.request.priority + int(waited // self._aging)
+
+    def _key(self, job: DownloadJob, now: float) -> Tuple:
+        """Chave de ordenação: menor executa primeiro."""
+        order = self._order[job.job_id]
+        if self._policy == self.FIFO:
+            return (order,)
+        level = -self.effective_priority(job, now)
+        if self._policy == self.PRIORITY:
+            return (level, order)
+        size = job.request.estimated_size
+        return (level, self._unknown_size if size is None else size, order)
@@ -0,0 +1,531 @@
+"""
+Gravação de transmissões ao vivo.
+
+Apontado para uma live, o yt-dlp grava um único arquivo que cresce
+enquanto a transmissão durar. O LiveRecorder lê a playlist HLS da
+transmissão por conta própria:
+- recarrega a playlist no ritmo da duração alvo;
+- grava cada segmento novo direto no disco, em blocos;
+- fecha um arquivo a cada LiveConfig.SEGMENT_SECONDS de conteúdo.
+Assim a memória usada não cresce com a duração da gravação.
+
+Falhas ao recarregar a playlist são repetidas com espera crescente. Após
+algumas falhas seguidas, ou quando a URL expira (403/404), uma nova URL
+é obtida pelo yt-dlp. Um segmento que não chega depois de algumas
+tentativas é registrado como perdido, pois a transmissão não espera;
+o mesmo vale para o segmento de inicialização (fMP4), que é pedido de
+novo no segmento seguinte.
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import urljoin
+
+import requests
+from yt_dlp.utils import DownloadCancelled, YoutubeDLError, sanitize_filename
+
+from .cookie_manager import CookieJarManager
+from .job_control import JobControl
+from .ydl_cache import YtDlpCache
+from .ydl_pool import YoutubeDLPool
+from ..models.video_info import DownloadRequest
+from ..models.exceptions import DownloadCancelledError, DownloadError
+from ..config.constants import AppConstants, DownloadFormats, LiveConfig
+
+T = TypeVar('T')
+
+
+@dataclass
+class _Segment:
+    """Segmento de mídia de uma playlist HLS."""
+
+    sequence: int
+    duration: float
+    url: str
+    byterange: Optional[Tuple[int, int]] = None  # EXT-X-BYTERANGE: (primeiro, último byte)
+
+
+@dataclass
+class _MediaPlaylist:
+    """Playlist HLS interpretada (ou a lista de variantes de uma playlist mestre)."""
+
+    target_duration: float = 2.0
+    segments: List[_Segment] = field(default_factory=list)
+    init_url: Optional[str] = None  # EXT-X-MAP (fMP4)
+    init_range: Optional[Tuple[int, int]] = None  # BYTERANGE do EXT-X-MAP
+    ended: bool = False
+    variants: List[Tuple[int, str]] = field(default_factory=list)  # (banda, URL)
+
+
+def parse_playlist(text: str, base_url: str) -> _MediaPlaylist:
+    """
+    Interpreta uma playlist HLS.
+
+    Segmentos com EXT-X-BYTERANGE são trechos de um mesmo arquivo; sem
+    deslocamento, o trecho começa logo após o segmento anterior.
+
+    Args:
+        text: Conteúdo da playlist
+        base_url: URL da playlist, base das URLs relativas
+
+    Returns:
+        Playlist com os segmentos (ou as variantes, se for uma playlist mestre)
+
+    Raises:
+        ValueError: Se o conteúdo não for uma playlist HLS
+        DownloadError: Se os segmentos forem criptografados
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines or lines[0] != '#EXTM3U':
+        raise ValueError("Resposta não é uma playlist HLS")
+
+    playlist = _MediaPlaylist()
+    sequence = 0
+    duration: Optional[float] = None
+    bandwidth: Optional[int] = None
+    byterange: Optional[Tuple[int, Optional[int]]] = None
+    previous: Optional[_Segment] = None
+    for line in lines[1:]:
+        if line.startswith('#EXT-X-TARGETDURATION:'):
+            playlist.target_duration = float(line.split(':', 1)[1])
+        elif line.startswith('#EXT-X-MEDIA-SEQUENCE:'):
+            sequence = int(line.split(':', 1)[1])
+        elif line.startswith('#EXTINF:'):
+            duration = float(line.split(':', 1)[1].split(',', 1)[0])
+        elif line.startswith('#EXT-X-BYTERANGE:'):
+            byterange = _parse_byterange(line.split(':', 1)[1])
+        elif line.startswith('#EXT-X-ENDLIST'):
+            playlist.ended = True
+        elif line.startswith('#EXT-X-MAP:'):
+            match = re.search(r'URI="([^"]+)"', line)
+            if match:
+                playlist.init_url = urljoin(base_url, match.group(1))
+                match = re.search(r'BYTERANGE="([^"]+)"', line)
+                if match:
+                    length, offset = _parse_byterange(match.group(1))
+                    playlist.init_range = (offset or 0, (offset or 0) + length - 1)
+        elif line.startswith('#EXT-X-KEY:'):
+            if 'METHOD=NONE' not in line:
+                raise DownloadError("Transmissões com segmentos criptografados não são suportadas.")
+        elif line.startswith('#EXT-X-STREAM-INF:'):
+            match = re.search(r'(?<![-\w])BANDWIDTH=(\d+)', line)
+            bandwidth = int(match.group(1)) if match else 0
+        elif not line.startswith('#'):
+            if bandwidth is not None:
+                playlist.variants.append((bandwidth, urljoin(base_url, line)))
+                bandwidth = None
+            elif duration is not None:
+                segment = _Segment(sequence, duration, urljoin(base_url, line))
+                if byterange is not None:
+                    length, offset = byterange
+                    if offset is None:
+                        if previous is None or previous.byterange is None or previous.url != segment.url:
+                            raise ValueError("EXT-X-BYTERANGE sem deslocamento e sem trecho anterior do mesmo arquivo")
+                        offset = previous.byterange[1] + 1
+                    segment.byterange = (offset, offset + length - 1)
+                    byterange = None
+                playlist.segments.append(segment)
+                previous = segment
+                sequence += 1
+                duration = None
+    return playlist
+
+
+def _parse_byterange(value: str) -> Tuple[int, Optional[int]]:
+    """Interpreta um valor '<tamanho>[@<deslocamento>]' de BYTERANGE."""
+    length, _, offset = value.strip().partition('@')
+    return int(length), int(offset) if offset else None
+
+
+def _range_header(byterange: Optional[Tuple[int, int]]) -> Dict[str, str]:
+    """Cabeçalho Range de um trecho (vazio quando o recurso é pedido inteiro)."""
+    return {'Range': f"bytes={byterange[0]}-{byterange[1]}"} if byterange else {}
+
+
+class LiveRecorder:
+    """Grava transmissões HLS ao vivo em arquivos de duração fixa."""
+
+    def __init__(
+        self,
+        cookies_file: str = AppConstants.COOKIES_FILE,
+        cookie_manager: Optional[CookieJarManager] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None,
+        segment_seconds: float = LiveConfig.SEGMENT_SECONDS,
+        keep_segments: int = LiveConfig.KEEP_SEGMENTS
+    ):
+        """
+        Inicializa o gravador.
+
+        Args:
+            cookies_file: Caminho para o arquivo de cookies
+            cookie_manager: Gerenciador do cookie jar compartilhado
+            ydl_pool: Pool do yt-dlp usado para obter a URL da playlist
+            segment_seconds: Duração de conteúdo de cada arquivo gravado
+            keep_segments: Arquivos mantidos no destino (0 = todos)
+        """
+        self._cookie_manager = cookie_manager or CookieJarManager.shared(cookies_file)
+        self._ydl_pool = ydl_pool or YoutubeDLPool(self._cookie_manager, cache=YtDlpCache.shared())
+        self._segment_seconds = segment_seconds
+        self._keep_segments = keep_segments
+
+    def record(
+        self,
+        request: DownloadRequest,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        control: Optional[JobControl] = None,
+        max_duration: Optional[float] = None
+    ) -> List[str]:
+        """
+        Grava uma transmissão até ela terminar, ser interrompida ou atingir max_duration.
+
+        Args:
+            request: Requisição (live_from_start escolhe o início da janela da playlist)
+            progress_callback: Callback com eventos no formato do yt-dlp
+            control: Controle de cancelamento/pausa; cancelar encerra a
+                gravação, preservando os arquivos já gravados
+            max_duration: Segundos de conteúdo a gravar (None = até o fim)
+
+        Returns:
+            Arquivos gravados, em ordem
+
+        Raises:
+            DownloadCancelledError: Se a gravação for interrompida
+            DownloadError: Se a transmissão não puder ser gravada, inclusive
+                por falhas de rede ou de disco não recuperáveis
+        """
+        if control is not None:
+            progress_callback = control.wrap_progress_hook(progress_callback)
+        try:
+            return _Recording(self, request, progress_callback, control, max_duration).run()
+        except DownloadCancelled as e:
+            raise DownloadCancelledError("Gravação interrompida.") from e
+        except (requests.RequestException, OSError) as e:
+            raise DownloadError(f"Erro durante a gravação: {e}") from e
+
+    def resolve(self, request: DownloadRequest, logger: Optional[Any] = None) -> Tuple[str, Dict[str, str], str]:
+        """
+        Obtém pelo yt-dlp a URL da playlist HLS da transmissão.
+
+        Args:
+            request: Requisição da gravação
+            logger: Destino das mensagens do yt-dlp (ex.: JobLog do job)
+
+        Returns:
+            (URL da playlist, cabeçalhos HTTP, título)
+
+        Raises:
+            DownloadError: Se a URL não tiver uma transmissão HLS
+        """
+        policy = DownloadFormats.get_policy(request.format_choice)
+        height = f"[height<={policy.max_height}]" if policy.max_height else ""
+        options = {
+            'quiet': True,
+            'format': f"best[protocol^=m3u8]{height}/best[protocol^=m3u8]",
+        }
+        if logger is not None:
+            options['logger'] = logger
+        try:
+            with self._ydl_pool.checkout(options) as ydl:
+                info = ydl.extract_info(request.url, download=False)
+        except YoutubeDLError as e:
+            raise DownloadError(f"Não foi possível obter a transmissão: {e}") from e
+        selected = (info.get('requested_formats') or [info])[0]
+        if not str(selected.get('protocol', '')).startswith('m3u8') or not selected.get('url'):
+            raise DownloadError("A transmissão não oferece um stream HLS.")
+        return selected['url'], dict(selected.get('http_headers') or {}), info.get('title') or 'live'
+
+    @property
+    def segment_seconds(self) -> float:
+        """Duração de conteúdo de cada arquivo gravado."""
+        return self._segment_seconds
+
+    @property
+    def keep_segments(self) -> int:
+        """Arquivos mantidos no destino (0 = todos)."""
+        return self._keep_segments
+
+
+class _Recording:
+    """Estado de uma gravação em andamento."""
+
+    def __init__(
+        self,
+        recorder: LiveRecorder,
+        request: DownloadRequest,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        control: Optional[JobControl],
+        max_duration: Optional[float]
+    ):
+        self._recorder = recorder
+        self._request = request
+        self._progress_callback = progress_callback
+        self._control = control
+        self._max_duration = max_duration
+
+        self._logger = control.log if control is not None else None
+        self._url, headers, title = recorder.resolve(request, self._logger)
+        self._session = requests.Session()
+        self._session.headers.update(headers)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        self._base = os.path.join(
+            request.save_path, f"{sanitize_filename(request.custom_title or title)}.{stamp}"
+        )
+
+        self._next_sequence: Optional[int] = None
+        self._files: List[str] = []
+        self._file = None
+        self._path: Optional[str] = None
+        self._index = 0
+        self._file_duration = 0.0
+        self._init_url: Optional[str] = None
+        self._init_data = b''
+        self._recorded = 0.0
+        self._bytes = 0
+        self._segments = 0
+        self._started = time.monotonic()
+        self._failures = 0
+        self._failing_since: Optional[float] = None
+
+    def run(self) -> List[str]:
+        """Grava até o fim e retorna os arquivos gravados."""
+        try:
+            self._loop()
+        finally:
+            self._finish_file()
+            self._session.close()
+        self._report('finished')
+        return self._files
+
+    def _loop(self) -> None:
+        """Recarrega a playlist e grava os segmentos novos."""
+        while True:
+            playlist = self._fetch_playlist()
+            if playlist is None:
+                return
+            new = self._take_new(playlist)
+            for segment in new:
+                self._checkpoint()
+                self._write_segment(segment, playlist)
+                if self._max_duration and self._recorded >= self._max_duration:
+                    return
+            if playlist.ended:
+                return
+            # Sem segmentos novos, a playlist é recarregada na metade da duração alvo (RFC 8216)
+            self._wait(playlist.target_duration if new else playlist.target_duration / 2)
+
+    def _fetch_playlist(self) -> Optional[_MediaPlaylist]:
+        """
+        Baixa a playlist, repetindo em caso de falha.
+
+        Returns:
+            Playlist ou None se ela ficou indisponível por mais de
+            LiveConfig.RECONNECT_TIMEOUT (transmissão encerrada)
+        """
+        while True:
+            self._checkpoint()
+            try:
+                response = self._session.get(self._url, timeout=LiveConfig.TIMEOUT)
+                response.raise_for_status()
+                playlist = parse_playlist(response.text, response.url)
+                if playlist.variants:
+                    self._url = max(playlist.variants)[1]
+                    continue
+                self._failures = 0
+                self._failing_since = None
+                return playlist
+            except (requests.RequestException, ValueError) as e:
+                if not self._should_retry(e):
+                    return None
+
+    def _should_retry(self, error: Exception) -> bool:
+        """Aguarda antes de uma nova tentativa, obtendo outra URL quando a atual parece expirada."""
+        now = time.monotonic()
+        if self._failing_since is None:
+            self._failing_since = now
+        elif now - self._failing_since >= LiveConfig.RECONNECT_TIMEOUT:
+            self._record('retry', f"playlist indisponível há {now - self._failing_since:.0f}s; gravação encerrada")
+            return False
+        self._failures += 1
+        self._record('retry', f"falha ao recarregar a playlist ({error}); tentativa {self._failures}")
+
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status in (403, 404, 410) or self._failures % LiveConfig.RERESOLVE_AFTER == 0:
+            try:
+                self._url, headers, _ = self._recorder.resolve(self._request, self._logger)
+                self._session.headers.update(headers)
+            except DownloadError:
+                pass
+        self._wait(min(LiveConfig.RECONNECT_DELAY * 2 ** (self._failures - 1), LiveConfig.RECONNECT_MAX_DELAY))
+        return True
+
+    def _take_new(self, playlist: _MediaPlaylist) -> List[_Segment]:
+        """Segmentos ainda não gravados, ajustando a posição após perdas ou reinícios."""
+        segments = playlist.segments
+        if not segments:
+            return []
+        first, last = segments[0].sequence, segments[-1].sequence
+        edge = max(first, last - LiveConfig.LIVE_EDGE_SEGMENTS + 1)
+        if self._next_sequence is None:
+            self._next_sequence = first if self._request.live_from_start else edge
+        elif self._next_sequence < first:
+            self._record('live_gap', f"{first - self._next_sequence} segmento(s) saíram da playlist antes de serem gravados")
+            self._next_sequence = first
+        elif self._next_sequence > last + 1 + len(segments):
+            # Numeração recomeçou (transmissão reiniciada): segue da borda ao vivo
+            self._record('live_restart', f"numeração da playlist recomeçou em {first}")
+            self._next_sequence = edge
+        return [segment for segment in segments if segment.sequence >= self._next_sequence]
+
+    def _write_segment(self, segment: _Segment, playlist: _MediaPlaylist) -> None:
+        """Grava um segmento no arquivo atual e faz a rotação quando ele completa a duração."""
+        if playlist.init_url != self._init_url:
+            try:
+                init_data = self._retrying(
+                    "segmento de inicialização", lambda: self._get(playlist.init_url, playlist.init_range)
+                ) if playlist.init_url else b''
+            except requests.RequestException as e:
+                # Sem a inicialização o segmento não decodifica; o próximo a pede de novo
+                self._skip(segment, f"segmento de inicialização indisponível ({e})")
+                return
+            self._finish_file()
+            self._init_url = playlist.init_url
+            self._init_data = init_data
+        if self._file is None:
+            self._open_file()
+
+        def download() -> None:
+            position = self._file.tell()
+            try:
+                with self._session.get(segment.url, headers=_range_header(segment.byterange), stream=True,
+                                       timeout=LiveConfig.TIMEOUT) as response:
+                    response.raise_for_status()
+                    if segment.byterange and response.status_code != 206:
+                        raise DownloadError("O servidor não atende pedidos de trecho (Range) da playlist.")
+                    for chunk in response.iter_content(LiveConfig.CHUNK_SIZE):
+                        self._file.write(chunk)
+                        self._bytes += len(chunk)
+            except requests.RequestException:
+                self._bytes -= self._file.tell() - position
+                self._file.seek(position)
+                self._file.truncate()
+                raise
+
+        try:
+            self._retrying(f"segmento {segment.sequence}", download)
+        except requests.RequestException as e:
+            self._skip(segment, str(e))
+            return
+
+        self._next_sequence = segment.sequence + 1
+        self._segments += 1
+        self._file_duration += segment.duration
+        self._recorded += segment.duration
+        self._report('downloading')
+        if self._file_duration >= self._recorder.segment_seconds:
+            self._finish_file()
+
+    def _retrying(self, what: str, action: Callable[[], T]) -> T:
+        """
+        Executa uma requisição com até LiveConfig.SEGMENT_RETRIES novas tentativas.
+
+        Args:
+            what: Descrição usada nos eventos de nova tentativa
+            action: Requisição a executar
+
+        Returns:
+            Resultado da requisição
+
+        Raises:
+            requests.RequestException: Falha da última tentativa
+        """
+        attempt = 0
+        while True:
+            try:
+                return action()
+            except requests.RequestException as e:
+                if attempt == LiveConfig.SEGMENT_RETRIES:
+                    raise
+                attempt += 1
+                self._record('retry', f"{what} falhou ({e}); tentativa {attempt}")
+                self._wait(LiveConfig.RECONNECT_DELAY)
+
+    def _skip(self, segment: _Segment, reason: str) -> None:
+        """Registra um segmento como perdido e segue para o próximo."""
+        self._record('live_gap', f"segmento {segment.sequence} perdido ({reason})")
+        self._next_sequence = segment.sequence + 1
+
+    def _get(self, url: str, byterange: Optional[Tuple[int, int]] = None) -> bytes:
+        """Baixa um recurso pequeno (segmento de inicialização), ou só o trecho indicado."""
+        response = self._session.get(url, headers=_range_header(byterange), timeout=LiveConfig.TIMEOUT)
+        response.raise_for_status()
+        if byterange and response.status_code != 206:
+            raise DownloadError("O servidor não atende pedidos de trecho (Range) da playlist.")
+        return response.content
+
+    def _open_file(self) -> None:
+        """Abre o próximo arquivo da gravação como .part."""
+        self._index += 1
+        ext = 'mp4' if self._init_url else 'ts'
+        self._path = f"{self._base}.{self._index:04d}.{ext}"
+        self._file = open(self._path + '.part', 'wb')
+        self._file.write(self._init_data)
+        self._file_duration = 0.0
+
+    def _finish_file(self) -> None:
+        """Fecha o arquivo atual, renomeando-o para o nome final, e aplica a retenção."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        part = self._path + '.part'
+        if self._file_duration <= 0:
+            os.remove(part)
+            self._index -= 1
+            return
+        os.replace(part, self._path)
+        self._files.append(self._path)
+
+        keep = self._recorder.keep_segments
+        while keep and len(self._files) > keep:
+            try:
+                os.remove(self._files.pop(0))
+            except OSError:
+                pass
+
+    def _report(self, status: str) -> None:
+        """Envia um evento de progresso no formato do yt-dlp."""
+        if self._progress_callback is None:
+            return
+        elapsed = time.monotonic() - self._started
+        self._progress_callback({
+            'status': status,
+            'filename': self._path,
+            'downloaded_bytes': self._bytes,
+            'elapsed': elapsed,
+            'speed': self._bytes / elapsed if elapsed > 0 else None,
+            'fragment_index': self._segments,
+            'live_duration': self._recorded,
+        })
+
+    def _record(self, kind: str, detail: str) -> None:
+        """Registra um evento de rede nas estatísticas do job."""
+        if self._control is not None:
+            self._control.stats.record(kind, detail)
+
+    def _checkpoint(self) -> None:
+        """Aplica pausa e cancelamento."""
+        if self._control is not None:
+            self._control.checkpoint()
+
+    def _wait(self, seconds: float) -> None:
+        """Espera atendendo a pausa e ao cancelamento."""
+        deadline = time.monotonic() + seconds
+        while True:
+            self._checkpoint()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 0.25))
@@ -0,0 +1,333 @@
+"""
+Execução em processos separados.
+
+A extração do yt-dlp (JSON, interpretação do JavaScript de assinatura)
+é Python puro e intensiva em CPU; em threads ela disputa o GIL com as
+demais extrações e com a interface. Este backend executa extrações em
+um pool de processos e cada download em um processo próprio, criados a
+partir de um servidor (forkserver) com o yt-dlp já importado. O
+progresso volta por um pipe e é entregue ao mesmo callback usado pelo
+DownloadService, de modo que os sinais da UI e a fila de jobs não
+precisam saber onde o download roda.
+"""
+
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional
+
+from .download_service import DownloadService
+from .history_store import HistoryStore
+from .job_control import JobControl
+from .job_log import JobLog
+from .video_info_service import VideoInfoService
+from ..models.video_info import DownloadRequest, VideoInfo
+from ..models.exceptions import DownloadError, DownloadCancelledError
+from ..config.constants import AppConstants, ProcessConfig
+
+# Campos do progresso repassados ao processo principal; o 'info_dict'
+# completo é grande demais para atravessar o pipe a cada evento
+PROGRESS_KEYS = (
+    'status', 'filename', 'tmpfilename', 'downloaded_bytes', 'total_bytes',
+    'total_bytes_estimate', 'elapsed', 'eta', 'speed', 'fragment_index',
+    'fragment_count', '_percent_str', '_eta_str', '_speed_str',
+)
+
+_worker_info_service: Optional[VideoInfoService] = None
+
+
+def _init_info_worker(cookies_file: str) -> None:
+    """Cria o serviço de metadados do processo (reutilizado entre extrações)."""
+    global _worker_info_service
+    _worker_info_service = VideoInfoService(cookies_file)
+
+
+def _extract_info(url: str) -> VideoInfo:
+    """Extrai os metadados de um vídeo no processo do pool."""
+    return _worker_info_service.get_video_info(url)
+
+
+def _warm_cache() -> bool:
+    """Aquece o cache em disco do yt-dlp, compartilhado com os demais processos."""
+    return _worker_info_service.warm_cache()
+
+
+def _noop() -> None:
+    """Tarefa vazia, usada para iniciar os processos do pool."""
+
+
+def _listen_commands(conn: Connection, control: JobControl) -> None:
+    """Aplica ao controle local os comandos enviados pelo processo principal."""
+    while True:
+        try:
+            command, argument = conn.recv()
+        except (EOFError, OSError):
+            # Processo principal sumiu: não há a quem entregar o download
+            control.cancel()
+            return
+        if command == 'cancel':
+            control.cancel(argument)
+        elif command == 'pause':
+            control.pause()
+        elif command == 'resume':
+            control.resume()
+
+
+def _download_worker(
+    conn: Connection,
+    request: DownloadRequest,
+    keep_partial: bool,
+    service_options: Dict[str, Any],
+    record_history: bool,
+    job_id: Optional[str] = None
+) -> None:
+    """Executa um download no processo filho, reportando pelo pipe."""
+    control = JobControl(keep_partial, log=JobLog(job_id))
+    threading.Thread(target=_listen_commands, args=(conn, control), daemon=True).start()
+
+    history = HistoryStore.shared() if record_history else None
+    service = DownloadService(history_store=history, **service_options)
+
+    def on_progress(data: Dict[str, Any]) -> None:
+        """Envia ao processo principal os campos de progresso."""
+        conn.send(('progress', {key: data[key] for key in PROGRESS_KEYS if key in data}))
+
+    outcome: Any = None
+    try:
+        service.download(request, on_progress, control)
+    except Exception as e:
+        outcome = e
+    finally:
+        if history is not None:
+            # O processo termina sem executar o atexit: grava o histórico já
+            history.close()
+
+    log = (control.log.records(), control.log.file_path)
+    try:
+        conn.send(('result', outcome, control.stats.to_dict(), log))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        conn.send(('result', DownloadError(str(outcome)), control.stats.to_dict(), log))
+    conn.close()
+
+
+class ProcessBackend:
+    """
+    Executa extrações e downloads em processos pré-carregados com o yt-dlp.
+
+    Implementa as mesmas operações usadas de DownloadService (download)
+    e VideoInfoService (get_video_info, prewarm), podendo substituí-los
+    na UI, no JobManager e no BatchResolver.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = ProcessConfig.MAX_WORKERS,
+        cookies_file: str = AppConstants.COOKIES_FILE,
+        rate_limit: Optional[int] = None,
+        record_history: bool = False,
+        start_method: str = ProcessConfig.START_METHOD
+    ):
+        """
+        Inicializa o backend. Os processos são criados sob demanda.
+
+        Args:
+            max_workers: Processos do pool de extração de metadados
+            cookies_file: Caminho para o arquivo de cookies
+            rate_limit: Limite de banda por download em bytes/s (None = sem limite)
+            record_history: Se True, os downloads são registrados no histórico
+            start_method: Método de criação de processos do multiprocessing
+        """
+        if start_method not in multiprocessing.get_all_start_methods():
+            start_method = 'spawn'
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == 'forkserver':
+            self._context.set_forkserver_preload(self.preload_modules())
+
+        self._max_workers = max_workers
+        self._cookies_file = cookies_file
+        self._service_options = {'cookies_file': cookies_file, 'rate_limit': rate_limit}
+        self._record_history = record_history
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def preload_modules() -> List[str]:
+        """Módulos importados uma única vez pelo servidor de processos."""
+        return ['yt_dlp', DownloadService.__module__, VideoInfoService.__module__, __name__]
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Executa uma função no pool de processos.
+
+        Args:
+            fn: Função de nível de módulo (precisa ser serializável)
+            *args: Argumentos serializáveis
+
+        Returns:
+            Future com o resultado
+        """
+        return self._get_executor().submit(fn, *args)
+
+    def get_video_info(self, url: str) -> VideoInfo:
+        """
+        Obtém informações de um vídeo em um processo do pool.
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+            VideoInfoError: Se houver erro ao obter informações
+        """
+        return self.submit(_extract_info, url).result()
+
+    def prewarm(self) -> None:
+        """Inicia o servidor de processos e os processos do pool."""
+        futures = [self.submit(_noop) for _ in range(self._max_workers)]
+        for future in futures:
+            future.result()
+
+    def warm_cache(self) -> bool:
+        """
+        Preenche o cache em disco do yt-dlp a partir de um processo do pool.
+
+        Returns:
+            True se uma extração de aquecimento foi feita
+        """
+        return self.submit(_warm_cache).result()
+
+    def download(
+        self,
+        request: DownloadRequest,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> None:
+        """
+        Realiza o download em um processo próprio.
+
+        Os eventos de progresso são entregues ao callback nesta thread, e
+        os comandos do controle (pausa, retomada, cancelamento) são
+        repassados ao processo. Um processo cancelado que não termina em
+        ProcessConfig.CANCEL_GRACE segundos (ex.: preso na extração) é
+        encerrado à força.
+
+        Raises:
+            CookiesNotFoundError: Se o arquivo de cookies não existir
+            DownloadCancelledError: Se o download for cancelado
+            InsufficientDiskSpaceError: Se não houver espaço para o download
+            DownloadError: Se houver erro no download
+        """
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_download_worker,
+            args=(
+                child_conn, request, control.keep_partial if control is not None else False,
+                self._service_options, self._record_history,
+                control.log.job_id if control is not None else None
+            ),
+            name='download-worker',
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        relay = _CommandRelay(conn, control)
+        try:
+            while True:
+                relay.forward()
+                if relay.cancel_expired():
+                    process.terminate()
+                    raise DownloadCancelledError("Download cancelado.")
+                if not conn.poll(ProcessConfig.POLL_INTERVAL):
+                    continue
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    process.join(ProcessConfig.POLL_INTERVAL)
+                    raise DownloadError(
+                        f"O processo de download terminou inesperadamente (código {process.exitcode})."
+                    )
+                if message[0] == 'progress':
+                    if progress_callback is not None:
+                        progress_callback(message[1])
+                    continue
+
+                _, outcome, stats, (log_records, log_file) = message
+                if control is not None:
+                    self._merge_stats(control, stats)
+                    control.log.extend(log_records, log_file)
+                if outcome is not None:
+                    raise outcome
+                return
+        finally:
+            conn.close()
+            process.join(ProcessConfig.CANCEL_GRACE)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    def shutdown(self) -> None:
+        """Encerra o pool de processos."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Cria o pool de extração na primeira utilização."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=self._context,
+                    initializer=_init_info_worker,
+                    initargs=(self._cookies_file,)
+                )
+            return self._executor
+
+    @staticmethod
+    def _merge_stats(control: JobControl, stats: Dict[str, Any]) -> None:
+        """Copia para o controle local as estatísticas de rede do processo."""
+        control.stats.throttle_restarts += stats['throttle_restarts']
+        control.stats.connection_retries += stats['connection_retries']
+        control.stats.events.extend(stats['events'])
+        del control.stats.events[:-control.stats.MAX_EVENTS]
+
+
+class _CommandRelay:
+    """Repassa ao processo de download as mudanças de estado do controle."""
+
+    def __init__(self, conn: Connection, control: Optional[JobControl]):
+        """
+        Inicializa o repasse.
+
+        Args:
+            conn: Extremidade do pipe no processo principal
+            control: Controle do job (None = sem comandos)
+        """
+        self._conn = conn
+        self._control = control
+        self._paused = False
+        self._cancelled_at: Optional[float] = None
+
+    def forward(self) -> None:
+        """Envia os comandos correspondentes ao que mudou desde a última chamada."""
+        control = self._control
+        if control is None or self._cancelled_at is not None:
+            return
+        try:
+            if control.is_cancelled:
+                self._conn.send(('cancel', control.keep_partial))
+                self._cancelled_at = time.monotonic()
+            elif control.is_paused != self._paused:
+                self._paused = control.is_paused
+                self._conn.send(('pause' if self._paused else 'resume', None))
+        except (BrokenPipeError, OSError):
+            pass
+
+    def cancel_expired(self) -> bool:
+        """Indica se o processo ignorou o cancelamento além do prazo."""
+        return (
+            self._cancelled_at is not None
+            and time.monotonic() - self._cancelled_at > ProcessConfig.CANCEL_GRACE
+        )
@@ -0,0 +1,329 @@
+"""
+Download HTTP em segmentos paralelos.
+
+O downloader nativo do yt-dlp baixa formatos progressivos por uma única
+conexão, e servidores que limitam a banda por conexão tornam esse
+download lento. O RangeDownloader divide o arquivo em N intervalos de
+bytes baixados em paralelo, cada um gravado na sua posição de um
+arquivo .part pré-alocado. Cada segmento tenta de novo sozinho quando
+sua conexão falha, e o progresso de todos fica em um arquivo .ytdl para
+retomar o download de onde parou.
+
+É associado às instâncias do YoutubeDL com attach() e só entra em ação
+nos jobs com params['range_connections'] > 1; servidores sem suporte a
+Range caem no downloader nativo.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import types
+from typing import Any, Dict, List, Optional
+
+from yt_dlp.downloader.common import FileDownloader
+from yt_dlp.downloader.http import HttpFD
+from yt_dlp.networking import Request
+from yt_dlp.networking.exceptions import HTTPError, TransportError
+from yt_dlp.utils import ContentTooShortError, determine_protocol
+
+from ..config.constants import RangeConfig
+
+
+class _Segment:
+    """Intervalo de bytes [start, end] e a próxima posição a baixar."""
+
+    __slots__ = ('start', 'end', 'position')
+
+    def __init__(self, start: int, end: int, position: Optional[int] = None):
+        self.start = start
+        self.end = end
+        self.position = start if position is None else position
+
+    @property
+    def remaining(self) -> int:
+        """Bytes ainda não baixados."""
+        return self.end + 1 - self.position
+
+
+class RangeDownloader(FileDownloader):
+    """Downloader do yt-dlp que usa várias conexões com intervalos de bytes."""
+
+    PROTOCOLS = ('http', 'https')
+    _CONTENT_RANGE = re.compile(r'bytes\s+\d+-\d+/(\d+)')
+
+    def __init__(self, ydl: Any, params: Dict[str, Any], connections: int):
+        """
+        Inicializa o downloader.
+
+        Args:
+            ydl: Instância do YoutubeDL
+            params: Opções do yt-dlp
+            connections: Máximo de conexões simultâneas
+        """
+        super().__init__(ydl, params)
+        self._connections = max(1, min(connections, RangeConfig.MAX_CONNECTIONS))
+        self._lock = threading.Lock()
+        self._hook_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    @classmethod
+    def attach(cls, ydl: Any) -> None:
+        """
+        Faz uma instância do YoutubeDL usar segmentos paralelos quando pedido.
+
+        Args:
+            ydl: Instância do yt_dlp.YoutubeDL
+        """
+        if not getattr(ydl, '_range_downloader_attached', False):
+            ydl.dl = types.MethodType(_dl, ydl)
+            ydl._range_downloader_attached = True
+
+    @classmethod
+    def can_download(cls, info: Dict[str, Any]) -> bool:
+        """Indica se o formato é um arquivo HTTP comum que aceita segmentação."""
+        return (
+            bool(info.get('url'))
+            and determine_protocol(info) in cls.PROTOCOLS
+            and not info.get('is_live')
+            and not info.get('request_data')
+            and not info.get('impersonate')
+            and info.get('section_start') is None
+            and info.get('section_end') is None
+        )
+
+    def real_download(self, filename: str, info_dict: Dict[str, Any]) -> bool:
+        """Baixa o arquivo em segmentos paralelos (usado pelo yt-dlp)."""
+        url = info_dict['url']
+        headers = dict(info_dict.get('http_headers') or {}, **{'Accept-Encoding': 'identity'})
+        total = self._probe(url, headers)
+        if total is None:
+            self.to_screen('[download] Servidor sem suporte a Range; usando uma conexão')
+            return self._fallback(filename, info_dict)
+
+        tmpfilename = self.temp_name(filename)
+        state_file = self.ytdl_filename(filename)
+        segments = self._load_state(tmpfilename, state_file, total)
+        if segments is None:
+            segments = self._plan(total)
+            self._preallocate(tmpfilename, total)
+        self.report_destination(filename)
+
+        self._start_time = time.time()
+        self._session_bytes = 0
+        self._downloaded = total - sum(segment.remaining for segment in segments)
+        self._last_report = self._last_save = 0.0
+        self._context = {
+            'filename': filename, 'tmpfilename': tmpfilename, 'state_file': state_file,
+            'total': total, 'info': info_dict, 'segments': segments,
+        }
+
+        workers = [
+            threading.Thread(target=self._run_segment, args=(url, headers, segment), daemon=True)
+            for segment in segments if segment.remaining > 0
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self._save_state()
+        if self._error is not None:
+            raise self._error
+
+        os.remove(state_file)
+        self.try_rename(tmpfilename, filename)
+        self._hook_progress({
+            'status': 'finished',
+            'filename': filename,
+            'downloaded_bytes': total,
+            'total_bytes': total,
+            'elapsed': time.time() - self._start_time,
+        }, info_dict)
+        return True
+
+    def _probe(self, url: str, headers: Dict[str, str]) -> Optional[int]:
+        """Pede o primeiro byte para saber o tamanho e se o servidor aceita Range."""
+        try:
+            response = self.ydl.urlopen(Request(url, headers=dict(headers, Range='bytes=0-0')))
+        except HTTPError as e:
+            # 416: arquivo vazio; o downloader nativo trata esse caso
+            if e.status == 416:
+                return None
+            raise
+        try:
+            if response.status != 206:
+                return None
+            match = self._CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+            return int(match.group(1)) if match else None
+        finally:
+            response.close()
+
+    def _fallback(self, filename: str, info_dict: Dict[str, Any]) -> bool:
+        """Baixa pelo downloader nativo, com os mesmos hooks de progresso."""
+        downloader = HttpFD(self.ydl, self.params)
+        downloader._progress_hooks = self._progress_hooks
+        return downloader.real_download(filename, info_dict)
+
+    def _plan(self, total: int) -> List[_Segment]:
+        """Divide o arquivo em segmentos de tamanhos iguais."""
+        count = max(1, min(self._connections, total // RangeConfig.MIN_SEGMENT_BYTES))
+        size = -(-total // count)
+        return [
+            _Segment(start, min(start + size, total) - 1)
+            for start in range(0, total, size)
+        ]
+
+    def _preallocate(self, tmpfilename: str, total: int) -> None:
+        """Cria o .part já com o tamanho final, reservando o espaço quando possível."""
+        with open(tmpfilename, 'wb') as f:
+            f.truncate(total)
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total)
+                except OSError:
+                    pass
+
+    def _load_state(self, tmpfilename: str, state_file: str, total: int) -> Optional[List[_Segment]]:
+        """Recupera os segmentos de um download interrompido, se compatível."""
+        if not self.params.get('continuedl', True):
+            return None
+        try:
+            with open(state_file, encoding='utf-8') as f:
+                state = json.load(f)['range_downloader']
+            if state['total'] != total or os.path.getsize(tmpfilename) != total:
+                return None
+            segments = [_Segment(*values) for values in state['segments']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self.report_resuming_byte(total - sum(segment.remaining for segment in segments))
+        return segments
+
+    def _save_state(self) -> None:
+        """Grava o progresso dos segmentos, de forma atômica."""
+        context = self._context
+        with self._lock:
+            state = {'range_downloader': {
+                'total': context['total'],
+                'segments': [[s.start, s.end, s.position] for s in context['segments']],
+            }}
+        temp_path = context['state_file'] + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, context['state_file'])
+
+    def _run_segment(self, url: str, headers: Dict[str, str], segment: _Segment) -> None:
+        """Baixa um segmento, repetindo a conexão a partir de onde parou em caso de falha."""
+        retries = self.params.get('retries', 10)
+        sleep_function = (self.params.get('retry_sleep_functions') or {}).get('http')
+        attempt = 0
+        try:
+            with open(self._context['tmpfilename'], 'r+b') as f:
+                while segment.remaining > 0 and not self._stop.is_set():
+                    try:
+                        self._fetch(url, headers, segment, f)
+                        attempt = 0
+                    except (TransportError, ContentTooShortError, OSError, HTTPError) as e:
+                        if isinstance(e, HTTPError) and e.status < 500:
+                            raise
+                        if attempt >= retries:
+                            raise
+                        self.to_screen(
+                            f'[download] Segmento {segment.start}-{segment.end} falhou ({e}); '
+                            f'tentativa {attempt + 1} de {retries}'
+                        )
+                        self._stop.wait(sleep_function(n=attempt) if sleep_function else min(2 ** attempt, 15))
+                        attempt += 1
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+            self._stop.set()
+
+    def _fetch(self, url: str, headers: Dict[str, str], segment: _Segment, f: Any) -> None:
+        """Abre uma conexão para o restante do segmento e grava os blocos recebidos."""
+        chunk_size = (
+            self.params.get('http_chunk_size')
+            or self._context['info'].get('downloader_options', {}).get('http_chunk_size')
+        )
+        end = segment.end
+        if chunk_size:
+            end = min(end, segment.position + chunk_size - 1)
+        request_range = f'bytes={segment.position}-{end}'
+        response = self.ydl.urlopen(Request(url, headers=dict(headers, Range=request_range)))
+        try:
+            if response.status != 206:
+                raise TransportError(f'Resposta {response.status} a um pedido de intervalo')
+            block_size = self.params.get('buffersize') or 1024
+            while segment.position <= end and not self._stop.is_set():
+                block = response.read(min(block_size, end + 1 - segment.position))
+                if not block:
+                    raise ContentTooShortError(segment.position, end + 1)
+                f.seek(segment.position)
+                f.write(block)
+                self._advance(segment, len(block))
+        finally:
+            response.close()
+
+    def _advance(self, segment: _Segment, count: int) -> None:
+        """Registra bytes recebidos, aplica o limite de banda e reporta o progresso."""
+        now = time.time()
+        with self._lock:
+            segment.position += count
+            self._downloaded += count
+            self._session_bytes += count
+            session_bytes = self._session_bytes
+            save = now - self._last_save >= RangeConfig.STATE_INTERVAL
+            if save:
+                self._last_save = now
+        if save:
+            self._save_state()
+        self.slow_down(self._start_time, now, session_bytes)
+
+        # Hooks chamados um de cada vez: um hook bloqueado (pausa) segura todos os segmentos
+        with self._hook_lock:
+            now = time.time()
+            if now - self._last_report < RangeConfig.PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            context = self._context
+            with self._lock:
+                downloaded, session_bytes = self._downloaded, self._session_bytes
+            elapsed = now - self._start_time
+            speed = session_bytes / elapsed if elapsed > 0 else None
+            self._hook_progress({
+                'status': 'downloading',
+                'filename': context['filename'],
+                'tmpfilename': context['tmpfilename'],
+                'downloaded_bytes': downloaded,
+                'total_bytes': context['total'],
+                'speed': speed,
+                'eta': (context['total'] - downloaded) / speed if speed else None,
+                'elapsed': elapsed,
+            }, context['info'])
+
+    def slow_down(self, start_time: float, now: Optional[float], byte_counter: int) -> None:
+        """Aplica o limite de banda ao total dos segmentos (e não a cada conexão)."""
+        rate_limit = self.params.get('ratelimit')
+        if not rate_limit or byte_counter == 0:
+            return
+        elapsed = (now or time.time()) - start_time
+        sleep_time = byte_counter / rate_limit - elapsed
+        if sleep_time > 0:
+            self._stop.wait(sleep_time)
+
+
+def _dl(self: Any, name: str, info: Dict[str, Any], subtitle: bool = False, test: bool = False) -> Any:
+    """Substitui YoutubeDL.dl, desviando para o RangeDownloader quando o job pede."""
+    connections = self.params.get('range_connections') or 1
+    if connections > 1 and not (subtitle or test) and name != '-' and RangeDownloader.can_download(info):
+        downloader = RangeDownloader(self, self.params, connections)
+        for hook in self._progress_hooks:
+            downloader.add_progress_hook(hook)
+        new_info = self._copy_infodict(info)
+        if new_info.get('http_headers') is None:
+            new_info['http_headers'] = self._calc_headers(new_info)
+        return downloader.download(name, new_info, subtitle)
+    return type(self).dl(self, name, info, subtitle, test)
@@ -0,0 +1,311 @@
+"""
+Armazenamento dos downloads.
+
+Verifica o espaço livre antes de cada vídeo (no diretório de rascunho e
+no destino) e mantém fragmentos e intermediários da mesclagem em um
+diretório local rápido, movendo apenas o arquivo final para o destino.
+"""
+
+import errno
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .format_selector import FormatSelector
+from ..models.exceptions import InsufficientDiskSpaceError
+from ..config.constants import StorageConfig
+
+
+class DiskSpaceGuard:
+    """
+    Verificação de espaço livre com reservas entre jobs simultâneos.
+
+    Cada job reserva o espaço que ainda vai ocupar, de modo que dois
+    downloads em paralelo no mesmo disco não passem ambos na verificação
+    contando com o mesmo espaço livre.
+    """
+
+    def __init__(
+        self,
+        safety_margin: float = StorageConfig.SAFETY_MARGIN,
+        min_free_bytes: int = StorageConfig.MIN_FREE_BYTES
+    ):
+        """
+        Inicializa a verificação.
+
+        Args:
+            safety_margin: Fator multiplicado sobre o tamanho estimado
+            min_free_bytes: Espaço que deve continuar livre após o download
+        """
+        self._margin = safety_margin
+        self._min_free = min_free_bytes
+        self._reserved: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_size(info: Dict[str, Any]) -> Optional[int]:
+        """
+        Estima o tamanho do vídeo a partir do formato selecionado.
+
+        Args:
+            info: Info dict do yt-dlp após a seleção de formato
+
+        Returns:
+            Tamanho em bytes ou None se desconhecido
+        """
+        duration = info.get('duration')
+        parts = info.get('requested_formats') or [info]
+        sizes = [FormatSelector.estimate_size(f, duration) for f in parts]
+        return None if None in sizes else sum(sizes)
+
+    def requirements(
+        self,
+        size: int,
+        merged: bool,
+        scratch_dir: Optional[str],
+        dest_dir: str
+    ) -> List[Tuple[str, int]]:
+        """
+        Calcula o espaço necessário em cada disco envolvido.
+
+        Durante a mesclagem coexistem os streams separados e o arquivo
+        final, por isso o disco de trabalho precisa do dobro do tamanho.
+        Se o rascunho estiver em outro disco, o destino precisa apenas
+        do arquivo final.
+
+        Returns:
+            Lista de (caminho, bytes) com um item por disco
+        """
+        peak = size * 2 if merged else size
+        work_dir = scratch_dir or dest_dir
+        needs = [(work_dir, peak)]
+        if scratch_dir and self._device(scratch_dir) != self._device(dest_dir):
+            needs.append((dest_dir, size))
+        return needs
+
+    def reserve(self, needs: List[Tuple[str, int]]) -> List[Tuple[int, int]]:
+        """
+        Verifica e reserva espaço nos discos informados.
+
+        Args:
+            needs: Lista de (caminho, bytes) gerada por requirements()
+
+        Returns:
+            Reserva a ser devolvida com release()
+
+        Raises:
+            InsufficientDiskSpaceError: Se algum disco não comportar o download
+        """
+        with self._lock:
+            reservation = []
+            for path, size in needs:
+                device = self._device(path)
+                required = int(size * self._margin)
+                free = shutil.disk_usage(self._existing(path)).free - self._reserved.get(device, 0)
+                if free - required < self._min_free:
+                    raise InsufficientDiskSpaceError(
+                        f"Espaço insuficiente em '{path}': são necessários "
+                        f"~{required / 1024 ** 2:.0f} MB e há {max(free, 0) / 1024 ** 2:.0f} MB livres."
+                    )
+                reservation.append((device, required))
+
+            for device, required in reservation:
+                self._reserved[device] = self._reserved.get(device, 0) + required
+            return reservation
+
+    def release(self, reservation: List[Tuple[int, int]]) -> None:
+        """Devolve uma reserva feita com reserve()."""
+        with self._lock:
+            for device, required in reservation:
+                self._reserved[device] = max(self._reserved.get(device, 0) - required, 0)
+
+    @classmethod
+    def _device(cls, path: str) -> int:
+        """Identifica o disco de um caminho (que pode ainda não existir)."""
+        return os.stat(cls._existing(path)).st_dev
+
+    @staticmethod
+    def _existing(path: str) -> str:
+        """Retorna o caminho ou o ancestral mais próximo que existe."""
+        path = os.path.abspath(path)
+        while not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return path
+
+
+class DiskPreflight:
+    """
+    Verificação de espaço de um job, usada como 'match_filter' do yt-dlp.
+
+    O yt-dlp chama o filtro duas vezes por vídeo: antes de escolher o
+    formato, com incomplete=True, e em process_info, depois da escolha e
+    antes do download. Só a segunda chamada é verificada, pois só então
+    o tamanho pode ser estimado.
+    """
+
+    def __init__(self, guard: DiskSpaceGuard, scratch_dir: Optional[str], dest_dir: str):
+        """
+        Inicializa a verificação.
+
+        Args:
+            guard: Verificação compartilhada entre os jobs
+            scratch_dir: Diretório de rascunho (None se não houver)
+            dest_dir: Diretório de destino
+        """
+        self._guard = guard
+        self._scratch_dir = scratch_dir
+        self._dest_dir = dest_dir
+        self._reservation: List[Tuple[int, int]] = []
+
+    def __call__(self, info: Dict[str, Any], *, incomplete: bool = False) -> Optional[str]:
+        """
+        Verifica o espaço para um vídeo.
+
+        Returns:
+            None para prosseguir com o download
+
+        Raises:
+            InsufficientDiskSpaceError: Se não houver espaço suficiente
+        """
+        if incomplete:
+            return None
+        size = self._guard.estimate_size(info)
+        if size is None:
+            return None
+
+        # O vídeo anterior da playlist já ocupa o disco: sua reserva termina aqui
+        self.release()
+        needs = self._guard.requirements(
+            size, bool(info.get('requested_formats')), self._scratch_dir, self._dest_dir
+        )
+        self._reservation = self._guard.reserve(needs)
+        return None
+
+    def release(self) -> None:
+        """Devolve a reserva atual."""
+        self._guard.release(self._reservation)
+        self._reservation = []
+
+
+class StagingArea:
+    """
+    Arquivos de um job no diretório de rascunho até a entrega no destino.
+
+    Cada job usa um subdiretório próprio, removido ao final, para que
+    jobs simultâneos com o mesmo título não compartilhem arquivos e para
+    que sobras de uma execução interrompida nunca sejam entregues.
+    """
+
+    def __init__(self, scratch_dir: str):
+        """
+        Inicializa a área de rascunho.
+
+        Args:
+            scratch_dir: Diretório local rápido para os arquivos temporários
+        """
+        self._root = os.path.abspath(scratch_dir)
+        self._directory: Optional[str] = None
+        self._files: List[str] = []
+
+    @property
+    def directory(self) -> str:
+        """Diretório do job (ou o diretório de rascunho, antes de prepare())."""
+        return self._directory or self._root
+
+    def prepare(self) -> str:
+        """Cria o subdiretório exclusivo do job e o retorna."""
+        os.makedirs(self._root, exist_ok=True)
+        self._directory = tempfile.mkdtemp(prefix='job-', dir=self._root)
+        return self._directory
+
+    def record(self, filepath: str) -> None:
+        """Registra um arquivo final (usado como 'post_hooks' do yt-dlp)."""
+        if filepath not in self._files:
+            self._files.append(filepath)
+
+    def commit(self, dest_dir: str) -> List[str]:
+        """
+        Move os arquivos finais para o destino.
+
+        Como o yt-dlp fazia ao baixar direto no destino, um arquivo que
+        já existe lá é mantido e a cópia do rascunho é descartada.
+
+        Returns:
+            Caminhos dos arquivos no destino
+        """
+        delivered = []
+        for path in self._files:
+            if not os.path.exists(path):
+                continue
+            try:
+                delivered.append(self.move_atomic(path, dest_dir))
+            except FileExistsError:
+                os.remove(path)
+                delivered.append(os.path.join(dest_dir, os.path.basename(path)))
+        self._files = []
+        return delivered
+
+    def cleanup(self) -> None:
+        """Remove o subdiretório do job com o que restou nele (.part, intermediários)."""
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+        self._files = []
+
+    @classmethod
+    def move_atomic(cls, src: str, dest_dir: str) -> str:
+        """
+        Move um arquivo sem nunca expor uma cópia parcial no destino.
+
+        No mesmo disco é uma renomeação; entre discos o arquivo é copiado
+        para um temporário oculto no destino e renomeado ao final. Um
+        arquivo existente no destino nunca é sobrescrito.
+
+        Returns:
+            Caminho final do arquivo
+
+        Raises:
+            FileExistsError: Se o destino já tiver um arquivo com o mesmo nome
+        """
+        dest = os.path.join(dest_dir, os.path.basename(src))
+        try:
+            cls._place(src, dest)
+            return dest
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(src)}.", suffix='.tmp', dir=dest_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(src, temp_path)
+            cls._place(temp_path, dest)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        os.remove(src)
+        return dest
+
+    @staticmethod
+    def _place(src: str, dest: str) -> None:
+        """Renomeia src para dest (mesmo disco) sem sobrescrever dest."""
+        try:
+            # link() falha se dest existir: a verificação e a criação são atômicas
+            os.link(src, dest)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                raise
+            # Sistemas de arquivos sem hard links (ex.: FAT, alguns compartilhamentos)
+            if os.path.exists(dest):
+                raise FileExistsError(errno.EEXIST, "Arquivo já existe no destino", dest) from e
+            os.replace(src, dest)
+            return
+        os.remove(src)
@@ -0,0 +1,493 @@
+"""
+Envio da mídia para um pipe ou stream, sem arquivo em disco.
+
+O DownloadService sempre grava o resultado em save_path, então entregar
+o vídeo a um transcodificador ou a um upload exige gravar o arquivo
+inteiro e lê-lo de novo. O MediaStreamer baixa um único stream e escreve
+cada bloco recebido direto em um destino (StreamSink):
+- a saída padrão ou um descritor de arquivo;
+- um pipe nomeado ou qualquer objeto binário com write();
+- um stream asyncio (StreamWriter), esperando o drain().
+
+A escrita bloqueia enquanto o destino não consome os dados e o próximo
+bloco só é lido da rede depois dela, então um consumidor lento segura o
+download (backpressure) em vez de acumular memória. Nada é gravado em
+disco.
+
+Só servem formatos que não precisam de mesclagem nem conversão: um
+stream progressivo (vídeo e áudio juntos), um stream só de áudio ou uma
+playlist HLS sob demanda. Quedas de conexão são retomadas com o
+cabeçalho Range a partir do último byte entregue.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import os
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple, Union
+
+import requests
+from yt_dlp.utils import DownloadCancelled, YoutubeDLError
+
+from .cookie_manager import CookieJarManager
+from .format_selector import FormatSelector
+from .job_control import JobControl
+from .live_recorder import _MediaPlaylist, parse_playlist
+from .ydl_cache import YtDlpCache
+from .ydl_pool import YoutubeDLPool
+from ..models.format_policy import FormatPolicy
+from ..models.video_info import DownloadRequest
+from ..models.exceptions import DownloadCancelledError, DownloadError
+from ..config.constants import AppConstants, DownloadFormats, StreamConfig
+
+
+class StreamSink(ABC):
+    """Destino dos bytes baixados. write() bloqueia até o destino aceitar os dados."""
+
+    name = '<stream>'
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """
+        Entrega um bloco ao destino.
+
+        Args:
+            data: Bytes recebidos, na ordem do arquivo
+
+        Raises:
+            OSError: Se o destino foi fechado (ex.: BrokenPipeError)
+        """
+
+    def flush(self) -> None:
+        """Garante que os bytes entregues chegaram ao destino."""
+
+    def close(self) -> None:
+        """Libera o destino, se ele pertencer ao sink."""
+
+
+class FileSink(StreamSink):
+    """Destino em um objeto binário com write(): saída padrão, pipe ou arquivo."""
+
+    def __init__(self, stream: BinaryIO, name: Optional[str] = None, owned: bool = False):
+        """
+        Inicializa o destino.
+
+        Args:
+            stream: Objeto binário com write()
+            name: Nome exibido do destino
+            owned: Se True, close() fecha o objeto
+        """
+        self._stream = stream
+        self._owned = owned
+        self.name = name or getattr(stream, 'name', None) or StreamSink.name
+
+    @classmethod
+    def open(cls, target: Union[str, int]) -> 'FileSink':
+        """
+        Abre um destino pelo nome usado na linha de comando.
+
+        Args:
+            target: '-' (saída padrão), 'fd:N' ou número do descritor, ou o
+                caminho de um pipe nomeado (a abertura espera o leitor)
+
+        Returns:
+            Destino aberto sem buffer, para o consumidor receber cada bloco
+        """
+        if target == '-':
+            return cls(sys.stdout.buffer, '<stdout>')
+        if isinstance(target, str) and target.startswith('fd:'):
+            target = int(target[3:])
+        if isinstance(target, int):
+            return cls(os.fdopen(target, 'wb', buffering=0, closefd=False), f"fd:{target}", owned=True)
+        return cls(open(target, 'wb', buffering=0), target, owned=True)
+
+    def write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            # Objetos sem buffer podem aceitar só parte dos bytes por chamada
+            written = self._stream.write(view)
+            view = view[written if written is not None else len(view):]
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self._stream.close()
+
+
+class AsyncStreamSink(StreamSink):
+    """
+    Destino em um stream asyncio, escrito a partir da thread do download.
+
+    Aceita objetos no formato do asyncio.StreamWriter (write() seguido de
+    drain()) ou com write() assíncrono. Cada bloco espera o drain(), de
+    modo que o buffer do transporte limita a memória usada.
+    """
+
+    def __init__(self, writer: Any, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Inicializa o destino. Sem loop, deve ser criado dentro do loop em execução.
+
+        Args:
+            writer: Stream de destino
+            loop: Loop que executa o stream
+        """
+        self._writer = writer
+        self._loop = loop or asyncio.get_running_loop()
+        self._pending: Optional[concurrent.futures.Future] = None
+        self._aborted = False
+        self.name = repr(writer)
+
+    def write(self, data: bytes) -> None:
+        if self._aborted:
+            raise BrokenPipeError("Envio ao stream interrompido.")
+        self._pending = asyncio.run_coroutine_threadsafe(self._write(data), self._loop)
+        try:
+            self._pending.result()
+        except concurrent.futures.CancelledError as e:
+            raise BrokenPipeError("Envio ao stream interrompido.") from e
+
+    def abort(self) -> None:
+        """Libera a thread do download presa esperando um destino que não consome mais."""
+        self._aborted = True
+        if self._pending is not None:
+            self._pending.cancel()
+
+    async def _write(self, data: bytes) -> None:
+        """Escreve e espera o destino aceitar os dados (executado no loop)."""
+        result = self._writer.write(data)
+        if inspect.isawaitable(result):
+            await result
+        drain = getattr(self._writer, 'drain', None)
+        if drain is not None:
+            await drain()
+
+
+class MediaStreamer:
+    """Baixa um único stream de um vídeo direto para um StreamSink."""
+
+    STREAMABLE_PROTOCOLS = ('http', 'https', 'm3u8', 'm3u8_native')
+
+    def __init__(
+        self,
+        cookies_file: str = AppConstants.COOKIES_FILE,
+        cookie_manager: Optional[CookieJarManager] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None
+    ):
+        """
+        Inicializa o streamer.
+
+        Args:
+            cookies_file: Caminho para o arquivo de cookies
+            cookie_manager: Gerenciador do cookie jar compartilhado
+            ydl_pool: Pool do yt-dlp usado para obter a URL do stream
+        """
+        self._cookie_manager = cookie_manager or CookieJarManager.shared(cookies_file)
+        self._ydl_pool = ydl_pool or YoutubeDLPool(self._cookie_manager, cache=YtDlpCache.shared())
+
+    def stream(
+        self,
+        request: DownloadRequest,
+        sink: StreamSink,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> Dict[str, Any]:
+        """
+        Baixa o vídeo escrevendo-o no destino, sem passar pelo disco.
+
+        Args:
+            request: Requisição (save_path é ignorado)
+            sink: Destino dos bytes; não é fechado ao final
+            progress_callback: Callback com eventos no formato do yt-dlp
+            control: Controle de cancelamento/pausa; pausar deixa de ler
+                da rede até a retomada
+
+        Returns:
+            Formato enviado ('title', 'format_id', 'ext', 'bytes')
+
+        Raises:
+            DownloadCancelledError: Se o envio for cancelado
+            DownloadError: Se não houver formato transmissível, a rede
+                falhar ou o destino for fechado
+        """
+        if control is not None:
+            progress_callback = control.wrap_progress_hook(progress_callback)
+        logger = control.log if control is not None else None
+        fmt, title = self.resolve(request, logger)
+        transfer = _Transfer(fmt, sink, progress_callback, control)
+        try:
+            transfer.run()
+            sink.flush()
+        except DownloadCancelled as e:
+            raise DownloadCancelledError("Envio cancelado.") from e
+        except OSError as e:
+            if control is not None and control.is_cancelled:
+                raise DownloadCancelledError("Envio cancelado.") from e
+            raise DownloadError(f"O destino do stream deixou de aceitar dados: {e}") from e
+        return {'title': title, 'format_id': fmt.get('format_id'), 'ext': fmt.get('ext'), 'bytes': transfer.sent}
+
+    def resolve(self, request: DownloadRequest, logger: Optional[Any] = None) -> Tuple[Dict[str, Any], str]:
+        """
+        Escolhe pelo yt-dlp o formato transmissível que atende ao formato pedido.
+
+        Args:
+            request: Requisição do envio
+            logger: Destino das mensagens do yt-dlp (ex.: JobLog do job)
+
+        Returns:
+            (formato do yt-dlp, título)
+
+        Raises:
+            DownloadError: Se o vídeo não tiver formato transmissível
+        """
+        options = {
+            'quiet': True,
+            'format': self.format_selector(DownloadFormats.get_policy(request.format_choice)),
+        }
+        if logger is not None:
+            options['logger'] = logger
+        try:
+            with self._ydl_pool.checkout(options) as ydl:
+                info = ydl.extract_info(request.url, download=False)
+        except YoutubeDLError as e:
+            raise DownloadError(
+                f"Nenhum formato pode ser enviado sem arquivo intermediário: {e}"
+            ) from e
+        fmt = (info.get('requested_formats') or [info])[0]
+        if not fmt.get('url'):
+            raise DownloadError("O formato escolhido não tem URL para envio.")
+        return fmt, info.get('title') or request.url
+
+    @classmethod
+    def format_selector(cls, policy: FormatPolicy) -> Callable[[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """
+        Seletor para a opção 'format' do yt-dlp restrito a formatos transmissíveis.
+
+        Vídeos só podem usar streams progressivos, pois vídeo e áudio
+        separados precisariam ser mesclados em arquivo.
+
+        Args:
+            policy: Política de seleção do formato pedido
+
+        Returns:
+            Callable no formato de seletor do yt-dlp
+        """
+        selector = FormatSelector(policy)
+
+        def select(ctx: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+            formats = [fmt for fmt in ctx.get('formats') or [] if cls._is_streamable(fmt, policy)]
+            choice = selector.select(formats)
+            if choice is not None:
+                yield choice.formats[0]
+            elif formats:
+                # Codecs desconhecidos (ex.: link direto): mantém o comportamento de "best"
+                yield formats[-1]
+        return select
+
+    @classmethod
+    def _is_streamable(cls, fmt: Dict[str, Any], policy: FormatPolicy) -> bool:
+        """Indica se o formato pode ser enviado como um único stream."""
+        if fmt.get('protocol', 'https') not in cls.STREAMABLE_PROTOCOLS or fmt.get('has_drm'):
+            return False
+        if policy.audio_only:
+            return fmt.get('vcodec') == 'none' and fmt.get('acodec') != 'none'
+        return fmt.get('vcodec') != 'none' and fmt.get('acodec') != 'none'
+
+
+class _Transfer:
+    """Cópia de um formato para o destino, com retomada após quedas."""
+
+    _CONTENT_RANGE = re.compile(r'bytes\s+\d+-\d+/(\d+)')
+
+    def __init__(
+        self,
+        fmt: Dict[str, Any],
+        sink: StreamSink,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        control: Optional[JobControl]
+    ):
+        self._fmt = fmt
+        self._sink = sink
+        self._progress_callback = progress_callback
+        self._control = control
+        self._session = requests.Session()
+        self._session.headers.update(fmt.get('http_headers') or {})
+        self._total: Optional[int] = fmt.get('filesize')
+        self.sent = 0
+        self._started = time.monotonic()
+        self._last_report = 0.0
+
+    def run(self) -> None:
+        """Envia o formato inteiro."""
+        try:
+            if str(self._fmt.get('protocol', '')).startswith('m3u8'):
+                self._send_playlist(self._fmt['url'])
+            else:
+                self._send_progressive(self._fmt['url'])
+        finally:
+            self._session.close()
+        self._report('finished')
+
+    def _send_progressive(self, url: str) -> None:
+        """
+        Envia um arquivo HTTP, em pedaços de http_chunk_size quando o
+        extrator os pede (o YouTube limita a banda de respostas longas).
+        """
+        chunk = (self._fmt.get('downloader_options') or {}).get('http_chunk_size')
+        position = 0
+        while self._total is None or position < self._total:
+            end = position + chunk - 1 if chunk else None
+            if self._total is not None and end is not None:
+                end = min(end, self._total - 1)
+            position += self._copy(url, position, end, sized=True)
+            if end is None or position <= end:
+                # Resposta menor que o pedaço pedido: fim do arquivo
+                return
+
+    def _send_playlist(self, url: str) -> None:
+        """Envia os segmentos de uma playlist HLS sob demanda, em ordem."""
+        playlist = self._playlist(url)
+        if playlist.variants:
+            playlist = self._playlist(max(playlist.variants)[1])
+        if not playlist.ended:
+            raise DownloadError("Transmissões ao vivo não podem ser enviadas a um stream; use a gravação ao vivo.")
+        if playlist.init_url:
+            self._copy(playlist.init_url, *(playlist.init_range or (0, None)))
+        for segment in playlist.segments:
+            # Com EXT-X-BYTERANGE cada segmento é só um trecho do arquivo
+            self._copy(segment.url, *(segment.byterange or (0, None)))
+
+    def _playlist(self, url: str) -> _MediaPlaylist:
+        """Baixa e interpreta uma playlist HLS."""
+        response = self._request(url)
+        try:
+            return parse_playlist(response.text, response.url)
+        except ValueError as e:
+            raise DownloadError(f"Playlist HLS inválida: {e}") from e
+
+    def _request(self, url: str) -> requests.Response:
+        """Baixa um recurso pequeno (playlist), repetindo em caso de falha."""
+        for attempt in range(StreamConfig.RETRIES + 1):
+            self._checkpoint()
+            try:
+                response = self._session.get(url, timeout=StreamConfig.TIMEOUT)
+                response.raise_for_status()
+                return response
+            except requests.RequestException as e:
+                self._retry(attempt, e)
+
+    def _copy(self, url: str, start: int, end: Optional[int], sized: bool = False) -> int:
+        """
+        Envia os bytes [start, end] de uma URL (end None = até o fim).
+
+        Uma queda retoma a partir do último byte entregue; só falhas
+        seguidas sem nenhum byte novo contam como tentativa.
+
+        Args:
+            url: URL do recurso
+            start: Primeiro byte
+            end: Último byte, inclusive (None = até o fim)
+            sized: Se True, o tamanho total do formato é lido da resposta
+
+        Returns:
+            Bytes enviados
+        """
+        copied = 0
+        attempt = 0
+        while True:
+            self._checkpoint()
+            offset = start + copied
+            headers = {}
+            if offset or end is not None:
+                headers['Range'] = f"bytes={offset}-{'' if end is None else end}"
+            try:
+                with self._session.get(url, headers=headers, stream=True, timeout=StreamConfig.TIMEOUT) as response:
+                    if response.status_code == 416:
+                        return copied
+                    response.raise_for_status()
+                    # Servidor que ignora o Range reenvia o arquivo desde o começo
+                    skip = offset if offset and response.status_code == 200 else 0
+                    if sized and self._total is None:
+                        self._total = self._size_of(response)
+                    expected = int(response.headers.get('Content-Length') or 0)
+                    received = 0
+                    for data in response.iter_content(StreamConfig.CHUNK_SIZE):
+                        received += len(data)
+                        if skip:
+                            data, skip = data[skip:], max(skip - len(data), 0)
+                            if not data:
+                                continue
+                        if end is not None:
+                            data = data[:end - start + 1 - copied]
+                        self._checkpoint()
+                        self._sink.write(data)
+                        copied += len(data)
+                        self.sent += len(data)
+                        attempt = 0
+                        self._report('downloading')
+                        if end is not None and copied >= end - start + 1:
+                            return copied
+                    if received < expected:
+                        # Conexão encerrada antes do fim do corpo
+                        raise requests.ConnectionError(f"resposta incompleta ({received} de {expected} bytes)")
+                return copied
+            except requests.RequestException as e:
+                self._retry(attempt, e)
+                attempt += 1
+
+    @classmethod
+    def _size_of(cls, response: requests.Response) -> Optional[int]:
+        """Tamanho total do recurso informado pela resposta, se houver."""
+        match = cls._CONTENT_RANGE.search(response.headers.get('Content-Range', ''))
+        if match:
+            return int(match.group(1))
+        if response.status_code == 200:
+            return int(response.headers.get('Content-Length') or 0) or None
+        return None
+
+    def _retry(self, attempt: int, error: Exception) -> None:
+        """Espera antes de uma nova tentativa ou desiste após StreamConfig.RETRIES."""
+        if attempt >= StreamConfig.RETRIES:
+            raise DownloadError(f"Falha de rede durante o envio: {error}") from error
+        if self._control is not None:
+            self._control.stats.record('retry', f"{error}; tentativa {attempt + 1}")
+        deadline = time.monotonic() + StreamConfig.RETRY_DELAY * 2 ** attempt
+        while True:
+            self._checkpoint()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 0.25))
+
+    def _report(self, status: str) -> None:
+        """Envia um evento de progresso no formato do yt-dlp, no máximo a cada PROGRESS_INTERVAL."""
+        if self._progress_callback is None:
+            return
+        now = time.monotonic()
+        if status == 'downloading' and now - self._last_report < StreamConfig.PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        elapsed = now - self._started
+        speed = self.sent / elapsed if elapsed > 0 else None
+        data = {
+            'status': status,
+            'downloaded_bytes': self.sent,
+            'total_bytes': self._total,
+            'elapsed': elapsed,
+            'speed': speed,
+        }
+        if self._total:
+            data['_percent_str'] = f"{min(self.sent / self._total, 1.0) * 100:.1f}%"
+            if speed:
+                data['eta'] = int(max(self._total - self.sent, 0) / speed)
+        self._progress_callback(data)
+
+    def _checkpoint(self) -> None:
+        """Aplica pausa e cancelamento."""
+        if self._control is not None:
+            self._control.checkpoint()
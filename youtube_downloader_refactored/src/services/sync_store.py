@@ -0,0 +1,191 @@
+"""
+Marcas d'água da sincronização de canais e playlists.
+
+Guarda em SQLite as fontes espelhadas e, para cada uma, os vídeos já
+vistos, os downloads que falharam (tentados de novo mesmo quando a
+enumeração não os alcança mais), o primeiro item da última enumeração
+e a data de envio até a qual tudo já foi sincronizado. É com essas marcas que a sincronização
+encerra a enumeração ao alcançar o trecho conhecido da lista.
+"""
+
+import os
+import time
+from typing import ClassVar, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.sync import SyncSource
+from ..utils.registry import SharedRegistry
+from ..utils.sqlite_utils import create_schema, transaction
+from ..config.constants import SyncConfig
+
+
+class SyncStore:
+    """Fontes espelhadas e vídeos já vistos de cada uma."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sources (
+            url TEXT PRIMARY KEY,
+            save_path TEXT NOT NULL,
+            format_choice TEXT NOT NULL,
+            last_video_id TEXT,
+            last_upload_date TEXT,
+            last_synced_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS seen (
+            source_url TEXT NOT NULL,
+            video_id TEXT NOT NULL,
+            upload_date TEXT,
+            seen_at REAL NOT NULL,
+            PRIMARY KEY (source_url, video_id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS pending (
+            source_url TEXT NOT NULL,
+            video_id TEXT NOT NULL,
+            url TEXT NOT NULL,
+            upload_date TEXT,
+            error TEXT,
+            failed_at REAL NOT NULL,
+            PRIMARY KEY (source_url, video_id)
+        ) WITHOUT ROWID;
+    """
+
+    _registry: ClassVar[SharedRegistry['SyncStore']] = SharedRegistry()
+
+    def __init__(self, db_path: str = SyncConfig.DB_PATH):
+        """
+        Inicializa o armazenamento, criando o banco se necessário.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        self._db_path = os.path.abspath(db_path)
+        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+        create_schema(self._db_path, self.SCHEMA, SyncConfig.BUSY_TIMEOUT)
+
+    @classmethod
+    def shared(cls, db_path: str = SyncConfig.DB_PATH) -> 'SyncStore':
+        """
+        Retorna o armazenamento compartilhado para um arquivo de banco.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        return cls._registry.get(db_path, cls)
+
+    def save_source(self, source: SyncSource) -> None:
+        """Registra uma fonte ou atualiza seu destino e formato."""
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            connection.execute(
+                "INSERT INTO sources (url, save_path, format_choice) VALUES (?, ?, ?)"
+                " ON CONFLICT (url) DO UPDATE SET"
+                " save_path = excluded.save_path, format_choice = excluded.format_choice",
+                (source.url, source.save_path, source.format_choice)
+            )
+
+    def get_source(self, url: str) -> Optional[SyncSource]:
+        """Fonte registrada para uma URL, ou None."""
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            row = connection.execute(
+                "SELECT url, save_path, format_choice, last_video_id, last_upload_date, last_synced_at"
+                " FROM sources WHERE url = ?", (url,)
+            ).fetchone()
+        return SyncSource(*row) if row else None
+
+    def sources(self) -> List[SyncSource]:
+        """Todas as fontes registradas, na ordem de URL."""
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            rows = connection.execute(
+                "SELECT url, save_path, format_choice, last_video_id, last_upload_date, last_synced_at"
+                " FROM sources ORDER BY url"
+            ).fetchall()
+        return [SyncSource(*row) for row in rows]
+
+    def known_ids(self, url: str) -> Set[str]:
+        """Ids dos vídeos já vistos de uma fonte."""
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            rows = connection.execute(
+                "SELECT video_id FROM seen WHERE source_url = ?", (url,)
+            ).fetchall()
+        return {video_id for video_id, in rows}
+
+    def mark_seen(self, url: str, videos: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """
+        Registra vídeos como vistos (baixados) em uma fonte.
+
+        Args:
+            url: URL da fonte
+            videos: Pares (id, data de envio YYYYMMDD ou None)
+        """
+        now = time.time()
+        videos = list(videos)
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO seen (source_url, video_id, upload_date, seen_at) VALUES (?, ?, ?, ?)",
+                [(url, video_id, upload_date, now) for video_id, upload_date in videos]
+            )
+            connection.executemany(
+                "DELETE FROM pending WHERE source_url = ? AND video_id = ?",
+                [(url, video_id) for video_id, _ in videos]
+            )
+
+    def mark_failed(
+        self,
+        url: str,
+        video_id: str,
+        video_url: str,
+        upload_date: Optional[str],
+        error: str
+    ) -> None:
+        """
+        Registra um download que falhou, para ser tentado de novo.
+
+        Args:
+            url: URL da fonte
+            video_id: Id do vídeo
+            video_url: URL usada no download
+            upload_date: Data de envio YYYYMMDD ou None
+            error: Mensagem de erro
+        """
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            connection.execute(
+                "INSERT INTO pending (source_url, video_id, url, upload_date, error, failed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (source_url, video_id) DO UPDATE SET"
+                " error = excluded.error, failed_at = excluded.failed_at",
+                (url, video_id, video_url, upload_date, error, time.time())
+            )
+
+    def pending(self, url: str) -> List[Dict[str, Optional[str]]]:
+        """
+        Downloads que falharam em uma fonte, do mais antigo para o mais novo.
+
+        Returns:
+            Itens no formato da enumeração ('id', 'url', 'upload_date')
+        """
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            rows = connection.execute(
+                "SELECT video_id, url, upload_date FROM pending WHERE source_url = ?"
+                " ORDER BY upload_date, failed_at", (url,)
+            ).fetchall()
+        return [{'id': video_id, 'url': video_url, 'upload_date': upload_date}
+                for video_id, video_url, upload_date in rows]
+
+    def advance(self, url: str, last_video_id: Optional[str], last_upload_date: Optional[str]) -> None:
+        """
+        Atualiza as marcas d'água de uma fonte ao fim de uma sincronização.
+
+        Valores None mantêm a marca anterior, e a data nunca retrocede.
+
+        Args:
+            url: URL da fonte
+            last_video_id: Primeiro item da enumeração
+            last_upload_date: Data até a qual tudo foi sincronizado
+        """
+        with transaction(self._db_path, SyncConfig.BUSY_TIMEOUT) as connection:
+            connection.execute(
+                "UPDATE sources SET"
+                " last_video_id = COALESCE(?, last_video_id),"
+                " last_upload_date = MAX(COALESCE(?, last_upload_date), COALESCE(last_upload_date, '')),"
+                " last_synced_at = ?"
+                " WHERE url = ?",
+                (last_video_id, last_upload_date, time.time(), url)
+            )
@@ -0,0 +1,193 @@
+"""
+Monitor de estrangulamento e travamento de downloads.
+
+Observa o fluxo de eventos de progresso do yt-dlp e, quando a
+velocidade cai de forma sustentada, força uma nova extração: o yt-dlp
+obtém URLs novas e retoma o arquivo .part a partir do ponto atual.
+Conexões travadas (sem bytes) são derrubadas pelo 'socket_timeout' e
+reabertas pelo próprio yt-dlp com o recuo calculado aqui.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from yt_dlp.utils import ReExtractInfo
+
+from ..models.job import JobStats
+from ..config.constants import ThrottleConfig
+
+
+class ThrottleMonitor:
+    """Detecta velocidade baixa sustentada e reconecta com recuo exponencial."""
+
+    BLOCKED_HOOK_SECONDS = 1.0
+
+    def __init__(
+        self,
+        stats: Optional[JobStats] = None,
+        window: float = ThrottleConfig.WINDOW_SECONDS,
+        min_speed_ratio: float = ThrottleConfig.MIN_SPEED_RATIO,
+        min_speed: Optional[float] = ThrottleConfig.MIN_SPEED,
+        rate_limit: Optional[float] = None,
+        max_restarts: int = ThrottleConfig.MAX_RESTARTS,
+        backoff_base: float = ThrottleConfig.BACKOFF_BASE,
+        backoff_max: float = ThrottleConfig.BACKOFF_MAX,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Inicializa o monitor.
+
+        Args:
+            stats: Estatísticas do job onde os eventos são registrados
+            window: Duração em segundos da janela de medição
+            min_speed_ratio: Fração da velocidade de pico considerada estrangulamento
+            min_speed: Velocidade mínima absoluta em bytes/s (None = só a relativa)
+            rate_limit: Limite de banda do download ('ratelimit'); a velocidade
+                mínima absoluta é reduzida a ThrottleConfig.RATE_LIMIT_FRACTION
+                dele, para que o próprio limite não pareça estrangulamento
+            max_restarts: Máximo de reconexões por estrangulamento no job
+            backoff_base: Espera inicial antes de reconectar, em segundos
+            backoff_max: Espera máxima antes de reconectar, em segundos
+            clock: Relógio monotônico (injetável para testes)
+            sleep: Função de espera (injetável para testes)
+        """
+        self._stats = stats if stats is not None else JobStats()
+        self._window = window
+        self._ratio = min_speed_ratio
+        self._min_speed = min_speed or 0.0
+        if rate_limit:
+            self._min_speed = min(self._min_speed, ThrottleConfig.RATE_LIMIT_FRACTION * rate_limit)
+        self._max_restarts = max_restarts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._clock = clock
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._samples: Deque[Tuple[float, int]] = deque()
+        self._filename: Optional[str] = None
+        self._peak = 0.0
+        self._restarts = 0
+
+    @property
+    def stats(self) -> JobStats:
+        """Estatísticas do job."""
+        return self._stats
+
+    @property
+    def peak_speed(self) -> float:
+        """Maior velocidade medida em uma janela, em bytes/s."""
+        return self._peak
+
+    def wrap_progress_hook(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Callable[[Dict[str, Any]], None]:
+        """
+        Envolve um progress hook com a observação da velocidade.
+
+        O tempo em que o callback fica bloqueado (ex.: job pausado) é
+        descartado da medição, para não ser confundido com lentidão.
+
+        Args:
+            callback: Hook original (pode ser None)
+
+        Returns:
+            Hook a ser registrado no yt-dlp
+        """
+        def hook(data: Dict[str, Any]) -> None:
+            self.observe(data)
+            if callback is None:
+                return
+            started = self._clock()
+            callback(data)
+            if self._clock() - started > self.BLOCKED_HOOK_SECONDS:
+                with self._lock:
+                    self._samples.clear()
+
+        return hook
+
+    def observe(self, data: Dict[str, Any]) -> None:
+        """
+        Processa um evento de progresso (usado como progress hook).
+
+        Raises:
+            ReExtractInfo: Se a velocidade ficou abaixo do limite por uma
+                janela inteira, para que o yt-dlp reconecte
+        """
+        if data.get('status') != 'downloading':
+            with self._lock:
+                self._samples.clear()
+            return
+        downloaded = data.get('downloaded_bytes')
+        if downloaded is None:
+            return
+
+        with self._lock:
+            speed = self._measure(data.get('filename'), downloaded)
+            if speed is None:
+                return
+            self._peak = max(self._peak, speed)
+            if speed >= max(self._ratio * self._peak, self._min_speed):
+                return
+            if self._restarts >= self._max_restarts:
+                return
+
+            delay = self.backoff(self._restarts)
+            self._restarts += 1
+            self._samples.clear()
+            self._stats.record(
+                'throttle',
+                f"{speed / 1024:.0f} KB/s com pico de {self._peak / 1024:.0f} KB/s; "
+                f"reconectando em {delay:.1f}s"
+            )
+
+        self._sleep(delay)
+        raise ReExtractInfo("Download estrangulado pelo servidor", expected=True)
+
+    def retry_delay(self, n: int) -> float:
+        """
+        Espera antes de uma nova tentativa de conexão do yt-dlp.
+
+        Usado em 'retry_sleep_functions'; cada chamada corresponde a uma
+        conexão que falhou ou ficou sem receber bytes até o timeout.
+
+        Args:
+            n: Número da tentativa, a partir de zero
+
+        Returns:
+            Segundos de espera
+        """
+        delay = self.backoff(n)
+        with self._lock:
+            self._samples.clear()
+            self._stats.record('retry', f"tentativa {n + 1}; reconectando em {delay:.1f}s")
+        return delay
+
+    def retry_sleep_functions(self) -> Dict[str, Callable[..., float]]:
+        """Retorna o valor da opção 'retry_sleep_functions' do yt-dlp."""
+        return {'http': self.retry_delay, 'fragment': self.retry_delay}
+
+    def backoff(self, attempt: int) -> float:
+        """Calcula o recuo exponencial para uma tentativa."""
+        return min(self._backoff_base * 2 ** attempt, self._backoff_max)
+
+    def _measure(self, filename: Optional[str], downloaded: int) -> Optional[float]:
+        """Registra uma amostra e retorna a velocidade da janela, se completa."""
+        now = self._clock()
+        # Arquivo novo ou reinício do contador invalidam a janela
+        if self._samples and (filename != self._filename or downloaded < self._samples[-1][1]):
+            self._samples.clear()
+        self._filename = filename
+        self._samples.append((now, downloaded))
+
+        while len(self._samples) > 2 and now - self._samples[1][0] >= self._window:
+            self._samples.popleft()
+        start_time, start_bytes = self._samples[0]
+        span = now - start_time
+        if span < self._window:
+            return None
+        return (downloaded - start_bytes) / span
@@ -6,28 +6,49 @@ Aplica o princípio de Responsabilidade Única (SRP).
 """
 
 import os
-from typing import Optional
-import yt_dlp
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
 import requests
-from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, QSize
 
+from .cookie_manager import CookieJarManager
+from .format_selector import estimate_choice_sizes
+from .ydl_cache import YtDlpCache
+from .ydl_pool import YoutubeDLPool
 from ..models.video_info import VideoInfo
 from ..models.exceptions import VideoInfoError, CookiesNotFoundError
-from ..config.constants import AppConstants
+from ..config.constants import AppConstants, CacheConfig, DownloadFormats, ThumbnailConfig
 
 
 class VideoInfoService:
     """Serviço responsável por obter informações de vídeos."""
     
-    def __init__(self, cookies_file: str = AppConstants.COOKIES_FILE):
+    def __init__(
+        self,
+        cookies_file: str = AppConstants.COOKIES_FILE,
+        cookie_manager: Optional[CookieJarManager] = None,
+        ydl_pool: Optional[YoutubeDLPool] = None,
+        ydl_cache: Optional[YtDlpCache] = None
+    ):
         """
         Inicializa o serviço de informações.
         
         Args:
             cookies_file: Caminho para o arquivo de cookies
+            cookie_manager: Gerenciador do cookie jar compartilhado
+            ydl_pool: Pool de instâncias do yt-dlp reutilizadas entre consultas
+            ydl_cache: Cache em disco do yt-dlp (player e assinaturas)
         """
         self._cookies_file = cookies_file
+        self._cookie_manager = cookie_manager or CookieJarManager.shared(cookies_file)
+        self._ydl_cache = ydl_cache or YtDlpCache.shared()
+        self._ydl_pool = ydl_pool or YoutubeDLPool(self._cookie_manager, cache=self._ydl_cache)
+    
+    @property
+    def ydl_cache(self) -> YtDlpCache:
+        """Cache em disco usado nas extrações."""
+        return self._ydl_cache
     
     def get_video_info(self, url: str) -> VideoInfo:
         """
@@ -48,29 +69,127 @@ class VideoInfoService:
         
         ydl_opts = {
             'quiet': True,
-            'cookiefile': self._cookies_file,
         }
         
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._ydl_pool.checkout(ydl_opts) as ydl, self._ydl_cache.measure(ydl):
                 info = ydl.extract_info(url, download=False)
-                return VideoInfo(
-                    title=info.get('title', 'Título não disponível'),
-                    thumbnail_url=info.get('thumbnail'),
-                    duration=info.get('duration')
-                )
+            self._cookie_manager.save()
+            return VideoInfo(
+                title=info.get('title', 'Título não disponível'),
+                thumbnail_url=info.get('thumbnail'),
+                duration=info.get('duration'),
+                video_id=info.get('id'),
+                size_estimates=estimate_choice_sizes(info, DownloadFormats.POLICIES),
+                thumbnails=self._readable_thumbnails(info.get('thumbnails') or [])
+            )
         except Exception as e:
             raise VideoInfoError("Não foi possível obter informações do vídeo.") from e
+    
+    def prewarm(self) -> None:
+        """
+        Deixa no pool uma instância pronta para a primeira consulta.
+        
+        Pode ser chamado de outra thread.
+        """
+        if not os.path.exists(self._cookies_file):
+            return
+        with self._ydl_pool.checkout({'quiet': True}) as ydl:
+            ydl.get_info_extractor('Youtube')
+    
+    def warm_cache(self, url: str = CacheConfig.WARM_URL) -> bool:
+        """
+        Preenche o cache em disco com o player atual, se ele estiver vazio.
+        
+        Extrai um vídeo de referência para que o JavaScript do player e
+        as soluções de assinatura já estejam em disco na primeira
+        consulta do usuário. Pode ser chamado de outra thread.
+        
+        Args:
+            url: Vídeo usado para o aquecimento
+            
+        Returns:
+            True se uma extração de aquecimento foi feita
+        """
+        if not os.path.exists(self._cookies_file) or self._ydl_cache.is_warm():
+            return False
+        try:
+            self.get_video_info(url)
+        except VideoInfoError as e:
+            print(f"Erro ao aquecer o cache do yt-dlp: {e.__cause__ or e}")
+            return False
+        return True
+    
+    @staticmethod
+    def _readable_thumbnails(thumbnails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Mantém das variantes de thumbnail só URL e dimensões, nos formatos decodificáveis."""
+        readable = {bytes(fmt).decode() for fmt in QImageReader.supportedImageFormats()}
+        result = []
+        for thumb in thumbnails:
+            url = thumb.get('url')
+            if not url:
+                continue
+            ext = os.path.splitext(urlparse(url).path)[1].lstrip('.').lower()
+            if ext and ext not in readable:
+                continue
+            result.append({'url': url, 'width': thumb.get('width'), 'height': thumb.get('height')})
+        return result
 
 
 class ThumbnailLoader:
     """Carregador de thumbnails de vídeos."""
     
     @staticmethod
-    def load_thumbnail(url: str, width: int = 200, height: int = 150) -> Optional[QPixmap]:
+    def load_image(
+        url: str,
+        width: int = ThumbnailConfig.WIDTH,
+        height: int = ThumbnailConfig.HEIGHT
+    ) -> Optional[QImage]:
+        """
+        Baixa e decodifica uma thumbnail já no tamanho de exibição.
+        
+        O corpo da resposta é lido em blocos, com limite de tamanho, e a
+        imagem é decodificada direto na escala final (no JPEG, a própria
+        descompressão é feita em resolução reduzida). Pode ser chamado
+        fora da thread da interface.
+        
+        Args:
+            url: URL da thumbnail
+            width: Largura máxima
+            height: Altura máxima
+            
+        Returns:
+            QImage no tamanho final ou None se houver erro
+        """
+        try:
+            data = ThumbnailLoader._fetch(url)
+            buffer = QBuffer()
+            buffer.setData(QByteArray(data))
+            buffer.open(QIODevice.ReadOnly)
+            reader = QImageReader(buffer)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(QSize(width, height), Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                raise ValueError(reader.errorString())
+            return image
+        except Exception as e:
+            print(f"Erro ao carregar thumbnail: {e}")
+            return None
+    
+    @staticmethod
+    def load_thumbnail(
+        url: str,
+        width: int = ThumbnailConfig.WIDTH,
+        height: int = ThumbnailConfig.HEIGHT
+    ) -> Optional[QPixmap]:
         """
         Carrega uma thumbnail de uma URL.
         
+        Deve ser chamado na thread da interface (QPixmap); para carregar
+        em background, use load_image e converta o resultado.
+        
         Args:
             url: URL da thumbnail
             width: Largura desejada
@@ -79,14 +198,20 @@ class ThumbnailLoader:
         Returns:
             QPixmap com a imagem ou None se houver erro
         """
-        try:
-            response = requests.get(url, timeout=10)
+        image = ThumbnailLoader.load_image(url, width, height)
+        return QPixmap.fromImage(image) if image is not None else None
+    
+    @staticmethod
+    def _fetch(url: str) -> bytes:
+        """Lê o corpo da resposta em blocos, recusando imagens acima do limite."""
+        with requests.get(url, timeout=ThumbnailConfig.TIMEOUT, stream=True) as response:
             response.raise_for_status()
-            
-            image = QImage()
-            image.loadFromData(response.content)
-            pixmap = QPixmap(image)
-            return pixmap.scaled(width, height, Qt.KeepAspectRatio)
-        except Exception as e:
-            print(f"Erro ao carregar thumbnail: {e}")
-            return None
+            declared = int(response.headers.get('Content-Length') or 0)
+            if declared > ThumbnailConfig.MAX_BYTES:
+                raise ValueError(f"thumbnail grande demais ({declared} bytes)")
+            data = bytearray()
+            for chunk in response.iter_content(ThumbnailConfig.CHUNK_SIZE):
+                data += chunk
+                if len(data) > ThumbnailConfig.MAX_BYTES:
+                    raise ValueError("thumbnail grande demais")
+            return bytes(data)
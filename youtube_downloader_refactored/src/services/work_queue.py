@@ -0,0 +1,285 @@
+"""
+Fila de trabalho compartilhada.
+
+Fila de downloads em um arquivo SQLite que vários workers, em uma ou
+mais máquinas, consomem ao mesmo tempo. Cada job retirado recebe uma
+concessão com prazo e um token; o worker a renova periodicamente e só
+consegue concluir o job enquanto o token for o vigente. Concessões
+vencidas (worker travado ou encerrado) devolvem o job à fila, e o
+worker antigo, ao tentar renovar ou concluir, descobre que o perdeu.
+"""
+
+import os
+import sqlite3
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+from ..models.job import WorkItem
+from ..models.video_info import DownloadRequest
+from ..utils.sqlite_utils import transaction
+from ..config.constants import FarmConfig
+
+
+class WorkQueue:
+    """Fila de downloads em SQLite com concessões renováveis."""
+
+    QUEUED = "queued"
+    LEASED = "leased"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS work_items (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL,
+            save_path TEXT NOT NULL,
+            format_choice TEXT NOT NULL,
+            custom_title TEXT,
+            connections INTEGER,
+            priority INTEGER NOT NULL DEFAULT 0,
+            estimated_size INTEGER,
+            live INTEGER NOT NULL DEFAULT 0,
+            live_from_start INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker_id TEXT,
+            lease_token TEXT,
+            lease_expires REAL,
+            error TEXT,
+            log_file TEXT,
+            enqueued_at REAL NOT NULL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_work_items_status ON work_items (status, id);
+        CREATE INDEX IF NOT EXISTS idx_work_items_lease ON work_items (status, lease_expires);
+    """
+
+    # Campos da DownloadRequest guardados com o job, na ordem das colunas
+    REQUEST_COLUMNS = (
+        'url', 'save_path', 'format_choice', 'custom_title', 'connections',
+        'priority', 'estimated_size', 'live', 'live_from_start',
+    )
+
+    # Colunas ausentes em bancos criados por versões anteriores
+    ADDED_COLUMNS = {
+        'connections': "INTEGER",
+        'priority': "INTEGER NOT NULL DEFAULT 0",
+        'estimated_size': "INTEGER",
+        'live': "INTEGER NOT NULL DEFAULT 0",
+        'live_from_start': "INTEGER NOT NULL DEFAULT 0",
+    }
+
+    def __init__(
+        self,
+        db_path: str = FarmConfig.DB_PATH,
+        lease_seconds: float = FarmConfig.LEASE_SECONDS,
+        max_attempts: int = FarmConfig.MAX_ATTEMPTS
+    ):
+        """
+        Inicializa a fila, criando o banco se necessário.
+
+        Args:
+            db_path: Caminho do arquivo SQLite (pode estar em armazenamento compartilhado)
+            lease_seconds: Prazo de cada concessão
+            max_attempts: Concessões vencidas toleradas antes de o job falhar
+        """
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._db_path = db_path
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        connection = sqlite3.connect(db_path, timeout=FarmConfig.BUSY_TIMEOUT)
+        try:
+            connection.executescript(self.SCHEMA)
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(work_items)")}
+            for column, definition in self.ADDED_COLUMNS.items():
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE work_items ADD COLUMN {column} {definition}")
+        finally:
+            connection.close()
+
+    @property
+    def lease_seconds(self) -> float:
+        """Prazo de cada concessão, em segundos."""
+        return self._lease_seconds
+
+    def enqueue(self, request: DownloadRequest) -> int:
+        """
+        Adiciona um download à fila.
+
+        Args:
+            request: Requisição de download
+
+        Returns:
+            Identificador do item na fila
+        """
+        return self.enqueue_many([request])[0]
+
+    def enqueue_many(self, requests: Iterable[DownloadRequest]) -> List[int]:
+        """
+        Adiciona vários downloads à fila em uma única transação.
+
+        Args:
+            requests: Requisições de download
+
+        Returns:
+            Identificadores dos itens, na mesma ordem
+        """
+        now = time.time()
+        ids = []
+        columns = ', '.join(self.REQUEST_COLUMNS)
+        placeholders = ', '.join('?' * len(self.REQUEST_COLUMNS))
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            for request in requests:
+                cursor = connection.execute(
+                    f"INSERT INTO work_items ({columns}, enqueued_at) VALUES ({placeholders}, ?)",
+                    tuple(getattr(request, column) for column in self.REQUEST_COLUMNS) + (now,)
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def claim(self, worker_id: str) -> Optional[WorkItem]:
+        """
+        Retira o job mais antigo da fila, concedendo-o ao worker.
+
+        Antes, devolve à fila os jobs com concessão vencida (ou os dá
+        como falhos após FarmConfig.MAX_ATTEMPTS concessões).
+
+        Args:
+            worker_id: Identificador do worker
+
+        Returns:
+            Item concedido ou None se a fila estiver vazia
+        """
+        now = time.time()
+        token = uuid.uuid4().hex
+        expires = now + self._lease_seconds
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            self._expire_leases(connection, now)
+            row = connection.execute(
+                f"SELECT id, attempts, {', '.join(self.REQUEST_COLUMNS)}"
+                " FROM work_items WHERE status = ? ORDER BY id LIMIT 1",
+                (self.QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            item_id, attempts = row[:2]
+            fields = dict(zip(self.REQUEST_COLUMNS, row[2:]))
+            fields['live'] = bool(fields['live'])
+            fields['live_from_start'] = bool(fields['live_from_start'])
+            connection.execute(
+                "UPDATE work_items SET status = ?, worker_id = ?, lease_token = ?,"
+                " lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (self.LEASED, worker_id, token, expires, item_id)
+            )
+        return WorkItem(
+            item_id=item_id,
+            request=DownloadRequest(**fields),
+            lease_token=token,
+            worker_id=worker_id,
+            attempts=attempts + 1,
+            lease_expires=expires,
+        )
+
+    def heartbeat(self, item: WorkItem) -> bool:
+        """
+        Renova a concessão de um item.
+
+        Args:
+            item: Item concedido ao worker
+
+        Returns:
+            False se a concessão foi perdida (o worker deve abandonar o job)
+        """
+        expires = time.time() + self._lease_seconds
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            renewed = connection.execute(
+                "UPDATE work_items SET lease_expires = ?"
+                " WHERE id = ? AND lease_token = ? AND status = ?",
+                (expires, item.item_id, item.lease_token, self.LEASED)
+            ).rowcount == 1
+        if renewed:
+            item.lease_expires = expires
+        return renewed
+
+    def complete(self, item: WorkItem) -> bool:
+        """
+        Marca um item como concluído.
+
+        Returns:
+            False se a concessão já não pertencia ao worker (resultado descartado)
+        """
+        return self._finish(item, self.COMPLETED, None, None)
+
+    def fail(self, item: WorkItem, error: str, log_file: Optional[str] = None) -> bool:
+        """
+        Marca um item como falho.
+
+        Args:
+            item: Item concedido ao worker
+            error: Mensagem de erro
+            log_file: Arquivo com o registro do job no worker
+
+        Returns:
+            False se a concessão já não pertencia ao worker (resultado descartado)
+        """
+        return self._finish(item, self.FAILED, error, log_file)
+
+    def release(self, item: WorkItem) -> bool:
+        """
+        Devolve um item à fila sem contar a tentativa (worker encerrando).
+
+        Args:
+            item: Item concedido ao worker
+
+        Returns:
+            False se a concessão já não pertencia ao worker
+        """
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            return connection.execute(
+                "UPDATE work_items SET status = ?, worker_id = NULL, lease_token = NULL,"
+                " lease_expires = NULL, attempts = attempts - 1"
+                " WHERE id = ? AND lease_token = ? AND status = ?",
+                (self.QUEUED, item.item_id, item.lease_token, self.LEASED)
+            ).rowcount == 1
+
+    def counts(self) -> Dict[str, int]:
+        """Quantidade de itens em cada estado."""
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM work_items GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in (self.QUEUED, self.LEASED, self.COMPLETED, self.FAILED)}
+        counts.update(dict(rows))
+        return counts
+
+    def status(self, item_id: int) -> Optional[str]:
+        """Estado de um item (None = inexistente)."""
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            row = connection.execute("SELECT status FROM work_items WHERE id = ?", (item_id,)).fetchone()
+        return row[0] if row else None
+
+    def _finish(self, item: WorkItem, status: str, error: Optional[str], log_file: Optional[str]) -> bool:
+        """Registra o resultado se o worker ainda detém a concessão."""
+        with transaction(self._db_path, FarmConfig.BUSY_TIMEOUT) as connection:
+            return connection.execute(
+                "UPDATE work_items SET status = ?, error = ?, log_file = ?, finished_at = ?,"
+                " lease_token = NULL, lease_expires = NULL"
+                " WHERE id = ? AND lease_token = ? AND status = ?",
+                (status, error, log_file, time.time(), item.item_id, item.lease_token, self.LEASED)
+            ).rowcount == 1
+
+    def _expire_leases(self, connection: sqlite3.Connection, now: float) -> None:
+        """Devolve à fila (ou dá como falhos) os itens com concessão vencida."""
+        connection.execute(
+            "UPDATE work_items SET status = ?, error = 'Concessão expirada repetidamente.',"
+            " finished_at = ?, lease_token = NULL, lease_expires = NULL"
+            " WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+            (self.FAILED, now, self.LEASED, now, self._max_attempts)
+        )
+        connection.execute(
+            "UPDATE work_items SET status = ?, worker_id = NULL, lease_token = NULL, lease_expires = NULL"
+            " WHERE status = ? AND lease_expires < ?",
+            (self.QUEUED, self.LEASED, now)
+        )
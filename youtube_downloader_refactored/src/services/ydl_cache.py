@@ -0,0 +1,219 @@
+"""
+Cache em disco do yt-dlp.
+
+O extrator do YouTube guarda em disco o JavaScript do player já
+processado e as soluções das funções de assinatura. Sem um diretório
+definido, cada instalação usa o padrão do yt-dlp e, nos processos de
+extração, o trabalho seria refeito a cada player novo. Este módulo
+mantém um diretório persistente, compartilhado por todas as instâncias
+e processos, limitado em tamanho e com estatísticas de uso.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, ClassVar, Iterator, List, Optional, Tuple
+
+from yt_dlp.cache import Cache
+
+from ..models.cache_stats import CacheStats
+from ..utils.registry import SharedRegistry
+from ..config.constants import CacheConfig
+
+
+class YtDlpCache:
+    """Diretório de cache do yt-dlp compartilhado, limitado e instrumentado."""
+
+    _registry: ClassVar[SharedRegistry['YtDlpCache']] = SharedRegistry()
+
+    def __init__(self, directory: str = CacheConfig.DIR, max_bytes: Optional[int] = None):
+        """
+        Inicializa o cache, criando o diretório se necessário.
+
+        Args:
+            directory: Diretório do cache
+            max_bytes: Tamanho máximo antes de remover os arquivos menos usados
+                (padrão: CacheConfig.MAX_BYTES, lido a cada verificação)
+        """
+        self._directory = os.path.abspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._size_bytes: Optional[int] = None
+
+    @property
+    def max_bytes(self) -> int:
+        """Tamanho máximo do cache em bytes."""
+        return self._max_bytes if self._max_bytes is not None else CacheConfig.MAX_BYTES
+
+    @classmethod
+    def shared(cls, directory: str = CacheConfig.DIR) -> 'YtDlpCache':
+        """
+        Retorna o cache compartilhado para um diretório.
+
+        Args:
+            directory: Diretório do cache
+        """
+        return cls._registry.get(directory, cls)
+
+    @property
+    def directory(self) -> str:
+        """Caminho absoluto do diretório do cache."""
+        return self._directory
+
+    def attach(self, ydl: Any) -> None:
+        """
+        Faz uma instância do YoutubeDL usar este cache.
+
+        Args:
+            ydl: Instância do yt_dlp.YoutubeDL
+        """
+        ydl.params['cachedir'] = self._directory
+        current = getattr(ydl, 'cache', None)
+        if not (isinstance(current, _TrackedCache) and current.owner is self):
+            ydl.cache = _TrackedCache(ydl, self)
+
+    def is_warm(self) -> bool:
+        """Indica se o cache já tem algum dado guardado."""
+        return bool(self._files())
+
+    @contextmanager
+    def measure(self, ydl: Any) -> Iterator[None]:
+        """
+        Mede uma extração feita com a instância, registrando sua latência.
+
+        A extração conta como quente se não houve falhas no cache
+        durante ela. Extrações que lançam exceção não são registradas.
+
+        Args:
+            ydl: Instância do YoutubeDL usada na extração
+        """
+        cache = getattr(ydl, 'cache', None)
+        tracked = cache if isinstance(cache, _TrackedCache) else None
+        misses = tracked.misses if tracked is not None else 0
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        warm = tracked is not None and tracked.misses == misses
+        with self._lock:
+            self._stats.record_extraction(elapsed, warm)
+
+    def stats(self) -> CacheStats:
+        """
+        Retorna uma cópia das estatísticas atuais.
+
+        Returns:
+            CacheStats com o tamanho do diretório atualizado
+        """
+        size = sum(size for _, size, _ in self._files())
+        with self._lock:
+            self._size_bytes = size
+            return replace(
+                self._stats,
+                size_bytes=size,
+                warm_latencies=list(self._stats.warm_latencies),
+                cold_latencies=list(self._stats.cold_latencies),
+            )
+
+    def prune(self) -> int:
+        """
+        Remove os arquivos usados há mais tempo até caber no limite.
+
+        Returns:
+            Quantidade de arquivos removidos
+        """
+        files = self._files()
+        size = sum(file_size for _, file_size, _ in files)
+        removed = 0
+        for path, file_size, _ in sorted(files, key=lambda item: item[2]):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= file_size
+            removed += 1
+
+        with self._lock:
+            self._size_bytes = size
+            self._stats.evicted_files += removed
+        return removed
+
+    def _record_load(self, path: str, hit: bool) -> None:
+        """Contabiliza uma leitura, marcando o arquivo como usado se houve acerto."""
+        with self._lock:
+            if hit:
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+        if hit:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def _record_store(self, path: str) -> None:
+        """Contabiliza uma gravação e aplica o limite de tamanho quando excedido."""
+        try:
+            added = os.path.getsize(path)
+        except OSError:
+            added = 0
+        with self._lock:
+            self._stats.stores += 1
+            if self._size_bytes is not None:
+                self._size_bytes += added
+            over_limit = self._size_bytes is None or self._size_bytes > self.max_bytes
+        if over_limit:
+            self.prune()
+
+    def _files(self) -> List[Tuple[str, int, float]]:
+        """Lista (caminho, tamanho, último uso) dos arquivos do cache."""
+        files = []
+        for root, _, names in os.walk(self._directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                files.append((path, info.st_size, info.st_mtime))
+        return files
+
+
+class _TrackedCache(Cache):
+    """Cache do yt-dlp que reporta leituras e gravações ao YtDlpCache."""
+
+    _MISSING = object()
+
+    def __init__(self, ydl: Any, owner: YtDlpCache):
+        """
+        Inicializa o cache da instância.
+
+        Args:
+            ydl: Instância do YoutubeDL
+            owner: Cache compartilhado que recebe as estatísticas
+        """
+        super().__init__(ydl)
+        self.owner = owner
+        self.misses = 0
+
+    def load(self, section, key, dtype='json', default=None, *, min_ver=None):
+        """Lê do cache, contabilizando acerto ou falha."""
+        data = super().load(section, key, dtype, default=self._MISSING, min_ver=min_ver)
+        # Dados de versões antigas do yt-dlp são descartados e voltam como None
+        hit = data is not self._MISSING and data is not None
+        if not hit:
+            self.misses += 1
+        if self.enabled:
+            self.owner._record_load(self._get_cache_fn(section, key, dtype), hit)
+        return data if hit else default
+
+    def store(self, section, key, data, dtype='json'):
+        """Grava no cache, contabilizando a gravação."""
+        super().store(section, key, data, dtype)
+        if self.enabled:
+            self.owner._record_store(self._get_cache_fn(section, key, dtype))
@@ -0,0 +1,216 @@
+"""
+Pool de instâncias do yt-dlp.
+
+Reutiliza instâncias de yt_dlp.YoutubeDL pré-inicializadas, evitando
+pagar a cada job o carregamento de extratores, o processamento de
+opções e a montagem dos pós-processadores.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yt_dlp
+
+from .cookie_manager import CookieJarManager
+from .range_downloader import RangeDownloader
+from .ydl_cache import YtDlpCache
+
+
+class YoutubeDLPool:
+    """
+    Pool de instâncias do YoutubeDL agrupadas por perfil de opções.
+
+    As opções recebidas em checkout() são divididas em duas partes:
+    o perfil (opções estáveis, que definem a instância) e as opções
+    do job (formato, destino, hooks etc.), aplicadas na retirada e
+    desfeitas na devolução.
+    """
+
+    JOB_OPTIONS = frozenset({
+        'format', 'outtmpl', 'paths', 'logger', 'ratelimit',
+        'throttledratelimit', 'match_filter', 'retry_sleep_functions', 'range_connections',
+    })
+    HOOK_OPTIONS = frozenset({'progress_hooks', 'postprocessor_hooks', 'post_hooks'})
+
+    _MISSING = object()
+
+    def __init__(
+        self,
+        cookie_manager: Optional[CookieJarManager] = None,
+        max_idle_per_profile: int = 4,
+        cache: Optional[YtDlpCache] = None
+    ):
+        """
+        Inicializa o pool.
+
+        Args:
+            cookie_manager: Gerenciador do cookie jar associado às instâncias
+            max_idle_per_profile: Máximo de instâncias ociosas por perfil
+            cache: Cache em disco associado às instâncias (None = padrão do yt-dlp)
+        """
+        self._cookie_manager = cookie_manager
+        self._cache = cache
+        self._max_idle = max_idle_per_profile
+        self._idle: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @property
+    def created_count(self) -> int:
+        """Quantidade de instâncias criadas desde o início."""
+        return self._created
+
+    @contextmanager
+    def checkout(self, options: Dict[str, Any]) -> Iterator[Any]:
+        """
+        Retira uma instância configurada para um job.
+
+        Se o job, ou a aplicação das suas opções, lançar uma exceção, a
+        instância é descartada, pois seu estado interno pode ter ficado
+        inconsistente.
+
+        Args:
+            options: Opções completas do yt-dlp para o job
+
+        Yields:
+            Instância do YoutubeDL pronta para uso
+        """
+        profile, job_options, hooks = self._split_options(options)
+        key = self._profile_key(profile)
+        ydl = self._acquire(key, profile)
+
+        # Falhas ao aplicar ou desfazer as opções (ex.: formato inválido)
+        # também descartam a instância, que nunca fica fora do pool aberta
+        try:
+            saved = self._apply_job_options(ydl, job_options)
+            self._bind_hooks(ydl, hooks)
+            if self._cookie_manager is not None:
+                self._cookie_manager.attach(ydl)
+            if self._cache is not None:
+                self._cache.attach(ydl)
+
+            yield ydl
+
+            self._restore_job_options(ydl, saved)
+            self._bind_hooks(ydl, {})
+        except BaseException:
+            self._discard(ydl)
+            raise
+
+        self._release(key, ydl)
+
+    def clear(self) -> None:
+        """Encerra todas as instâncias ociosas."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for instances in idle.values():
+            for ydl in instances:
+                self._discard(ydl)
+
+    def _acquire(self, key: str, profile: Dict[str, Any]) -> Any:
+        """Retorna uma instância ociosa do perfil ou cria uma nova."""
+        with self._lock:
+            instances = self._idle.get(key)
+            if instances:
+                return instances.pop()
+            self._created += 1
+
+        # O pool faz o papel do bloco "with": entra na criação e sai no descarte
+        ydl = yt_dlp.YoutubeDL(dict(profile)).__enter__()
+        RangeDownloader.attach(ydl)
+        return ydl
+
+    def _release(self, key: str, ydl: Any) -> None:
+        """Devolve uma instância ao pool ou a descarta se houver excesso."""
+        with self._lock:
+            instances = self._idle.setdefault(key, [])
+            if len(instances) < self._max_idle:
+                instances.append(ydl)
+                return
+        self._discard(ydl)
+
+    @staticmethod
+    def _discard(ydl: Any) -> None:
+        """Encerra uma instância, liberando conexões."""
+        try:
+            ydl.__exit__(None, None, None)
+        except Exception:
+            pass
+
+    @classmethod
+    def _split_options(
+        cls,
+        options: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Separa perfil, opções do job e hooks."""
+        profile, job_options, hooks = {}, {}, {}
+        for name, value in options.items():
+            if name in cls.HOOK_OPTIONS:
+                hooks[name] = value
+            elif name in cls.JOB_OPTIONS:
+                job_options[name] = value
+            else:
+                profile[name] = value
+        return profile, job_options, hooks
+
+    @staticmethod
+    def _profile_key(profile: Dict[str, Any]) -> str:
+        """Gera uma chave estável para o perfil de opções."""
+        return json.dumps(profile, sort_keys=True, default=repr)
+
+    def _apply_job_options(self, ydl: Any, job_options: Dict[str, Any]) -> Dict[str, Any]:
+        """Aplica as opções do job, retornando os valores anteriores."""
+        saved = {name: ydl.params.get(name, self._MISSING) for name in job_options}
+        ydl.params.update(job_options)
+
+        if 'outtmpl' in job_options:
+            outtmpl = job_options['outtmpl']
+            ydl.params['outtmpl'] = dict(outtmpl) if isinstance(outtmpl, dict) else {'default': outtmpl}
+            ydl._parse_outtmpl()
+        if 'format' in job_options:
+            self._rebuild_format_selector(ydl)
+
+        self._reset_counters(ydl)
+        return saved
+
+    def _restore_job_options(self, ydl: Any, saved: Dict[str, Any]) -> None:
+        """Desfaz as opções aplicadas para o job."""
+        for name, value in saved.items():
+            if value is self._MISSING:
+                ydl.params.pop(name, None)
+            else:
+                ydl.params[name] = value
+
+        if 'outtmpl' in saved:
+            ydl._parse_outtmpl()
+        if 'format' in saved:
+            self._rebuild_format_selector(ydl)
+
+    @staticmethod
+    def _rebuild_format_selector(ydl: Any) -> None:
+        """Recria o seletor de formato a partir de params['format']."""
+        fmt = ydl.params.get('format')
+        if fmt in (None, '-') or callable(fmt):
+            ydl.format_selector = fmt
+        else:
+            ydl.format_selector = ydl.build_format_selector(fmt)
+
+    @staticmethod
+    def _bind_hooks(ydl: Any, hooks: Dict[str, Any]) -> None:
+        """Substitui os hooks da instância pelos hooks do job."""
+        ydl._progress_hooks = list(hooks.get('progress_hooks', []))
+        ydl._post_hooks = list(hooks.get('post_hooks', []))
+        ydl._postprocessor_hooks = []
+        for processors in ydl._pps.values():
+            for processor in processors:
+                processor._progress_hooks = []
+        for hook in hooks.get('postprocessor_hooks', []):
+            ydl.add_postprocessor_hook(hook)
+
+    @staticmethod
+    def _reset_counters(ydl: Any) -> None:
+        """Zera contadores acumulados por execuções anteriores."""
+        ydl._num_downloads = 0
+        ydl._download_retcode = 0
@@ -7,7 +7,7 @@ Aplica o princípio DRY (Don't Repeat Yourself).
 
 from PyQt5.QtWidgets import QLabel, QLineEdit, QPushButton
 from PyQt5.QtCore import Qt
-from ..config.constants import Styles, Colors
+from ..config.constants import Styles
 
 
 class TitleLabel(QLabel):
@@ -73,12 +73,31 @@ class FlatButton(QPushButton):
 
 
 class StatusLabel(QLabel):
-    """Label para exibição de status."""
+    """
+    Label para exibição de status.
+    
+    A folha de estilo é aplicada uma única vez; os estados visuais são
+    seletores da propriedade dinâmica "state", e o widget só é
+    repolido quando o estado muda. Mensagens repetidas não geram
+    repintura.
+    """
+    
+    INFO = "info"
+    SUCCESS = "success"
+    ERROR = "error"
     
     def __init__(self):
         """Inicializa o label de status."""
         super().__init__("")
         self.setAlignment(Qt.AlignCenter)
+        self._state = self.INFO
+        self.setProperty("state", self._state)
+        self.setStyleSheet(Styles.STATUS_LABEL)
+    
+    @property
+    def state(self) -> str:
+        """Estado visual atual."""
+        return self._state
     
     def show_success(self, message: str) -> None:
         """
@@ -87,8 +106,7 @@ class StatusLabel(QLabel):
         Args:
             message: Mensagem a ser exibida
         """
-        self.setText(f"✔ {message}")
-        self.setStyleSheet(f"color: #43b581; padding: 4px;")
+        self._show(self.SUCCESS, f"✔ {message}")
     
     def show_error(self, message: str) -> None:
         """
@@ -97,8 +115,7 @@ class StatusLabel(QLabel):
         Args:
             message: Mensagem a ser exibida
         """
-        self.setText(f"❌ {message}")
-        self.setStyleSheet(f"color: {Colors.ACCENT}; padding: 4px;")
+        self._show(self.ERROR, f"❌ {message}")
     
     def show_info(self, message: str) -> None:
         """
@@ -107,9 +124,20 @@ class StatusLabel(QLabel):
         Args:
             message: Mensagem a ser exibida
         """
-        self.setText(message)
-        self.setStyleSheet(f"color: {Colors.TEXT_PRIMARY}; padding: 4px;")
+        self._show(self.INFO, message)
     
     def clear(self) -> None:
         """Limpa o label."""
-        self.setText("")
+        self._show(self._state, "")
+    
+    def _show(self, state: str, text: str) -> None:
+        """Aplica estado e texto, ignorando o que não mudou."""
+        if state != self._state:
+            self._state = state
+            self.setProperty("state", state)
+            # Reavalia os seletores da folha já carregada, sem reprocessá-la
+            self.style().unpolish(self)
+            self.style().polish(self)
+            self.update()
+        if text != self.text():
+            self.setText(text)
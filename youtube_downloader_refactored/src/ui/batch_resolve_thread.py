@@ -0,0 +1,43 @@
+"""
+Thread de resolução de metadados.
+
+Resolve uma ou mais URLs em background, entregando cada resultado à
+interface assim que fica pronto.
+"""
+
+import threading
+from typing import List
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from ..services.batch_resolver import BatchResolver
+
+
+class BatchResolveThread(QThread):
+    """Thread que resolve metadados sem bloquear a UI."""
+
+    result_signal = pyqtSignal(object)
+
+    def __init__(self, urls: List[str], resolver: BatchResolver):
+        """
+        Inicializa a thread.
+
+        Args:
+            urls: URLs a resolver
+            resolver: Resolvedor compartilhado
+        """
+        super().__init__()
+        self._urls = urls
+        self._resolver = resolver
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Abandona as resoluções que ainda não começaram."""
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        """Resolve as URLs e emite um ResolvedVideo por vídeo."""
+        for result in self._resolver.resolve(self._urls, self._cancel_event):
+            if self._cancel_event.is_set():
+                break
+            self.result_signal.emit(result)
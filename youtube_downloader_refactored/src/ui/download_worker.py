@@ -0,0 +1,308 @@
+"""
+Workers de download da interface.
+
+Um conjunto fixo de threads, criado com a janela, executa os downloads
+um após o outro. Cada download é uma tarefa sem referências à interface,
+liberada assim que termina, para que uma sessão aberta por semanas não
+acumule threads, conexões de sinais e objetos do yt-dlp.
+"""
+
+import itertools
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from ..models.video_info import DownloadRequest
+from ..services.download_service import DownloadService
+from ..services.daemon_client import DaemonClient
+from ..services.job_control import JobControl
+from ..models.exceptions import (
+    DownloadError, DownloadCancelledError, CookiesNotFoundError, DaemonError
+)
+from ..config.constants import WorkerPoolConfig
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class DownloadTask(ABC):
+    """Download executado por um worker; o resultado segue o formato dos sinais."""
+
+    def __init__(self, request: DownloadRequest):
+        """
+        Inicializa a tarefa.
+
+        Args:
+            request: Requisição de download
+        """
+        self._request = request
+        self._cancelled = False
+
+    @property
+    def request(self) -> DownloadRequest:
+        """Requisição de download."""
+        return self._request
+
+    def cancel(self, keep_partial: bool = False) -> None:
+        """
+        Cancela o download, mesmo que ainda não tenha começado.
+
+        Args:
+            keep_partial: Se True, preserva os arquivos .part para retomar depois
+        """
+        self._cancelled = True
+
+    def pause(self) -> None:
+        """Pausa o download."""
+
+    def resume(self) -> None:
+        """Retoma o download pausado."""
+
+    def run(self, progress_callback: ProgressCallback) -> str:
+        """
+        Executa o download.
+
+        Args:
+            progress_callback: Recebe os dados de progresso no formato do yt-dlp
+
+        Returns:
+            "success", "cancelled" ou a mensagem de erro
+        """
+        if self._cancelled:
+            return "cancelled"
+        return self._execute(progress_callback)
+
+    @abstractmethod
+    def _execute(self, progress_callback: ProgressCallback) -> str:
+        """Executa o download propriamente dito (chamado se não houve cancelamento)."""
+
+
+class LocalDownloadTask(DownloadTask):
+    """Download executado pelo DownloadService deste processo."""
+
+    def __init__(self, request: DownloadRequest, download_service: DownloadService):
+        """
+        Inicializa a tarefa.
+
+        Args:
+            request: Requisição de download
+            download_service: Serviço compartilhado (reaproveita o pool do yt-dlp)
+        """
+        super().__init__(request)
+        self._download_service = download_service
+        self._control = JobControl()
+
+    def cancel(self, keep_partial: bool = False) -> None:
+        """Cancela o download no próximo evento de progresso."""
+        super().cancel(keep_partial)
+        self._control.cancel(keep_partial)
+
+    def pause(self) -> None:
+        """Pausa o download."""
+        self._control.pause()
+
+    def resume(self) -> None:
+        """Retoma o download pausado."""
+        self._control.resume()
+
+    def _execute(self, progress_callback: ProgressCallback) -> str:
+        try:
+            self._download_service.download(
+                self._request,
+                progress_callback=progress_callback,
+                control=self._control
+            )
+            return "success"
+        except DownloadCancelledError:
+            return "cancelled"
+        except (CookiesNotFoundError, DownloadError) as e:
+            return str(e)
+
+
+class RemoteDownloadTask(DownloadTask):
+    """
+    Download executado pelo daemon.
+
+    Converte os eventos do daemon no formato de progresso do yt-dlp,
+    permitindo que a janela atue como cliente fino sem alterar o
+    tratamento de progresso.
+    """
+
+    def __init__(self, request: DownloadRequest, client: DaemonClient):
+        """
+        Inicializa a tarefa.
+
+        Args:
+            request: Requisição de download
+            client: Cliente do daemon
+        """
+        super().__init__(request)
+        self._client = client
+        self._lock = threading.Lock()
+        self._job_id: Optional[str] = None
+        # keep_partial de um cancelamento pedido antes de o daemon informar o id do job
+        self._pending_cancel: Optional[bool] = None
+
+    def cancel(self, keep_partial: bool = False) -> None:
+        """Solicita ao daemon o cancelamento do job (adiado até o job ter id)."""
+        super().cancel(keep_partial)
+        with self._lock:
+            if self._job_id is None:
+                self._pending_cancel = keep_partial
+                return
+        self._send_command(lambda job_id: self._client.cancel(job_id, keep_partial))
+
+    def pause(self) -> None:
+        """Solicita ao daemon a pausa do job."""
+        self._send_command(self._client.pause)
+
+    def resume(self) -> None:
+        """Solicita ao daemon a retomada do job."""
+        self._send_command(self._client.resume)
+
+    def _send_command(self, command) -> None:
+        """Envia um comando ao daemon, ignorando falhas de comunicação."""
+        if self._job_id is None:
+            return
+        try:
+            command(self._job_id)
+        except DaemonError:
+            pass
+
+    def _execute(self, progress_callback: ProgressCallback) -> str:
+        try:
+            job = self._client.submit(self._request)
+            with self._lock:
+                self._job_id = job['job_id']
+                keep_partial = self._pending_cancel
+            if keep_partial is not None:
+                self._send_command(lambda job_id: self._client.cancel(job_id, keep_partial))
+            for event in self._client.iter_events(job['job_id']):
+                job = event['job']
+                if event['event'] == 'progress':
+                    progress_callback({
+                        'status': 'downloading',
+                        '_percent_str': f"{job['percent']}%",
+                        'eta': job['eta'],
+                        'speed': job['speed'],
+                    })
+        except DaemonError as e:
+            return str(e)
+        if job['status'] == 'completed':
+            progress_callback({'status': 'finished'})
+            return "success"
+        if job['status'] == 'cancelled':
+            return "cancelled"
+        return job.get('error') or "Falha no daemon."
+
+
+class _WorkerThread(QThread):
+    """Thread de vida longa que executa tarefas da fila do pool."""
+
+    def __init__(self, tasks: 'queue.Queue[Optional[Tuple[int, DownloadTask]]]', execute, index: int):
+        super().__init__()
+        self.setObjectName(f"download-worker-{index}")
+        self._tasks = tasks
+        self._execute = execute
+
+    def run(self) -> None:
+        """Executa tarefas até receber o sinal de parada (None)."""
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                return
+            self._execute(*item)
+            # Não segura a tarefa concluída enquanto espera a próxima
+            item = None
+
+
+class DownloadWorkerPool(QObject):
+    """
+    Conjunto fixo de workers de download.
+
+    Os sinais são conectados uma única vez pela janela e identificam a
+    tarefa pelo número retornado por submit(). O pool só referencia uma
+    tarefa enquanto ela está na fila ou em execução.
+    """
+
+    progress_signal = pyqtSignal(int, dict)
+    finished_signal = pyqtSignal(int, str)
+
+    def __init__(self, size: int = WorkerPoolConfig.SIZE, parent: Optional[QObject] = None):
+        """
+        Inicializa o pool e inicia seus workers.
+
+        Args:
+            size: Número de downloads simultâneos
+            parent: Objeto Qt dono do pool
+        """
+        super().__init__(parent)
+        self._tasks: 'queue.Queue[Optional[Tuple[int, DownloadTask]]]' = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._active: Dict[int, DownloadTask] = {}
+        self._workers: List[_WorkerThread] = [
+            _WorkerThread(self._tasks, self._run_task, index) for index in range(size)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def size(self) -> int:
+        """Número de workers."""
+        return len(self._workers)
+
+    def pending(self) -> int:
+        """Tarefas na fila ou em execução."""
+        with self._lock:
+            return len(self._active)
+
+    def submit(self, task: DownloadTask) -> int:
+        """
+        Enfileira uma tarefa.
+
+        Args:
+            task: Download a executar
+
+        Returns:
+            Número que identifica a tarefa nos sinais
+        """
+        task_id = next(self._ids)
+        with self._lock:
+            self._active[task_id] = task
+        self._tasks.put((task_id, task))
+        return task_id
+
+    def shutdown(self, keep_partial: bool = True, timeout_ms: int = WorkerPoolConfig.SHUTDOWN_TIMEOUT_MS) -> bool:
+        """
+        Cancela as tarefas restantes e encerra os workers.
+
+        Args:
+            keep_partial: Se True, preserva os .part para retomar depois
+            timeout_ms: Espera máxima por worker
+
+        Returns:
+            True se todos os workers terminaram dentro do prazo
+        """
+        with self._lock:
+            tasks = list(self._active.values())
+        for task in tasks:
+            task.cancel(keep_partial=keep_partial)
+        for _ in self._workers:
+            self._tasks.put(None)
+        stopped = all(worker.wait(timeout_ms) for worker in self._workers)
+        self._workers = []
+        return stopped
+
+    def _run_task(self, task_id: int, task: DownloadTask) -> None:
+        """Executa uma tarefa na thread do worker e a libera ao terminar."""
+        try:
+            result = task.run(lambda data: self.progress_signal.emit(task_id, data))
+        except Exception as e:
+            result = f"Erro inesperado: {str(e)}"
+        finally:
+            with self._lock:
+                self._active.pop(task_id, None)
+        self.finished_signal.emit(task_id, result)
@@ -5,40 +5,81 @@ Interface principal para download de vídeos do YouTube.
 Aplica princípios de separação de responsabilidades e SOLID.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel,
-    QLineEdit, QPushButton, QComboBox, QProgressBar, QFileDialog
+    QLineEdit, QPushButton, QComboBox, QProgressBar, QFileDialog, QListWidget
 )
 from PyQt5.QtCore import Qt, QRectF
-from PyQt5.QtGui import QIcon, QPainterPath, QRegion, QColor
+from PyQt5.QtGui import QIcon, QPainterPath, QRegion, QColor, QImage, QPixmap
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
-from .download_thread import DownloadThread
+from .download_worker import DownloadTask, DownloadWorkerPool, LocalDownloadTask, RemoteDownloadTask
+from .batch_resolve_thread import BatchResolveThread
+from .thumbnail_thread import ThumbnailThread
+from .history_window import HistoryWindow
 from .base_components import StatusLabel
-from ..models.video_info import DownloadRequest, VideoInfo
-from ..services.video_info_service import VideoInfoService, ThumbnailLoader
-from ..services.download_service import ProgressParser
+from ..models.video_info import DownloadRequest, ResolvedVideo
+from ..services.video_info_service import VideoInfoService
+from ..services.batch_resolver import BatchResolver
+from ..services.history_store import HistoryStore
+from ..services.process_backend import ProcessBackend
+from ..services.download_service import DownloadService, ProgressParser
+from ..services.daemon_client import DaemonClient
 from ..utils.validators import URLValidator
 from ..utils.system_utils import FileSystemUtils
-from ..models.exceptions import InvalidURLError, VideoInfoError, CookiesNotFoundError
+from ..utils.startup_metrics import StartupMetrics
+from ..models.exceptions import InvalidURLError
 from ..config.constants import (
-    AppConstants, WindowSize, Colors, Styles, DownloadFormats
+    AppConstants, CacheConfig, ThumbnailConfig, WindowSize, Colors, Styles, DownloadFormats
 )
 
 
 class DownloaderWindow(QWidget):
     """Janela principal de download de vídeos."""
     
-    def __init__(self):
-        """Inicializa a janela de download."""
+    def __init__(
+        self,
+        daemon_client: Optional[DaemonClient] = None,
+        use_processes: bool = False
+    ):
+        """
+        Inicializa a janela de download.
+        
+        Args:
+            daemon_client: Se informado, os downloads são delegados ao daemon
+            use_processes: Se True, extrações e downloads rodam em processos
+                separados, fora do GIL da interface
+        """
         super().__init__()
         self._is_downloading = False
-        self._download_thread: Optional[DownloadThread] = None
+        self._daemon_client = daemon_client
+        self._download_task: Optional[DownloadTask] = None
+        self._download_task_id: Optional[int] = None
         self._save_path: Optional[str] = None
         self._old_pos = self.pos()
         
-        self._video_info_service = VideoInfoService()
+        self._history_store = HistoryStore.shared()
+        self._history_window: Optional[HistoryWindow] = None
+        self._process_backend: Optional[ProcessBackend] = None
+        if use_processes:
+            self._process_backend = ProcessBackend(record_history=True)
+            self._video_info_service = self._process_backend
+            self._download_service = self._process_backend
+        else:
+            self._video_info_service = VideoInfoService()
+            self._download_service = DownloadService(history_store=self._history_store)
+        self._batch_resolver = BatchResolver(self._video_info_service)
+        self._resolve_threads: List[BatchResolveThread] = []
+        self._thumbnail_threads: List[ThumbnailThread] = []
+        self._thumbnail_url: Optional[str] = None
+        self._queue: List[ResolvedVideo] = []
+        self._pending: List[ResolvedVideo] = []
+        
+        # Workers criados uma vez; os sinais são conectados uma única vez
+        self._workers = DownloadWorkerPool(parent=self)
+        self._workers.progress_signal.connect(self._on_worker_progress)
+        self._workers.finished_signal.connect(self._on_worker_finished)
         
         self._setup_window()
         self._setup_ui()
@@ -60,6 +101,18 @@ class DownloaderWindow(QWidget):
         
         self._apply_styles()
     
+    def prewarm(self) -> None:
+        """
+        Prepara os serviços para a primeira consulta e o primeiro download.
+        
+        Pode ser chamado de outra thread enquanto a janela está oculta.
+        """
+        self._video_info_service.prewarm()
+        if self._daemon_client is None and self._process_backend is None:
+            self._download_service.prewarm()
+        if CacheConfig.WARM_ON_STARTUP:
+            self._video_info_service.warm_cache()
+    
     def _apply_styles(self) -> None:
         """Aplica estilos CSS à janela."""
         self.setStyleSheet(f"""
@@ -83,7 +136,7 @@ class DownloaderWindow(QWidget):
         
         # Campos de entrada
         self._url_input = QLineEdit()
-        self._url_input.setPlaceholderText("Cole o link do vídeo do YouTube...")
+        self._url_input.setPlaceholderText("Cole ou arraste links do YouTube...")
         
         self._title_input = QLineEdit()
         self._title_input.setPlaceholderText("Nome do arquivo (opcional)")
@@ -91,11 +144,27 @@ class DownloaderWindow(QWidget):
         self._format_box = QComboBox()
         self._format_box.addItems(DownloadFormats.get_format_keys())
         
+        # Fila de vídeos adicionados em lote
+        self._queue_list = QListWidget()
+        self._queue_list.setMaximumHeight(90)
+        self._queue_list.setVisible(False)
+        
         # Botão de download
         self._download_btn = QPushButton("🎬 Baixar Vídeo")
         self._download_btn.clicked.connect(self._handle_download)
         self._add_glow_effect(self._download_btn)
         
+        # Controles do download em andamento
+        self._pause_btn = QPushButton("⏸ Pausar")
+        self._pause_btn.setCheckable(True)
+        self._pause_btn.toggled.connect(self._toggle_pause)
+        self._cancel_btn = QPushButton("✖ Cancelar")
+        self._cancel_btn.clicked.connect(self._cancel_download)
+        controls = QHBoxLayout()
+        controls.addWidget(self._pause_btn)
+        controls.addWidget(self._cancel_btn)
+        self._set_controls_visible(False)
+        
         # Barra de progresso e status
         self._progress_bar = QProgressBar()
         self._progress_bar.setValue(0)
@@ -110,7 +179,9 @@ class DownloaderWindow(QWidget):
         main_layout.addWidget(self._url_input)
         main_layout.addWidget(self._title_input)
         main_layout.addWidget(self._format_box)
+        main_layout.addWidget(self._queue_list)
         main_layout.addWidget(self._download_btn)
+        main_layout.addLayout(controls)
         main_layout.addWidget(self._progress_bar)
         main_layout.addWidget(self._status)
         main_layout.addWidget(self._video_title)
@@ -130,11 +201,14 @@ class DownloaderWindow(QWidget):
         title = QLabel("▶ YouTube Gamer DL")
         title.setStyleSheet(f"color: {Colors.ACCENT}; font-size: 16px; font-weight: bold;")
         
+        btn_history = self._create_window_button("🕘", self._show_history)
+        btn_history.setToolTip("Histórico de downloads")
         btn_minimize = self._create_window_button("–", self.showMinimized)
         btn_close = self._create_window_button("×", self.close)
         
         layout.addWidget(title)
         layout.addStretch()
+        layout.addWidget(btn_history)
         layout.addWidget(btn_minimize)
         layout.addWidget(btn_close)
         
@@ -148,6 +222,13 @@ class DownloaderWindow(QWidget):
         btn.clicked.connect(callback)
         return btn
     
+    def _show_history(self) -> None:
+        """Abre a janela de histórico de downloads."""
+        if self._history_window is None:
+            self._history_window = HistoryWindow(self._history_store)
+        self._history_window.show()
+        self._history_window.raise_()
+    
     def _add_glow_effect(self, widget: QWidget) -> None:
         """Adiciona efeito de brilho a um widget."""
         glow = QGraphicsDropShadowEffect()
@@ -161,8 +242,20 @@ class DownloaderWindow(QWidget):
         url = self._url_input.text().strip()
         custom_title = self._title_input.text().strip()
         
+        if self._is_downloading:
+            return
+        
+        # Vários links colados de uma vez vão para a fila
+        urls = URLValidator.extract_urls(url)
+        if len(urls) > 1:
+            self._url_input.clear()
+            self._enqueue_urls(urls)
+            return
+        
         # Validações
-        if not url or self._is_downloading:
+        if not url:
+            if self._queue:
+                self._start_queue()
             return
         
         try:
@@ -181,8 +274,11 @@ class DownloaderWindow(QWidget):
         self._start_download(url, save_path, custom_title)
         self._load_video_info(url)
     
-    def _start_download(self, url: str, save_path: str, custom_title: str) -> None:
-        """Inicia o processo de download."""
+    def _start_download(
+        self, url: str, save_path: str, custom_title: str, estimated_size: Optional[int] = None
+    ) -> None:
+        """Inicia o processo de download (o tamanho estimado ordena a fila do daemon)."""
+        StartupMetrics.shared().mark(StartupMetrics.DOWNLOAD_REQUESTED)
         self._is_downloading = True
         self._download_btn.setEnabled(False)
         self._progress_bar.setVisible(True)
@@ -194,35 +290,155 @@ class DownloaderWindow(QWidget):
             url=url,
             save_path=save_path,
             format_choice=self._format_box.currentText(),
-            custom_title=custom_title if custom_title else None
+            custom_title=custom_title if custom_title else None,
+            estimated_size=estimated_size
         )
         
-        self._download_thread = DownloadThread(request)
-        self._download_thread.progress_signal.connect(self._update_progress)
-        self._download_thread.finished_signal.connect(self._download_finished)
-        self._download_thread.start()
+        if self._daemon_client is not None:
+            self._download_task = RemoteDownloadTask(request, self._daemon_client)
+        else:
+            self._download_task = LocalDownloadTask(request, self._download_service)
+        self._download_task_id = self._workers.submit(self._download_task)
+        self._set_controls_visible(True)
+    
+    def _set_controls_visible(self, visible: bool) -> None:
+        """Exibe ou oculta os botões de pausa e cancelamento."""
+        self._pause_btn.blockSignals(True)
+        self._pause_btn.setChecked(False)
+        self._pause_btn.setText("⏸ Pausar")
+        self._pause_btn.blockSignals(False)
+        self._pause_btn.setVisible(visible)
+        self._cancel_btn.setVisible(visible)
+    
+    def _toggle_pause(self, paused: bool) -> None:
+        """Pausa ou retoma o download em andamento."""
+        if self._download_task is None:
+            return
+        if paused:
+            self._download_task.pause()
+            self._pause_btn.setText("▶ Retomar")
+            self._status.show_info("⏸ Download pausado")
+        else:
+            self._download_task.resume()
+            self._pause_btn.setText("⏸ Pausar")
+    
+    def _cancel_download(self) -> None:
+        """Cancela o download em andamento, descartando arquivos parciais."""
+        if self._download_task is not None and self._is_downloading:
+            self._cancel_btn.setEnabled(False)
+            self._status.show_info("⏹ Cancelando...")
+            self._download_task.cancel(keep_partial=False)
     
     def _load_video_info(self, url: str) -> None:
-        """Carrega informações do vídeo."""
-        try:
-            video_info = self._video_info_service.get_video_info(url)
-            self._video_title.setText(str(video_info))
-            
-            if video_info.thumbnail_url:
-                pixmap = ThumbnailLoader.load_thumbnail(video_info.thumbnail_url)
-                if pixmap:
-                    self._thumbnail_label.setPixmap(pixmap)
-        except (CookiesNotFoundError, VideoInfoError) as e:
-            self._video_title.setText(f"⚠️ {str(e)}")
+        """Carrega informações do vídeo em background."""
+        self._resolve_in_background([url], self._show_video_info)
+    
+    def _show_video_info(self, result: ResolvedVideo) -> None:
+        """Exibe título, tamanho estimado e thumbnail de um vídeo."""
+        video_info = result.info
+        if video_info is None:
+            self._video_title.setText(f"⚠️ {result.error}")
+            return
+        
+        self._video_title.setText(self._describe(result))
+        self._thumbnail_url = video_info.pick_thumbnail(ThumbnailConfig.WIDTH, ThumbnailConfig.HEIGHT)
+        if self._thumbnail_url:
+            thread = ThumbnailThread(self._thumbnail_url)
+            thread.image_signal.connect(
+                lambda image, url=self._thumbnail_url: self._show_thumbnail(url, image)
+            )
+            thread.finished.connect(lambda: self._thumbnail_threads.remove(thread))
+            self._thumbnail_threads.append(thread)
+            thread.start()
+    
+    def _show_thumbnail(self, url: str, image: QImage) -> None:
+        """Exibe a thumbnail carregada, se ainda for a do vídeo mostrado."""
+        if url == self._thumbnail_url:
+            self._thumbnail_label.setPixmap(QPixmap.fromImage(image))
+    
+    def _describe(self, result: ResolvedVideo) -> str:
+        """Texto de um vídeo com o tamanho estimado no formato escolhido."""
+        if result.info is None:
+            return str(result)
+        size = result.info.get_formatted_size(self._format_box.currentText())
+        return f"{result.info} ({size})" if size else str(result.info)
+    
+    def _resolve_in_background(self, urls: List[str], slot) -> None:
+        """Resolve URLs em uma thread, entregando cada resultado ao slot."""
+        thread = BatchResolveThread(urls, self._batch_resolver)
+        thread.result_signal.connect(slot)
+        thread.finished.connect(lambda: self._resolve_threads.remove(thread))
+        self._resolve_threads.append(thread)
+        thread.start()
+    
+    def _enqueue_urls(self, urls: List[str]) -> None:
+        """Resolve uma lista de links e os adiciona à fila."""
+        self._queue_list.setVisible(True)
+        self._status.show_info(f"🔎 Resolvendo {len(urls)} links...")
+        self._resolve_in_background(urls, self._add_to_queue)
+    
+    def _add_to_queue(self, result: ResolvedVideo) -> None:
+        """Adiciona um vídeo resolvido à fila (ou exibe o erro)."""
+        queued_ids = {item.video_id for item in self._queue + self._pending}
+        if result.ok and result.video_id in queued_ids:
+            return
+        self._queue_list.addItem(self._describe(result))
+        if result.ok:
+            self._queue.append(result)
+            self._status.show_info(f"📋 {len(self._queue)} vídeos na fila — clique em Baixar")
+    
+    def _start_queue(self) -> None:
+        """Baixa os vídeos da fila, um após o outro, na mesma pasta."""
+        save_path = QFileDialog.getExistingDirectory(self, "Escolha a pasta para salvar")
+        if not save_path:
+            self._status.show_error("Caminho de destino não escolhido.")
+            return
+        
+        self._save_path = save_path
+        self._pending, self._queue = self._queue, []
+        self._queue_list.clear()
+        self._queue_list.setVisible(False)
+        self._start_next_queued()
+    
+    def _start_next_queued(self) -> None:
+        """Inicia o próximo download pendente da fila."""
+        item = self._pending.pop(0)
+        self._video_title.setText(self._describe(item))
+        self._thumbnail_url = None
+        self._thumbnail_label.clear()
+        self._start_download(
+            item.url, self._save_path, "", item.info.size_estimates.get(self._format_box.currentText())
+        )
+    
+    def dragEnterEvent(self, event) -> None:
+        """Aceita links arrastados para a janela."""
+        if event.mimeData().hasUrls() or event.mimeData().hasText():
+            event.acceptProposedAction()
+    
+    def dropEvent(self, event) -> None:
+        """Adiciona à fila os links soltos na janela."""
+        mime = event.mimeData()
+        text = "\n".join(url.toString() for url in mime.urls()) if mime.hasUrls() else mime.text()
+        urls = URLValidator.extract_urls(text)
+        if urls:
+            event.acceptProposedAction()
+            self._enqueue_urls(urls)
+    
+    def _set_progress(self, value: int) -> None:
+        """Atualiza a barra de progresso apenas quando o valor visível muda."""
+        if value == self._progress_bar.value():
+            return
+        self._progress_bar.setValue(value)
+        self._progress_bar.setFormat(f"{value}%")
     
     def _update_progress(self, data: Dict[str, Any]) -> None:
         """Atualiza barra de progresso."""
         progress = ProgressParser.parse(data)
         
         if progress.is_downloading():
+            StartupMetrics.shared().mark(StartupMetrics.FIRST_PROGRESS)
             value = int(progress.percent)
-            self._progress_bar.setValue(value)
-            self._progress_bar.setFormat(f"{value}%")
+            self._set_progress(value)
             
             eta_str = progress.get_formatted_eta()
             if eta_str:
@@ -230,21 +446,56 @@ class DownloaderWindow(QWidget):
             else:
                 self._status.show_info(f"📥 Baixando... {value}%")
         elif progress.is_finished():
-            self._progress_bar.setValue(100)
-            self._progress_bar.setFormat("100%")
+            self._set_progress(100)
             self._status.show_success("Download finalizado!")
     
+    def _on_worker_progress(self, task_id: int, data: Dict[str, Any]) -> None:
+        """Repassa o progresso da tarefa atual (eventos atrasados são ignorados)."""
+        if task_id == self._download_task_id:
+            self._update_progress(data)
+    
+    def _on_worker_finished(self, task_id: int, result: str) -> None:
+        """Libera a tarefa concluída e trata o resultado."""
+        if task_id != self._download_task_id:
+            return
+        self._download_task = None
+        self._download_task_id = None
+        self._download_finished(result)
+    
     def _download_finished(self, result: str) -> None:
         """Processa finalização do download."""
         if result == "success":
             self._status.show_success("Download concluído!")
-            if self._save_path:
+            if self._save_path and not self._pending:
                 FileSystemUtils.open_folder(self._save_path)
+        elif result == "cancelled":
+            self._status.show_info("Download cancelado.")
+            self._pending = []
         else:
             self._status.show_error(f"Erro: {result}")
         
         self._download_btn.setEnabled(True)
+        self._cancel_btn.setEnabled(True)
+        self._set_controls_visible(False)
         self._is_downloading = False
+        
+        if self._pending:
+            self._start_next_queued()
+    
+    def closeEvent(self, event) -> None:
+        """Interrompe o download em andamento ao fechar a janela."""
+        for thread in list(self._resolve_threads):
+            thread.cancel()
+            thread.wait()
+        for thread in list(self._thumbnail_threads):
+            thread.wait()
+        # Preserva os .part para que o download possa ser retomado depois
+        self._workers.shutdown(keep_partial=True)
+        if self._history_window is not None:
+            self._history_window.close()
+        if self._process_backend is not None:
+            self._process_backend.shutdown()
+        super().closeEvent(event)
     
     # Métodos para movimentação da janela
     def mousePressEvent(self, event) -> None:
@@ -0,0 +1,199 @@
+"""
+Janela de histórico.
+
+Lista os downloads registrados no histórico, com busca por título ou
+canal e filtros de formato e período. As linhas são carregadas sob
+demanda, página a página, conforme a tabela é rolada.
+"""
+
+import os
+import time
+from typing import Any, List
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QTableView, QHeaderView
+)
+
+from ..models.history import HistoryEntry, HistoryQuery
+from ..services.history_store import HistoryStore
+from ..utils.system_utils import FileSystemUtils
+from ..config.constants import AppConstants, DownloadFormats, HistoryConfig, Styles
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """Modelo de tabela que busca o histórico em páginas sob demanda."""
+
+    HEADERS = ("Data", "Título", "Canal", "Formato", "Arquivo")
+
+    def __init__(self, store: HistoryStore, page_size: int = HistoryConfig.PAGE_SIZE):
+        """
+        Inicializa o modelo.
+
+        Args:
+            store: Histórico consultado
+            page_size: Linhas carregadas por página
+        """
+        super().__init__()
+        self._store = store
+        self._page_size = page_size
+        self._query = HistoryQuery()
+        self._rows: List[HistoryEntry] = []
+        self._exhausted = False
+
+    def set_query(self, query: HistoryQuery) -> None:
+        """
+        Troca os filtros e carrega a primeira página.
+
+        Args:
+            query: Novos filtros
+        """
+        self.beginResetModel()
+        self._query = query
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def refresh(self) -> None:
+        """Recarrega a partir da primeira página (ex.: após novos downloads)."""
+        self.set_query(self._query)
+
+    def entry(self, row: int) -> HistoryEntry:
+        """Retorna o registro de uma linha."""
+        return self._rows[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Quantidade de linhas já carregadas."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Quantidade de colunas."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Indica se há mais páginas a carregar."""
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Carrega a próxima página a partir da última linha."""
+        if parent.isValid() or self._exhausted:
+            return
+        after = self._rows[-1] if self._rows else None
+        page = self._store.search(self._query, self._page_size, after)
+        self._exhausted = len(page) < self._page_size
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Texto exibido em cada célula."""
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        entry = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return entry.get_formatted_date()
+        if column == 1:
+            return entry.title
+        if column == 2:
+            return entry.channel or ""
+        if column == 3:
+            return entry.format_choice
+        return entry.file_path if role == Qt.ToolTipRole else os.path.basename(entry.file_path)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """Títulos das colunas."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class HistoryWindow(QWidget):
+    """Janela de consulta ao histórico de downloads."""
+
+    ALL_FORMATS = "Todos os formatos"
+    PERIODS = {
+        "Qualquer data": None,
+        "Últimas 24 horas": 24 * 3600,
+        "Últimos 7 dias": 7 * 24 * 3600,
+        "Últimos 30 dias": 30 * 24 * 3600,
+    }
+
+    def __init__(self, store: HistoryStore):
+        """
+        Inicializa a janela de histórico.
+
+        Args:
+            store: Histórico consultado
+        """
+        super().__init__()
+        self._model = HistoryTableModel(store)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(HistoryConfig.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_filters)
+
+        self.setWindowTitle("Histórico de downloads")
+        self.setWindowIcon(QIcon(AppConstants.WINDOW_ICON))
+        self.resize(820, 480)
+        self.setStyleSheet(f"{Styles.BASE_WIDGET}{Styles.LINE_EDIT}{Styles.COMBO_BOX}")
+        self._setup_ui()
+        self._apply_filters()
+
+    def _setup_ui(self) -> None:
+        """Configura a interface do usuário."""
+        self._search_input = QLineEdit()
+        self._search_input.setPlaceholderText("Buscar por título ou canal...")
+        self._search_input.textChanged.connect(lambda _: self._search_timer.start())
+
+        self._format_box = QComboBox()
+        self._format_box.addItems([self.ALL_FORMATS] + DownloadFormats.get_format_keys())
+        self._format_box.currentIndexChanged.connect(self._apply_filters)
+
+        self._period_box = QComboBox()
+        self._period_box.addItems(list(self.PERIODS))
+        self._period_box.currentIndexChanged.connect(self._apply_filters)
+
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setSelectionBehavior(QTableView.SelectRows)
+        self._table.setEditTriggers(QTableView.NoEditTriggers)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self._table.doubleClicked.connect(self._open_entry_folder)
+
+        filters = QHBoxLayout()
+        filters.addWidget(self._search_input, stretch=1)
+        filters.addWidget(self._format_box)
+        filters.addWidget(self._period_box)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(filters)
+        layout.addWidget(self._table)
+
+    def showEvent(self, event) -> None:
+        """Recarrega o histórico sempre que a janela é exibida."""
+        super().showEvent(event)
+        self._model.refresh()
+
+    def _apply_filters(self) -> None:
+        """Monta a consulta a partir dos filtros e recarrega a tabela."""
+        format_choice = self._format_box.currentText()
+        period = self.PERIODS[self._period_box.currentText()]
+        self._model.set_query(HistoryQuery(
+            text=self._search_input.text(),
+            format_choice=None if format_choice == self.ALL_FORMATS else format_choice,
+            since=time.time() - period if period else None,
+        ))
+
+    def _open_entry_folder(self, index: QModelIndex) -> None:
+        """Abre a pasta do arquivo da linha escolhida."""
+        entry = self._model.entry(index.row())
+        folder = os.path.dirname(entry.file_path)
+        if folder and os.path.isdir(folder):
+            FileSystemUtils.open_folder(folder)
@@ -0,0 +1,39 @@
+"""
+Thread de pré-aquecimento.
+
+Executa em background etapas caras da inicialização (imports, criação
+de instâncias do yt-dlp, leitura de cookies) enquanto o usuário ainda
+está na tela de login.
+"""
+
+from typing import Callable, List, Optional
+
+from PyQt5.QtCore import QThread
+
+
+class PrewarmThread(QThread):
+    """Thread que executa etapas de pré-aquecimento em sequência."""
+    
+    def __init__(self, steps: List[Callable[[], None]]):
+        """
+        Inicializa a thread.
+        
+        Args:
+            steps: Funções executadas em ordem, fora da thread da interface
+        """
+        super().__init__()
+        self._steps = steps
+        self._error: Optional[Exception] = None
+    
+    @property
+    def error(self) -> Optional[Exception]:
+        """Primeira falha ocorrida (as etapas seguintes não são executadas)."""
+        return self._error
+    
+    def run(self) -> None:
+        """Executa as etapas; uma falha só adia o trabalho para o primeiro uso."""
+        try:
+            for step in self._steps:
+                step()
+        except Exception as e:
+            self._error = e
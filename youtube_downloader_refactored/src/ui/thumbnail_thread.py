@@ -0,0 +1,37 @@
+"""
+Thread de carregamento de thumbnail.
+
+Baixa e decodifica a thumbnail em background; a interface só converte
+a imagem pronta em QPixmap.
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from ..services.video_info_service import ThumbnailLoader
+from ..config.constants import ThumbnailConfig
+
+
+class ThumbnailThread(QThread):
+    """Thread que carrega uma thumbnail sem bloquear a UI."""
+
+    image_signal = pyqtSignal(object)
+
+    def __init__(self, url: str, width: int = ThumbnailConfig.WIDTH, height: int = ThumbnailConfig.HEIGHT):
+        """
+        Inicializa a thread.
+
+        Args:
+            url: URL da thumbnail
+            width: Largura máxima da imagem
+            height: Altura máxima da imagem
+        """
+        super().__init__()
+        self._url = url
+        self._width = width
+        self._height = height
+
+    def run(self) -> None:
+        """Carrega a imagem e a emite se o carregamento der certo."""
+        image = ThumbnailLoader.load_image(self._url, self._width, self._height)
+        if image is not None:
+            self.image_signal.emit(image)
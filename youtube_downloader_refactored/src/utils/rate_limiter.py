@@ -0,0 +1,52 @@
+"""
+Limitador de taxa.
+
+Balde de fichas compartilhado entre threads para espaçar requisições.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class RateLimiter:
+    """Limitador de taxa do tipo balde de fichas (token bucket)."""
+    
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Inicializa o limitador.
+        
+        Args:
+            rate: Requisições por segundo (None = sem limite)
+            burst: Requisições permitidas de imediato após um período ocioso
+            clock: Relógio monotônico (injetável para testes)
+            sleep: Função de espera (injetável para testes)
+        """
+        self._rate = rate
+        self._capacity = float(max(burst, 1))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Bloqueia até haver uma ficha disponível e a consome."""
+        if not self._rate:
+            return
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            self._sleep(wait)
@@ -0,0 +1,40 @@
+"""
+Instâncias compartilhadas por caminho.
+
+Cookies, cache do yt-dlp, histórico e os bancos SQLite são mantidos em
+uma única instância por arquivo ou diretório, criada no primeiro uso e
+reaproveitada por todas as threads.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class SharedRegistry(Generic[T]):
+    """Registro de instâncias indexadas pelo caminho absoluto."""
+
+    def __init__(self):
+        """Inicializa o registro vazio."""
+        self._items: Dict[str, T] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, factory: Callable[[str], T]) -> T:
+        """
+        Retorna a instância de um caminho, criando-a na primeira vez.
+
+        Args:
+            path: Arquivo ou diretório da instância
+            factory: Cria a instância a partir do caminho absoluto
+
+        Returns:
+            A mesma instância para caminhos que apontam para o mesmo lugar
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = self._items[key] = factory(key)
+            return item
@@ -0,0 +1,57 @@
+"""
+Acesso a bancos SQLite compartilhados entre threads e processos.
+
+A fila de trabalho, o armazenamento por conteúdo e as marcas de
+sincronização abrem uma conexão por operação, pois são usados por
+várias threads e, no caso da fila, por várias máquinas. O diário padrão
+(DELETE) é mantido: o modo WAL não funciona em sistemas de arquivos de
+rede.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
+
+def create_schema(db_path: str, schema: str, timeout: float) -> None:
+    """
+    Cria as tabelas de um banco, se ainda não existirem.
+
+    Args:
+        db_path: Caminho do arquivo SQLite
+        schema: Script com os CREATE ... IF NOT EXISTS
+        timeout: Espera máxima por um banco ocupado, em segundos
+    """
+    connection = sqlite3.connect(db_path, timeout=timeout)
+    try:
+        connection.executescript(schema)
+    finally:
+        connection.close()
+
+
+@contextmanager
+def transaction(db_path: str, timeout: float) -> Iterator[sqlite3.Connection]:
+    """
+    Abre uma conexão com transação de escrita exclusiva entre processos.
+
+    A transação é confirmada ao fim do bloco e desfeita se ele levantar
+    uma exceção; a conexão é fechada em ambos os casos.
+
+    Args:
+        db_path: Caminho do arquivo SQLite
+        timeout: Espera máxima por um banco ocupado, em segundos
+
+    Raises:
+        sqlite3.OperationalError: Se o banco continuar ocupado após timeout
+    """
+    connection = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
@@ -0,0 +1,86 @@
+"""
+Métricas de inicialização.
+
+Registra marcos da inicialização (tela de login pronta, pré-aquecimento
+concluído, primeiro download iniciado...) relativos ao início do
+processo, para medir o tempo até o primeiro download.
+"""
+
+import threading
+import time
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
+
+
+class StartupMetrics:
+    """Marcos de tempo da inicialização da aplicação."""
+    
+    LOGIN_SHOWN = "login_shown"
+    PREWARM_DONE = "prewarm_done"
+    LOGIN_SUCCEEDED = "login_succeeded"
+    DOWNLOADER_SHOWN = "downloader_shown"
+    DOWNLOAD_REQUESTED = "download_requested"
+    FIRST_PROGRESS = "first_progress"
+    
+    _shared: ClassVar[Optional['StartupMetrics']] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Inicializa as métricas, tomando o instante atual como origem.
+        
+        Args:
+            clock: Relógio monotônico (injetável para testes)
+        """
+        self._clock = clock
+        self._origin = clock()
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls) -> 'StartupMetrics':
+        """Retorna as métricas do processo, criadas na primeira chamada."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def mark(self, name: str) -> float:
+        """
+        Registra um marco; apenas a primeira ocorrência é mantida.
+        
+        Args:
+            name: Nome do marco
+            
+        Returns:
+            Segundos desde a origem até a primeira ocorrência do marco
+        """
+        now = self._clock() - self._origin
+        with self._lock:
+            return self._marks.setdefault(name, now)
+    
+    def elapsed(self, name: str) -> Optional[float]:
+        """Segundos desde a origem até o marco (None se não ocorreu)."""
+        return self._marks.get(name)
+    
+    def between(self, start: str, end: str) -> Optional[float]:
+        """Segundos entre dois marcos (None se algum não ocorreu)."""
+        if start not in self._marks or end not in self._marks:
+            return None
+        return self._marks[end] - self._marks[start]
+    
+    def summary(self) -> List[Tuple[str, Optional[float]]]:
+        """Intervalos relevantes da inicialização, em segundos."""
+        return [
+            ("login pronto", self.elapsed(self.LOGIN_SHOWN)),
+            ("pré-aquecimento", self.elapsed(self.PREWARM_DONE)),
+            ("login → janela de download", self.between(self.LOGIN_SUCCEEDED, self.DOWNLOADER_SHOWN)),
+            ("tempo até o primeiro download", self.between(self.DOWNLOAD_REQUESTED, self.FIRST_PROGRESS)),
+        ]
+    
+    def report(self) -> str:
+        """Texto com os intervalos medidos, em milissegundos."""
+        lines = ["Inicialização:"]
+        for label, seconds in self.summary():
+            value = f"{seconds * 1000:.0f} ms" if seconds is not None else "-"
+            lines.append(f"  {label}: {value}")
+        return "\n".join(lines)
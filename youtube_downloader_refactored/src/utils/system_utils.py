@@ -6,6 +6,9 @@ Funções auxiliares para operações do sistema operacional.
 
 import os
 import platform
+import signal
+import subprocess
+from typing import List, Tuple
 
 
 class FileSystemUtils:
@@ -27,3 +30,61 @@ class FileSystemUtils:
             os.system(f"open '{path}'")
         else:  # Linux e outros
             os.system(f"xdg-open '{path}'")
+
+
+class ProcessUtils:
+    """Utilitários para processos filhos da aplicação."""
+    
+    @staticmethod
+    def terminate_children_using(path: str) -> int:
+        """
+        Encerra processos filhos cuja linha de comando referencia um arquivo.
+        
+        Usado para interromper o ffmpeg de um job cancelado sem afetar
+        os processos de outros jobs.
+        
+        Args:
+            path: Caminho (ou prefixo) do arquivo de saída do job
+            
+        Returns:
+            Quantidade de processos encerrados
+        """
+        stem = os.path.splitext(path)[0]
+        terminated = 0
+        
+        for pid, command in ProcessUtils._list_children():
+            if stem and stem in command:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    terminated += 1
+                except OSError:
+                    pass
+        return terminated
+    
+    @staticmethod
+    def _list_children() -> List[Tuple[int, str]]:
+        """Lista (pid, linha de comando) dos processos filhos diretos."""
+        parent = os.getpid()
+        
+        if platform.system() == 'Windows':
+            query = f"ParentProcessId={parent}"
+            args = ['wmic', 'process', 'where', query, 'get', 'ProcessId,CommandLine', '/format:csv']
+        else:
+            args = ['ps', '-A', '-o', 'pid=,ppid=,args=']
+        
+        try:
+            output = subprocess.run(args, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            return []
+        
+        children = []
+        for line in output.splitlines():
+            if platform.system() == 'Windows':
+                fields = line.strip().rsplit(',', 1)
+                if len(fields) == 2 and fields[1].isdigit():
+                    children.append((int(fields[1]), fields[0]))
+                continue
+            fields = line.split(None, 2)
+            if len(fields) == 3 and fields[1] == str(parent):
+                children.append((int(fields[0]), fields[2]))
+        return children
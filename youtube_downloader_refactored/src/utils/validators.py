@@ -5,6 +5,7 @@ Funções auxiliares para validação de dados.
 """
 
 import re
+from typing import List, Optional
 from ..models.exceptions import InvalidURLError
 
 
@@ -12,6 +13,8 @@ class URLValidator:
     """Validador de URLs do YouTube."""
     
     YOUTUBE_PATTERN = r"^https?://(www\.)?(youtube\.com|youtu\.be)/"
+    URL_IN_TEXT_PATTERN = r"https?://[^\s<>\"']+"
+    VIDEO_ID_PATTERN = r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([0-9A-Za-z_-]{11})(?![0-9A-Za-z_-])"
     
     @classmethod
     def validate(cls, url: str) -> bool:
@@ -39,6 +42,34 @@ class URLValidator:
         """
         if not cls.validate(url):
             raise InvalidURLError("URL inválida. Use uma URL do YouTube.")
+    
+    @classmethod
+    def extract_urls(cls, text: str) -> List[str]:
+        """
+        Extrai URLs de um texto colado ou arrastado.
+        
+        Args:
+            text: Texto com uma ou mais URLs
+            
+        Returns:
+            URLs na ordem em que aparecem
+        """
+        urls = (url.rstrip(".,;:!?)]") for url in re.findall(cls.URL_IN_TEXT_PATTERN, text or ""))
+        return [url for url in urls if url]
+    
+    @classmethod
+    def extract_video_id(cls, url: str) -> Optional[str]:
+        """
+        Extrai o ID do vídeo de uma URL do YouTube sem acessar a rede.
+        
+        Args:
+            url: URL do vídeo
+            
+        Returns:
+            ID de 11 caracteres ou None se não reconhecido
+        """
+        match = re.search(cls.VIDEO_ID_PATTERN, url)
+        return match.group(1) if match else None
 
 
 class EmailValidator:
@@ -0,0 +1,132 @@
+"""
+Testes unitários para o serviço de download assíncrono.
+
+Valida concorrência, fluxo de progresso e cancelamento do
+AsyncDownloadService com serviços síncronos simulados.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from src.services.async_download_service import AsyncDownloadService, ProgressStream
+from src.models.video_info import DownloadRequest, VideoInfo
+from src.models.exceptions import DownloadError
+
+
+class TestAsyncDownloadService:
+    """Testes para a classe AsyncDownloadService."""
+
+    @pytest.fixture
+    def download_request(self):
+        """Fixture que retorna uma requisição de download de teste."""
+        return DownloadRequest(
+            url="https://www.youtube.com/watch?v=test123",
+            save_path="/tmp/downloads",
+            format_choice="Melhor qualidade"
+        )
+
+    def test_download_streams_progress(self, download_request):
+        """Testa entrega do progresso como iterador assíncrono."""
+        # Arrange
+        download_service = Mock()
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            for percent in ('10%', '60%'):
+                progress_callback({'status': 'downloading', '_percent_str': percent})
+            progress_callback({'status': 'finished'})
+        download_service.download.side_effect = fake_download
+        service = AsyncDownloadService(download_service=download_service, video_info_service=Mock())
+
+        async def run():
+            stream = ProgressStream()
+            task = asyncio.create_task(service.download(download_request, progress=stream))
+            received = [p async for p in stream]
+            await task
+            return received
+
+        # Act
+        received = asyncio.run(run())
+
+        # Assert
+        assert [p.percent for p in received] == [10.0, 60.0, 100.0]
+        service.shutdown()
+
+    def test_download_error_propagates(self, download_request):
+        """Testa propagação de erro do serviço síncrono."""
+        # Arrange
+        download_service = Mock()
+        download_service.download.side_effect = DownloadError("falhou")
+        service = AsyncDownloadService(download_service=download_service, video_info_service=Mock())
+
+        # Act & Assert
+        with pytest.raises(DownloadError):
+            asyncio.run(service.download(download_request))
+        service.shutdown()
+
+    def test_cancel_propagates_to_download(self, download_request):
+        """Testa interrupção do download ao cancelar a corrotina."""
+        # Arrange
+        started = threading.Event()
+        stopped = threading.Event()
+        download_service = Mock()
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            started.set()
+            try:
+                while True:
+                    progress_callback({'status': 'downloading', '_percent_str': '1%'})
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+        download_service.download.side_effect = fake_download
+        service = AsyncDownloadService(download_service=download_service, video_info_service=Mock())
+
+        async def run():
+            task = asyncio.create_task(service.download(download_request))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        assert stopped.is_set()
+        service.shutdown()
+
+    def test_concurrency_is_bounded(self):
+        """Testa limite de operações simultâneas pelo semáforo."""
+        # Arrange
+        active = []
+        peak = []
+        lock = threading.Lock()
+        info_service = Mock()
+
+        def fake_info(url):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(url)
+            return VideoInfo(title=url)
+        info_service.get_video_info.side_effect = fake_info
+        service = AsyncDownloadService(
+            download_service=Mock(), video_info_service=info_service, max_concurrent=3
+        )
+
+        async def run():
+            return await asyncio.gather(*(service.get_info(f"url-{i}") for i in range(20)))
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        assert len(results) == 20
+        assert max(peak) <= 3
+        service.shutdown()
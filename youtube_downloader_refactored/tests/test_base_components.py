@@ -0,0 +1,58 @@
+"""
+Testes unitários para os componentes base de UI.
+
+Valida as transições de estado do StatusLabel sem reaplicar a folha
+de estilo.
+"""
+
+import pytest
+from unittest.mock import patch
+from PyQt5.QtWidgets import QApplication
+from src.ui.base_components import StatusLabel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Fixture que garante uma QApplication para os widgets."""
+    return QApplication.instance() or QApplication([])
+
+
+class TestStatusLabel:
+    """Testes para a classe StatusLabel."""
+
+    @pytest.fixture
+    def label(self, qapp):
+        """Fixture que retorna um StatusLabel novo."""
+        return StatusLabel()
+
+    def test_states(self, label):
+        """Testa texto e propriedade de estado de cada tipo de mensagem."""
+        # Act & Assert
+        label.show_success("Pronto")
+        assert label.text() == "✔ Pronto"
+        assert label.property("state") == StatusLabel.SUCCESS
+
+        label.show_error("Falhou")
+        assert label.text() == "❌ Falhou"
+        assert label.property("state") == StatusLabel.ERROR
+
+        label.clear()
+        assert label.text() == ""
+        assert label.state == StatusLabel.ERROR
+
+    def test_updates_do_not_touch_stylesheet(self, label):
+        """Testa que mensagens repetidas não reaplicam estilo nem repolem o widget."""
+        # Arrange
+        stylesheet = label.styleSheet()
+
+        with patch.object(label, 'setStyleSheet') as set_style, \
+                patch.object(label.style(), 'polish') as polish:
+            # Act
+            for value in range(50):
+                label.show_info(f"📥 Baixando... {value}%")
+            label.show_success("Download finalizado!")
+
+        # Assert
+        set_style.assert_not_called()
+        assert polish.call_count == 1
+        assert label.styleSheet() == stylesheet
@@ -0,0 +1,154 @@
+"""
+Testes unitários para a resolução de metadados em lote.
+
+Valida paralelismo, remoção de repetidos, erros por URL, limite de
+taxa e cancelamento.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from src.services.batch_resolver import BatchResolver
+from src.models.video_info import VideoInfo
+from src.models.exceptions import VideoInfoError
+from src.utils.rate_limiter import RateLimiter
+from src.utils.validators import URLValidator
+
+LATENCY = 0.05
+
+
+def _url(n: int) -> str:
+    """Monta uma URL de vídeo com ID de 11 caracteres."""
+    return f"https://www.youtube.com/watch?v=vid{n:08d}"
+
+
+class _SlowInfoService:
+    """Serviço de metadados falso com latência de rede fixa."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_video_info(self, url):
+        with self._lock:
+            self.calls += 1
+        time.sleep(LATENCY)
+        if 'fail' in url:
+            raise VideoInfoError("Vídeo indisponível")
+        return VideoInfo(title=url, video_id=URLValidator.extract_video_id(url))
+
+
+class TestBatchResolver:
+    """Testes para a classe BatchResolver."""
+
+    @pytest.fixture
+    def service(self):
+        """Fixture que retorna o serviço de metadados falso."""
+        return _SlowInfoService()
+
+    def test_resolves_in_parallel(self, service):
+        """Testa que o lote leva uma fração do tempo da resolução sequencial."""
+        # Arrange
+        urls = [_url(n) for n in range(40)]
+        resolver = BatchResolver(service, max_workers=8, rate_limit=None)
+
+        # Act
+        start = time.monotonic()
+        results = list(resolver.resolve(urls))
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert len(results) == 40
+        assert all(result.ok for result in results)
+        serial = len(urls) * LATENCY
+        assert elapsed < serial / 3
+
+    def test_deduplicates_by_video_id(self, service):
+        """Testa que links diferentes para o mesmo vídeo são resolvidos uma vez."""
+        # Arrange
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+            "  ",
+        ]
+        resolver = BatchResolver(service, rate_limit=None)
+
+        # Act
+        results = list(resolver.resolve(urls))
+
+        # Assert
+        assert len(results) == 1
+        assert results[0].video_id == "dQw4w9WgXcQ"
+        assert service.calls == 1
+
+    def test_errors_are_reported_per_url(self, service):
+        """Testa que URLs inválidas e falhas não interrompem o lote."""
+        # Arrange
+        urls = ["https://example.com/video", _url(1), "https://www.youtube.com/watch?v=failfailfai"]
+        resolver = BatchResolver(service, rate_limit=None)
+
+        # Act
+        results = {result.url: result for result in resolver.resolve(urls)}
+
+        # Assert
+        assert "URL inválida" in results["https://example.com/video"].error
+        assert results[_url(1)].ok
+        assert results["https://www.youtube.com/watch?v=failfailfai"].error == "Vídeo indisponível"
+        assert service.calls == 2
+
+    def test_cancel_skips_pending_urls(self, service):
+        """Testa que o cancelamento abandona as resoluções ainda não iniciadas."""
+        # Arrange
+        urls = [_url(n) for n in range(20)]
+        resolver = BatchResolver(service, max_workers=2, rate_limit=None)
+        cancel_event = threading.Event()
+
+        # Act
+        results = []
+        for result in resolver.resolve(urls, cancel_event):
+            results.append(result)
+            cancel_event.set()
+        time.sleep(LATENCY * 3)
+
+        # Assert
+        assert len(results) < 20
+        assert service.calls <= 4
+
+
+class TestRateLimiter:
+    """Testes para a classe RateLimiter."""
+
+    def test_spaces_requests_after_burst(self):
+        """Testa que, após a rajada inicial, as fichas seguem a taxa configurada."""
+        # Arrange
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = RateLimiter(rate=2.0, burst=3, clock=lambda: now[0], sleep=sleep)
+
+        # Act
+        for _ in range(7):
+            limiter.acquire()
+
+        # Assert
+        assert sleeps == [0.5] * 4
+        assert now[0] == pytest.approx(2.0)
+
+    def test_unlimited(self):
+        """Testa que sem taxa configurada não há espera."""
+        # Arrange
+        sleep = MagicMock()
+        limiter = RateLimiter(rate=None, sleep=sleep)
+
+        # Act
+        for _ in range(100):
+            limiter.acquire()
+
+        # Assert
+        sleep.assert_not_called()
@@ -0,0 +1,227 @@
+"""
+Testes unitários para a sincronização incremental de canais.
+
+Usa um canal simulado, paginado de forma preguiçosa como as abas do
+YouTube, para validar a parada antecipada ao alcançar itens conhecidos,
+as marcas d'água, a nova tentativa de downloads que falharam (mesmo
+além do trecho conhecido) e a linha de base.
+"""
+
+import pytest
+from contextlib import contextmanager
+from unittest.mock import Mock
+from src.models.exceptions import DownloadError
+from src.services.channel_sync import ChannelSync
+from src.services.sync_store import SyncStore
+
+CHANNEL = "https://www.youtube.com/@canal/videos"
+PAGE_SIZE = 10
+
+
+class _FakeChannel:
+    """Canal simulado: vídeos do mais novo para o mais antigo, em páginas."""
+
+    def __init__(self, count: int):
+        self.videos = [self._video(n) for n in range(count)]
+        self.pages_fetched = 0
+
+    @staticmethod
+    def _video(n: int) -> dict:
+        return {
+            '_type': 'url', 'ie_key': 'Youtube', 'id': f"v{n:05d}",
+            'url': f"https://www.youtube.com/watch?v=v{n:05d}",
+        }
+
+    def upload(self, count: int) -> None:
+        """Publica vídeos novos no topo da lista."""
+        start = len(self.videos)
+        self.videos[:0] = [self._video(n) for n in range(start + count - 1, start - 1, -1)]
+
+    def entries(self):
+        for offset in range(0, len(self.videos), PAGE_SIZE):
+            self.pages_fetched += 1
+            yield from list(self.videos[offset:offset + PAGE_SIZE])
+
+    def extract_info(self, url, download=False, ie_key=None, process=True):
+        assert process is False
+        return {'_type': 'playlist', 'id': 'canal', 'entries': self.entries()}
+
+
+class _FakePool:
+    """Pool que entrega sempre o mesmo yt-dlp simulado."""
+
+    def __init__(self, ydl):
+        self.ydl = ydl
+
+    @contextmanager
+    def checkout(self, options):
+        yield self.ydl
+
+
+class TestChannelSync:
+    """Testes para a classe ChannelSync."""
+
+    @pytest.fixture
+    def channel(self):
+        """Fixture que retorna um canal com 200 vídeos."""
+        return _FakeChannel(200)
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Fixture que retorna as marcas d'água em um banco temporário."""
+        return SyncStore(str(tmp_path / "sync.db"))
+
+    @pytest.fixture
+    def service(self):
+        """Fixture que retorna um serviço de download simulado."""
+        return Mock()
+
+    @pytest.fixture
+    def sync(self, channel, store, service):
+        """Fixture que retorna a sincronização com o canal simulado."""
+        return ChannelSync(store, download_service=service, ydl_pool=_FakePool(channel), known_streak=5)
+
+    def test_first_sync_downloads_everything_oldest_first(self, sync, store, service):
+        """Testa que a primeira sincronização baixa o canal inteiro, do mais antigo ao mais novo."""
+        # Act
+        result = sync.sync(CHANNEL, "/tmp/espelho", "Apenas áudio (MP3)")
+
+        # Assert
+        assert len(result.downloaded) == 200
+        assert not result.stopped_early
+        urls = [call.args[0].url for call in service.download.call_args_list]
+        assert urls[0].endswith("v00199") and urls[-1].endswith("v00000")
+        assert service.download.call_args.args[0].format_choice == "Apenas áudio (MP3)"
+        source = store.get_source(CHANNEL)
+        assert (source.save_path, source.last_video_id) == ("/tmp/espelho", "v00000")
+        assert source.last_synced_at is not None
+
+    def test_incremental_sync_stops_at_known_items(self, sync, channel, service):
+        """Testa que só os envios novos são baixados e a enumeração para cedo."""
+        # Arrange
+        sync.sync(CHANNEL, "/tmp/espelho")
+        channel.upload(3)
+        service.download.reset_mock()
+        channel.pages_fetched = 0
+
+        # Act
+        result = sync.sync(CHANNEL)
+
+        # Assert
+        assert result.downloaded == ["v00200", "v00201", "v00202"]
+        assert result.stopped_early
+        assert result.enumerated == 3 + 5
+        assert channel.pages_fetched == 1
+        assert service.download.call_args.args[0].save_path == "/tmp/espelho"
+
+    def test_failed_download_is_retried(self, sync, channel, service, store):
+        """Testa que um download que falhou continua novo na próxima sincronização."""
+        # Arrange
+        sync.sync(CHANNEL)
+        channel.upload(2)
+
+        def fake_download(request):
+            if request.url.endswith("v00200"):
+                raise DownloadError("falhou")
+        service.download.side_effect = fake_download
+
+        # Act
+        first = sync.sync(CHANNEL)
+        service.download.side_effect = None
+        second = sync.sync(CHANNEL)
+
+        # Assert
+        assert first.downloaded == ["v00201"]
+        assert first.failed == {"v00200": "falhou"}
+        assert second.downloaded == ["v00200"]
+        assert "v00200" in store.known_ids(CHANNEL)
+
+    def test_failed_download_beyond_known_streak_is_retried(self, sync, channel, service, store):
+        """Testa que uma falha coberta por itens mais novos já vistos ainda é tentada de novo."""
+        # Arrange
+        sync.sync(CHANNEL)
+        channel.upload(6)
+
+        def fake_download(request):
+            if request.url.endswith("v00200"):
+                raise DownloadError("falhou")
+        service.download.side_effect = fake_download
+
+        # Act
+        first = sync.sync(CHANNEL)
+        service.download.side_effect = None
+        second = sync.sync(CHANNEL)
+        third = sync.sync(CHANNEL)
+
+        # Assert
+        assert first.failed == {"v00200": "falhou"}
+        assert second.stopped_early
+        assert second.enumerated == 5
+        assert second.downloaded == ["v00200"]
+        assert third.downloaded == []
+        assert store.pending(CHANNEL) == []
+
+    def test_upload_date_watermark_stops_enumeration(self, sync, channel, service):
+        """Testa a parada no primeiro item anterior à marca d'água de data."""
+        # Arrange
+        for n, video in enumerate(channel.videos):
+            video['upload_date'] = f"2024{12 - min(n, 11):02d}01"
+        sync.sync(CHANNEL)
+        channel.upload(1)
+        channel.videos[0]['upload_date'] = "20250101"
+        channel.videos[1]['id'] = "v-nunca-visto"
+
+        # Act
+        result = sync.sync(CHANNEL)
+
+        # Assert
+        assert result.downloaded == ["v-nunca-visto", "v00200"]
+        assert result.stopped_early
+        assert result.enumerated == 3
+
+    def test_baseline_marks_without_downloading(self, sync, channel, service):
+        """Testa que a linha de base registra o canal sem baixar o acervo."""
+        # Act
+        baseline = sync.sync(CHANNEL, baseline=True)
+        channel.upload(1)
+        result = sync.sync(CHANNEL)
+
+        # Assert
+        assert len(baseline.downloaded) == 200
+        assert result.downloaded == ["v00200"]
+        assert service.download.call_count == 1
+
+    def test_nested_tabs_and_redirects(self, store, service):
+        """Testa canais com abas aninhadas e URLs redirecionadas."""
+        # Arrange
+        videos, shorts = _FakeChannel(3), _FakeChannel(2)
+        shorts.videos = [dict(video, id=f"s{n}") for n, video in enumerate(shorts.videos)]
+        ydl = Mock()
+        ydl.extract_info.side_effect = lambda url, download, ie_key, process: {
+            "https://www.youtube.com/@canal": {'_type': 'url', 'url': "https://www.youtube.com/@canal/tabs"},
+            "https://www.youtube.com/@canal/tabs": {'_type': 'playlist', 'entries': iter([
+                {'_type': 'playlist', 'entries': videos.entries()},
+                {'_type': 'url', 'ie_key': 'YoutubeTab', 'url': "https://www.youtube.com/@canal/shorts"},
+            ])},
+            "https://www.youtube.com/@canal/shorts": {'_type': 'playlist', 'entries': shorts.entries()},
+        }[url]
+        sync = ChannelSync(store, download_service=service, ydl_pool=_FakePool(ydl))
+
+        # Act
+        result = sync.sync("https://www.youtube.com/@canal")
+
+        # Assert
+        assert sorted(result.downloaded) == ["s0", "s1", "v00000", "v00001", "v00002"]
+
+    def test_sync_all_uses_registered_sources(self, sync, store, service):
+        """Testa que sync_all percorre as fontes registradas com seus destinos."""
+        # Arrange
+        sync.sync(CHANNEL, "/tmp/espelho", baseline=True)
+
+        # Act
+        results = sync.sync_all()
+
+        # Assert
+        assert [result.url for result in results] == [CHANNEL]
+        assert [source.save_path for source in store.sources()] == ["/tmp/espelho"]
+        service.download.assert_not_called()
@@ -0,0 +1,148 @@
+"""
+Testes unitários para o armazenamento por conteúdo.
+
+Valida a deduplicação por hard link, a contagem de referências, a coleta
+de lixo e a preservação do arquivo quando não é possível criar o link.
+"""
+
+import errno
+import os
+import pytest
+from unittest.mock import patch
+from src.services.content_store import ContentStore
+
+
+def _write(path, content: bytes) -> str:
+    """Cria um arquivo com o conteúdo informado."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestContentStore:
+    """Testes para a classe ContentStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Fixture que retorna um armazenamento que usa hard links."""
+        return ContentStore(str(tmp_path / "store"), link_mode=ContentStore.MODE_HARDLINK)
+
+    def test_identical_files_share_one_object(self, store, tmp_path):
+        """Testa que cópias iguais em pastas diferentes passam a ocupar o espaço de uma."""
+        # Arrange
+        first = _write(tmp_path / "ana" / "video.mp4", b"conteudo" * 1000)
+        second = _write(tmp_path / "bruno" / "copia.mp4", b"conteudo" * 1000)
+
+        # Act
+        digest = store.ingest(first)
+        same = store.ingest(second)
+
+        # Assert
+        assert same == digest
+        assert os.path.samefile(first, second)
+        assert os.path.samefile(first, store.object_path(digest))
+        assert store.references(digest) == 2
+        stats = store.stats()
+        assert (stats.objects, stats.references) == (1, 2)
+        assert stats.saved_bytes == 8000
+
+    def test_different_content_kept_apart(self, store, tmp_path):
+        """Testa que conteúdos diferentes geram objetos distintos."""
+        # Arrange
+        first = _write(tmp_path / "a.mp4", b"um")
+        second = _write(tmp_path / "b.mp4", b"dois")
+
+        # Act
+        digests = {store.ingest(first), store.ingest(second)}
+
+        # Assert
+        assert len(digests) == 2
+        assert store.stats().saved_bytes == 0
+
+    def test_ingest_twice_is_idempotent(self, store, tmp_path):
+        """Testa que registrar de novo o mesmo caminho não duplica a referência."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", b"video")
+
+        # Act
+        digest = store.ingest(path)
+        store.ingest(path)
+
+        # Assert
+        assert store.references(digest) == 1
+
+    def test_garbage_collection_keeps_referenced_objects(self, store, tmp_path):
+        """Testa que o objeto sobrevive enquanto algum destino o referencia."""
+        # Arrange
+        first = _write(tmp_path / "a" / "video.mp4", b"video")
+        second = _write(tmp_path / "b" / "video.mp4", b"video")
+        digest = store.ingest(first)
+        store.ingest(second)
+        os.remove(first)
+
+        # Act
+        removed, freed = store.collect_garbage()
+
+        # Assert
+        assert (removed, freed) == (0, 0)
+        assert store.references(digest) == 1
+        assert os.path.exists(store.object_path(digest))
+
+    def test_garbage_collection_removes_orphans(self, store, tmp_path):
+        """Testa a remoção do objeto quando todos os destinos foram apagados."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", b"video")
+        digest = store.ingest(path)
+        os.remove(path)
+
+        # Act
+        removed, freed = store.collect_garbage()
+
+        # Assert
+        assert (removed, freed) == (1, 5)
+        assert not os.path.exists(store.object_path(digest))
+        assert store.stats().objects == 0
+
+    def test_replaced_file_drops_reference(self, store, tmp_path):
+        """Testa que um arquivo substituído por outro conteúdo deixa de referenciar o objeto."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", b"video")
+        digest = store.ingest(path)
+        os.remove(path)
+        _write(tmp_path / "a.mp4", b"outro video")
+
+        # Act
+        store.collect_garbage()
+
+        # Assert
+        assert store.references(digest) == 0
+        assert (tmp_path / "a.mp4").read_bytes() == b"outro video"
+
+    def test_file_untouched_when_link_fails(self, store, tmp_path):
+        """Testa que um destino em outro disco fica intacto e sem deduplicação."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", b"video")
+
+        with patch('src.services.content_store.os.link', side_effect=OSError(errno.EXDEV, "cross-device")):
+            # Act
+            digest = store.ingest(path)
+
+        # Assert
+        assert digest is None
+        assert (tmp_path / "a.mp4").read_bytes() == b"video"
+        assert store.stats().references == 0
+
+    def test_auto_mode_falls_back_to_hard_link(self, tmp_path):
+        """Testa que sem suporte a reflink o modo automático usa hard links."""
+        # Arrange
+        store = ContentStore(str(tmp_path / "store"))
+        first = _write(tmp_path / "a.mp4", b"video")
+        second = _write(tmp_path / "b.mp4", b"video")
+
+        with patch.object(ContentStore, '_reflink', side_effect=OSError(errno.EOPNOTSUPP, "sem reflink")):
+            # Act
+            store.ingest(first)
+            store.ingest(second)
+
+        # Assert
+        assert os.path.samefile(first, second)
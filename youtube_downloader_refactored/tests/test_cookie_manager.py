@@ -0,0 +1,125 @@
+"""
+Testes unitários para o gerenciador de cookies.
+
+Valida carga única, recarga por mtime e escrita atômica do CookieJarManager.
+"""
+
+import os
+import threading
+import pytest
+from unittest.mock import Mock
+from yt_dlp.cookies import YoutubeDLCookieJar
+from src.services.cookie_manager import CookieJarManager
+from src.models.exceptions import CookiesNotFoundError
+
+COOKIES = (
+    "# Netscape HTTP Cookie File\n"
+    ".youtube.com\tTRUE\t/\tTRUE\t1999999999\tSID\tabc\n"
+)
+
+
+class TestCookieJarManager:
+    """Testes para a classe CookieJarManager."""
+
+    @pytest.fixture
+    def cookies_file(self, tmp_path):
+        """Fixture que cria um arquivo de cookies válido."""
+        path = tmp_path / "cookies.txt"
+        path.write_text(COOKIES)
+        return path
+
+    def test_parses_once_while_unchanged(self, cookies_file):
+        """Testa que o arquivo é interpretado uma única vez."""
+        # Arrange
+        manager = CookieJarManager(str(cookies_file))
+
+        # Act
+        jars = [manager.get_jar() for _ in range(10)]
+
+        # Assert
+        assert manager.load_count == 1
+        assert all(jar is jars[0] for jar in jars)
+        assert {c.name for c in jars[0]} == {'SID'}
+
+    def test_reloads_when_mtime_changes(self, cookies_file):
+        """Testa recarga quando o arquivo é alterado."""
+        # Arrange
+        manager = CookieJarManager(str(cookies_file))
+        jar = manager.get_jar()
+        cookies_file.write_text(COOKIES.replace('abc', 'xyz'))
+        stat = cookies_file.stat()
+        os.utime(cookies_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        # Act
+        reloaded = manager.get_jar()
+
+        # Assert
+        assert reloaded is jar
+        assert manager.load_count == 2
+        assert [c.value for c in reloaded] == ['xyz']
+
+    def test_attach_shares_jar(self, cookies_file):
+        """Testa que todas as instâncias recebem o mesmo jar."""
+        # Arrange
+        manager = CookieJarManager(str(cookies_file))
+        first, second = Mock(), Mock()
+
+        # Act
+        manager.attach(first)
+        manager.attach(second)
+
+        # Assert
+        assert first.cookiejar is second.cookiejar
+
+    def test_save_skips_unchanged_jar(self, cookies_file):
+        """Testa que nada é gravado quando o jar não mudou."""
+        # Arrange
+        manager = CookieJarManager(str(cookies_file))
+        manager.get_jar()
+
+        # Act & Assert
+        assert manager.save() is False
+
+    def test_concurrent_saves_keep_file_valid(self, cookies_file):
+        """Testa que gravações concorrentes não corrompem o arquivo."""
+        # Arrange
+        manager = CookieJarManager(str(cookies_file))
+        jar = manager.get_jar()
+        template = next(iter(jar))
+
+        def worker(index):
+            for n in range(20):
+                cookie = YoutubeDLCookieJar()
+                cookie.set_cookie(template)
+                changed = next(iter(cookie))
+                changed.value = f"{index}-{n}"
+                jar.set_cookie(changed)
+                manager.save()
+
+        # Act
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        reread = YoutubeDLCookieJar(str(cookies_file))
+        reread.load()
+        assert {c.name for c in reread} == {'SID'}
+        assert not [p for p in os.listdir(cookies_file.parent) if p.endswith('.tmp')]
+
+    def test_missing_file(self, tmp_path):
+        """Testa erro quando o arquivo de cookies não existe."""
+        # Arrange
+        manager = CookieJarManager(str(tmp_path / "missing.txt"))
+
+        # Act & Assert
+        assert manager.exists() is False
+        with pytest.raises(CookiesNotFoundError):
+            manager.get_jar()
+
+    def test_shared_returns_same_instance(self, cookies_file):
+        """Testa registro compartilhado por caminho."""
+        # Act & Assert
+        assert CookieJarManager.shared(str(cookies_file)) is CookieJarManager.shared(str(cookies_file))
@@ -0,0 +1,112 @@
+"""
+Testes de integração do daemon de downloads.
+
+Valida a API HTTP local usando o DaemonClient contra um servidor real
+em porta livre e um serviço de download simulado.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+from src.services.daemon_server import DownloadDaemon
+from src.services.daemon_client import DaemonClient
+from src.services.job_manager import JobManager
+from src.models.video_info import DownloadRequest, VideoInfo
+from src.models.exceptions import JobNotFoundError, DaemonError
+
+
+class TestDownloadDaemon:
+    """Testes para o DownloadDaemon e o DaemonClient."""
+
+    @pytest.fixture
+    def service(self):
+        """Fixture que retorna um serviço de download simulado."""
+        service = Mock()
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            progress_callback({'status': 'downloading', '_percent_str': '42.0%', 'eta': 3})
+        service.download.side_effect = fake_download
+        return service
+
+    @pytest.fixture
+    def info_service(self):
+        """Fixture que retorna um serviço de metadados simulado."""
+        info_service = Mock()
+        info_service.get_video_info.side_effect = lambda url: VideoInfo(
+            title=f"Vídeo {url[-11:]}", video_id=url[-11:], duration=60
+        )
+        return info_service
+
+    @pytest.fixture
+    def client(self, service, info_service):
+        """Fixture que inicia um daemon em porta livre e retorna o cliente."""
+        manager = JobManager(download_service=service, max_concurrent=2)
+        daemon = DownloadDaemon(manager=manager, video_info_service=info_service, port=0)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        yield DaemonClient(daemon.address)
+        daemon.shutdown()
+        thread.join(5)
+
+    @pytest.fixture
+    def download_request(self):
+        """Fixture que retorna uma requisição de download de teste."""
+        return DownloadRequest(
+            url="https://www.youtube.com/watch?v=test123",
+            save_path="/tmp/downloads",
+            format_choice="Melhor qualidade"
+        )
+
+    def test_submit_and_stream_events(self, client, download_request):
+        """Testa submissão de job e acompanhamento dos eventos até o fim."""
+        # Act
+        job = client.submit(download_request)
+        events = list(client.iter_events(job['job_id']))
+
+        # Assert
+        assert events[-1]['job']['status'] == 'completed'
+        assert client.get_job(job['job_id'])['status'] == 'completed'
+        assert any(job['job_id'] == j['job_id'] for j in client.list_jobs())
+
+    def test_unknown_job(self, client):
+        """Testa consulta de job inexistente."""
+        # Act & Assert
+        with pytest.raises(JobNotFoundError):
+            client.get_job("deadbeef")
+
+    def test_resolve_batch(self, client, info_service):
+        """Testa resolução em lote com URLs repetidas e inválidas."""
+        # Arrange
+        urls = [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "https://youtu.be/aaaaaaaaaaa",
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+            "https://example.com/video",
+        ]
+
+        # Act
+        results = list(client.resolve_batch(urls))
+
+        # Assert
+        assert sorted(r['video_id'] for r in results if r['video_id']) == ['aaaaaaaaaaa', 'bbbbbbbbbbb']
+        assert [r['url'] for r in results if r['error']] == ["https://example.com/video"]
+        assert info_service.get_video_info.call_count == 2
+
+    def test_cache_stats(self, client):
+        """Testa consulta às estatísticas do cache do yt-dlp."""
+        # Act
+        stats = client.cache_stats()
+
+        # Assert
+        assert {'hits', 'misses', 'size_bytes', 'warm_latency_mean'} <= set(stats)
+
+    def test_daemon_unavailable(self):
+        """Testa erro quando o daemon não está em execução."""
+        # Arrange
+        client = DaemonClient("http://127.0.0.1:1", timeout=1)
+
+        # Act & Assert
+        assert client.is_available() is False
+        with pytest.raises(DaemonError):
+            client.list_jobs()
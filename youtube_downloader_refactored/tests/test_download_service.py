@@ -4,11 +4,16 @@ Testes unitários para o serviço de download.
 Valida o comportamento do DownloadService e ProgressParser.
 """
 
+import sqlite3
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from src.services.download_service import DownloadService, ProgressParser
 from src.models.video_info import DownloadRequest, DownloadProgress
-from src.models.exceptions import DownloadError, CookiesNotFoundError
+from src.services.job_control import JobControl
+from src.models.exceptions import (
+    DownloadError, DownloadCancelledError, CookiesNotFoundError, InsufficientDiskSpaceError
+)
 
 
 class TestDownloadService:
@@ -17,7 +22,7 @@ class TestDownloadService:
     @pytest.fixture
     def download_service(self):
         """Fixture que retorna uma instância do DownloadService."""
-        return DownloadService(cookies_file="test_cookies.txt")
+        return DownloadService(cookies_file="test_cookies.txt", cookie_manager=Mock())
     
     @pytest.fixture
     def download_request(self):
@@ -54,6 +59,8 @@ class TestDownloadService:
             
             # Assert
             mock_ydl.download.assert_called_once_with([download_request.url])
+            download_service._cookie_manager.attach.assert_called_once_with(mock_ydl)
+            download_service._cookie_manager.save.assert_called_once()
     
     def test_download_failure(self, download_service, download_request):
         """Testa falha no download."""
@@ -71,6 +78,27 @@ class TestDownloadService:
             
             assert "Erro durante o download" in str(exc_info.value)
     
+    def test_download_failure_saves_job_log(self, download_service, download_request):
+        """Testa que a falha grava o registro do job e informa o arquivo."""
+        # Arrange
+        control = JobControl()
+        with patch('os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class, \
+             patch.object(control.log, 'flush', return_value="/logs/jobs.log") as flush:
+            
+            mock_ydl = MagicMock()
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            mock_ydl.download.side_effect = Exception("Download failed")
+            
+            # Act
+            with pytest.raises(DownloadError) as exc_info:
+                download_service.download(download_request, control=control)
+            
+            # Assert
+            flush.assert_called_once()
+            assert "/logs/jobs.log" in str(exc_info.value)
+            assert "Exception: Download failed" in control.log.lines()[-1]
+    
     def test_build_download_options(self, download_service, download_request):
         """Testa construção de opções de download."""
         # Arrange
@@ -82,10 +110,294 @@ class TestDownloadService:
         # Assert
         assert 'format' in options
         assert 'outtmpl' in options
-        assert 'cookiefile' in options
+        # Os cookies vêm do jar compartilhado, não do arquivo por instância
+        assert 'cookiefile' not in options
         assert 'progress_hooks' in options
         assert callback in options['progress_hooks']
 
+    def test_build_download_options_with_connections(self, download_service, download_request):
+        """Testa a escolha do download em segmentos paralelos por job."""
+        # Arrange
+        download_request.connections = 4
+        
+        # Act
+        options = download_service._build_download_options(download_request, None)
+        
+        # Assert
+        assert options['range_connections'] == 4
+        assert 'range_connections' not in download_service._build_download_options(
+            DownloadRequest("https://youtu.be/x", "/tmp", "Melhor qualidade"), None
+        )
+
+    def test_download_cancelled(self, download_service, download_request):
+        """Testa conversão do cancelamento em DownloadCancelledError."""
+        # Arrange
+        control = JobControl()
+        
+        with patch('os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            def fake_download(urls):
+                hook = mock_ydl._progress_hooks[0]
+                control.cancel()
+                hook({'status': 'downloading'})
+            mock_ydl.download.side_effect = fake_download
+            
+            # Act & Assert
+            with pytest.raises(DownloadCancelledError):
+                download_service.download(download_request, control=control)
+
+    def test_download_staged_in_scratch(self, download_request, tmp_path):
+        """Testa download no diretório de rascunho e entrega ao destino."""
+        # Arrange
+        scratch = tmp_path / "scratch"
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        download_request.save_path = str(dest)
+        service = DownloadService(
+            cookies_file="test_cookies.txt", cookie_manager=Mock(), scratch_dir=str(scratch)
+        )
+        
+        with patch('src.services.download_service.os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl.params = {}
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            def fake_download(urls):
+                outtmpl = mock_ydl.params['outtmpl']['default']
+                final = outtmpl.replace('%(ext)s', 'mp4')
+                with open(final, 'wb') as f:
+                    f.write(b'video')
+                mock_ydl._post_hooks[0](final)
+            mock_ydl.download.side_effect = fake_download
+            
+            # Act
+            service.download(download_request)
+        
+        # Assert
+        assert (dest / "Test Video.mp4").read_bytes() == b'video'
+        assert list(scratch.iterdir()) == []
+    
+    def test_staged_download_keeps_existing_file(self, download_request, tmp_path):
+        """Testa que o download no rascunho não sobrescreve um arquivo já existente no destino."""
+        # Arrange
+        scratch = tmp_path / "scratch"
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "Test Video.mp4").write_bytes(b'original')
+        download_request.save_path = str(dest)
+        service = DownloadService(
+            cookies_file="test_cookies.txt", cookie_manager=Mock(), scratch_dir=str(scratch)
+        )
+        
+        with patch('src.services.download_service.os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl.params = {}
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            def fake_download(urls):
+                final = mock_ydl.params['outtmpl']['default'].replace('%(ext)s', 'mp4')
+                with open(final, 'wb') as f:
+                    f.write(b'video')
+                mock_ydl._post_hooks[0](final)
+            mock_ydl.download.side_effect = fake_download
+            
+            # Act
+            service.download(download_request)
+        
+        # Assert
+        assert (dest / "Test Video.mp4").read_bytes() == b'original'
+        assert list(scratch.iterdir()) == []
+    
+    def test_download_recorded_in_history(self, download_request, tmp_path):
+        """Testa o registro no histórico dos arquivos entregues ao destino."""
+        # Arrange
+        download_request.save_path = str(tmp_path / "dest")
+        (tmp_path / "dest").mkdir()
+        history_store = Mock()
+        service = DownloadService(
+            cookies_file="test_cookies.txt", cookie_manager=Mock(),
+            scratch_dir=str(tmp_path / "scratch"), history_store=history_store
+        )
+        
+        with patch('src.services.download_service.os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl.params = {}
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            def fake_download(urls):
+                final = mock_ydl.params['outtmpl']['default'].replace('%(ext)s', 'mp4')
+                with open(final, 'wb') as f:
+                    f.write(b'video')
+                for hook in mock_ydl._progress_hooks:
+                    hook({'status': 'finished', 'info_dict': {'id': 'test123', 'title': 'Título', 'channel': 'Canal'}})
+                for hook in mock_ydl._post_hooks:
+                    hook(final)
+            mock_ydl.download.side_effect = fake_download
+            
+            # Act
+            service.download(download_request)
+        
+        # Assert
+        (entry,), = history_store.add_many.call_args.args
+        assert entry.file_path == str(tmp_path / "dest" / "Test Video.mp4")
+        assert (entry.video_id, entry.channel, entry.size_bytes) == ('test123', 'Canal', 5)
+    
+    def test_download_deduplicated_in_content_store(self, download_request, tmp_path):
+        """Testa a entrega dos arquivos finais ao armazenamento por conteúdo."""
+        # Arrange
+        download_request.save_path = str(tmp_path / "dest")
+        (tmp_path / "dest").mkdir()
+        content_store = Mock()
+        service = DownloadService(
+            cookies_file="test_cookies.txt", cookie_manager=Mock(),
+            scratch_dir=str(tmp_path / "scratch"), content_store=content_store
+        )
+        
+        with patch('src.services.download_service.os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl.params = {}
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            def fake_download(urls):
+                final = mock_ydl.params['outtmpl']['default'].replace('%(ext)s', 'mp4')
+                with open(final, 'wb') as f:
+                    f.write(b'video')
+                for hook in mock_ydl._post_hooks:
+                    hook(final)
+            mock_ydl.download.side_effect = fake_download
+            
+            # Act
+            service.download(download_request)
+        
+        # Assert
+        content_store.ingest.assert_called_once_with(str(tmp_path / "dest" / "Test Video.mp4"))
+    
+    def test_content_store_failure_does_not_fail_download(self, download_request, tmp_path):
+        """Testa que um store.db ocupado só deixa o arquivo sem deduplicação."""
+        # Arrange
+        download_request.save_path = str(tmp_path / "dest")
+        (tmp_path / "dest").mkdir()
+        content_store = Mock()
+        content_store.ingest.side_effect = sqlite3.OperationalError("database is locked")
+        cookie_manager = Mock()
+        history_store = Mock()
+        service = DownloadService(
+            cookies_file="test_cookies.txt", cookie_manager=cookie_manager,
+            scratch_dir=str(tmp_path / "scratch"), content_store=content_store,
+            history_store=history_store
+        )
+        
+        with patch('src.services.download_service.os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl.params = {}
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            def fake_download(urls):
+                final = mock_ydl.params['outtmpl']['default'].replace('%(ext)s', 'mp4')
+                with open(final, 'wb') as f:
+                    f.write(b'video')
+                for hook in mock_ydl._post_hooks:
+                    hook(final)
+            mock_ydl.download.side_effect = fake_download
+            
+            # Act
+            service.download(download_request)
+        
+        # Assert
+        assert (tmp_path / "dest" / "Test Video.mp4").read_bytes() == b'video'
+        history_store.add_many.assert_called_once()
+        cookie_manager.save.assert_called_once()
+    
+    def test_download_insufficient_space(self, download_service, download_request):
+        """Testa que a falta de espaço não é mascarada como erro genérico."""
+        # Arrange
+        with patch('os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            mock_ydl.download.side_effect = InsufficientDiskSpaceError("Espaço insuficiente")
+            
+            # Act & Assert
+            with pytest.raises(InsufficientDiskSpaceError):
+                download_service.download(download_request)
+
+    def test_live_request_uses_live_recorder(self, download_request):
+        """Testa que transmissões ao vivo são gravadas pelo LiveRecorder."""
+        # Arrange
+        recorder = Mock()
+        service = DownloadService(cookies_file="test_cookies.txt", cookie_manager=Mock(), live_recorder=recorder)
+        download_request.live = True
+        control = JobControl()
+
+        with patch('os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            # Act
+            service.download(download_request, control=control)
+
+        # Assert
+        recorder.record.assert_called_once_with(download_request, None, control)
+        mock_ydl_class.assert_not_called()
+
+    def test_live_failure_saves_job_log(self, download_request):
+        """Testa que a falha de uma gravação ao vivo traz o registro do job, como nos downloads."""
+        # Arrange
+        recorder = Mock()
+        recorder.record.side_effect = DownloadError("Erro durante a gravação: conexão reiniciada")
+        service = DownloadService(cookies_file="test_cookies.txt", cookie_manager=Mock(), live_recorder=recorder)
+        download_request.live = True
+        control = JobControl()
+        control.log.flush = Mock(return_value="/logs/jobs.log")
+
+        with patch('os.path.exists', return_value=True):
+            # Act & Assert
+            with pytest.raises(DownloadError, match="conexão reiniciada\nRegistro do job: /logs/jobs.log"):
+                service.download(download_request, control=control)
+
+    def test_prewarm_prepares_first_download(self, download_service, download_request):
+        """Testa que o primeiro download reutiliza a instância pré-aquecida."""
+        # Arrange
+        with patch('os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            mock_ydl = MagicMock()
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            
+            # Act
+            download_service.prewarm()
+            download_service.download(download_request)
+            
+            # Assert
+            mock_ydl_class.assert_called_once()
+            mock_ydl.get_info_extractor.assert_called_once_with('Youtube')
+            mock_ydl.download.assert_called_once_with([download_request.url])
+    
+    def test_prewarm_without_cookies(self, download_service):
+        """Testa que sem arquivo de cookies o pré-aquecimento não faz nada."""
+        # Arrange
+        with patch('os.path.exists', return_value=False), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+            
+            # Act
+            download_service.prewarm()
+            
+            # Assert
+            mock_ydl_class.assert_not_called()
+
 
 class TestProgressParser:
     """Testes para a classe ProgressParser."""
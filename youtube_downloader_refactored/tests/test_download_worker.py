@@ -0,0 +1,207 @@
+"""
+Testes unitários para os workers de download da interface.
+
+Valida que um conjunto fixo de threads executa as tarefas, que cada
+tarefa é liberada ao terminar e, num teste de longa duração com milhares
+de downloads simulados, que memória e número de threads ficam estáveis.
+"""
+
+import gc
+import os
+import threading
+import weakref
+from unittest.mock import Mock
+
+import pytest
+
+from src.models.exceptions import DownloadError
+from src.models.video_info import DownloadRequest
+from src.ui.download_worker import DownloadWorkerPool, LocalDownloadTask, RemoteDownloadTask
+
+
+class _FakeService:
+    """Serviço que simula um download com alguns eventos de progresso."""
+
+    def __init__(self, events: int = 5, payload_bytes: int = 64 * 1024):
+        self.events = events
+        self.payload_bytes = payload_bytes
+        self.threads = set()
+
+    def download(self, request, progress_callback, control):
+        self.threads.add(threading.get_ident())
+        progress_callback = control.wrap_progress_hook(progress_callback)
+        buffer = bytearray(self.payload_bytes)  # objetos por job, como os do yt-dlp
+        for n in range(1, self.events + 1):
+            progress_callback({'status': 'downloading', '_percent_str': f"{100 * n / self.events:.1f}%"})
+        del buffer
+        progress_callback({'status': 'finished'})
+        return "video"
+
+
+def _rss_bytes() -> int:
+    """Memória residente do processo."""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _request(n: int = 0) -> DownloadRequest:
+    return DownloadRequest(f"https://www.youtube.com/watch?v={n}", "/tmp/downloads", "Melhor qualidade")
+
+
+class TestRemoteDownloadTask:
+    """Testes para a classe RemoteDownloadTask."""
+
+    def test_cancel_during_submit_is_sent_when_job_id_arrives(self):
+        """Testa que o cancelamento pedido antes de o daemon devolver o id do job não se perde."""
+        # Arrange
+        client = Mock()
+        task = RemoteDownloadTask(_request(), client)
+
+        def submit(request):
+            task.cancel(keep_partial=True)
+            return {'job_id': 'abc'}
+        client.submit.side_effect = submit
+        client.iter_events.return_value = [{'event': 'status', 'job': {'status': 'cancelled'}}]
+
+        # Act
+        result = task.run(lambda data: None)
+
+        # Assert
+        assert result == "cancelled"
+        client.cancel.assert_called_once_with('abc', True)
+
+
+class TestDownloadWorkerPool:
+    """Testes para a classe DownloadWorkerPool."""
+
+    @pytest.fixture
+    def pool(self, qapp):
+        """Fixture que retorna um pool com um worker."""
+        pool = DownloadWorkerPool(size=1)
+        yield pool
+        pool.shutdown()
+
+    def _run(self, qtbot, pool, task):
+        """Executa uma tarefa e retorna (id, resultado, eventos de progresso)."""
+        progress = []
+        pool.progress_signal.connect(lambda task_id, data: progress.append(data))
+        with qtbot.waitSignal(pool.finished_signal, timeout=5000) as blocker:
+            task_id = pool.submit(task)
+        pool.progress_signal.disconnect()
+        assert blocker.args[0] == task_id
+        return task_id, blocker.args[1], progress
+
+    def test_tasks_reuse_the_same_thread(self, qtbot, pool):
+        """Testa que downloads seguidos rodam na mesma thread de vida longa."""
+        # Arrange
+        service = _FakeService()
+
+        # Act
+        results = [self._run(qtbot, pool, LocalDownloadTask(_request(n), service))[1] for n in range(5)]
+
+        # Assert
+        assert results == ["success"] * 5
+        assert len(service.threads) == 1
+        assert threading.get_ident() not in service.threads
+
+    def test_progress_and_errors_are_forwarded(self, qtbot, pool):
+        """Testa o repasse do progresso e da mensagem de erro do serviço."""
+        # Arrange
+        service = Mock()
+        service.download.side_effect = DownloadError("Erro durante o download: boom")
+
+        # Act
+        _, ok, progress = self._run(qtbot, pool, LocalDownloadTask(_request(), _FakeService(events=2)))
+        _, failed, _ = self._run(qtbot, pool, LocalDownloadTask(_request(), service))
+
+        # Assert
+        assert ok == "success"
+        assert [event['status'] for event in progress] == ['downloading', 'downloading', 'finished']
+        assert failed == "Erro durante o download: boom"
+
+    def test_finished_task_is_released(self, qtbot, pool):
+        """Testa que o pool não retém a tarefa nem o serviço após o fim do download."""
+        # Arrange
+        service = _FakeService()
+        task = LocalDownloadTask(_request(), service)
+        task_ref = weakref.ref(task)
+        service_ref = weakref.ref(service)
+
+        # Act
+        self._run(qtbot, pool, task)
+        del task, service
+
+        # Assert
+        assert task_ref() is None
+        assert service_ref() is None
+        assert pool.pending() == 0
+
+    def test_cancel_before_start(self, qtbot, pool):
+        """Testa que uma tarefa cancelada ainda na fila não chega a executar."""
+        # Arrange
+        client = Mock()
+        task = RemoteDownloadTask(_request(), client)
+        task.cancel()
+
+        # Act
+        _, result, _ = self._run(qtbot, pool, task)
+
+        # Assert
+        assert result == "cancelled"
+        client.submit.assert_not_called()
+
+    def test_shutdown_cancels_running_task_keeping_partial(self, qapp):
+        """Testa que encerrar o pool cancela o download em andamento preservando os .part."""
+        # Arrange
+        started = threading.Event()
+        controls = []
+
+        def blocking_download(request, progress_callback, control):
+            controls.append(control)
+            started.set()
+            while not control.is_cancelled:
+                threading.Event().wait(0.01)
+
+        service = Mock()
+        service.download.side_effect = blocking_download
+        pool = DownloadWorkerPool(size=1)
+        pool.submit(LocalDownloadTask(_request(), service))
+        assert started.wait(5)
+
+        # Act
+        stopped = pool.shutdown(keep_partial=True, timeout_ms=5000)
+
+        # Assert
+        assert stopped
+        assert controls[0].keep_partial is True
+
+    @pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason="requer /proc")
+    def test_soak_memory_and_threads_stay_flat(self, qtbot, pool):
+        """Testa milhares de downloads simulados sem crescimento de memória ou de threads."""
+        # Arrange
+        service = _FakeService()
+        finished = []
+        pool.finished_signal.connect(lambda task_id, result: finished.append(result))
+
+        def run_batch(count):
+            for n in range(count):
+                with qtbot.waitSignal(pool.finished_signal, timeout=5000):
+                    pool.submit(LocalDownloadTask(_request(n), service))
+
+        run_batch(300)  # aquecimento: caches, pools e filas de eventos do Qt
+        gc.collect()
+        rss_before = _rss_bytes()
+        threads_before = threading.active_count()
+
+        # Act
+        run_batch(3000)
+        gc.collect()
+        rss_after = _rss_bytes()
+        threads_after = threading.active_count()
+
+        # Assert
+        assert finished == ["success"] * 3300
+        assert len(service.threads) == 1
+        assert threads_after == threads_before
+        assert rss_after - rss_before < 4 * 1024 ** 2
+        assert pool.pending() == 0
@@ -0,0 +1,165 @@
+"""
+Testes unitários para a seleção de formatos.
+
+Valida o FormatSelector sobre listas de formatos sintéticas.
+"""
+
+import pytest
+from src.services.format_selector import FormatSelector, estimate_choice_sizes
+from src.models.format_policy import FormatPolicy
+
+
+def _fmt(format_id, ext, vcodec, acodec, tbr, height=None, fps=30, **extra):
+    """Cria um formato no estilo do yt-dlp com tamanho derivado do bitrate."""
+    fmt = {
+        'format_id': format_id, 'ext': ext, 'vcodec': vcodec, 'acodec': acodec,
+        'tbr': tbr, 'height': height, 'fps': fps if height else None,
+        'filesize': int(tbr * 125 * 100), 'protocol': 'https',
+    }
+    fmt.update(extra)
+    return fmt
+
+
+class TestFormatSelector:
+    """Testes para a classe FormatSelector."""
+
+    @pytest.fixture
+    def formats(self):
+        """Fixture com áudio, vídeo H.264/VP9/AV1 e um formato progressivo."""
+        return [
+            _fmt('140', 'm4a', 'none', 'mp4a.40.2', 129, abr=129),
+            _fmt('249', 'webm', 'none', 'opus', 50, abr=50),
+            _fmt('251', 'webm', 'none', 'opus', 120, abr=120),
+            _fmt('18', 'mp4', 'avc1.42001E', 'mp4a.40.2', 600, height=360),
+            _fmt('136', 'mp4', 'avc1.4d401f', 'none', 1700, height=720),
+            _fmt('247', 'webm', 'vp09.00.31.08', 'none', 1200, height=720),
+            _fmt('398', 'mp4', 'av01.0.05M.08', 'none', 1000, height=720),
+            _fmt('137', 'mp4', 'avc1.640028', 'none', 3300, height=1080),
+            _fmt('248', 'webm', 'vp09.00.40.08', 'none', 2300, height=1080),
+            _fmt('sb0', 'mhtml', 'none', 'none', 0),
+        ]
+
+    def test_smallest_stream_at_best_resolution(self, formats):
+        """Testa escolha do menor vídeo na maior resolução disponível."""
+        # Arrange
+        selector = FormatSelector(FormatPolicy())
+
+        # Act
+        choice = selector.select(formats)
+
+        # Assert
+        assert choice.format_id == '248+251'
+        assert choice.height == 1080
+        assert choice.estimated_size == formats[8]['filesize'] + formats[2]['filesize']
+        assert choice.is_merged
+
+    def test_max_height(self, formats):
+        """Testa o limite de resolução da política."""
+        # Act
+        choice = FormatSelector(FormatPolicy(max_height=720)).select(formats)
+
+        # Assert
+        assert choice.format_id == '398+251'
+
+    def test_codec_constraint(self, formats):
+        """Testa restrição de codecs de vídeo e áudio."""
+        # Arrange
+        policy = FormatPolicy(max_height=720, video_codecs=('avc1',), audio_codecs=('mp4a',))
+
+        # Act
+        choice = FormatSelector(policy).select(formats)
+
+        # Assert
+        assert choice.format_id == '136+140'
+
+    def test_relaxes_unsatisfiable_codec(self, formats):
+        """Testa relaxamento de codec quando nada atende à política."""
+        # Act
+        choice = FormatSelector(FormatPolicy(max_height=720, video_codecs=('hev1',))).select(formats)
+
+        # Assert
+        assert choice.height == 720
+
+    def test_prefer_largest(self, formats):
+        """Testa a preferência pelo maior bitrate."""
+        # Act
+        choice = FormatSelector(FormatPolicy(prefer_smallest=False)).select(formats)
+
+        # Assert
+        assert choice.format_id == '137+140'
+
+    def test_audio_only(self, formats):
+        """Testa política somente áudio restrita a m4a."""
+        # Act
+        choice = FormatSelector(FormatPolicy(audio_only=True, containers=('m4a',))).select(formats)
+
+        # Assert
+        assert choice.format_id == '140'
+        assert not choice.is_merged
+
+    def test_estimate_size_from_bitrate(self):
+        """Testa estimativa de tamanho pelo bitrate e duração."""
+        # Arrange
+        fmt = {'tbr': 800}
+
+        # Act & Assert
+        assert FormatSelector.estimate_size(fmt, duration=10) == 1_000_000
+        assert FormatSelector.estimate_size(fmt) is None
+
+    def test_callable_yields_merged_format(self, formats):
+        """Testa a interface de seletor usada pelo yt-dlp."""
+        # Arrange
+        selector = FormatSelector(FormatPolicy(max_height=720), merge_ext='mp4')
+
+        # Act
+        selected = list(selector({'formats': formats}))
+
+        # Assert
+        assert len(selected) == 1
+        assert selected[0]['format_id'] == '398+251'
+        assert selected[0]['ext'] == 'mp4'
+        assert [f['format_id'] for f in selected[0]['requested_formats']] == ['398', '251']
+
+    def test_callable_uses_duration_for_bitrate_only_formats(self):
+        """Testa que o seletor usa a duração do vídeo e escolhe o que estimate_choice_sizes mostrou."""
+        # Arrange
+        formats = [
+            _fmt('251', 'webm', 'none', 'opus', 120, abr=120),
+            _fmt('136', 'mp4', 'avc1.4d401f', 'none', 1700, height=720),
+            # Manifesto DASH: o yt-dlp não preenche o tamanho, só o bitrate
+            _fmt('398', 'mp4', 'av01.0.05M.08', 'none', 1000, height=720, filesize=None),
+        ]
+        info = {'formats': formats, 'duration': 100}
+        policy = FormatPolicy(max_height=720)
+        shown = estimate_choice_sizes(info, {'720p': policy})['720p']
+        observed = FormatSelector(policy)
+
+        # Act
+        observed.observe(info)
+        from_observe = list(observed({'formats': formats}))[0]
+        from_constructor = list(FormatSelector(policy, duration=100)({'formats': formats}))[0]
+        without_duration = list(FormatSelector(policy)({'formats': formats}))[0]
+
+        # Assert
+        assert shown == 1000 * 125 * 100 + formats[0]['filesize']
+        assert from_observe['format_id'] == '398+251'
+        assert from_constructor['format_id'] == '398+251'
+        assert without_duration['format_id'] == '136+251'
+
+    def test_callable_without_formats(self):
+        """Testa seletor sem formatos disponíveis."""
+        # Act & Assert
+        assert list(FormatSelector(FormatPolicy())({'formats': []})) == []
+
+    def test_estimate_choice_sizes(self, formats):
+        """Testa estimativa de tamanho por política."""
+        # Arrange
+        policies = {'720p': FormatPolicy(max_height=720), 'Áudio': FormatPolicy(audio_only=True)}
+
+        # Act
+        sizes = estimate_choice_sizes({'formats': formats, 'duration': 100}, policies)
+
+        # Assert
+        assert sizes['720p'] == formats[6]['filesize'] + formats[2]['filesize']
+        assert sizes['Áudio'] == formats[2]['filesize']
+        assert estimate_choice_sizes({}, policies) == {'720p': None, 'Áudio': None}
@@ -0,0 +1,185 @@
+"""
+Testes unitários para o histórico de downloads.
+
+Valida a gravação em lote, a busca textual e por filtros, a paginação
+e o modelo de tabela carregado sob demanda.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+from PyQt5.QtCore import QModelIndex
+from src.services.history_store import HistoryStore, HistoryRecorder
+from src.models.history import HistoryEntry, HistoryQuery
+from src.models.video_info import DownloadRequest
+from src.ui.history_window import HistoryTableModel
+
+DAY = 24 * 3600
+
+
+def _entry(n: int, **overrides) -> HistoryEntry:
+    """Cria um registro de teste."""
+    values = dict(
+        title=f"Vídeo {n}", url=f"https://youtu.be/{n:011d}", file_path=f"/videos/{n}.mp4",
+        format_choice="Melhor qualidade", video_id=f"{n:011d}", channel="Canal Teste",
+        downloaded_at=1_700_000_000 + n,
+    )
+    values.update(overrides)
+    return HistoryEntry(**values)
+
+
+class TestHistoryStore:
+    """Testes para a classe HistoryStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Fixture que retorna um histórico em arquivo temporário."""
+        store = HistoryStore(str(tmp_path / "history.db"), batch_size=50, flush_interval=0.05)
+        yield store
+        store.close()
+
+    def test_add_is_written_in_batches(self, store):
+        """Testa que os registros são gravados em poucas transações, fora da thread chamadora."""
+        # Arrange
+        batches = []
+        write_batch = store._write_batch
+
+        def spy(connection, batch):
+            batches.append(len(batch))
+            write_batch(connection, batch)
+
+        # Act
+        with patch.object(store, '_write_batch', side_effect=spy):
+            store.add_many(_entry(n) for n in range(120))
+            store.flush()
+
+        # Assert
+        assert sum(batches) == 120
+        assert len(batches) <= 4
+        assert len(store.search(limit=500)) == 120
+
+    def test_text_search_by_prefix_and_accents(self, store):
+        """Testa busca por prefixo de palavras, sem diferenciar acentos."""
+        # Arrange
+        store.add_many([
+            _entry(1, title="Tutorial de Programação em Python"),
+            _entry(2, title="Música para programar", channel="Lo-fi Rádio"),
+            _entry(3, title="Receita de bolo"),
+        ])
+        store.flush()
+
+        # Act
+        programacao = store.search(HistoryQuery(text="programa"))
+        musica = store.search(HistoryQuery(text="musica"))
+        canal = store.search(HistoryQuery(text="radio"))
+        todas_as_palavras = store.search(HistoryQuery(text="tutorial python"))
+
+        # Assert
+        assert [e.entry_id for e in programacao] == [2, 1]
+        assert [e.title for e in musica] == ["Música para programar"]
+        assert [e.title for e in canal] == ["Música para programar"]
+        assert [e.title for e in todas_as_palavras] == ["Tutorial de Programação em Python"]
+        assert store.search(HistoryQuery(text='"; DROP TABLE downloads --')) == []
+
+    def test_filters(self, store):
+        """Testa filtros por canal, formato e período."""
+        # Arrange
+        now = time.time()
+        store.add_many([
+            _entry(1, channel="Alpha", downloaded_at=now - 10 * DAY),
+            _entry(2, channel="alpha", format_choice="Áudio MP3", downloaded_at=now - DAY / 2),
+            _entry(3, channel="Beta", downloaded_at=now - DAY / 4),
+        ])
+        store.flush()
+
+        # Act & Assert
+        assert [e.channel for e in store.search(HistoryQuery(channel="ALPHA"))] == ["alpha", "Alpha"]
+        assert [e.entry_id for e in store.search(HistoryQuery(format_choice="Áudio MP3"))] == [2]
+        assert [e.entry_id for e in store.search(HistoryQuery(since=now - DAY))] == [3, 2]
+        assert [e.entry_id for e in store.search(HistoryQuery(until=now - DAY))] == [1]
+
+    def test_pagination(self, store):
+        """Testa a paginação a partir do último registro da página anterior."""
+        # Arrange
+        store.add_many(_entry(n, downloaded_at=1_700_000_000 + n // 2) for n in range(25))
+        store.flush()
+
+        # Act
+        pages, after = [], None
+        while True:
+            page = store.search(limit=10, after=after)
+            if not page:
+                break
+            pages.append(page)
+            after = page[-1]
+
+        # Assert
+        ids = [e.entry_id for page in pages for e in page]
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert ids == sorted(ids, reverse=True)
+        assert len(set(ids)) == 25
+
+    def test_close_writes_pending_entries(self, tmp_path):
+        """Testa que registros enfileirados não se perdem ao fechar."""
+        # Arrange
+        path = str(tmp_path / "history.db")
+        store = HistoryStore(path, flush_interval=60)
+        store.add(_entry(1))
+
+        # Act
+        store.close()
+        reopened = HistoryStore(path)
+
+        # Assert
+        assert [e.title for e in reopened.search()] == ["Vídeo 1"]
+        reopened.close()
+
+
+class TestHistoryRecorder:
+    """Testes para a classe HistoryRecorder."""
+
+    def test_entries_from_hooks(self, tmp_path):
+        """Testa a montagem dos registros a partir dos hooks do yt-dlp."""
+        # Arrange
+        request = DownloadRequest(url="https://youtu.be/abc", save_path=str(tmp_path), format_choice="Áudio MP3")
+        recorder = HistoryRecorder(request)
+        (tmp_path / "Meu vídeo.m4a").write_bytes(b"x" * 10)
+        info = {'id': 'abc', 'title': 'Meu vídeo', 'channel': 'Canal', 'webpage_url': 'https://www.youtube.com/watch?v=abc'}
+
+        # Act
+        recorder.progress_hook({'status': 'finished', 'info_dict': info})
+        recorder.post_hook("/tmp/scratch/Meu vídeo.m4a")
+        entries = recorder.entries()
+
+        # Assert
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry.file_path == str(tmp_path / "Meu vídeo.m4a")
+        assert (entry.title, entry.channel, entry.video_id) == ("Meu vídeo", "Canal", "abc")
+        assert entry.size_bytes == 10
+        assert entry.format_choice == "Áudio MP3"
+
+
+class TestHistoryTableModel:
+    """Testes para a classe HistoryTableModel."""
+
+    def test_loads_pages_on_demand(self, qapp, tmp_path):
+        """Testa que o modelo só busca novas páginas quando solicitado."""
+        # Arrange
+        store = HistoryStore(str(tmp_path / "history.db"))
+        store.add_many(_entry(n) for n in range(45))
+        store.flush()
+        model = HistoryTableModel(store, page_size=20)
+
+        # Act
+        model.set_query(HistoryQuery())
+        first = model.rowCount()
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+
+        # Assert
+        assert first == 20
+        assert model.rowCount() == 45
+        assert model.data(model.index(0, 1)) == "Vídeo 44"
+        assert model.data(model.index(0, 4)) == "44.mp4"
+        store.close()
@@ -0,0 +1,115 @@
+"""
+Testes unitários para o controle de jobs.
+
+Valida cancelamento, pausa e limpeza de arquivos parciais do JobControl.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from yt_dlp.utils import DownloadCancelled
+from src.services.job_control import JobControl
+
+
+class TestJobControl:
+    """Testes para a classe JobControl."""
+
+    def test_hook_raises_after_cancel(self):
+        """Testa interrupção do hook de progresso após cancelamento."""
+        # Arrange
+        callback = Mock()
+        control = JobControl()
+        hook = control.wrap_progress_hook(callback)
+        hook({'status': 'downloading'})
+
+        # Act
+        control.cancel()
+
+        # Assert
+        with pytest.raises(DownloadCancelled):
+            hook({'status': 'downloading'})
+        assert callback.call_count == 1
+
+    def test_pause_blocks_until_resume(self):
+        """Testa bloqueio do hook enquanto o job estiver pausado."""
+        # Arrange
+        control = JobControl()
+        hook = control.wrap_progress_hook(None)
+        control.pause()
+        passed = threading.Event()
+
+        def run_hook():
+            hook({'status': 'downloading'})
+            passed.set()
+
+        # Act
+        thread = threading.Thread(target=run_hook)
+        thread.start()
+        blocked = not passed.wait(0.1)
+        control.resume()
+        thread.join(5)
+
+        # Assert
+        assert blocked
+        assert passed.is_set()
+
+    def test_cancel_wakes_paused_job(self):
+        """Testa que o cancelamento libera um job pausado."""
+        # Arrange
+        control = JobControl()
+        control.pause()
+
+        # Act
+        control.cancel()
+
+        # Assert
+        with pytest.raises(DownloadCancelled):
+            control.checkpoint()
+
+    def test_cleanup_partial_files(self, tmp_path):
+        """Testa remoção dos arquivos .part de um job cancelado."""
+        # Arrange
+        target = tmp_path / "video.mp4"
+        part = tmp_path / "video.mp4.part"
+        fragment = tmp_path / "video.mp4.part-Frag3"
+        part.write_bytes(b"x")
+        fragment.write_bytes(b"x")
+        control = JobControl()
+        control.wrap_progress_hook(None)({'status': 'downloading', 'filename': str(target)})
+
+        # Act
+        control.cancel()
+        control.cleanup_partial_files()
+
+        # Assert
+        assert not part.exists()
+        assert not fragment.exists()
+
+    def test_keep_partial_files(self, tmp_path):
+        """Testa preservação dos arquivos .part quando solicitado."""
+        # Arrange
+        target = tmp_path / "video.mp4"
+        part = tmp_path / "video.mp4.part"
+        part.write_bytes(b"x")
+        control = JobControl(keep_partial=True)
+        control.wrap_progress_hook(None)({'status': 'downloading', 'filename': str(target)})
+
+        # Act
+        control.cancel()
+        control.cleanup_partial_files()
+
+        # Assert
+        assert part.exists()
+
+    def test_cancel_during_postprocessing_terminates_ffmpeg(self):
+        """Testa encerramento do ffmpeg do job ao cancelar no pós-processamento."""
+        # Arrange
+        control = JobControl()
+        control.postprocessor_hook({'status': 'started', 'info_dict': {'filepath': '/tmp/video.mp4'}})
+
+        with patch('src.services.job_control.ProcessUtils') as mock_process:
+            # Act
+            control.cancel()
+
+            # Assert
+            mock_process.terminate_children_using.assert_called_once_with('/tmp/video.mp4')
@@ -0,0 +1,103 @@
+"""
+Testes unitários para o registro por job das mensagens do yt-dlp.
+
+Valida a captura pelo logger do yt-dlp, o limite do buffer, os campos
+estruturados e a gravação incremental no arquivo rotativo.
+"""
+
+import logging
+import os
+import pytest
+import yt_dlp
+from src.services.job_log import JobLog
+
+
+class TestJobLog:
+    """Testes para a classe JobLog."""
+
+    @pytest.fixture
+    def log(self):
+        """Fixture que retorna um registro com identificador fixo."""
+        return JobLog("job123", max_lines=5)
+
+    def test_captures_ytdlp_messages_with_phase(self, log):
+        """Testa a captura de mensagens do yt-dlp mesmo em modo silencioso."""
+        # Arrange
+        with yt_dlp.YoutubeDL({'quiet': True, 'logger': log}) as ydl:
+
+            # Act
+            ydl.to_screen("[youtube] abc: Downloading webpage")
+            log.progress_hook({'status': 'downloading'})
+            ydl.report_warning("formato indisponível")
+
+        # Assert
+        records = log.records()
+        assert [(level, phase) for _, _, level, phase, _ in records] == [
+            (logging.INFO, JobLog.PHASE_EXTRACT),
+            (logging.WARNING, JobLog.PHASE_DOWNLOAD),
+        ]
+        assert "formato indisponível" in records[1][4]
+
+    def test_buffer_keeps_most_recent_lines(self, log):
+        """Testa que o buffer circular descarta as mensagens mais antigas."""
+        # Act
+        for index in range(8):
+            log.info(f"linha {index}")
+
+        # Assert
+        assert [record[4] for record in log.records()] == [f"linha {i}" for i in range(3, 8)]
+
+    def test_lines_have_structured_fields(self, log):
+        """Testa a formatação com identificador do job, fase e nível."""
+        # Arrange
+        log.postprocessor_hook({'status': 'started'})
+
+        # Act
+        log.error("ffmpeg falhou")
+
+        # Assert
+        line = log.lines()[0]
+        assert "job=job123 phase=postprocess ERROR ffmpeg falhou" in line
+
+    def test_flush_writes_only_new_records(self, log, tmp_path):
+        """Testa que gravações seguidas não repetem mensagens."""
+        # Arrange
+        log.info("primeira")
+
+        # Act
+        path = log.flush(str(tmp_path))
+        log.warning("segunda")
+        log.flush(str(tmp_path))
+
+        # Assert
+        with open(path, encoding='utf-8') as f:
+            content = f.read().splitlines()
+        assert path == log.file_path == os.path.join(str(tmp_path), "jobs.log")
+        assert len(content) == 2
+        assert content[0].endswith("INFO primeira")
+        assert content[1].endswith("WARNING segunda")
+
+    def test_nothing_written_without_flush(self, log, tmp_path):
+        """Testa que nada vai para o disco enquanto o registro não é gravado."""
+        # Act
+        log.info("mensagem")
+
+        # Assert
+        assert log.file_path is None
+        assert not os.listdir(tmp_path)
+
+    def test_extend_from_other_process(self, log, tmp_path):
+        """Testa a incorporação de mensagens já gravadas por outro processo."""
+        # Arrange
+        child = JobLog("job123")
+        child.error("erro no processo filho")
+        child_file = child.flush(str(tmp_path))
+
+        # Act
+        log.extend(child.records(), child_file)
+        log.flush(str(tmp_path))
+
+        # Assert
+        assert log.file_path == child_file
+        with open(child_file, encoding='utf-8') as f:
+            assert len(f.read().splitlines()) == 1
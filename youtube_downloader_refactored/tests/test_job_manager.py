@@ -0,0 +1,345 @@
+"""
+Testes unitários para o gerenciador de jobs.
+
+Valida o comportamento do JobManager com um serviço de download simulado.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from src.services.job_manager import JobManager
+from src.services.job_scheduler import JobScheduler
+from src.models.job import JobStatus
+from src.models.video_info import DownloadRequest, VideoInfo
+from src.models.exceptions import JobNotFoundError, DownloadError, VideoInfoError
+
+
+def _wait_for(subscription, job_id, status, timeout=5.0):
+    """Consome eventos até o job atingir o estado esperado."""
+    while True:
+        event = subscription.get(timeout=timeout)
+        assert event is not None, f"Job não atingiu o estado {status}"
+        if event['job']['job_id'] == job_id and event['job']['status'] == status:
+            return event
+
+
+def _wait_until(condition, timeout=5.0):
+    """Espera a condição se tornar verdadeira."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condição não atingida"
+        time.sleep(0.01)
+
+
+class TestJobManager:
+    """Testes para a classe JobManager."""
+
+    @pytest.fixture
+    def download_request(self):
+        """Fixture que retorna uma requisição de download de teste."""
+        return DownloadRequest(
+            url="https://www.youtube.com/watch?v=test123",
+            save_path="/tmp/downloads",
+            format_choice="Melhor qualidade"
+        )
+
+    @pytest.fixture
+    def service(self):
+        """Fixture que retorna um serviço de download simulado."""
+        return Mock()
+
+    @pytest.fixture
+    def manager(self, service):
+        """Fixture que retorna um gerenciador iniciado."""
+        manager = JobManager(download_service=service, max_concurrent=1)
+        manager.start()
+        yield manager
+        manager.shutdown()
+
+    def test_submit_runs_job(self, manager, service, download_request):
+        """Testa execução de um job submetido."""
+        # Arrange
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            progress_callback({'status': 'downloading', '_percent_str': '50.0%'})
+        service.download.side_effect = fake_download
+        subscription = manager.subscribe()
+
+        # Act
+        job = manager.submit(download_request)
+        _wait_for(subscription, job.job_id, 'completed')
+
+        # Assert
+        assert job.status == JobStatus.COMPLETED
+        assert job.percent == 100.0
+        service.download.assert_called_once()
+
+    def test_failed_job_records_error(self, manager, service, download_request):
+        """Testa registro de erro de um job que falhou."""
+        # Arrange
+        service.download.side_effect = DownloadError("Erro durante o download: boom")
+        subscription = manager.subscribe()
+
+        # Act
+        job = manager.submit(download_request)
+        _wait_for(subscription, job.job_id, 'failed')
+
+        # Assert
+        assert job.status == JobStatus.FAILED
+        assert "boom" in job.error
+
+    def test_job_log_is_kept_per_job(self, manager, service, download_request, tmp_path):
+        """Testa que as mensagens do yt-dlp ficam no registro do job."""
+        # Arrange
+        def fake_download(request, progress_callback, control):
+            control.log.warning("aviso do yt-dlp")
+            control.log.flush(str(tmp_path))
+            raise DownloadError("falhou")
+        service.download.side_effect = fake_download
+        subscription = manager.subscribe()
+
+        # Act
+        job = manager.submit(download_request)
+        _wait_for(subscription, job.job_id, 'failed')
+        log = manager.get_log(job.job_id)
+
+        # Assert
+        assert log.job_id == job.job_id
+        assert "aviso do yt-dlp" in log.lines()[0]
+        assert job.to_dict()['log_file'] == str(tmp_path / "jobs.log")
+        with pytest.raises(JobNotFoundError):
+            manager.get_log("deadbeef")
+
+    def test_cancel_running_job(self, manager, service, download_request):
+        """Testa cancelamento de um job em execução no próximo progresso."""
+        # Arrange
+        started = threading.Event()
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            started.set()
+            while True:
+                progress_callback({'status': 'downloading', '_percent_str': '10%'})
+        service.download.side_effect = fake_download
+        subscription = manager.subscribe()
+
+        # Act
+        job = manager.submit(download_request)
+        started.wait(5)
+        manager.cancel(job.job_id)
+        _wait_for(subscription, job.job_id, 'cancelled')
+
+        # Assert
+        assert job.status == JobStatus.CANCELLED
+        assert job.error is None
+
+    def test_cancel_queued_job(self, service, download_request):
+        """Testa cancelamento de um job ainda na fila."""
+        # Arrange
+        manager = JobManager(download_service=service, max_concurrent=1)
+        job = manager.submit(download_request)
+
+        # Act
+        manager.cancel(job.job_id)
+
+        # Assert
+        assert job.status == JobStatus.CANCELLED
+        service.download.assert_not_called()
+
+    def test_get_unknown_job(self, manager):
+        """Testa consulta de job inexistente."""
+        # Act & Assert
+        with pytest.raises(JobNotFoundError):
+            manager.get_job("deadbeef")
+
+    def test_pause_and_resume(self, manager, service, download_request):
+        """Testa pausa e retomada de um job em execução."""
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            started.set()
+            release.wait(5)
+            progress_callback({'status': 'downloading', '_percent_str': '90%'})
+        service.download.side_effect = fake_download
+        subscription = manager.subscribe()
+
+        # Act
+        job = manager.submit(download_request)
+        started.wait(5)
+        manager.pause(job.job_id)
+        release.set()
+        _wait_for(subscription, job.job_id, 'paused')
+        paused_percent = job.percent
+        manager.resume(job.job_id)
+        _wait_for(subscription, job.job_id, 'completed')
+
+        # Assert
+        assert paused_percent == 0.0
+        assert job.status == JobStatus.COMPLETED
+
+    def test_queued_jobs_follow_scheduler_policy(self, service):
+        """Testa que o gerenciador usa o escalonador informado (FIFO em vez do SJF padrão)."""
+        # Arrange
+        manager = JobManager(download_service=service, max_concurrent=1, scheduler=JobScheduler(JobScheduler.FIFO))
+        order = []
+        service.download.side_effect = lambda request, progress_callback, control: order.append(request.url)
+        jobs = [
+            manager.submit(DownloadRequest(f"https://youtu.be/{name}", "/tmp", "Melhor qualidade", estimated_size=size))
+            for name, size in (("longo", 4000), ("clipe", 10), ("medio", 300))
+        ]
+        subscription = manager.subscribe()
+
+        # Act
+        manager.start()
+        _wait_for(subscription, jobs[-1].job_id, 'completed')
+        manager.shutdown()
+
+        # Assert
+        assert order == ["https://youtu.be/longo", "https://youtu.be/clipe", "https://youtu.be/medio"]
+
+    def test_submit_estimates_sizes_for_sjf(self, service):
+        """Testa que jobs sem estimated_size são estimados em segundo plano e ordenados pelo tamanho."""
+        # Arrange
+        sizes = {"https://youtu.be/longo": 4000, "https://youtu.be/clipe": 10, "https://youtu.be/medio": 300}
+        info_service = Mock()
+        info_service.get_video_info.side_effect = lambda url: VideoInfo(
+            title=url, size_estimates={"Melhor qualidade": sizes[url], "Áudio MP3": 1}
+        )
+        manager = JobManager(download_service=service, max_concurrent=1,
+                             scheduler=JobScheduler(JobScheduler.SJF), video_info_service=info_service)
+        order = []
+        service.download.side_effect = lambda request, progress_callback, control: order.append(request.url)
+        jobs = [manager.submit(DownloadRequest(url, "/tmp", "Melhor qualidade")) for url in sizes]
+        subscription = manager.subscribe()
+        _wait_until(lambda: all(job.request.estimated_size is not None for job in jobs))
+
+        # Act
+        manager.start()
+        _wait_for(subscription, jobs[0].job_id, 'completed')
+        manager.shutdown()
+
+        # Assert
+        assert order == ["https://youtu.be/clipe", "https://youtu.be/medio", "https://youtu.be/longo"]
+        assert [job.request.estimated_size for job in jobs] == [4000, 10, 300]
+
+    def test_submit_does_not_wait_for_size_estimate(self, service, download_request):
+        """Testa que a submissão responde antes da extração dos metadados terminar."""
+        # Arrange
+        release = threading.Event()
+
+        def slow_info(url):
+            release.wait(5)
+            return VideoInfo(title=url, size_estimates={"Melhor qualidade": 42})
+        info_service = Mock()
+        info_service.get_video_info.side_effect = slow_info
+        manager = JobManager(download_service=service, scheduler=JobScheduler(JobScheduler.SJF),
+                             video_info_service=info_service)
+
+        # Act
+        job = manager.submit(download_request)
+        queued_size = job.request.estimated_size
+        release.set()
+        _wait_until(lambda: job.request.estimated_size is not None)
+        manager.shutdown()
+
+        # Assert
+        assert queued_size is None
+        assert job.request.estimated_size == 42
+        assert download_request.estimated_size is None
+
+    def test_submit_keeps_unknown_size_when_info_fails(self, service, download_request):
+        """Testa que uma falha nos metadados mantém o job na fila com tamanho desconhecido."""
+        # Arrange
+        info_service = Mock()
+        info_service.get_video_info.side_effect = VideoInfoError("Erro ao obter informações: boom")
+        manager = JobManager(download_service=service, scheduler=JobScheduler(JobScheduler.SJF),
+                             video_info_service=info_service)
+
+        # Act
+        job = manager.submit(download_request)
+        _wait_until(lambda: info_service.get_video_info.called)
+        manager.shutdown()
+
+        # Assert
+        assert job.request.estimated_size is None
+        assert manager.get_job(job.job_id).status == JobStatus.QUEUED
+
+    def test_high_priority_job_preempts_running_job(self, service):
+        """Testa que um job urgente pausa o job em execução e o retoma ao terminar."""
+        # Arrange
+        manager = JobManager(download_service=service, max_concurrent=1, preempt=True)
+        manager.start()
+        started = threading.Event()
+        order = []
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            if request.priority == 0:
+                started.set()
+                for _ in range(200):
+                    progress_callback({'status': 'downloading', '_percent_str': '10%'})
+                    threading.Event().wait(0.005)
+            order.append(request.url)
+        service.download.side_effect = fake_download
+        subscription = manager.subscribe()
+
+        # Act
+        low = manager.submit(DownloadRequest("https://youtu.be/longo", "/tmp", "Melhor qualidade"))
+        started.wait(5)
+        high = manager.submit(DownloadRequest("https://youtu.be/urgente", "/tmp", "Melhor qualidade", priority=5))
+        _wait_for(subscription, low.job_id, 'completed')
+        manager.shutdown()
+
+        # Assert
+        assert order == ["https://youtu.be/urgente", "https://youtu.be/longo"]
+        assert high.status == low.status == JobStatus.COMPLETED
+        assert [event['kind'] for event in low.stats.events] == ['preempted']
+
+    def test_preemption_stays_within_concurrency(self, service):
+        """Testa que o job preemptivo ocupa o slot do pausado e que sua thread é descartada ao fim."""
+        # Arrange
+        manager = JobManager(download_service=service, max_concurrent=1, preempt=True)
+        manager.start()
+        low_started, high_started, release_high = threading.Event(), threading.Event(), threading.Event()
+        events = []
+
+        def fake_download(request, progress_callback, control):
+            progress_callback = control.wrap_progress_hook(progress_callback)
+            events.append(('início', request.url))
+            if request.priority == 5:
+                high_started.set()
+                release_high.wait(5)
+            elif request.url.endswith("longo"):
+                low_started.set()
+                while True:
+                    progress_callback({'status': 'downloading', '_percent_str': '10%'})
+                    threading.Event().wait(0.005)
+            events.append(('fim', request.url))
+        service.download.side_effect = fake_download
+        subscription = manager.subscribe()
+
+        # Act
+        low = manager.submit(DownloadRequest("https://youtu.be/longo", "/tmp", "Melhor qualidade"))
+        low_started.wait(5)
+        high = manager.submit(DownloadRequest("https://youtu.be/urgente", "/tmp", "Melhor qualidade", priority=5))
+        high_started.wait(5)
+        other = manager.submit(DownloadRequest("https://youtu.be/outro", "/tmp", "Melhor qualidade"))
+        manager.cancel(low.job_id)
+        _wait_for(subscription, low.job_id, 'cancelled')
+        threading.Event().wait(0.1)  # tempo para um worker (indevidamente) pegar o próximo job
+        other_waited = other.status == JobStatus.QUEUED
+        release_high.set()
+        _wait_for(subscription, other.job_id, 'completed')
+        preempt_threads = [t for t in threading.enumerate() if t.name == f"download-preempt-{high.job_id}"]
+        manager.shutdown()
+
+        # Assert
+        assert other_waited
+        assert high.status == JobStatus.COMPLETED
+        assert events.index(('início', "https://youtu.be/outro")) > events.index(('fim', "https://youtu.be/urgente"))
+        assert preempt_threads == []
+
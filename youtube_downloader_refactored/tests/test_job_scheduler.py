@@ -0,0 +1,117 @@
+"""
+Testes unitários para o escalonador da fila de downloads.
+
+Valida as políticas FIFO, por prioridade e do menor job primeiro, o
+envelhecimento que evita espera indefinida e a retirada de jobs.
+"""
+
+import pytest
+from src.models.job import DownloadJob
+from src.models.video_info import DownloadRequest
+from src.services.job_scheduler import JobScheduler
+
+MB = 1024 ** 2
+
+
+def _job(name: str, priority: int = 0, size=None, created_at: float = 0.0) -> DownloadJob:
+    """Cria um job de teste."""
+    request = DownloadRequest(
+        f"https://youtu.be/{name}", "/tmp", "Melhor qualidade",
+        priority=priority, estimated_size=size
+    )
+    return DownloadJob(request=request, job_id=name, created_at=created_at)
+
+
+def _drain(scheduler: JobScheduler):
+    """Retira todos os jobs, na ordem escolhida."""
+    return [scheduler.pop().job_id for _ in range(len(scheduler))]
+
+
+class TestJobScheduler:
+    """Testes para a classe JobScheduler."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fixture que retorna um relógio controlado pelo teste."""
+        now = [0.0]
+        clock = lambda: now[0]  # noqa: E731
+        clock.now = now
+        return clock
+
+    def test_fifo_keeps_arrival_order(self, clock):
+        """Testa que a política FIFO ignora prioridade e tamanho."""
+        # Arrange
+        scheduler = JobScheduler(JobScheduler.FIFO, clock=clock)
+        for job in (_job("a", size=4000 * MB), _job("b", priority=5), _job("c", size=1 * MB)):
+            scheduler.push(job)
+
+        # Act & Assert
+        assert _drain(scheduler) == ["a", "b", "c"]
+
+    def test_priority_then_arrival(self, clock):
+        """Testa que jobs mais prioritários saem antes, e empates por chegada."""
+        # Arrange
+        scheduler = JobScheduler(JobScheduler.PRIORITY, clock=clock)
+        for job in (_job("a"), _job("b", priority=2), _job("c"), _job("d", priority=2)):
+            scheduler.push(job)
+
+        # Act & Assert
+        assert _drain(scheduler) == ["b", "d", "a", "c"]
+
+    def test_shortest_job_first(self, clock):
+        """Testa que clipes curtos passam à frente de um vídeo longo."""
+        # Arrange
+        scheduler = JobScheduler(JobScheduler.SJF, unknown_size=100 * MB, clock=clock)
+        for job in (_job("longo", size=8000 * MB), _job("clipe", size=20 * MB),
+                    _job("desconhecido"), _job("medio", size=300 * MB)):
+            scheduler.push(job)
+
+        # Act & Assert
+        assert _drain(scheduler) == ["clipe", "desconhecido", "medio", "longo"]
+
+    def test_priority_outranks_size(self, clock):
+        """Testa que a prioridade prevalece sobre o tamanho estimado."""
+        # Arrange
+        scheduler = JobScheduler(JobScheduler.SJF, clock=clock)
+        scheduler.push(_job("clipe", size=1 * MB))
+        scheduler.push(_job("urgente", priority=1, size=4000 * MB))
+
+        # Act & Assert
+        assert _drain(scheduler) == ["urgente", "clipe"]
+
+    def test_aging_prevents_starvation(self, clock):
+        """Testa que um job grande que esperou muito passa à frente de clipes novos."""
+        # Arrange
+        scheduler = JobScheduler(JobScheduler.SJF, aging_seconds=60, clock=clock)
+        scheduler.push(_job("longo", size=8000 * MB, created_at=0.0))
+        clock.now[0] = 90.0
+        scheduler.push(_job("clipe", size=1 * MB, created_at=90.0))
+
+        # Act
+        first = scheduler.pop()
+
+        # Assert
+        assert first.job_id == "longo"
+        assert scheduler.effective_priority(first, clock()) == 1
+
+    def test_remove_pending_job(self, clock):
+        """Testa a retirada de um job cancelado antes de executar."""
+        # Arrange
+        scheduler = JobScheduler(clock=clock)
+        job = _job("a")
+        scheduler.push(job)
+        scheduler.push(_job("b"))
+
+        # Act
+        scheduler.remove(job)
+
+        # Assert
+        assert [pending.job_id for pending in scheduler] == ["b"]
+
+    def test_pop_empty_and_unknown_policy(self):
+        """Testa os erros de fila vazia e de política desconhecida."""
+        # Act & Assert
+        with pytest.raises(IndexError):
+            JobScheduler().pop()
+        with pytest.raises(ValueError):
+            JobScheduler("lifo")
@@ -0,0 +1,284 @@
+"""
+Testes unitários para a gravação de transmissões ao vivo.
+
+Usa um servidor HLS local que publica segmentos curtos conforme o
+relógio, com janela deslizante, para validar a rotação dos arquivos, o
+início pela borda ao vivo ou pelo começo da janela, a reconexão após
+falhas, a retenção dos arquivos e a interrupção da gravação.
+"""
+
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.config.constants import LiveConfig
+from src.models.exceptions import DownloadCancelledError, DownloadError
+from src.models.video_info import DownloadRequest
+from src.services.job_control import JobControl
+from src.services.live_recorder import LiveRecorder, parse_playlist
+from src.services.ydl_pool import YoutubeDLPool
+
+SEGMENT_SECONDS = 0.05
+PUBLISHED = 6  # segmentos já publicados quando a transmissão começa
+WINDOW = 40  # segmentos mantidos na playlist (janela deslizante)
+
+
+def _payload(sequence: int) -> bytes:
+    """Conteúdo identificável de um segmento."""
+    return f"[{sequence:06d}]".encode() * 64
+
+
+def _sequences(paths) -> list:
+    """Números dos segmentos gravados, na ordem dos arquivos."""
+    data = b"".join(open(path, 'rb').read() for path in paths)
+    return [int(n) for n in re.findall(rb'\[(\d{6})\]', data)[::64]]
+
+
+class _LiveHandler(BaseHTTPRequestHandler):
+    """Publica uma transmissão HLS cuja borda avança com o relógio."""
+
+    def do_GET(self) -> None:
+        server = self.server
+        head = min(int((time.monotonic() - server.started) / SEGMENT_SECONDS) + PUBLISHED, server.total)
+        first = max(head - WINDOW, 0)
+        if self.path.startswith('/live.m3u8'):
+            with server.lock:
+                server.playlist_requests += 1
+                failing = server.failures > 0
+                if failing:
+                    server.failures -= 1
+            if failing:
+                self._send(503, b'', 'text/plain')
+                return
+            lines = ['#EXTM3U', f'#EXT-X-TARGETDURATION:{SEGMENT_SECONDS}',
+                     f'#EXT-X-MEDIA-SEQUENCE:{first}']
+            if server.fmp4:
+                lines.append('#EXT-X-MAP:URI="init.mp4"')
+            for sequence in range(first, head):
+                lines += [f'#EXTINF:{SEGMENT_SECONDS},', f'seg/{sequence}.ts']
+            if head >= server.total:
+                lines.append('#EXT-X-ENDLIST')
+            self._send(200, '\n'.join(lines).encode(), 'application/vnd.apple.mpegurl')
+        elif self.path.startswith('/init.mp4'):
+            with server.lock:
+                failing = server.init_failures > 0
+                if failing:
+                    server.init_failures -= 1
+            self._send(503 if failing else 200, b'' if failing else b'INIT', 'video/mp4')
+        elif self.path.startswith('/seg/'):
+            sequence = int(re.search(r'/seg/(\d+)\.ts', self.path).group(1))
+            self._send(200, _payload(sequence), 'video/mp2t')
+        else:
+            self._send(403, b'', 'text/plain')
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class TestLiveRecorder:
+    """Testes para a classe LiveRecorder."""
+
+    @pytest.fixture
+    def server(self):
+        """Fixture que inicia a transmissão local."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _LiveHandler)
+        server.daemon_threads = True
+        server.lock = threading.Lock()
+        server.started = time.monotonic()
+        server.total = 10 ** 6
+        server.failures = 0
+        server.playlist_requests = 0
+        server.fmp4 = False
+        server.init_failures = 0
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture(autouse=True)
+    def fast_retries(self):
+        """Fixture que encurta as esperas entre novas tentativas."""
+        with patch.object(LiveConfig, 'RECONNECT_DELAY', 0.01), \
+             patch.object(LiveConfig, 'RECONNECT_MAX_DELAY', 0.05):
+            yield
+
+    @staticmethod
+    def _request(server, tmp_path, from_start: bool = False) -> DownloadRequest:
+        """Requisição de gravação da transmissão local."""
+        return DownloadRequest(
+            f"http://127.0.0.1:{server.server_address[1]}/live.m3u8", str(tmp_path),
+            "Melhor qualidade", custom_title="live", live=True, live_from_start=from_start
+        )
+
+    @staticmethod
+    def _recorder(**kwargs) -> LiveRecorder:
+        """Gravador que resolve a transmissão com o yt-dlp, sem cookies."""
+        return LiveRecorder(cookie_manager=Mock(), ydl_pool=YoutubeDLPool(), **kwargs)
+
+    def test_records_until_end_with_rotation(self, server, tmp_path):
+        """Testa a gravação do começo da janela até o fim, em arquivos rotativos."""
+        # Arrange
+        server.total = PUBLISHED + 8
+        recorder = self._recorder(segment_seconds=5 * SEGMENT_SECONDS)
+
+        # Act
+        files = recorder.record(self._request(server, tmp_path, from_start=True))
+
+        # Assert
+        assert _sequences(files) == list(range(server.total))
+        assert [len(_sequences([path])) for path in files] == [5, 5, 4]
+        assert all(path.endswith(f".{n:04d}.ts") for n, path in enumerate(files, 1))
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+    def test_starts_at_live_edge(self, server, tmp_path):
+        """Testa que, sem from_start, a gravação começa perto da borda ao vivo."""
+        # Arrange
+        recorder = self._recorder()
+
+        # Act
+        files = recorder.record(self._request(server, tmp_path), max_duration=4 * SEGMENT_SECONDS)
+
+        # Assert
+        recorded = _sequences(files)
+        assert len(recorded) == 4
+        assert recorded[0] >= PUBLISHED - LiveConfig.LIVE_EDGE_SEGMENTS
+        assert recorded == list(range(recorded[0], recorded[0] + 4))
+
+    def test_reconnects_after_playlist_outage(self, server, tmp_path):
+        """Testa que a gravação sobrevive a falhas seguidas da playlist."""
+        # Arrange
+        server.total = PUBLISHED + 30
+        control = JobControl()
+        progress = []
+
+        def fail_once(data):
+            if data['status'] == 'downloading' and data['fragment_index'] == 3:
+                server.failures = 2
+            progress.append(data)
+
+        # Act
+        files = self._recorder().record(self._request(server, tmp_path, from_start=True), fail_once, control)
+
+        # Assert
+        recorded = _sequences(files)
+        assert recorded == sorted(set(recorded))
+        assert recorded[-1] == server.total - 1
+        assert sum(event['kind'] == 'retry' for event in control.stats.events) == 2
+        assert progress[-1]['status'] == 'finished'
+
+    def test_expired_url_is_resolved_again(self, server, tmp_path):
+        """Testa que uma playlist que responde 403 é obtida de novo pelo yt-dlp."""
+        # Arrange
+        server.total = PUBLISHED + 10
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        recorder = self._recorder()
+        recorder.resolve = Mock(side_effect=lambda request, logger: (
+            f"{base}/expirada.m3u8" if recorder.resolve.call_count == 1 else f"{base}/live.m3u8", {}, "live"
+        ))
+
+        # Act
+        files = recorder.record(self._request(server, tmp_path, from_start=True))
+
+        # Assert
+        assert recorder.resolve.call_count >= 2
+        assert _sequences(files)[-1] == server.total - 1
+
+    def test_init_segment_is_retried(self, server, tmp_path):
+        """Testa que falhas do segmento de inicialização perdem só um segmento, sem encerrar a gravação."""
+        # Arrange
+        server.total = PUBLISHED + 6
+        server.fmp4 = True
+        server.init_failures = LiveConfig.SEGMENT_RETRIES + 2
+        control = JobControl()
+
+        # Act
+        files = self._recorder().record(self._request(server, tmp_path, from_start=True), control=control)
+
+        # Assert
+        assert _sequences(files) == list(range(1, server.total))
+        assert all(open(path, 'rb').read().startswith(b'INIT') for path in files)
+        assert all(path.endswith('.mp4') for path in files)
+        assert [event['kind'] for event in control.stats.events].count('live_gap') == 1
+
+    def test_disk_error_becomes_download_error(self, server, tmp_path):
+        """Testa que uma falha inesperada ao gravar chega ao chamador como DownloadError."""
+        # Arrange
+        request = self._request(server, tmp_path / "inexistente")
+
+        # Act & Assert
+        with pytest.raises(DownloadError, match="Erro durante a gravação"):
+            self._recorder().record(request)
+
+    def test_keep_segments_removes_oldest_files(self, server, tmp_path):
+        """Testa que só os arquivos mais recentes ficam no destino."""
+        # Arrange
+        server.total = PUBLISHED + 6
+        recorder = self._recorder(segment_seconds=2 * SEGMENT_SECONDS, keep_segments=2)
+
+        # Act
+        files = recorder.record(self._request(server, tmp_path, from_start=True))
+
+        # Assert
+        assert len(files) == 2
+        assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in files)
+        assert _sequences(files) == list(range(server.total - 4, server.total))
+
+    def test_cancel_keeps_recorded_files(self, server, tmp_path):
+        """Testa que interromper a gravação preserva o que já foi gravado."""
+        # Arrange
+        control = JobControl()
+
+        def stop_after_three(data):
+            if data['status'] == 'downloading' and data['fragment_index'] == 3:
+                control.cancel()
+
+        # Act & Assert
+        with pytest.raises(DownloadCancelledError):
+            self._recorder().record(self._request(server, tmp_path), stop_after_three, control)
+        names = os.listdir(tmp_path)
+        assert len(names) == 1 and names[0].endswith('.0001.ts')
+        assert len(_sequences([str(tmp_path / names[0])])) == 3
+
+    def test_parse_master_and_encrypted_playlists(self):
+        """Testa a escolha da variante de maior banda e a recusa de segmentos criptografados."""
+        # Arrange
+        master = "#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=800000\nbaixa.m3u8\n" \
+                 "#EXT-X-STREAM-INF:AVERAGE-BANDWIDTH=1,BANDWIDTH=3000000\nalta.m3u8\n"
+        encrypted = "#EXTM3U\n#EXT-X-KEY:METHOD=AES-128,URI=\"k\"\n#EXTINF:2,\na.ts\n"
+
+        # Act
+        playlist = parse_playlist(master, "http://cdn/live/master.m3u8")
+
+        # Assert
+        assert max(playlist.variants) == (3000000, "http://cdn/live/alta.m3u8")
+        with pytest.raises(DownloadError):
+            parse_playlist(encrypted, "http://cdn/live/a.m3u8")
+
+    def test_parse_byterange_playlist(self):
+        """Testa os trechos de EXT-X-BYTERANGE, com e sem deslocamento explícito."""
+        # Arrange
+        text = "#EXTM3U\n#EXT-X-MAP:URI=\"v.mp4\",BYTERANGE=\"100@0\"\n" \
+               "#EXTINF:2,\n#EXT-X-BYTERANGE:500@100\nv.mp4\n" \
+               "#EXTINF:2,\n#EXT-X-BYTERANGE:300\nv.mp4\n"
+
+        # Act
+        playlist = parse_playlist(text, "http://cdn/vod/index.m3u8")
+
+        # Assert
+        assert playlist.init_range == (0, 99)
+        assert [segment.byterange for segment in playlist.segments] == [(100, 599), (600, 899)]
+        with pytest.raises(ValueError):
+            parse_playlist("#EXTM3U\n#EXTINF:2,\n#EXT-X-BYTERANGE:300\nv.mp4\n", "http://cdn/vod/index.m3u8")
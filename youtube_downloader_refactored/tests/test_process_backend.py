@@ -0,0 +1,161 @@
+"""
+Testes do backend de execução em processos.
+
+Valida o download em processo filho contra um servidor HTTP local, o
+repasse de progresso e comandos pelo pipe e a propagação de erros.
+"""
+
+import os
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+from src.services.process_backend import ProcessBackend, PROGRESS_KEYS, _CommandRelay
+from src.services.job_control import JobControl
+from src.models.video_info import DownloadRequest
+from src.models.exceptions import CookiesNotFoundError, DownloadCancelledError
+
+FILE_SIZE = 2 * 1024 * 1024
+CHUNK = 64 * 1024
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """Serve um arquivo binário na taxa definida pelo servidor."""
+
+    def do_GET(self):
+        """Responde com o arquivo inteiro."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(FILE_SIZE))
+        self.end_headers()
+        try:
+            for start in range(0, FILE_SIZE, CHUNK):
+                self.wfile.write(self.server.payload[start:start + CHUNK])
+                time.sleep(CHUNK / self.server.rate)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        """Silencia o log do servidor."""
+        pass
+
+
+class TestProcessBackend:
+    """Testes para a classe ProcessBackend."""
+
+    @pytest.fixture
+    def server(self):
+        """Fixture que inicia um servidor HTTP local com um arquivo de vídeo."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _FileHandler)
+        server.payload = os.urandom(FILE_SIZE)
+        server.rate = 64 * 1024 * 1024
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def backend(self, tmp_path):
+        """Fixture que retorna um backend com arquivo de cookies temporário."""
+        cookies = tmp_path / "cookies.txt"
+        cookies.write_text("# Netscape HTTP Cookie File\n")
+        backend = ProcessBackend(max_workers=1, cookies_file=str(cookies))
+        yield backend
+        backend.shutdown()
+
+    def _request(self, server, tmp_path) -> DownloadRequest:
+        """Monta a requisição de download do arquivo do servidor."""
+        dest = tmp_path / "dest"
+        dest.mkdir(exist_ok=True)
+        return DownloadRequest(
+            url=f"http://127.0.0.1:{server.server_address[1]}/video.mp4",
+            save_path=str(dest),
+            format_choice="Melhor qualidade",
+            custom_title="video"
+        )
+
+    def test_download_streams_progress(self, backend, server, tmp_path):
+        """Testa download em processo filho com progresso entregue ao callback."""
+        # Arrange
+        request = self._request(server, tmp_path)
+        events = []
+        caller = threading.get_ident()
+
+        def on_progress(data):
+            events.append((threading.get_ident(), data))
+
+        # Act
+        backend.download(request, on_progress, JobControl())
+
+        # Assert
+        assert (tmp_path / "dest" / "video.mp4").read_bytes() == server.payload
+        assert events[-1][1]['status'] == 'finished'
+        assert all(thread == caller for thread, _ in events)
+        assert all(set(data) <= set(PROGRESS_KEYS) for _, data in events)
+
+    def test_cancel_stops_worker(self, backend, server, tmp_path):
+        """Testa que o cancelamento é repassado ao processo filho."""
+        # Arrange
+        server.rate = 256 * 1024
+        request = self._request(server, tmp_path)
+        control = JobControl()
+
+        def on_progress(data):
+            if data.get('downloaded_bytes', 0) > 0:
+                control.cancel()
+
+        # Act
+        start = time.monotonic()
+        with pytest.raises(DownloadCancelledError):
+            backend.download(request, on_progress, control)
+
+        # Assert
+        assert time.monotonic() - start < 5
+        assert not (tmp_path / "dest" / "video.mp4").exists()
+
+    def test_errors_are_raised_in_caller(self, tmp_path, server):
+        """Testa que as exceções do processo filho chegam ao chamador."""
+        # Arrange
+        backend = ProcessBackend(max_workers=1, cookies_file=str(tmp_path / "missing.txt"))
+
+        # Act & Assert
+        with pytest.raises(CookiesNotFoundError):
+            backend.download(self._request(server, tmp_path))
+
+    def test_pool_runs_in_other_processes(self, backend):
+        """Testa que as tarefas do pool executam em processos pré-iniciados."""
+        # Act
+        backend.prewarm()
+        pid = backend.submit(os.getpid).result()
+
+        # Assert
+        assert pid != os.getpid()
+
+
+class TestCommandRelay:
+    """Testes para a classe _CommandRelay."""
+
+    def test_forwards_state_changes_once(self):
+        """Testa que só as mudanças de estado do controle viram comandos."""
+        # Arrange
+        conn = Mock()
+        control = JobControl()
+        relay = _CommandRelay(conn, control)
+
+        # Act
+        relay.forward()
+        control.pause()
+        relay.forward()
+        relay.forward()
+        control.resume()
+        relay.forward()
+        control.cancel(keep_partial=True)
+        relay.forward()
+        relay.forward()
+
+        # Assert
+        sent = [call.args[0] for call in conn.send.call_args_list]
+        assert sent == [('pause', None), ('resume', None), ('cancel', True)]
+        assert relay.cancel_expired() is False
@@ -0,0 +1,188 @@
+"""
+Testes unitários para o download em segmentos paralelos.
+
+Usa um servidor HTTP local com suporte a Range para validar a montagem
+do arquivo, o uso de várias conexões, a retomada a partir do estado
+gravado, a nova tentativa de um segmento interrompido e o retorno ao
+downloader nativo quando o servidor ignora o Range.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import yt_dlp
+
+from src.config.constants import RangeConfig
+from src.services.range_downloader import RangeDownloader
+
+DATA = os.urandom(256 * 1024)
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serve DATA respeitando o cabeçalho Range, com falhas injetáveis."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+            if match and server.supports_range:
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else len(DATA) - 1
+                server.ranges.append((start, end))
+                self.send_response(206)
+                self.send_header('Content-Range', f'bytes {start}-{end}/{len(DATA)}')
+            else:
+                start, end = 0, len(DATA) - 1
+                self.send_response(200)
+            body = DATA[start:end + 1]
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+
+            with server.lock:
+                drop = len(body) > 1 and server.drops > 0
+                if drop:
+                    server.drops -= 1
+            if drop:
+                self.wfile.write(body[:len(body) // 2])
+                self.close_connection = True
+                return
+            for offset in range(0, len(body), 16 * 1024):
+                self.wfile.write(body[offset:offset + 16 * 1024])
+                time.sleep(server.delay)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class TestRangeDownloader:
+    """Testes para a classe RangeDownloader."""
+
+    @pytest.fixture
+    def server(self):
+        """Fixture que inicia o servidor local."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _RangeHandler)
+        server.daemon_threads = True
+        server.lock = threading.Lock()
+        server.active = server.max_active = server.drops = 0
+        server.delay = 0.01
+        server.supports_range = True
+        server.ranges = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def ydl(self):
+        """Fixture que retorna uma instância do YoutubeDL com 4 conexões."""
+        with patch.object(RangeConfig, 'MIN_SEGMENT_BYTES', 16 * 1024), \
+             yt_dlp.YoutubeDL({
+                 'quiet': True, 'noprogress': True, 'range_connections': 4, 'buffersize': 8192,
+                 'retries': 3, 'retry_sleep_functions': {'http': lambda n: 0},
+             }) as ydl:
+            RangeDownloader.attach(ydl)
+            yield ydl
+
+    @staticmethod
+    def _info(server) -> dict:
+        """Info dict de um formato progressivo servido pelo servidor local."""
+        return {
+            'id': 'video', 'ext': 'mp4', 'protocol': 'http',
+            'url': f'http://127.0.0.1:{server.server_address[1]}/video.mp4',
+        }
+
+    def test_downloads_with_parallel_connections(self, server, ydl, tmp_path):
+        """Testa que o arquivo é montado corretamente a partir de vários segmentos."""
+        # Arrange
+        target = str(tmp_path / "video.mp4")
+        events = []
+        ydl.add_progress_hook(events.append)
+
+        # Act
+        ydl.dl(target, self._info(server))
+
+        # Assert
+        with open(target, 'rb') as f:
+            assert f.read() == DATA
+        assert server.max_active >= 2
+        assert not os.path.exists(target + '.part')
+        assert not os.path.exists(target + '.ytdl')
+        assert events[-1]['status'] == 'finished'
+        assert events[-1]['total_bytes'] == len(DATA)
+
+    def test_resumes_from_saved_state(self, server, ydl, tmp_path):
+        """Testa que a retomada baixa apenas o que faltava de cada segmento."""
+        # Arrange
+        target = str(tmp_path / "video.mp4")
+        half = len(DATA) // 2
+        with open(target + '.part', 'wb') as f:
+            f.write(DATA[:half] + b'\0' * (len(DATA) - half))
+        with open(target + '.ytdl', 'w', encoding='utf-8') as f:
+            json.dump({'range_downloader': {
+                'total': len(DATA),
+                'segments': [[0, half - 1, half], [half, len(DATA) - 1, half]],
+            }}, f)
+
+        # Act
+        ydl.dl(target, self._info(server))
+
+        # Assert
+        with open(target, 'rb') as f:
+            assert f.read() == DATA
+        assert all(start >= half for start, _ in server.ranges[1:])
+
+    def test_retries_interrupted_segment(self, server, ydl, tmp_path):
+        """Testa que uma conexão derrubada é reaberta a partir do ponto atingido."""
+        # Arrange
+        target = str(tmp_path / "video.mp4")
+        server.drops = 2
+
+        # Act
+        ydl.dl(target, self._info(server))
+
+        # Assert
+        with open(target, 'rb') as f:
+            assert f.read() == DATA
+
+    def test_falls_back_without_range_support(self, server, ydl, tmp_path):
+        """Testa o uso do downloader nativo quando o servidor ignora o Range."""
+        # Arrange
+        target = str(tmp_path / "video.mp4")
+        server.supports_range = False
+
+        # Act
+        ydl.dl(target, self._info(server))
+
+        # Assert
+        with open(target, 'rb') as f:
+            assert f.read() == DATA
+        assert not os.path.exists(target + '.ytdl')
+
+    def test_single_connection_uses_native_downloader(self, server, ydl, tmp_path):
+        """Testa que jobs sem range_connections seguem pelo downloader do yt-dlp."""
+        # Arrange
+        target = str(tmp_path / "video.mp4")
+        ydl.params['range_connections'] = 1
+
+        # Act
+        ydl.dl(target, self._info(server))
+
+        # Assert
+        with open(target, 'rb') as f:
+            assert f.read() == DATA
+        assert server.ranges == []
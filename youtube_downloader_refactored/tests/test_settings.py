@@ -0,0 +1,180 @@
+"""
+Testes unitários para as configurações de desempenho.
+
+Valida a precedência entre padrões, perfil, arquivo e ambiente, a
+validação dos valores, a recarga em tempo de execução e a reação do
+JobManager aos novos limites.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.config.constants import CacheConfig, DaemonConfig, RangeConfig, StreamConfig
+from src.config.settings import Settings
+from src.models.exceptions import SettingsError
+from src.models.video_info import DownloadRequest
+from src.services.job_manager import JobManager
+
+
+class TestSettings:
+    """Testes para a classe Settings."""
+
+    @pytest.fixture(autouse=True)
+    def restore_defaults(self):
+        """Fixture que devolve as classes de configuração aos valores padrão."""
+        yield
+        Settings(path=None, environ={}).load()
+
+    @pytest.fixture
+    def settings_file(self, tmp_path):
+        """Fixture que grava um arquivo de configurações e retorna seu caminho."""
+        path = tmp_path / "settings.json"
+
+        def write(document):
+            path.write_text(json.dumps(document), encoding='utf-8')
+            return str(path)
+        return write
+
+    def test_precedence_defaults_profile_file_environment(self, settings_file):
+        """Testa que o ambiente vence o arquivo, que vence o perfil, que vence o padrão."""
+        # Arrange
+        path = settings_file({
+            'profile': 'server',
+            'daemon': {'max_concurrent_jobs': 6},
+            'stream': {'chunk_size': '128K'},
+        })
+        settings = Settings(path, environ={'YTGDL_STREAM_CHUNK_SIZE': '256K'})
+
+        # Act
+        settings.load()
+
+        # Assert
+        assert settings.profile == 'server'
+        assert RangeConfig.CONNECTIONS == 4
+        assert DaemonConfig.MAX_CONCURRENT_JOBS == 6
+        assert StreamConfig.CHUNK_SIZE == 256 * 1024
+        sources = {key: item['source'] for key, item in settings.to_dict()['settings'].items()}
+        assert sources['range.connections'] == 'perfil server'
+        assert sources['daemon.max_concurrent_jobs'] == 'arquivo'
+        assert sources['stream.chunk_size'] == 'ambiente'
+        assert sources['range.max_connections'] == 'padrão'
+
+    def test_explicit_profile_overrides_environment(self, settings_file):
+        """Testa que o perfil pedido na linha de comando vence YTGDL_PROFILE."""
+        # Arrange
+        settings = Settings(settings_file({'profile': 'server'}), environ={'YTGDL_PROFILE': 'server'},
+                            profile='low-bandwidth')
+
+        # Act
+        settings.load()
+
+        # Assert
+        assert settings.profile == 'low-bandwidth'
+        assert DaemonConfig.MAX_CONCURRENT_JOBS == 1
+        assert StreamConfig.CHUNK_SIZE == 16 * 1024
+
+    def test_environment_parses_sizes_and_none(self):
+        """Testa a leitura de tamanhos com sufixo e de 'none' nas variáveis de ambiente."""
+        # Arrange
+        settings = Settings(path=None, environ={
+            'YTGDL_CACHE_MAX_BYTES': '1.5G',
+            'YTGDL_DAEMON_TOTAL_RATE_LIMIT': 'none',
+            'YTGDL_LOG_VERBOSE': 'yes',
+        })
+
+        # Act
+        settings.load()
+
+        # Assert
+        assert CacheConfig.MAX_BYTES == int(1.5 * 1024 ** 3)
+        assert DaemonConfig.TOTAL_RATE_LIMIT is None
+        assert settings.get('log.verbose') is True
+
+    @pytest.mark.parametrize('environ, message', [
+        ({'YTGDL_DAEMON_MAX_CONCURRENT_JOBS': '0'}, 'daemon.max_concurrent_jobs'),
+        ({'YTGDL_SCHEDULER_POLICY': 'lifo'}, 'scheduler.policy'),
+        ({'YTGDL_STREAM_CHUNK_SIZE': 'muito'}, 'stream.chunk_size'),
+        ({'YTGDL_PROFILE': 'turbo'}, 'Perfil desconhecido'),
+    ])
+    def test_invalid_value_changes_nothing(self, environ, message):
+        """Testa que um valor inválido é rejeitado sem aplicar os demais."""
+        # Arrange
+        environ = dict(environ, YTGDL_RANGE_CONNECTIONS='8')
+        settings = Settings(path=None, environ=environ)
+
+        # Act & Assert
+        with pytest.raises(SettingsError, match=message):
+            settings.load()
+        assert RangeConfig.CONNECTIONS == 1
+
+    def test_unknown_key_in_file_is_rejected(self, settings_file):
+        """Testa que um item desconhecido no arquivo é apontado pelo nome."""
+        # Arrange
+        settings = Settings(settings_file({'daemon': {'max_jobs': 3}}), environ={})
+
+        # Act & Assert
+        with pytest.raises(SettingsError, match='daemon.max_jobs'):
+            settings.load()
+
+    def test_reload_notifies_only_changes(self, settings_file):
+        """Testa que a recarga informa aos ouvintes só o que mudou e o que exige reinício."""
+        # Arrange
+        path = settings_file({'daemon': {'max_concurrent_jobs': 2}})
+        settings = Settings(path, environ={})
+        settings.load()
+        listener = Mock()
+        settings.subscribe(listener)
+        settings_file({'daemon': {'max_concurrent_jobs': 5}, 'batch': {'max_workers': 2}})
+
+        # Act
+        changed = settings.reload()
+        unchanged = settings.reload()
+
+        # Assert
+        assert changed == {'daemon.max_concurrent_jobs': 5, 'batch.max_workers': 2}
+        assert unchanged == {}
+        listener.assert_called_once_with(changed)
+        assert settings.restart_required(changed) == ['batch.max_workers']
+
+    def test_job_manager_grows_after_reconfigure(self):
+        """Testa que mais slots deixam os jobs pendentes começarem sem reiniciar a fila."""
+        # Arrange
+        release = threading.Event()
+        started = []
+        lock = threading.Lock()
+
+        def fake_download(request, progress_callback, control):
+            with lock:
+                started.append(request.url)
+            release.wait(5)
+        service = Mock()
+        service.download.side_effect = fake_download
+        manager = JobManager(download_service=service, max_concurrent=1)
+        manager.start()
+        for n in range(3):
+            manager.submit(DownloadRequest(f"https://www.youtube.com/watch?v={n}", "/tmp", "Melhor qualidade"))
+
+        # Act
+        before = self._wait_started(started, 1)
+        manager.reconfigure(3, None)
+        after = self._wait_started(started, 3)
+        release.set()
+        manager.shutdown()
+
+        # Assert
+        assert before == 1
+        assert after == 3
+        assert manager.max_concurrent == 3
+
+    @staticmethod
+    def _wait_started(started, count, timeout=2.0):
+        """Espera até 'count' downloads começarem (e um pouco mais) e retorna quantos começaram."""
+        deadline = time.monotonic() + timeout
+        while len(started) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        return len(started)
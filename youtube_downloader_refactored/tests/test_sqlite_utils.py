@@ -0,0 +1,61 @@
+"""
+Testes unitários para os utilitários de SQLite.
+
+Valida a criação do esquema e a confirmação ou reversão da transação.
+"""
+
+import sqlite3
+
+import pytest
+from src.utils.sqlite_utils import create_schema, transaction
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (name TEXT PRIMARY KEY);"
+
+
+class TestTransaction:
+    """Testes para o gerenciador de contexto transaction."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Fixture que cria um banco com a tabela de teste."""
+        path = str(tmp_path / "test.db")
+        create_schema(path, SCHEMA, timeout=1.0)
+        return path
+
+    @staticmethod
+    def _names(db_path: str) -> list:
+        connection = sqlite3.connect(db_path)
+        try:
+            return [row[0] for row in connection.execute("SELECT name FROM items ORDER BY name")]
+        finally:
+            connection.close()
+
+    def test_commits_at_end_of_block(self, db_path):
+        """Testa que as escritas do bloco são confirmadas."""
+        # Act
+        with transaction(db_path, timeout=1.0) as connection:
+            connection.execute("INSERT INTO items VALUES ('a')")
+            connection.execute("INSERT INTO items VALUES ('b')")
+
+        # Assert
+        assert self._names(db_path) == ['a', 'b']
+
+    def test_rolls_back_on_exception(self, db_path):
+        """Testa que uma exceção no bloco desfaz todas as escritas."""
+        # Act
+        with pytest.raises(RuntimeError):
+            with transaction(db_path, timeout=1.0) as connection:
+                connection.execute("INSERT INTO items VALUES ('a')")
+                raise RuntimeError("falha no meio")
+
+        # Assert
+        assert self._names(db_path) == []
+
+    def test_busy_database_times_out(self, db_path):
+        """Testa que outra transação de escrita aberta bloqueia até o timeout."""
+        # Arrange
+        with transaction(db_path, timeout=1.0):
+            # Act & Assert
+            with pytest.raises(sqlite3.OperationalError):
+                with transaction(db_path, timeout=0.1):
+                    pass
@@ -0,0 +1,55 @@
+"""
+Testes unitários para as métricas de inicialização.
+
+Valida o registro de marcos e o cálculo do tempo até o primeiro download.
+"""
+
+import pytest
+from src.utils.startup_metrics import StartupMetrics
+
+
+class TestStartupMetrics:
+    """Testes para a classe StartupMetrics."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fixture com um relógio controlado manualmente."""
+        class Clock:
+            now = 100.0
+
+            def __call__(self):
+                return self.now
+        return Clock()
+
+    def test_marks_keep_first_occurrence(self, clock):
+        """Testa que marcos repetidos (ex.: a cada progresso) mantêm o primeiro instante."""
+        # Arrange
+        metrics = StartupMetrics(clock=clock)
+
+        # Act
+        clock.now += 2.0
+        first = metrics.mark(StartupMetrics.FIRST_PROGRESS)
+        clock.now += 5.0
+        again = metrics.mark(StartupMetrics.FIRST_PROGRESS)
+
+        # Assert
+        assert first == again == pytest.approx(2.0)
+        assert metrics.elapsed(StartupMetrics.FIRST_PROGRESS) == pytest.approx(2.0)
+
+    def test_time_to_first_download(self, clock):
+        """Testa o intervalo entre o pedido e o primeiro progresso do download."""
+        # Arrange
+        metrics = StartupMetrics(clock=clock)
+        clock.now += 1.0
+        metrics.mark(StartupMetrics.DOWNLOAD_REQUESTED)
+
+        # Act
+        before = metrics.between(StartupMetrics.DOWNLOAD_REQUESTED, StartupMetrics.FIRST_PROGRESS)
+        clock.now += 0.25
+        metrics.mark(StartupMetrics.FIRST_PROGRESS)
+
+        # Assert
+        assert before is None
+        summary = dict(metrics.summary())
+        assert summary["tempo até o primeiro download"] == pytest.approx(0.25)
+        assert "250 ms" in metrics.report()
@@ -0,0 +1,196 @@
+"""
+Testes unitários para o armazenamento dos downloads.
+
+Valida a verificação de espaço livre e a área de rascunho.
+"""
+
+import errno
+import os
+import pytest
+from collections import namedtuple
+from unittest.mock import patch
+from src.services.storage import DiskSpaceGuard, DiskPreflight, StagingArea
+from src.models.exceptions import InsufficientDiskSpaceError
+
+Usage = namedtuple('Usage', 'total used free')
+MB = 1024 ** 2
+
+
+class TestDiskSpaceGuard:
+    """Testes para as classes DiskSpaceGuard e DiskPreflight."""
+
+    @pytest.fixture
+    def guard(self):
+        """Fixture que retorna uma verificação sem folga nem mínimo livre."""
+        return DiskSpaceGuard(safety_margin=1.0, min_free_bytes=0)
+
+    def test_estimate_size_merged(self):
+        """Testa estimativa de tamanho de formatos mesclados."""
+        # Arrange
+        info = {'duration': 10, 'requested_formats': [{'filesize': 100}, {'tbr': 8}]}
+
+        # Act & Assert
+        assert DiskSpaceGuard.estimate_size(info) == 100 + 10_000
+        assert DiskSpaceGuard.estimate_size({'format_id': '18'}) is None
+
+    def test_requirements_same_disk(self, guard, tmp_path):
+        """Testa que a mesclagem exige o dobro do tamanho no disco de trabalho."""
+        # Act
+        needs = guard.requirements(100, True, str(tmp_path / 'scratch'), str(tmp_path))
+
+        # Assert
+        assert needs == [(str(tmp_path / 'scratch'), 200)]
+
+    def test_requirements_other_disk(self, guard, tmp_path):
+        """Testa que o destino em outro disco precisa do arquivo final."""
+        # Arrange
+        with patch.object(DiskSpaceGuard, '_device', side_effect=lambda path: hash(path)):
+            # Act
+            needs = guard.requirements(100, True, 'scratch', 'dest')
+
+        # Assert
+        assert needs == [('scratch', 200), ('dest', 100)]
+
+    def test_reserve_insufficient_space(self, guard, tmp_path):
+        """Testa falha antecipada quando o disco não comporta o download."""
+        # Arrange
+        with patch('shutil.disk_usage', return_value=Usage(1000 * MB, 900 * MB, 100 * MB)):
+            # Act & Assert
+            with pytest.raises(InsufficientDiskSpaceError) as exc_info:
+                guard.reserve([(str(tmp_path), 150 * MB)])
+
+        assert "Espaço insuficiente" in str(exc_info.value)
+
+    def test_reservations_are_shared(self, guard, tmp_path):
+        """Testa que jobs simultâneos não contam com o mesmo espaço livre."""
+        # Arrange
+        with patch('shutil.disk_usage', return_value=Usage(1000 * MB, 900 * MB, 100 * MB)):
+            first = guard.reserve([(str(tmp_path), 60 * MB)])
+
+            # Act & Assert
+            with pytest.raises(InsufficientDiskSpaceError):
+                guard.reserve([(str(tmp_path), 60 * MB)])
+            guard.release(first)
+            guard.reserve([(str(tmp_path), 60 * MB)])
+
+    def test_preflight_filter(self, guard, tmp_path):
+        """Testa o filtro usado pelo yt-dlp antes de cada vídeo."""
+        # Arrange
+        preflight = DiskPreflight(guard, None, str(tmp_path))
+        info = {'requested_formats': [{'filesize': 80 * MB}, {'filesize': 20 * MB}]}
+
+        with patch('shutil.disk_usage', return_value=Usage(1000 * MB, 850 * MB, 150 * MB)):
+            # Act & Assert
+            assert preflight(info, incomplete=True) is None
+            with pytest.raises(InsufficientDiskSpaceError):
+                preflight(info)
+            assert preflight({'filesize': 100 * MB}) is None
+        preflight.release()
+
+
+class TestStagingArea:
+    """Testes para a classe StagingArea."""
+
+    def test_commit_moves_recorded_files(self, tmp_path):
+        """Testa entrega dos arquivos finais ao destino."""
+        # Arrange
+        staging = StagingArea(str(tmp_path / 'scratch'))
+        scratch = staging.prepare()
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+        video = os.path.join(scratch, 'video.mp4')
+        with open(video, 'wb') as f:
+            f.write(b'data')
+        staging.record(video)
+        staging.record(video)
+
+        # Act
+        moved = staging.commit(str(dest))
+
+        # Assert
+        assert moved == [str(dest / 'video.mp4')]
+        assert (dest / 'video.mp4').read_bytes() == b'data'
+        assert not os.path.exists(video)
+
+    def test_move_across_disks(self, tmp_path):
+        """Testa cópia com renomeação atômica quando o destino está em outro disco."""
+        # Arrange
+        src = tmp_path / 'video.mp4'
+        src.write_bytes(b'data')
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+        real_link = os.link
+        calls = []
+
+        def fake_link(a, b):
+            calls.append(a)
+            if len(calls) == 1:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            real_link(a, b)
+
+        # Act
+        with patch('os.link', side_effect=fake_link):
+            result = StagingArea.move_atomic(str(src), str(dest))
+
+        # Assert
+        assert result == str(dest / 'video.mp4')
+        assert (dest / 'video.mp4').read_bytes() == b'data'
+        assert os.path.dirname(calls[1]) == str(dest)
+        assert not src.exists()
+        assert os.listdir(dest) == ['video.mp4']
+
+    def test_jobs_get_separate_directories(self, tmp_path):
+        """Testa que jobs simultâneos não compartilham o rascunho e que sobras não são entregues."""
+        # Arrange
+        leftover = tmp_path / 'scratch' / 'video.mp4'
+        leftover.parent.mkdir()
+        leftover.write_bytes(b'sobra de uma execucao interrompida')
+        first = StagingArea(str(tmp_path / 'scratch'))
+        second = StagingArea(str(tmp_path / 'scratch'))
+
+        # Act
+        first_dir, second_dir = first.prepare(), second.prepare()
+        first.cleanup()
+
+        # Assert
+        assert first_dir != second_dir
+        assert os.listdir(second_dir) == []
+        assert not os.path.exists(first_dir)
+        assert os.path.isdir(second_dir)
+
+    def test_commit_keeps_existing_destination_file(self, tmp_path):
+        """Testa que a entrega não sobrescreve um arquivo que já existe no destino."""
+        # Arrange
+        staging = StagingArea(str(tmp_path / 'scratch'))
+        video = os.path.join(staging.prepare(), 'video.mp4')
+        with open(video, 'wb') as f:
+            f.write(b'novo')
+        staging.record(video)
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+        (dest / 'video.mp4').write_bytes(b'original')
+
+        # Act
+        moved = staging.commit(str(dest))
+
+        # Assert
+        assert moved == [str(dest / 'video.mp4')]
+        assert (dest / 'video.mp4').read_bytes() == b'original'
+        assert not os.path.exists(video)
+
+    def test_move_without_hard_links_does_not_overwrite(self, tmp_path):
+        """Testa o caminho sem hard links (ex.: FAT): o destino existente é preservado."""
+        # Arrange
+        src = tmp_path / 'video.mp4'
+        src.write_bytes(b'novo')
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+        (dest / 'video.mp4').write_bytes(b'original')
+
+        # Act & Assert
+        with patch('os.link', side_effect=OSError(errno.EPERM, "Operation not permitted")), \
+             pytest.raises(FileExistsError):
+            StagingArea.move_atomic(str(src), str(dest))
+        assert (dest / 'video.mp4').read_bytes() == b'original'
+        assert src.exists()
+
@@ -0,0 +1,314 @@
+"""
+Testes unitários para o envio da mídia a pipes e streams.
+
+Usa um servidor HTTP local com suporte a Range, quedas de conexão
+simuladas e uma playlist HLS sob demanda para validar a cópia sem
+arquivo em disco, a retomada, a backpressure de um pipe que não é lido
+e a escolha de formatos que não precisam de mesclagem.
+"""
+
+import asyncio
+import io
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.config.constants import DownloadFormats, StreamConfig
+from src.models.exceptions import DownloadError
+from src.models.video_info import DownloadRequest
+from src.services.async_download_service import AsyncDownloadService
+from src.services.download_service import DownloadService
+from src.services.job_control import JobControl
+from src.services.stream_sink import FileSink, MediaStreamer
+
+VIDEO = os.urandom(3 * 1024 ** 2 + 123)
+SEGMENTS = [os.urandom(50_000 + n) for n in range(5)]
+INIT = b'ftyp-init'
+SINGLE = INIT + b''.join(SEGMENTS)  # playlist com EXT-X-BYTERANGE: trechos de um só arquivo
+
+
+class _MediaHandler(BaseHTTPRequestHandler):
+    """Serve um arquivo com Range e uma playlist HLS sob demanda."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        server = self.server
+        if self.path == '/video.mp4':
+            server.requests.append(self.headers.get('Range'))
+            self._send_video()
+        elif self.path == '/vod.m3u8':
+            lines = ['#EXTM3U', '#EXT-X-TARGETDURATION:2', '#EXT-X-MAP:URI="init.mp4"']
+            for n in range(len(SEGMENTS)):
+                lines += ['#EXTINF:2.0,', f'seg/{n}.m4s']
+            lines.append('#EXT-X-ENDLIST')
+            self._send(200, '\n'.join(lines).encode())
+        elif self.path == '/byterange.m3u8':
+            lines = ['#EXTM3U', '#EXT-X-TARGETDURATION:2', f'#EXT-X-MAP:URI="single.mp4",BYTERANGE="{len(INIT)}@0"']
+            for n, segment in enumerate(SEGMENTS):
+                # Só o primeiro traz o deslocamento; os seguintes continuam do anterior
+                lines += ['#EXTINF:2.0,', f'#EXT-X-BYTERANGE:{len(segment)}' + ('' if n else f'@{len(INIT)}'), 'single.mp4']
+            lines.append('#EXT-X-ENDLIST')
+            self._send(200, '\n'.join(lines).encode())
+        elif self.path == '/single.mp4':
+            self._send_video(SINGLE)
+        elif self.path == '/init.mp4':
+            self._send(200, INIT)
+        elif self.path.startswith('/seg/'):
+            self._send(200, SEGMENTS[int(re.search(r'/seg/(\d+)', self.path).group(1))])
+        else:
+            self._send(404, b'')
+
+    def _send_video(self, content: bytes = VIDEO) -> None:
+        server = self.server
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range') or '')
+        if match and not server.ignore_range:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(content) - 1
+            body = content[start:end + 1]
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{start + len(body) - 1}/{len(content)}")
+        else:
+            body = content
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if server.drop_after:
+            # Derruba a conexão no meio do corpo, uma única vez
+            drop, server.drop_after = server.drop_after, 0
+            self.wfile.write(body[:drop])
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(body)
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class TestMediaStreamer:
+    """Testes para a classe MediaStreamer."""
+
+    @pytest.fixture
+    def server(self):
+        """Fixture que inicia o servidor de mídia local."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _MediaHandler)
+        server.daemon_threads = True
+        server.requests = []
+        server.drop_after = 0
+        server.ignore_range = False
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture(autouse=True)
+    def fast_retries(self):
+        """Fixture que encurta as esperas e mostra todo evento de progresso."""
+        with patch.object(StreamConfig, 'RETRY_DELAY', 0.01), \
+             patch.object(StreamConfig, 'PROGRESS_INTERVAL', 0.0):
+            yield
+
+    @staticmethod
+    def _streamer(fmt: dict) -> MediaStreamer:
+        """Streamer cujo formato já vem resolvido."""
+        streamer = MediaStreamer(cookie_manager=Mock(), ydl_pool=Mock())
+        streamer.resolve = Mock(return_value=(fmt, "video"))
+        return streamer
+
+    @staticmethod
+    def _url(server, path: str) -> str:
+        return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+    @staticmethod
+    def _request() -> DownloadRequest:
+        return DownloadRequest("https://www.youtube.com/watch?v=test123", "/nao/usado", DownloadFormats.DEFAULT)
+
+    def test_progressive_in_chunks(self, server):
+        """Testa o envio em pedaços de http_chunk_size, na ordem e sem perdas."""
+        # Arrange
+        fmt = {'url': self._url(server, '/video.mp4'), 'protocol': 'https', 'format_id': '18', 'ext': 'mp4',
+               'downloader_options': {'http_chunk_size': 1024 ** 2}}
+        sink = io.BytesIO()
+        progress = []
+
+        # Act
+        result = self._streamer(fmt).stream(self._request(), FileSink(sink), progress.append)
+
+        # Assert
+        assert sink.getvalue() == VIDEO
+        assert result == {'title': "video", 'format_id': '18', 'ext': 'mp4', 'bytes': len(VIDEO)}
+        assert server.requests == ['bytes=0-1048575', 'bytes=1048576-2097151',
+                                   'bytes=2097152-3145727', 'bytes=3145728-3145850']
+        assert progress[-1]['status'] == 'finished'
+        assert progress[-2]['_percent_str'] == '100.0%'
+
+    def test_resumes_after_connection_drop(self, server):
+        """Testa que uma queda retoma do último byte entregue."""
+        # Arrange
+        server.drop_after = 1_000_000
+        fmt = {'url': self._url(server, '/video.mp4'), 'protocol': 'https'}
+        sink = io.BytesIO()
+        control = JobControl()
+
+        # Act
+        self._streamer(fmt).stream(self._request(), FileSink(sink), control=control)
+
+        # Assert
+        assert sink.getvalue() == VIDEO
+        assert server.requests[-1] == 'bytes=1000000-'
+        assert [event['kind'] for event in control.stats.events] == ['retry']
+
+    def test_resume_when_server_ignores_range(self, server):
+        """Testa que, sem suporte a Range, os bytes já entregues são descartados."""
+        # Arrange
+        server.drop_after = 700_000
+        server.ignore_range = True
+        fmt = {'url': self._url(server, '/video.mp4'), 'protocol': 'https'}
+        sink = io.BytesIO()
+
+        # Act
+        self._streamer(fmt).stream(self._request(), FileSink(sink))
+
+        # Assert
+        assert sink.getvalue() == VIDEO
+
+    def test_hls_playlist_is_concatenated(self, server):
+        """Testa o envio do segmento de inicialização e dos segmentos, em ordem."""
+        # Arrange
+        fmt = {'url': self._url(server, '/vod.m3u8'), 'protocol': 'm3u8_native'}
+        sink = io.BytesIO()
+
+        # Act
+        self._streamer(fmt).stream(self._request(), FileSink(sink))
+
+        # Assert
+        assert sink.getvalue() == INIT + b''.join(SEGMENTS)
+
+    @pytest.mark.parametrize('ignore_range', [False, True])
+    def test_hls_byterange_sends_each_range_once(self, server, ignore_range):
+        """Testa uma playlist com EXT-X-BYTERANGE, inclusive com um servidor que ignora o Range."""
+        # Arrange
+        server.ignore_range = ignore_range
+        fmt = {'url': self._url(server, '/byterange.m3u8'), 'protocol': 'm3u8_native'}
+        sink = io.BytesIO()
+
+        # Act
+        self._streamer(fmt).stream(self._request(), FileSink(sink))
+
+        # Assert
+        assert sink.getvalue() == SINGLE
+
+    def test_invalid_playlist_raises_download_error(self, server):
+        """Testa que uma resposta que não é playlist HLS vira DownloadError."""
+        # Arrange
+        fmt = {'url': self._url(server, '/init.mp4'), 'protocol': 'm3u8_native'}
+
+        # Act & Assert
+        with pytest.raises(DownloadError, match="Playlist HLS inválida"):
+            self._streamer(fmt).stream(self._request(), FileSink(io.BytesIO()))
+
+    def test_unread_pipe_holds_the_download(self, server):
+        """Testa a backpressure: um pipe que não é lido segura o download."""
+        # Arrange
+        fmt = {'url': self._url(server, '/video.mp4'), 'protocol': 'https'}
+        read_fd, write_fd = os.pipe()
+        sink = FileSink.open(write_fd)
+        sent = []
+        worker = threading.Thread(
+            target=self._streamer(fmt).stream,
+            args=(self._request(), sink, lambda data: sent.append(data['downloaded_bytes']))
+        )
+
+        # Act
+        worker.start()
+        worker.join(0.5)
+        held = max(sent)
+        received = bytearray()
+        while len(received) < len(VIDEO):
+            received += os.read(read_fd, StreamConfig.CHUNK_SIZE)
+        worker.join(5)
+        sink.close()
+        os.close(write_fd)
+        os.close(read_fd)
+
+        # Assert
+        assert held < len(VIDEO) / 2
+        assert not worker.is_alive()
+        assert bytes(received) == VIDEO
+
+    def test_closed_sink_raises_download_error(self, server):
+        """Testa que um destino fechado encerra o envio com erro."""
+        # Arrange
+        fmt = {'url': self._url(server, '/video.mp4'), 'protocol': 'https'}
+        sink = Mock()
+        sink.write.side_effect = BrokenPipeError("pipe fechado")
+
+        # Act & Assert
+        with pytest.raises(DownloadError, match="deixou de aceitar"):
+            self._streamer(fmt).stream(self._request(), sink)
+
+    def test_async_stream_waits_for_drain(self, server):
+        """Testa o envio a um stream asyncio pelo AsyncDownloadService."""
+        # Arrange
+        fmt = {'url': self._url(server, '/video.mp4'), 'protocol': 'https'}
+        service = DownloadService(cookies_file="test_cookies.txt", cookie_manager=Mock(),
+                                  media_streamer=self._streamer(fmt))
+        async_service = AsyncDownloadService(download_service=service, video_info_service=Mock())
+
+        class Writer:
+            def __init__(self):
+                self.data = bytearray()
+                self.drains = 0
+
+            def write(self, data):
+                self.data += data
+
+            async def drain(self):
+                self.drains += 1
+                await asyncio.sleep(0)
+
+        writer = Writer()
+
+        # Act
+        with patch('os.path.exists', return_value=True):
+            result = asyncio.run(async_service.stream(self._request(), writer))
+        async_service.shutdown()
+
+        # Assert
+        assert bytes(writer.data) == VIDEO
+        assert writer.drains >= len(VIDEO) // StreamConfig.CHUNK_SIZE
+        assert result['bytes'] == len(VIDEO)
+
+    def test_selector_avoids_formats_that_need_merging(self):
+        """Testa que só formatos progressivos ou só de áudio são escolhidos."""
+        # Arrange
+        formats = [
+            {'format_id': '18', 'protocol': 'https', 'vcodec': 'avc1', 'acodec': 'mp4a', 'height': 360},
+            {'format_id': '137', 'protocol': 'https', 'vcodec': 'avc1', 'acodec': 'none', 'height': 1080},
+            {'format_id': '96', 'protocol': 'm3u8_native', 'vcodec': 'avc1', 'acodec': 'mp4a', 'height': 1080},
+            {'format_id': '140', 'protocol': 'https', 'vcodec': 'none', 'acodec': 'mp4a', 'ext': 'm4a', 'abr': 128},
+            {'format_id': 'dash', 'protocol': 'http_dash_segments', 'vcodec': 'avc1', 'acodec': 'mp4a', 'height': 1440},
+        ]
+
+        # Act
+        video = list(MediaStreamer.format_selector(DownloadFormats.get_policy("Melhor qualidade"))({'formats': formats}))
+        small = list(MediaStreamer.format_selector(DownloadFormats.get_policy("Qualidade até 720p"))({'formats': formats}))
+        audio = list(MediaStreamer.format_selector(DownloadFormats.get_policy("Áudio MP3"))({'formats': formats}))
+
+        # Assert
+        assert [fmt['format_id'] for fmt in video] == ['96']
+        assert [fmt['format_id'] for fmt in small] == ['18']
+        assert [fmt['format_id'] for fmt in audio] == ['140']
@@ -0,0 +1,221 @@
+"""
+Testes para o monitor de estrangulamento.
+
+Valida a detecção com relógio simulado e a recuperação da velocidade
+com o yt-dlp real contra um servidor HTTP local que estrangula a
+primeira conexão de download.
+"""
+
+import os
+import re
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yt_dlp
+from yt_dlp.utils import ReExtractInfo
+
+from src.services.throttle_monitor import ThrottleMonitor
+from src.models.job import JobStats
+
+FILE_SIZE = 4 * 1024 * 1024
+LINE_RATE = 2 * 1024 * 1024  # bytes/s
+THROTTLED_RATE = 48 * 1024
+THROTTLE_AFTER = 1536 * 1024
+CHUNK = 16 * 1024
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    """Serve um arquivo com suporte a Range, estrangulando a primeira conexão longa."""
+
+    def do_GET(self):
+        """Responde ao download, limitado à taxa da linha ou à taxa estrangulada."""
+        server = self.server
+        start = 0
+        match = re.match(r'bytes=(\d+)-', self.headers.get('Range', ''))
+        if match:
+            start = int(match.group(1))
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{FILE_SIZE - 1}/{FILE_SIZE}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(FILE_SIZE - start))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+        sent, throttled = 0, False
+        try:
+            while start + sent < FILE_SIZE:
+                size = min(CHUNK, FILE_SIZE - start - sent)
+                self.wfile.write(server.payload[start + sent:start + sent + size])
+                sent += size
+                if not throttled and sent > THROTTLE_AFTER and not server.throttled_once:
+                    server.throttled_once = throttled = True
+                time.sleep(size / (THROTTLED_RATE if throttled else LINE_RATE))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        """Silencia o log do servidor."""
+        pass
+
+
+class TestThrottleMonitor:
+    """Testes para a classe ThrottleMonitor."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fixture com um relógio controlado manualmente."""
+        class Clock:
+            now = 0.0
+
+            def __call__(self):
+                return self.now
+        return Clock()
+
+    @pytest.fixture
+    def monitor(self, clock):
+        """Fixture que retorna um monitor com janela de 1 segundo."""
+        return ThrottleMonitor(
+            JobStats(), window=1.0, min_speed_ratio=0.3, min_speed=None,
+            max_restarts=2, backoff_base=0.5, clock=clock, sleep=lambda s: None
+        )
+
+    def _feed(self, monitor, clock, start_bytes, speed, seconds, step=0.25):
+        """Envia eventos de progresso a uma velocidade constante."""
+        downloaded = start_bytes
+        for _ in range(int(seconds / step)):
+            clock.now += step
+            downloaded += int(speed * step)
+            monitor.observe({'status': 'downloading', 'downloaded_bytes': downloaded, 'filename': 'v.mp4'})
+        return downloaded
+
+    def test_detects_sustained_slowdown(self, monitor, clock):
+        """Testa reconexão quando a velocidade cai abaixo da fração do pico."""
+        # Arrange
+        downloaded = self._feed(monitor, clock, 0, 1_000_000, 3)
+
+        # Act & Assert
+        with pytest.raises(ReExtractInfo):
+            self._feed(monitor, clock, downloaded, 100_000, 3)
+        assert monitor.stats.throttle_restarts == 1
+        assert monitor.peak_speed == pytest.approx(1_000_000, rel=0.01)
+
+    def test_brief_dip_is_ignored(self, monitor, clock):
+        """Testa que uma queda menor que a janela não causa reconexão."""
+        # Arrange
+        downloaded = self._feed(monitor, clock, 0, 1_000_000, 3)
+
+        # Act
+        downloaded = self._feed(monitor, clock, downloaded, 100_000, 0.5)
+        self._feed(monitor, clock, downloaded, 1_000_000, 3)
+
+        # Assert
+        assert monitor.stats.throttle_restarts == 0
+
+    def test_paused_hook_is_not_throttling(self, monitor, clock):
+        """Testa que o tempo de um job pausado não é confundido com estrangulamento."""
+        # Arrange
+        def paused_callback(data):
+            clock.now += 60
+        hook = monitor.wrap_progress_hook(paused_callback)
+        downloaded = self._feed(monitor, clock, 0, 1_000_000, 3)
+
+        # Act
+        hook({'status': 'downloading', 'downloaded_bytes': downloaded, 'filename': 'v.mp4'})
+        self._feed(monitor, clock, downloaded, 1_000_000, 3)
+
+        # Assert
+        assert monitor.stats.throttle_restarts == 0
+
+    def test_gives_up_after_max_restarts(self, monitor, clock):
+        """Testa o limite de reconexões por job."""
+        # Arrange
+        downloaded = self._feed(monitor, clock, 0, 1_000_000, 3)
+
+        # Act
+        for _ in range(2):
+            with pytest.raises(ReExtractInfo):
+                downloaded = self._feed(monitor, clock, downloaded, 100_000, 3)
+        self._feed(monitor, clock, downloaded, 100_000, 3)
+
+        # Assert
+        assert monitor.stats.throttle_restarts == 2
+
+    def test_rate_limit_below_min_speed_is_not_throttling(self, clock):
+        """Testa que um 'ratelimit' menor que MIN_SPEED reduz o piso em vez de reconectar sem parar."""
+        # Arrange
+        def limited_monitor(rate_limit):
+            return ThrottleMonitor(
+                JobStats(), window=1.0, min_speed_ratio=0.3, min_speed=50 * 1024,
+                rate_limit=rate_limit, max_restarts=2, clock=clock, sleep=lambda s: None
+            )
+        limited = limited_monitor(20 * 1024)
+        starved = limited_monitor(20 * 1024)
+
+        # Act
+        self._feed(limited, clock, 0, 20 * 1024, 3)
+        with pytest.raises(ReExtractInfo):
+            self._feed(starved, clock, 0, 5 * 1024, 3)
+
+        # Assert
+        assert limited.stats.throttle_restarts == 0
+        assert starved.stats.throttle_restarts == 1
+        with pytest.raises(ReExtractInfo):
+            self._feed(limited_monitor(None), clock, 0, 20 * 1024, 3)
+
+    def test_retry_delay_backoff(self, monitor):
+        """Testa recuo exponencial e registro das novas tentativas de conexão."""
+        # Act
+        delays = [monitor.retry_delay(n) for n in range(8)]
+
+        # Assert
+        assert delays[:3] == [0.5, 1.0, 2.0]
+        assert max(delays) == monitor.backoff(100)
+        assert monitor.stats.connection_retries == 8
+        assert len(monitor.stats.events) == 8
+
+    def test_recovers_line_rate_on_throttling_server(self, tmp_path):
+        """Testa a recuperação da velocidade contra um servidor que estrangula a conexão."""
+        # Arrange
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _ThrottlingHandler)
+        server.payload = os.urandom(FILE_SIZE)
+        server.throttled_once = False
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/video.mp4'
+
+        monitor = ThrottleMonitor(window=0.5, min_speed=None, backoff_base=0.05)
+        samples = []
+        options = {
+            'quiet': True,
+            'noprogress': True,
+            'buffersize': 64 * 1024,
+            'noresizebuffer': True,
+            'outtmpl': str(tmp_path / 'video.%(ext)s'),
+            'progress_hooks': [
+                monitor.observe,
+                lambda d: samples.append((time.monotonic(), d.get('downloaded_bytes') or 0)),
+            ],
+            'retry_sleep_functions': monitor.retry_sleep_functions(),
+        }
+
+        # Act
+        try:
+            with yt_dlp.YoutubeDL(options) as ydl:
+                start = time.monotonic()
+                ydl.download([url])
+                elapsed = time.monotonic() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Assert
+        assert (tmp_path / 'video.mp4').read_bytes() == server.payload
+        assert monitor.stats.throttle_restarts == 1
+        # Sem o monitor o restante do arquivo levaria mais de 50 s na taxa estrangulada
+        assert elapsed < 10
+        tail = [s for s in samples if s[1] >= FILE_SIZE - 1024 * 1024]
+        recovered_rate = (tail[-1][1] - tail[0][1]) / (tail[-1][0] - tail[0][0])
+        assert recovered_rate > LINE_RATE * 0.8
@@ -63,6 +63,32 @@ class TestURLValidator:
         
         assert "URL inválida" in str(exc_info.value)
 
+    
+    def test_extract_urls_from_pasted_text(self):
+        """Testa extração de várias URLs de um texto colado."""
+        # Arrange
+        text = (
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ\n"
+            "veja também https://youtu.be/9bZkp7q19f0, e outro texto"
+        )
+        
+        # Act
+        urls = URLValidator.extract_urls(text)
+        
+        # Assert
+        assert urls == [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/9bZkp7q19f0"
+        ]
+    
+    def test_extract_video_id(self):
+        """Testa extração do ID do vídeo sem acesso à rede."""
+        # Act & Assert
+        assert URLValidator.extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10") == "dQw4w9WgXcQ"
+        assert URLValidator.extract_video_id("https://youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert URLValidator.extract_video_id("https://www.youtube.com/") is None
+
+
 
 class TestEmailValidator:
     """Testes para a classe EmailValidator."""
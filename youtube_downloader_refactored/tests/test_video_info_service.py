@@ -9,6 +9,9 @@ from unittest.mock import Mock, patch, MagicMock
 from src.services.video_info_service import VideoInfoService, ThumbnailLoader
 from src.models.video_info import VideoInfo
 from src.models.exceptions import VideoInfoError, CookiesNotFoundError
+from src.config.constants import ThumbnailConfig
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage, QPixmap
 
 
 class TestVideoInfoService:
@@ -17,7 +20,7 @@ class TestVideoInfoService:
     @pytest.fixture
     def video_info_service(self):
         """Fixture que retorna uma instância do VideoInfoService."""
-        return VideoInfoService(cookies_file="test_cookies.txt")
+        return VideoInfoService(cookies_file="test_cookies.txt", cookie_manager=Mock())
     
     def test_get_video_info_without_cookies(self, video_info_service):
         """Testa obtenção de informações sem arquivo de cookies."""
@@ -95,48 +98,148 @@ class TestVideoInfoService:
             assert result.title == 'Título não disponível'
             assert result.thumbnail_url is None
 
+    def test_get_video_info_keeps_readable_thumbnails(self, video_info_service):
+        """Testa que as variantes de thumbnail guardam só URL e dimensões decodificáveis."""
+        # Arrange
+        mock_info = {
+            'title': 'Vídeo',
+            'thumbnails': [
+                {'url': 'https://i.ytimg.com/vi/x/mqdefault.jpg', 'width': 320, 'height': 180, 'id': '1'},
+                {'url': 'https://i.ytimg.com/vi/x/thumb.xyz', 'width': 320, 'height': 180},
+                {'id': 'sem-url'},
+            ],
+        }
+
+        with patch('os.path.exists', return_value=True), \
+             patch('yt_dlp.YoutubeDL') as mock_ydl_class:
+
+            mock_ydl = MagicMock()
+            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            mock_ydl.extract_info.return_value = mock_info
+
+            # Act
+            result = video_info_service.get_video_info("https://www.youtube.com/watch?v=x")
+
+            # Assert
+            assert result.thumbnails == [
+                {'url': 'https://i.ytimg.com/vi/x/mqdefault.jpg', 'width': 320, 'height': 180}
+            ]
+
+
+class TestPickThumbnail:
+    """Testes para a escolha da variante de thumbnail."""
+
+    THUMBNAILS = [
+        {'url': 'maxres.jpg', 'width': 1280, 'height': 720},
+        {'url': 'default.jpg', 'width': 120, 'height': 90},
+        {'url': 'hq.jpg', 'width': 480, 'height': 360},
+        {'url': 'mq.jpg', 'width': 320, 'height': 180},
+        {'url': 'sem-dimensoes.jpg', 'width': None, 'height': None},
+    ]
+
+    def test_picks_smallest_that_fills_area(self):
+        """Testa a escolha da menor variante que não precisa ser ampliada."""
+        # Arrange
+        info = VideoInfo(title="t", thumbnail_url="maxres.jpg", thumbnails=self.THUMBNAILS)
+
+        # Act & Assert
+        assert info.pick_thumbnail(200, 150) == 'mq.jpg'
+        assert info.pick_thumbnail(400, 300) == 'hq.jpg'
+
+    def test_falls_back_to_main_thumbnail(self):
+        """Testa o uso da thumbnail principal quando nenhuma variante serve."""
+        # Arrange
+        info = VideoInfo(title="t", thumbnail_url="principal.jpg", thumbnails=self.THUMBNAILS[1:2])
+
+        # Act & Assert
+        assert info.pick_thumbnail(200, 150) == 'principal.jpg'
+        assert VideoInfo(title="t").pick_thumbnail(200, 150) is None
+
 
 class TestThumbnailLoader:
     """Testes para a classe ThumbnailLoader."""
-    
-    def test_load_thumbnail_success(self):
-        """Testa carregamento bem-sucedido de thumbnail."""
+
+    @staticmethod
+    def _jpeg(width, height):
+        """Gera uma imagem JPEG em memória."""
+        image = QImage(width, height, QImage.Format_RGB32)
+        image.fill(0x336699)
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, 'JPG')
+        return bytes(data)
+
+    @staticmethod
+    def _response(body, headers=None):
+        """Resposta HTTP falsa transmitida em blocos."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.headers = headers or {}
+        response.iter_content.side_effect = lambda size: (
+            body[i:i + size] for i in range(0, len(body), size)
+        )
+        return response
+
+    def test_load_image_decodes_at_target_size(self, qapp):
+        """Testa decodificação direto no tamanho de exibição, mantendo a proporção."""
         # Arrange
         url = "https://example.com/thumb.jpg"
-        mock_image_data = b'\x89PNG\r\n\x1a\n'  # Dados de imagem fake
-        
-        with patch('requests.get') as mock_get, \
-             patch('src.services.video_info_service.QImage') as mock_qimage, \
-             patch('src.services.video_info_service.QPixmap') as mock_qpixmap:
-            
-            mock_response = Mock()
-            mock_response.content = mock_image_data
-            mock_response.raise_for_status = Mock()
-            mock_get.return_value = mock_response
-            
-            mock_image = Mock()
-            mock_qimage.return_value = mock_image
-            
-            mock_pixmap = Mock()
-            mock_scaled = Mock()
-            mock_pixmap.scaled.return_value = mock_scaled
-            mock_qpixmap.return_value = mock_pixmap
-            
+
+        with patch('requests.get', return_value=self._response(self._jpeg(1280, 720))) as mock_get:
+
             # Act
-            result = ThumbnailLoader.load_thumbnail(url)
-            
+            image = ThumbnailLoader.load_image(url, 200, 150)
+
             # Assert
-            mock_get.assert_called_once_with(url, timeout=10)
-            assert result == mock_scaled
-    
+            mock_get.assert_called_once_with(url, timeout=10, stream=True)
+            assert (image.width(), image.height()) == (200, 112)
+
+    def test_load_thumbnail_returns_pixmap(self, qapp):
+        """Testa carregamento bem-sucedido de thumbnail como QPixmap."""
+        # Arrange
+        with patch('requests.get', return_value=self._response(self._jpeg(320, 180))):
+
+            # Act
+            result = ThumbnailLoader.load_thumbnail("https://example.com/thumb.jpg")
+
+            # Assert
+            assert isinstance(result, QPixmap)
+            assert result.width() == 200
+
+    def test_load_image_rejects_oversized_body(self, qapp):
+        """Testa recusa de imagens acima do limite sem ler o corpo."""
+        # Arrange
+        response = self._response(b"", {'Content-Length': str(ThumbnailConfig.MAX_BYTES + 1)})
+
+        with patch('requests.get', return_value=response):
+
+            # Act
+            result = ThumbnailLoader.load_image("https://example.com/enorme.jpg")
+
+            # Assert
+            assert result is None
+            response.iter_content.assert_not_called()
+
+    def test_load_image_invalid_data(self, qapp):
+        """Testa dados que não são uma imagem."""
+        # Arrange
+        with patch('requests.get', return_value=self._response(b"nao e imagem")):
+
+            # Act
+            result = ThumbnailLoader.load_image("https://example.com/thumb.jpg")
+
+            # Assert
+            assert result is None
+
     def test_load_thumbnail_failure(self):
         """Testa falha no carregamento de thumbnail."""
         # Arrange
         url = "https://example.com/invalid.jpg"
-        
+
         with patch('requests.get', side_effect=Exception("Connection error")):
             # Act
             result = ThumbnailLoader.load_thumbnail(url)
-            
+
             # Assert
             assert result is None
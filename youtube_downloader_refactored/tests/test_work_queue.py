@@ -0,0 +1,404 @@
+"""
+Testes unitários para a fila compartilhada e o worker que a consome.
+
+Valida a ordem de retirada, a renovação e expiração das concessões, o
+descarte de resultados de workers que perderam o job e a execução dos
+jobs pelo FarmWorker.
+"""
+
+import sqlite3
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from src.models.video_info import DownloadRequest
+from src.models.exceptions import DownloadError, DownloadCancelledError
+from src.services.farm_worker import FarmWorker
+from src.services.work_queue import WorkQueue
+
+
+def _request(n: int) -> DownloadRequest:
+    """Cria uma requisição de teste."""
+    return DownloadRequest(f"https://youtu.be/video{n}", "/tmp", "Melhor qualidade")
+
+
+class TestWorkQueue:
+    """Testes para a classe WorkQueue."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Fixture que retorna o caminho de um banco vazio."""
+        return str(tmp_path / "farm.db")
+
+    @pytest.fixture
+    def queue(self, db_path):
+        """Fixture que retorna uma fila com concessões curtas."""
+        return WorkQueue(db_path, lease_seconds=0.05, max_attempts=2)
+
+    def test_claim_returns_oldest_item(self, queue):
+        """Testa que os itens são concedidos na ordem em que entraram."""
+        # Arrange
+        first, second = queue.enqueue_many([_request(1), _request(2)])
+
+        # Act
+        item = queue.claim("w1")
+
+        # Assert
+        assert item.item_id == first
+        assert item.request == _request(1)
+        assert item.attempts == 1
+        assert queue.claim("w2").item_id == second
+        assert queue.claim("w3") is None
+
+    def test_claim_restores_all_request_fields(self, queue):
+        """Testa que conexões, prioridade, tamanho e opções de ao vivo sobrevivem à fila."""
+        # Arrange
+        request = DownloadRequest(
+            "https://youtu.be/live", "/tmp", "Melhor qualidade", "Título",
+            connections=4, priority=5, estimated_size=1024, live=True, live_from_start=True
+        )
+        queue.enqueue(request)
+
+        # Act
+        item = queue.claim("w1")
+
+        # Assert
+        assert item.request == request
+
+    def test_adds_missing_columns_to_old_database(self, db_path):
+        """Testa que um banco criado sem as colunas novas continua utilizável."""
+        # Arrange
+        connection = sqlite3.connect(db_path)
+        connection.execute(
+            "CREATE TABLE work_items (id INTEGER PRIMARY KEY, url TEXT NOT NULL, save_path TEXT NOT NULL,"
+            " format_choice TEXT NOT NULL, custom_title TEXT, status TEXT NOT NULL DEFAULT 'queued',"
+            " attempts INTEGER NOT NULL DEFAULT 0, worker_id TEXT, lease_token TEXT, lease_expires REAL,"
+            " error TEXT, log_file TEXT, enqueued_at REAL NOT NULL, finished_at REAL)"
+        )
+        connection.execute(
+            "INSERT INTO work_items (url, save_path, format_choice, enqueued_at)"
+            " VALUES ('https://youtu.be/video1', '/tmp', 'Melhor qualidade', 0)"
+        )
+        connection.commit()
+        connection.close()
+
+        # Act
+        item = WorkQueue(db_path).claim("w1")
+
+        # Assert
+        assert item.request == _request(1)
+
+    def test_complete_with_current_lease(self, queue):
+        """Testa a conclusão de um item pelo worker que o detém."""
+        # Arrange
+        queue.enqueue(_request(1))
+        item = queue.claim("w1")
+
+        # Act
+        completed = queue.complete(item)
+
+        # Assert
+        assert completed is True
+        assert queue.status(item.item_id) == WorkQueue.COMPLETED
+
+    def test_heartbeat_keeps_lease(self, queue):
+        """Testa que a renovação impede a devolução do item à fila."""
+        # Arrange
+        queue.enqueue(_request(1))
+        item = queue.claim("w1")
+
+        # Act
+        for _ in range(4):
+            time.sleep(0.02)
+            assert queue.heartbeat(item) is True
+
+        # Assert
+        assert queue.claim("w2") is None
+        assert queue.status(item.item_id) == WorkQueue.LEASED
+
+    def test_expired_lease_is_requeued_and_old_worker_rejected(self, queue):
+        """Testa que um worker travado perde o job para outro sem duplicar o resultado."""
+        # Arrange
+        queue.enqueue(_request(1))
+        stale = queue.claim("w1")
+        time.sleep(0.1)
+
+        # Act
+        fresh = queue.claim("w2")
+
+        # Assert
+        assert fresh.item_id == stale.item_id
+        assert fresh.attempts == 2
+        assert queue.heartbeat(stale) is False
+        assert queue.complete(stale) is False
+        assert queue.fail(stale, "tarde demais") is False
+        assert queue.complete(fresh) is True
+
+    def test_item_fails_after_max_attempts(self, queue):
+        """Testa que um item cujas concessões vencem repetidamente é dado como falho."""
+        # Arrange
+        item_id = queue.enqueue(_request(1))
+        queue.claim("w1")
+        time.sleep(0.1)
+        queue.claim("w2")
+        time.sleep(0.1)
+
+        # Act
+        item = queue.claim("w3")
+
+        # Assert
+        assert item is None
+        assert queue.status(item_id) == WorkQueue.FAILED
+
+    def test_release_requeues_without_using_an_attempt(self, queue):
+        """Testa que o item devolvido pelo worker volta à fila com as mesmas tentativas."""
+        # Arrange
+        queue.enqueue(_request(1))
+        item = queue.claim("w1")
+
+        # Act
+        released = queue.release(item)
+
+        # Assert
+        assert released is True
+        assert queue.status(item.item_id) == WorkQueue.QUEUED
+        assert queue.claim("w2").attempts == 1
+        assert queue.release(item) is False
+
+    def test_fail_records_error(self, queue):
+        """Testa o registro da falha com o arquivo de log do worker."""
+        # Arrange
+        queue.enqueue(_request(1))
+        item = queue.claim("w1")
+
+        # Act
+        queue.fail(item, "erro de rede", "/logs/jobs.log")
+
+        # Assert
+        assert queue.counts() == {
+            WorkQueue.QUEUED: 0, WorkQueue.LEASED: 0, WorkQueue.COMPLETED: 0, WorkQueue.FAILED: 1
+        }
+
+    def test_concurrent_workers_never_share_an_item(self, db_path):
+        """Testa que workers com conexões próprias não recebem o mesmo item."""
+        # Arrange
+        WorkQueue(db_path).enqueue_many(_request(n) for n in range(40))
+        claimed = []
+        lock = threading.Lock()
+
+        def consume(worker_id):
+            queue = WorkQueue(db_path)
+            while True:
+                item = queue.claim(worker_id)
+                if item is None:
+                    return
+                with lock:
+                    claimed.append(item.item_id)
+                queue.complete(item)
+
+        threads = [threading.Thread(target=consume, args=(f"w{n}",)) for n in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert sorted(claimed) == list(range(1, 41))
+        assert WorkQueue(db_path).counts()[WorkQueue.COMPLETED] == 40
+
+
+class TestFarmWorker:
+    """Testes para a classe FarmWorker."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        """Fixture que retorna uma fila com um item."""
+        queue = WorkQueue(str(tmp_path / "farm.db"), lease_seconds=0.2)
+        queue.enqueue(_request(1))
+        return queue
+
+    def test_process_one_completes_item(self, queue):
+        """Testa a execução bem-sucedida de um item."""
+        # Arrange
+        service = Mock()
+        worker = FarmWorker(queue, download_service=service, worker_id="w1")
+
+        # Act
+        processed = worker.process_one()
+
+        # Assert
+        assert processed is True
+        assert service.download.call_args[0][0] == _request(1)
+        assert queue.status(1) == WorkQueue.COMPLETED
+        assert worker.process_one() is False
+
+    def test_process_one_records_failure(self, queue):
+        """Testa que erros do download marcam o item como falho."""
+        # Arrange
+        service = Mock()
+        service.download.side_effect = DownloadError("formato indisponível")
+        worker = FarmWorker(queue, download_service=service, worker_id="w1")
+
+        # Act
+        worker.process_one()
+
+        # Assert
+        assert queue.status(1) == WorkQueue.FAILED
+
+    def test_lost_lease_cancels_download(self, queue):
+        """Testa que o worker abandona o job quando sua concessão se perde."""
+        # Arrange
+        def download(request, control):
+            while not control.is_cancelled:
+                time.sleep(0.01)
+            raise DownloadCancelledError("Download cancelado.")
+
+        service = Mock()
+        service.download.side_effect = download
+        worker = FarmWorker(queue, download_service=service, worker_id="w1")
+        runner = threading.Thread(target=worker.process_one)
+        runner.start()
+        time.sleep(0.3)
+        other = queue.claim("w2")
+
+        # Act
+        worker.renew_leases()
+        runner.join(timeout=5)
+
+        # Assert
+        assert not runner.is_alive()
+        assert other is not None
+        assert queue.status(1) == WorkQueue.LEASED
+        assert queue.complete(other) is True
+
+    def test_start_and_stop(self, queue):
+        """Testa que o worker consome a fila em segundo plano até ser parado."""
+        # Arrange
+        service = Mock()
+        worker = FarmWorker(
+            queue, download_service=service, concurrency=2,
+            heartbeat_interval=0.05, poll_interval=0.01
+        )
+
+        # Act
+        worker.start()
+        deadline = time.time() + 5
+        while queue.status(1) != WorkQueue.COMPLETED and time.time() < deadline:
+            time.sleep(0.01)
+        worker.stop()
+
+        # Assert
+        assert queue.status(1) == WorkQueue.COMPLETED
+        service.download.assert_called_once()
+
+    def test_stop_releases_active_job(self, queue):
+        """Testa que encerrar o worker devolve o job à fila sem gastar uma tentativa."""
+        # Arrange
+        started = threading.Event()
+
+        def download(request, control):
+            started.set()
+            while not control.is_cancelled:
+                time.sleep(0.01)
+            raise DownloadCancelledError("Download cancelado.")
+
+        service = Mock()
+        service.download.side_effect = download
+        worker = FarmWorker(queue, download_service=service, worker_id="w1", poll_interval=0.01)
+        worker.start()
+        assert started.wait(5)
+
+        # Act
+        worker.stop()
+
+        # Assert
+        assert queue.status(1) == WorkQueue.QUEUED
+        assert queue.claim("w2").attempts == 1
+
+    def test_loops_survive_queue_errors(self, queue):
+        """Testa que erros transitórios do banco não encerram os slots nem a renovação."""
+        # Arrange
+        claim, heartbeat = queue.claim, queue.heartbeat
+        failures = {'claim': 1, 'heartbeat': 1}
+        renewed = threading.Event()
+
+        def flaky_claim(worker_id):
+            if failures['claim']:
+                failures['claim'] -= 1
+                raise sqlite3.OperationalError("database is locked")
+            return claim(worker_id)
+
+        def flaky_heartbeat(item):
+            if failures['heartbeat']:
+                failures['heartbeat'] -= 1
+                raise sqlite3.OperationalError("database is locked")
+            renewed.set()
+            return heartbeat(item)
+
+        release = threading.Event()
+        service = Mock()
+        service.download.side_effect = lambda request, control: release.wait(5)
+        worker = FarmWorker(
+            queue, download_service=service, heartbeat_interval=0.05,
+            poll_interval=0.01, error_backoff=0.01
+        )
+
+        # Act
+        with patch.object(queue, 'claim', side_effect=flaky_claim), \
+             patch.object(queue, 'heartbeat', side_effect=flaky_heartbeat):
+            worker.start()
+            assert renewed.wait(5)
+            release.set()
+            deadline = time.time() + 5
+            while queue.status(1) != WorkQueue.COMPLETED and time.time() < deadline:
+                time.sleep(0.01)
+            worker.stop()
+
+        # Assert
+        assert failures == {'claim': 0, 'heartbeat': 0}
+        assert queue.status(1) == WorkQueue.COMPLETED
+
+    def test_result_is_retried_while_queue_is_locked(self, queue):
+        """Testa que o resultado é registrado de novo, com a concessão mantida, se a fila falhar."""
+        # Arrange
+        complete = queue.complete
+        attempts = []
+        worker = FarmWorker(queue, download_service=Mock(), worker_id="w1", error_backoff=0.01)
+
+        def flaky_complete(item):
+            attempts.append(item.item_id in worker._active)
+            if len(attempts) < 3:
+                raise sqlite3.OperationalError("database is locked")
+            return complete(item)
+
+        # Act
+        with patch.object(queue, 'complete', side_effect=flaky_complete):
+            worker.process_one()
+
+        # Assert
+        assert attempts == [True, True, True]
+        assert queue.status(1) == WorkQueue.COMPLETED
+        assert worker._active == {}
+
+    def test_job_claimed_during_stop_is_released(self, queue):
+        """Testa que um job retirado enquanto o worker para volta à fila sem ser baixado."""
+        # Arrange
+        service = Mock()
+        worker = FarmWorker(queue, download_service=service, worker_id="w1")
+        claim = queue.claim
+
+        def claim_while_stopping(worker_id):
+            item = claim(worker_id)
+            worker.stop(wait=False)
+            return item
+
+        # Act
+        with patch.object(queue, 'claim', side_effect=claim_while_stopping):
+            worker.process_one()
+
+        # Assert
+        service.download.assert_not_called()
+        assert queue.status(1) == WorkQueue.QUEUED
+        assert queue.claim("w2").attempts == 1
@@ -0,0 +1,213 @@
+"""
+Testes unitários para o cache em disco do yt-dlp.
+
+Valida a contabilização de acertos e falhas, o limite de tamanho,
+a medição de latência e o aquecimento usando instâncias reais do
+YoutubeDL (sem acesso à rede).
+"""
+
+import os
+import time
+import pytest
+import yt_dlp
+from unittest.mock import Mock, patch
+from src.services.ydl_cache import YtDlpCache
+from src.services.ydl_pool import YoutubeDLPool
+from src.services.video_info_service import VideoInfoService
+from src.models.video_info import VideoInfo
+
+
+class TestYtDlpCache:
+    """Testes para a classe YtDlpCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture que retorna um cache em diretório temporário."""
+        return YtDlpCache(str(tmp_path / "cache"), max_bytes=10_000)
+
+    @pytest.fixture
+    def ydl(self, cache):
+        """Fixture que retorna uma instância do YoutubeDL associada ao cache."""
+        with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
+            cache.attach(ydl)
+            yield ydl
+
+    def test_attach_points_instance_to_directory(self, cache, ydl):
+        """Testa que a instância passa a gravar no diretório gerenciado."""
+        # Act
+        ydl.cache.store('youtube-sigfuncs', 'player', {'spec': [1, 2]})
+
+        # Assert
+        assert ydl.params['cachedir'] == cache.directory
+        assert os.path.exists(os.path.join(cache.directory, 'youtube-sigfuncs', 'player.json'))
+
+    def test_attach_is_idempotent(self, cache, ydl):
+        """Testa que reassociar não substitui o cache da instância."""
+        # Arrange
+        tracked = ydl.cache
+
+        # Act
+        cache.attach(ydl)
+
+        # Assert
+        assert ydl.cache is tracked
+
+    def test_counts_hits_misses_and_stores(self, cache, ydl):
+        """Testa a contabilização de leituras e gravações."""
+        # Act
+        missing = ydl.cache.load('youtube-sigfuncs', 'player', default='padrão')
+        ydl.cache.store('youtube-sigfuncs', 'player', {'spec': [1, 2]})
+        found = ydl.cache.load('youtube-sigfuncs', 'player')
+        stats = cache.stats()
+
+        # Assert
+        assert missing == 'padrão'
+        assert found == {'spec': [1, 2]}
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+        assert stats.size_bytes > 0
+
+    def test_is_warm_after_store(self, cache, ydl):
+        """Testa a detecção de cache vazio e preenchido."""
+        # Arrange
+        was_warm = cache.is_warm()
+
+        # Act
+        ydl.cache.store('challenge-solver', 'player:x', {'code': 'abc'})
+
+        # Assert
+        assert not was_warm
+        assert cache.is_warm()
+
+    def test_prune_removes_least_recently_used(self, cache):
+        """Testa a remoção dos arquivos menos usados até caber no limite."""
+        # Arrange
+        section = os.path.join(cache.directory, 'youtube-nsig')
+        os.makedirs(section)
+        now = time.time()
+        for index, name in enumerate(['velho', 'medio', 'novo']):
+            path = os.path.join(section, f'{name}.json')
+            with open(path, 'w') as f:
+                f.write('x' * 4_000)
+            os.utime(path, (now - 100 + index, now - 100 + index))
+
+        # Act
+        removed = cache.prune()
+
+        # Assert
+        assert removed == 1
+        assert sorted(os.listdir(section)) == ['medio.json', 'novo.json']
+        assert cache.stats().evicted_files == 1
+
+    def test_store_over_limit_prunes(self, cache, ydl):
+        """Testa que gravações além do limite disparam a limpeza."""
+        # Act
+        for index in range(5):
+            ydl.cache.store('youtube-nsig', f'chave{index}', 'x' * 4_000)
+
+        # Assert
+        assert cache.stats().size_bytes <= 10_000
+
+    def test_measure_separates_warm_and_cold_extractions(self, cache, ydl):
+        """Testa a classificação das extrações pelo uso do cache."""
+        # Arrange
+        ydl.cache.store('youtube-sigfuncs', 'player', {'spec': [1]})
+
+        # Act
+        with cache.measure(ydl):
+            ydl.cache.load('youtube-sigfuncs', 'player')
+        with cache.measure(ydl):
+            ydl.cache.load('youtube-sigfuncs', 'outro')
+        stats = cache.stats()
+
+        # Assert
+        assert len(stats.warm_latencies) == 1
+        assert len(stats.cold_latencies) == 1
+
+    def test_measure_ignores_failed_extraction(self, cache, ydl):
+        """Testa que extrações com erro não entram na latência."""
+        # Act
+        with pytest.raises(RuntimeError):
+            with cache.measure(ydl):
+                raise RuntimeError("falha")
+
+        # Assert
+        assert cache.stats().to_dict()['warm_extractions'] == 0
+
+    def test_pool_attaches_cache(self, cache):
+        """Testa que o pool associa o cache às instâncias retiradas."""
+        # Arrange
+        pool = YoutubeDLPool(cache=cache)
+
+        # Act
+        with pool.checkout({'quiet': True}) as ydl:
+            cachedir = ydl.params['cachedir']
+
+        # Assert
+        assert cachedir == cache.directory
+        pool.clear()
+
+    def test_shared_returns_same_instance(self, tmp_path):
+        """Testa que o cache compartilhado é único por diretório."""
+        # Act
+        first = YtDlpCache.shared(str(tmp_path / "compartilhado"))
+        second = YtDlpCache.shared(str(tmp_path / "compartilhado"))
+
+        # Assert
+        assert first is second
+
+
+class TestWarmCache:
+    """Testes para o aquecimento do cache pelo VideoInfoService."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture que retorna um cache vazio em diretório temporário."""
+        return YtDlpCache(str(tmp_path / "cache"))
+
+    @pytest.fixture
+    def service(self, cache):
+        """Fixture que retorna um serviço de metadados com o cache temporário."""
+        return VideoInfoService(cookies_file="test_cookies.txt", cookie_manager=Mock(), ydl_cache=cache)
+
+    def test_warm_cache_extracts_when_cold(self, service):
+        """Testa que o cache vazio é aquecido com uma extração."""
+        # Arrange
+        with patch('os.path.exists', return_value=True), \
+             patch.object(service, 'get_video_info', return_value=VideoInfo(title="t")) as get_info:
+
+            # Act
+            warmed = service.warm_cache("https://www.youtube.com/watch?v=abc")
+
+        # Assert
+        assert warmed is True
+        get_info.assert_called_once_with("https://www.youtube.com/watch?v=abc")
+
+    def test_warm_cache_skips_when_warm(self, service, cache):
+        """Testa que um cache já preenchido não é aquecido novamente."""
+        # Arrange
+        os.makedirs(os.path.join(cache.directory, 'youtube-sigfuncs'))
+        with open(os.path.join(cache.directory, 'youtube-sigfuncs', 'p.json'), 'w') as f:
+            f.write('{}')
+
+        with patch('os.path.exists', return_value=True), \
+             patch.object(service, 'get_video_info') as get_info:
+
+            # Act
+            warmed = service.warm_cache()
+
+        # Assert
+        assert warmed is False
+        get_info.assert_not_called()
+
+    def test_warm_cache_without_cookies(self, service):
+        """Testa que sem cookies não há aquecimento."""
+        # Arrange
+        with patch.object(service, 'get_video_info') as get_info:
+
+            # Act
+            warmed = service.warm_cache()
+
+        # Assert
+        assert warmed is False
+        get_info.assert_not_called()
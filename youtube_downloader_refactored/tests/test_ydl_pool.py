@@ -0,0 +1,125 @@
+"""
+Testes unitários para o pool de instâncias do yt-dlp.
+
+Valida reutilização, aplicação de opções por job e troca de hooks
+do YoutubeDLPool usando instâncias reais (sem acesso à rede).
+"""
+
+import pytest
+from unittest.mock import Mock
+from src.services.ydl_pool import YoutubeDLPool
+
+PROFILE = {'quiet': True, 'noprogress': True}
+
+
+class TestYoutubeDLPool:
+    """Testes para a classe YoutubeDLPool."""
+
+    @pytest.fixture
+    def pool(self):
+        """Fixture que retorna um pool sem gerenciador de cookies."""
+        pool = YoutubeDLPool()
+        yield pool
+        pool.clear()
+
+    def test_reuses_instance_for_same_profile(self, pool):
+        """Testa reutilização da instância entre jobs do mesmo perfil."""
+        # Act
+        with pool.checkout(dict(PROFILE, outtmpl='/a/%(title)s.%(ext)s')) as first:
+            pass
+        with pool.checkout(dict(PROFILE, outtmpl='/b/%(title)s.%(ext)s')) as second:
+            pass
+
+        # Assert
+        assert first is second
+        assert pool.created_count == 1
+
+    def test_different_profiles_use_different_instances(self, pool):
+        """Testa separação de instâncias por perfil de opções."""
+        # Act
+        with pool.checkout(PROFILE) as first:
+            pass
+        with pool.checkout(dict(PROFILE, merge_output_format='mkv')) as second:
+            pass
+
+        # Assert
+        assert first is not second
+        assert pool.created_count == 2
+
+    def test_job_options_are_applied_and_restored(self, pool):
+        """Testa aplicação e restauração das opções por job."""
+        # Act
+        with pool.checkout(dict(PROFILE, outtmpl='/dest/video.%(ext)s', format='bestaudio')) as ydl:
+            applied_outtmpl = ydl.params['outtmpl']['default']
+            applied_format = ydl.params['format']
+        with pool.checkout(PROFILE) as ydl:
+            restored_outtmpl = ydl.params['outtmpl']['default']
+            restored_format = ydl.params.get('format')
+
+        # Assert
+        assert applied_outtmpl == '/dest/video.%(ext)s'
+        assert applied_format == 'bestaudio'
+        assert restored_outtmpl != applied_outtmpl
+        assert restored_format is None
+
+    def test_hooks_are_rebound_per_job(self, pool):
+        """Testa que os hooks de um job não vazam para o próximo."""
+        # Arrange
+        first_hook, second_hook = Mock(), Mock()
+
+        # Act
+        with pool.checkout(dict(PROFILE, progress_hooks=[first_hook])) as ydl:
+            during_first = list(ydl._progress_hooks)
+        with pool.checkout(dict(PROFILE, progress_hooks=[second_hook])) as ydl:
+            during_second = list(ydl._progress_hooks)
+
+        # Assert
+        assert during_first == [first_hook]
+        assert during_second == [second_hook]
+
+    def test_failed_job_discards_instance(self, pool):
+        """Testa descarte da instância após erro no job."""
+        # Act
+        with pytest.raises(RuntimeError):
+            with pool.checkout(PROFILE) as failed:
+                raise RuntimeError("falhou")
+        with pool.checkout(PROFILE) as fresh:
+            pass
+
+        # Assert
+        assert fresh is not failed
+        assert pool.created_count == 2
+
+    def test_invalid_job_options_discard_instance(self, pool):
+        """Testa que uma instância com opções do job rejeitadas é encerrada, e não devolvida."""
+        # Arrange
+        with pool.checkout(PROFILE) as pooled:
+            pass
+        closed = Mock()
+        pooled.__exit__ = closed
+
+        # Act
+        with pytest.raises(SyntaxError):
+            with pool.checkout(dict(PROFILE, format='best[height<')):
+                pass
+        with pool.checkout(PROFILE) as fresh:
+            pass
+
+        # Assert
+        closed.assert_called_once_with(None, None, None)
+        assert fresh is not pooled
+        assert pool.created_count == 2
+
+    def test_attaches_shared_cookie_jar(self):
+        """Testa associação do cookie jar compartilhado na retirada."""
+        # Arrange
+        cookie_manager = Mock()
+        pool = YoutubeDLPool(cookie_manager)
+
+        # Act
+        with pool.checkout(PROFILE) as ydl:
+            pass
+
+        # Assert
+        cookie_manager.attach.assert_called_once_with(ydl)
+        pool.clear()